@@ -13,7 +13,11 @@ __license__ = 'Apache 2.0'
 
 from mi.core.log import get_logger ; log = get_logger()
 
+import mmap
+from bisect import bisect_left, bisect_right
+
 from mi.core.exceptions import SampleException
+from mi.core.stage_timer import Stage, StageTimer
 
 class Chunker(object):
     """
@@ -39,6 +43,11 @@ class Chunker(object):
             If no data is present, return and empty list. If multiple data
             blocks are found, the returned list will contain multiple tuples,
             IN SEQUENTIAL ORDER and WITHOUT OVERLAP.
+            A sieve may instead return a (match_list, restart_index) tuple,
+            where restart_index is the offset in the raw data before which
+            everything has been fully sieved and will not change as more data
+            arrives. Chunkers that support it will only pass the data from
+            that point on to the next sieve call.
         """
         self.sieve = data_sieve_fn
         
@@ -133,7 +142,7 @@ class Chunker(object):
         """
         log.debug("Generating data lists with start index %s", start_index)
         return_list = {'data_chunk_list':[], 'non_data_chunk_list':[]}
-        result = self.sieve(self.buffer[start_index:])
+        (result, restart_index) = self._run_sieve(self.buffer[start_index:])
         # assert no overlap!
         if (self.overlaps(result)):
             raise SampleException("Overlapping blocks in sieve list: %s" % result)
@@ -199,6 +208,20 @@ class Chunker(object):
         log.trace("add_timestamp returning result_list: %s", result_list)
         return result_list
     
+    def _run_sieve(self, raw_data):
+        """
+        Run the sieve function over some raw data
+
+        @param raw_data The raw data to sieve
+        @retval A tuple of (match_list, restart_index). restart_index is None
+            if the sieve function does not provide one.
+        """
+        with StageTimer.stage(Stage.SIEVE):
+            result = self.sieve(raw_data)
+        if isinstance(result, tuple):
+            return result
+        return result, None
+
     @staticmethod
     def overlaps(data_list):
         """
@@ -454,7 +477,31 @@ class Chunker(object):
     
         return return_list
 
-    
+    @staticmethod
+    def line_sieve_function(raw_data, regex_list=[]):
+        """
+        A resumable version of regex_sieve_function for line oriented data,
+        where no regex can match across a newline other than at the end of the
+        match. Only complete lines are searched, and the start of the trailing
+        partial line is returned as the restart index, so lines that have
+        already been sieved are not searched again when more data arrives.
+        Use with functools.partial() the same way as regex_sieve_function.
+        @param raw_data The raw data to run through this regex sieve
+        @param regex_list a list of pre-compiled regexes that will identify some
+        flavor of a pattern in the raw data for matching.
+        @retval A tuple of a list of (start, end) tuples for each match the
+        regexes find and the restart index
+        """
+        return_list = []
+        restart_index = raw_data.rfind('\n') + 1
+
+        for matcher in regex_list:
+            for match in matcher.finditer(raw_data, 0, restart_index):
+                return_list.append((match.start(), match.end()))
+
+        return return_list, restart_index
+
+
 class StringChunker(Chunker):
     """
     A version of the chunker that handles a string buffer. Methods are tuned
@@ -473,4 +520,429 @@ class BinaryChunker(Chunker):
     def __init__(self, data_sieve_fn):
         Chunker.__init__(self, data_sieve_fn)
         self.buffer = []
-    
\ No newline at end of file
+    
+
+class ChunkIndex(object):
+    """
+    A sorted index of non-overlapping (start, end, timestamp) chunks, as kept
+    in the chunker chunk lists. Chunks are added at the end and consumed from
+    the front, so the index is stored as parallel start, end and timestamp
+    lists with a moving head, which keeps appending and consuming O(1)
+    amortized and lets chunks be looked up by offset with a binary search.
+
+    The index can be used like the list of (start, end, timestamp) tuples it
+    replaces for iteration, len() and indexing.
+    """
+
+    def __init__(self, chunks=()):
+        self._starts = []
+        self._ends = []
+        self._times = []
+        self._head = 0
+        self.extend(chunks)
+
+    def __len__(self):
+        return len(self._starts) - self._head
+
+    def __iter__(self):
+        for index in xrange(self._head, len(self._starts)):
+            yield (self._starts[index], self._ends[index], self._times[index])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("chunk index out of range")
+        index += self._head
+        return self._starts[index], self._ends[index], self._times[index]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, chunk):
+        """
+        Add a chunk to the end of the index
+        @param chunk A (start, end, timestamp) tuple, starting at or after the
+            end of the last chunk in the index
+        """
+        (start, end, timestamp) = chunk
+        self._starts.append(start)
+        self._ends.append(end)
+        self._times.append(timestamp)
+
+    def extend(self, chunks):
+        """
+        Add a sequence of chunks to the end of the index
+        @param chunks An iterable of (start, end, timestamp) tuples
+        """
+        for chunk in chunks:
+            self.append(chunk)
+
+    def popleft(self):
+        """
+        Remove and return the first chunk in the index
+        """
+        chunk = self[0]
+        self._head += 1
+        self._compact()
+        return chunk
+
+    def find(self, offset):
+        """
+        Find the first chunk that ends after the given offset
+        @param offset The offset to look up
+        @retval The position of the chunk in the index, len() if none
+        """
+        return bisect_right(self._ends, offset, self._head) - self._head
+
+    def find_end(self, offset):
+        """
+        Find the first chunk that ends at or after the given offset
+        @param offset The offset to look up
+        @retval The position of the chunk in the index, len() if none
+        """
+        return bisect_left(self._ends, offset, self._head) - self._head
+
+    def timestamp_at(self, offset):
+        """
+        Look up the timestamp of the chunk holding the given offset, or of the
+        first chunk after it
+        @param offset The offset to look up
+        @retval The timestamp, None if no chunk ends after the offset
+        """
+        index = bisect_right(self._ends, offset, self._head)
+        if index < len(self._ends):
+            return self._times[index]
+        return None
+
+    def remove_start(self, start):
+        """
+        Remove the chunk starting at the given offset, if there is one
+        @param start The start offset of the chunk to remove
+        """
+        index = bisect_left(self._starts, start, self._head)
+        if index < len(self._starts) and self._starts[index] == start:
+            del self._starts[index]
+            del self._ends[index]
+            del self._times[index]
+
+    def set_end(self, index, end):
+        """
+        Change the end offset of a chunk, dropping all chunks after it
+        @param index The position of the chunk in the index
+        @param end The new end offset
+        """
+        index += self._head
+        self._ends[index] = end
+        del self._starts[index + 1:]
+        del self._ends[index + 1:]
+        del self._times[index + 1:]
+
+    def trim(self, end_index):
+        """
+        Drop all chunks that end at or before the given offset and clip a chunk
+        that straddles it so it starts there
+        @param end_index The offset that has been consumed up to
+        """
+        self._head = bisect_right(self._ends, end_index, self._head)
+        if self._head < len(self._starts) and self._starts[self._head] < end_index:
+            self._starts[self._head] = end_index
+        self._compact()
+
+    def _compact(self):
+        """
+        Release the consumed part of the lists once it makes up half of them
+        """
+        if self._head > 64 and self._head * 2 >= len(self._starts):
+            del self._starts[:self._head]
+            del self._ends[:self._head]
+            del self._times[:self._head]
+            self._head = 0
+
+
+class BufferChunker(Chunker):
+    """
+    A version of the chunker backed by a single growable bytearray. Unlike
+    StringChunker, chunk indices are tracked internally as absolute offsets
+    from the start of the stream and consumption just moves a read cursor, so
+    fetching data does not re-slice the buffer or rebuild every index list.
+    Consumed bytes are dropped lazily, once they make up enough of the buffer
+    to be worth compacting.
+
+    Indices handed back by the get_next_* methods are relative to the unread
+    portion of the buffer, exactly as they are for StringChunker, so this can
+    be used anywhere a StringChunker is used.
+
+    A read-only buffer or mmap added while there is no unread data, such as
+    a whole mapped file, is held as it is rather than copied into the
+    bytearray, and the sieve runs over a buffer view of it. It is only copied
+    if more data is added after it.
+    """
+
+    # Minimum number of consumed bytes before the buffer is compacted
+    COMPACT_THRESHOLD = 65536
+
+    def __init__(self, data_sieve_fn):
+        self._data = bytearray()
+        # absolute stream offset of self._data[0]
+        self._base = 0
+        # absolute stream offset of the first unread byte
+        self._cursor = 0
+        # absolute stream offset the next sieve call can start from
+        self._restart_index = 0
+
+        Chunker.__init__(self, data_sieve_fn)
+
+        self.raw_chunk_list = ChunkIndex()
+        self.data_chunk_list = ChunkIndex()
+        self.nondata_chunk_list = ChunkIndex()
+
+    @property
+    def buffer(self):
+        """
+        The unread contents of the buffer, as a string
+        """
+        return self._slice(self._cursor, self._end())
+
+    @buffer.setter
+    def buffer(self, value):
+        self._data = bytearray(value or '')
+        self._base = 0
+        self._cursor = 0
+        self._restart_index = 0
+
+    def _end(self):
+        """
+        @retval The absolute offset one past the last byte in the buffer
+        """
+        return self._base + len(self._data)
+
+    def _slice(self, start, end):
+        """
+        Copy a section of the buffer out as a string
+        @param start The absolute offset of the first byte
+        @param end The absolute offset one past the last byte
+        """
+        if isinstance(self._data, buffer):
+            return self._data[start - self._base:end - self._base]
+        return memoryview(self._data)[start - self._base:end - self._base].tobytes()
+
+    def _sieve_data(self, start):
+        """
+        The data from an absolute offset to the end of the buffer, to be sieved.
+        A held read-only buffer is viewed in place, the bytearray is copied out
+        since sieve functions may use string methods and it can be resized.
+        @param start The absolute offset of the first byte
+        """
+        if isinstance(self._data, buffer):
+            return buffer(self._data, start - self._base)
+        return self._slice(start, self._end())
+
+    def add_chunk(self, raw_data, timestamp):
+        """
+        Adds a chunk of data to the end of the buffer, includes the new indices
+        in the raw_chunk_list.
+
+        @param raw_data The raw data as a string, bytearray, buffer or mmap
+        @param timestamp The time (in NTP4 float format) that the data was
+            collected at the port agent
+        """
+        assert isinstance(raw_data, (str, bytearray, buffer, mmap.mmap))
+        assert isinstance(timestamp, float)
+
+        start_index = self._end()
+        if self.data_chunk_list:
+            last_data_index = self.data_chunk_list[-1][1]
+        else:
+            last_data_index = self._cursor
+
+        if isinstance(raw_data, (buffer, mmap.mmap)) and self._cursor == start_index:
+            # nothing is left unread, hold the read-only data instead of copying it
+            self._data = buffer(raw_data)
+            self._base = start_index
+        else:
+            if isinstance(self._data, buffer):
+                self._data = bytearray(self._slice(self._cursor, start_index))
+                self._base = self._cursor
+            self._data.extend(raw_data)
+        self.raw_chunk_list.append((start_index, self._end(), timestamp))
+
+        # find data
+        result = self._generate_data_lists(timestamp, start_index=last_data_index)
+
+        for (s, e, t) in result['data_chunk_list']:
+            self.data_chunk_list.append((s, e, t))
+
+            # remove first fragment part from non-data array if we completed a fragment
+            self.nondata_chunk_list.remove_start(s)
+
+        # splice non-data blocks in, combining the first new block with the
+        # existing block it runs into, if any
+        new_non_data = result['non_data_chunk_list']
+        if new_non_data:
+            (first_new_s, first_new_e, first_new_t) = new_non_data[0]
+            index = self.nondata_chunk_list.find_end(first_new_s)
+            if index < len(self.nondata_chunk_list):
+                self.nondata_chunk_list.set_end(index, first_new_e)
+                new_non_data = new_non_data[1:]
+            self.nondata_chunk_list.extend(new_non_data)
+
+        log.trace("Added chunk, data_chunk_list: %s, nondata_chunk_list: %s",
+                  self.data_chunk_list, self.nondata_chunk_list)
+
+    def _generate_data_lists(self, timestamp, start_index=0):
+        """
+        From some absolute starting offset, go through and find the blocks of
+        data and non-data in the buffer.
+
+        If a resumable sieve has already settled the data past start_index
+        without finding any matches, only the data from its restart index on
+        is sieved again.
+
+        @param timestamp The timestamp to use for a new non-data chunk
+        @param start_index The absolute offset to start generating lists from
+        @retval A dict with keys "data_chunk_list" and "non_data_chunk_list"
+            with absolute offsets into the stream
+        """
+        return_list = {'data_chunk_list': [], 'non_data_chunk_list': []}
+        sieve_index = max(start_index, self._restart_index)
+        (result, restart_index) = self._run_sieve(self._sieve_data(sieve_index))
+        if restart_index is not None:
+            self._restart_index = sieve_index + restart_index
+        if self.overlaps(result):
+            raise SampleException("Overlapping blocks in sieve list: %s" % result)
+        result.sort()
+
+        result = [(s + sieve_index, e + sieve_index) for (s, e) in result]
+        return_list['data_chunk_list'] = self.add_timestamps(result)
+
+        if not result:
+            return_list['non_data_chunk_list'].append((start_index, self._end(), timestamp))
+
+        non_data = []
+        previous_end = start_index
+        for (s, e) in result:
+            assert s >= previous_end
+            if s > previous_end:
+                non_data.append((previous_end, s))
+            previous_end = e
+
+        return_list['non_data_chunk_list'].extend(self.add_timestamps(non_data))
+        return return_list
+
+    def add_timestamps(self, start_end_list):
+        """
+        Add timestamps to a list of (start, end) tuples from the raw chunk
+        each one starts in. Chunks that start past the end of the raw chunks
+        are dropped.
+
+        @param start_end_list The list of (start, end) tuples
+        @retval The list of (start, end, timestamp) tuples
+        """
+        result_list = []
+        for item in start_end_list:
+            if len(item) == 3:
+                result_list.append(item)
+                continue
+            elif len(item) != 2:
+                raise SampleException("Invalid pair encountered!")
+
+            timestamp = self.raw_chunk_list.timestamp_at(item[0])
+            if timestamp is not None:
+                result_list.append((item[0], item[1], timestamp))
+
+        return result_list
+
+    def _get_next(self, chunk_list, clean):
+        """
+        Fetch the first chunk of the given list, optionally consuming the buffer
+        up to and including it.
+
+        @param chunk_list The chunk list to fetch from
+        @param clean Remove the buffer contents before and including the chunk
+        @retval A tuple of (timestamp, chunk, start, end), with start and end
+            relative to the unread portion of the buffer
+        """
+        if not chunk_list:
+            return None, None, None, None
+
+        (next_start, next_end, timestamp) = chunk_list[0]
+        next_block = self._slice(next_start, next_end)
+        origin = self._cursor
+
+        if clean:
+            chunk_list.popleft()
+            self._consume(next_end)
+
+        return timestamp, next_block, next_start - origin, next_end - origin
+
+    def _consume(self, end_index):
+        """
+        Move the read cursor up to the given absolute offset, trimming the
+        chunk lists to match.
+        @param end_index The absolute offset that has been consumed up to
+        """
+        self._cursor = end_index
+        for chunk_list in (self.raw_chunk_list, self.data_chunk_list, self.nondata_chunk_list):
+            chunk_list.trim(end_index)
+
+        consumed = self._cursor - self._base
+        if consumed >= self.COMPACT_THRESHOLD and consumed * 2 >= len(self._data) and \
+                isinstance(self._data, bytearray):
+            del self._data[:consumed]
+            self._base = self._cursor
+
+    def get_next_data_with_index(self, clean=True):
+        """
+        Get the next chunk of data from the buffer. By default, it clears all
+        that comes before it.
+
+        @param clean If set to false, do not clear the buffer when fetching the
+            data, but simply return the data block and make no further changes.
+        @return A tuple of (timestamp, data_chunk, start_index, end_index),
+            (None, None, None, None) if no data
+        """
+        return self._get_next(self.data_chunk_list, clean)
+
+    def get_next_non_data_with_index(self, clean=True):
+        """
+        Get the next chunk of non-data from the buffer. By default, it clears
+        all that comes before it.
+
+        @param clean Remove the buffer contents before and including this data
+        @return A tuple of (timestamp, data_chunk, start_index, end_index),
+            (None, None, None, None) if no non-data
+        """
+        return self._get_next(self.nondata_chunk_list, clean)
+
+    def get_next_raw(self, clean=True):
+        """
+        Get the next chunk of raw characters from the buffer, clearing all
+        that comes before it.
+
+        @param clean Remove the buffer contents before and including this data
+        @return A tuple of (timestamp, data_chunk), (None, None) if empty
+        """
+        if not self.raw_chunk_list:
+            return None, None
+
+        (next_start, next_end, next_time) = self.raw_chunk_list[0]
+        next_block = self._slice(next_start, next_end)
+
+        if clean:
+            self.raw_chunk_list.popleft()
+            # keep the same data and non-data list handling as the base class,
+            # this is only used when throwing away everything in the buffer
+            self.data_chunk_list = list(self.data_chunk_list)
+            self._clean_data_list(next_end)
+            self.data_chunk_list = ChunkIndex(self.data_chunk_list)
+            self.nondata_chunk_list = ChunkIndex(self.nondata_chunk_list)
+            self._consume(next_end)
+
+        return next_time, next_block
@@ -16,6 +16,9 @@ import copy
 import ntplib
 import base64
 import logging
+import numpy
+from contextlib import contextmanager
+from itertools import izip
 from warnings import warn
 try:
     import simplejson as json
@@ -59,6 +62,213 @@ class DataParticleValue(BaseEnum):
     INVALID = "invalid"
     QUESTIONABLE = "questionable"
 
+
+class ParticleJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for particle dictionaries, which also encodes NumPy arrays
+    as lists and NumPy scalars as the matching python value
+    """
+
+    def default(self, o):
+        if isinstance(o, numpy.ndarray):
+            return o.tolist()
+        if isinstance(o, numpy.generic):
+            return o.item()
+        return super(ParticleJSONEncoder, self).default(o)
+
+
+# encoders shared by DataParticle.generate()
+_JSON_ENCODER = ParticleJSONEncoder()
+_SORTED_JSON_ENCODER = ParticleJSONEncoder(sort_keys=True)
+
+
+class ParticleSerializer(object):
+    """
+    Serializes batches of particles with a single JSON encoder, either as
+    newline delimited JSON (one particle dictionary per line) or as a JSON
+    array. Each particle dictionary is encoded the same as
+    DataParticle.generate().
+    """
+
+    def __init__(self, sort_keys=False):
+        """
+        @param sort_keys Sort the keys of the particle dictionaries, useful
+           for testing but slower
+        """
+        self._encoder = _SORTED_JSON_ENCODER if sort_keys else _JSON_ENCODER
+
+    def encode(self, particle):
+        """
+        Encode one particle, generating its dictionary if needed
+        @param particle The data particle to encode
+        @retval The JSON string of the particle
+        """
+        particle_dict = particle._dict
+        if not particle_dict:
+            particle_dict = particle.generate_dict()
+        return self._encoder.encode(particle_dict)
+
+    def _samples(self, particles):
+        """
+        Generator of the JSON string of each particle, expanding particle batches
+        """
+        encode = self._encoder.encode
+        for particle in particles:
+            if isinstance(particle, ParticleBatch):
+                for particle_dict in particle.generate_dicts():
+                    yield encode(particle_dict)
+            else:
+                yield self.encode(particle)
+
+    def write_ndjson(self, particles, stream):
+        """
+        Write particles to a stream as newline delimited JSON
+        @param particles An iterable of data particles and particle batches
+        @param stream A file-like object to write to
+        @retval The number of particles written
+        """
+        count = 0
+        write = stream.write
+        for sample in self._samples(particles):
+            write(sample)
+            write('\n')
+            count += 1
+        return count
+
+    def write_array(self, particles, stream):
+        """
+        Write particles to a stream as a single JSON array
+        @param particles An iterable of data particles and particle batches
+        @param stream A file-like object to write to
+        @retval The number of particles written
+        """
+        count = 0
+        write = stream.write
+        write('[')
+        for sample in self._samples(particles):
+            if count:
+                write(', ')
+            write(sample)
+            count += 1
+        write(']')
+        return count
+
+    def to_ndjson(self, particles):
+        """
+        @param particles An iterable of data particles and particle batches
+        @retval A newline delimited JSON string of the particles
+        """
+        return ''.join([sample + '\n' for sample in self._samples(particles)])
+
+    def to_array(self, particles):
+        """
+        @param particles An iterable of data particles and particle batches
+        @retval A JSON array string of the particles
+        """
+        return '[' + ', '.join(self._samples(particles)) + ']'
+
+
+# marks a value which has not been looked up yet in ValueEncoder.encode
+_NO_VALUE = object()
+
+
+class ValueEncoder(object):
+    """
+    Encoder for the values of a particle, compiled once from a list of
+    (name, source, encoding function) tuples. The name is the value id of
+    the encoded value, and the source is the key or index of the value in
+    the record. encode() turns a whole record into the particle values list
+    in one pass, a failure to encode a value is recorded as an encoding
+    error and the value is set to None, the same as
+    DataParticle._encode_value. A sparse encoder leaves the values which
+    are None out of the values list.
+    """
+    __slots__ = ('_fields', '_optional', '_sparse')
+
+    def __init__(self, fields, optional=False, sparse=False):
+        """
+        @param fields An iterable of (name, source, encoding function) tuples
+        @param optional If True a source missing from the record is encoded
+           as a None value without an error, otherwise the lookup error is raised
+        @param sparse If True values which are None, missing or encoded as None,
+           are left out of the values list
+        """
+        self._fields = tuple((name, source, function) for name, source, function in fields)
+        self._optional = optional
+        self._sparse = sparse
+
+    def __len__(self):
+        return len(self._fields)
+
+    @property
+    def sources(self):
+        """
+        The sources of the encoded values, in order
+        """
+        return tuple(source for name, source, function in self._fields)
+
+    def project(self, names=None, sparse=None):
+        """
+        Build an encoder for some of the values of this one
+        @param names The names of the values to keep, in any order, or None to keep them all
+        @param sparse Whether the new encoder is sparse, the same as this one if None
+        @retval A new ValueEncoder
+        """
+        fields = self._fields
+        if names is not None:
+            names = frozenset(names)
+            fields = [field for field in fields if field[0] in names]
+        if sparse is None:
+            sparse = self._sparse
+        return ValueEncoder(fields, optional=self._optional, sparse=sparse)
+
+    def encode(self, record):
+        """
+        Encode the values of a record
+        @param record The record to look the sources up in
+        @retval A tuple of the values list and a list of encoding errors, or
+           None if there were none
+        """
+        optional = self._optional
+        sparse = self._sparse
+        lookup = record.get if optional else record.__getitem__
+        values = []
+        append = values.append
+        errors = None
+        value_id = DataParticleKey.VALUE_ID
+        value_key = DataParticleKey.VALUE
+
+        # a single exception handler covers the whole record, after a value
+        # fails to encode the loop resumes from the next field
+        fields = iter(self._fields)
+        while True:
+            value = _NO_VALUE
+            try:
+                for name, source, function in fields:
+                    value = _NO_VALUE
+                    value = lookup(source)
+                    if value is None and optional:
+                        if not sparse:
+                            append({value_id: name, value_key: None})
+                    else:
+                        encoded = function(value)
+                        if encoded is not None or not sparse:
+                            append({value_id: name, value_key: encoded})
+                break
+            except Exception:
+                if value is _NO_VALUE:
+                    # the lookup failed, not the encoding
+                    raise
+                log.error("Data particle error encoding. Name:%s Value:%s", name, value)
+                if errors is None:
+                    errors = []
+                errors.append({name: value})
+                if not sparse:
+                    append({value_id: name, value_key: None})
+
+        return values, errors
+
+
 class DataParticle(object):
     """
     This class is responsible for storing and ultimately generating data
@@ -69,7 +279,22 @@ class DataParticle(object):
     It is the intent that this class is subclassed as needed if an instrument must
     modify fields in the outgoing packet. The hope is to have most of the superclass
     code be called by the child class with just values overridden as needed.
+
+    Particles are slotted, the header fields that are the same in every
+    particle are shared through the class header template. A subclass only
+    carries no per instance dictionary if it and every class between it and
+    DataParticle declare __slots__, empty or with the names of the attributes
+    they set, otherwise it gets a dictionary like any other class.
     """
+    __slots__ = ('contents', 'raw_data', '_dict', '_encoding_errors')
+
+    # header fields that do not change between particles, merged into the
+    # base structure when the particle is generated
+    _header_template = ((DataParticleKey.PKT_FORMAT_ID, DataParticleValue.JSON_DATA),
+                        (DataParticleKey.PKT_VERSION, 1))
+
+    # driver timestamp shared by all particles built inside a batch
+    _batch_driver_timestamp = None
 
     # data particle type is intended to be defined in each derived data particle class.  This value should be unique
     # for all data particles.  Best practice is to access this variable using the accessor method:
@@ -89,16 +314,19 @@ class DataParticle(object):
         if new_sequence is not None and not isinstance(new_sequence, bool):
             raise TypeError("new_sequence is not a bool")
 
+        driver_timestamp = DataParticle._batch_driver_timestamp
+        if driver_timestamp is None:
+            driver_timestamp = ntplib.system_to_ntp_time(time.time())
+
         self.contents = {
-            DataParticleKey.PKT_FORMAT_ID: DataParticleValue.JSON_DATA,
-            DataParticleKey.PKT_VERSION: 1,
             DataParticleKey.PORT_TIMESTAMP: port_timestamp,
             DataParticleKey.INTERNAL_TIMESTAMP: internal_timestamp,
-            DataParticleKey.DRIVER_TIMESTAMP: ntplib.system_to_ntp_time(time.time()),
+            DataParticleKey.DRIVER_TIMESTAMP: driver_timestamp,
             DataParticleKey.PREFERRED_TIMESTAMP: preferred_timestamp,
             DataParticleKey.QUALITY_FLAG: quality_flag,
         }
-        self._encoding_errors = []
+        # only allocated once there is an encoding error
+        self._encoding_errors = None
         if new_sequence is not None:
             self.contents[DataParticleKey.NEW_SEQUENCE] = new_sequence
 
@@ -111,6 +339,10 @@ class DataParticle(object):
         data, timestamp, they are the same enough for this particle
         """
         allowed_diff = .000001
+        if self.raw_data is None or arg.raw_data is None:
+            # raw data has been released, compare the generated values instead
+            return self._released_eq(arg, allowed_diff)
+
         if ((self.raw_data == arg.raw_data) and \
             (abs(self.contents[DataParticleKey.INTERNAL_TIMESTAMP] - \
                  arg.contents[DataParticleKey.INTERNAL_TIMESTAMP]) <= allowed_diff)):
@@ -125,6 +357,47 @@ class DataParticle(object):
                           arg.contents[DataParticleKey.INTERNAL_TIMESTAMP])
             return False
 
+    def _released_eq(self, arg, allowed_diff):
+        """
+        Equality check for particles whose raw data has been released, using
+        the generated values and internal timestamp
+        """
+        if self._dict is None:
+            self.generate_dict()
+        if arg._dict is None:
+            arg.generate_dict()
+
+        if self._dict[DataParticleKey.VALUES] != arg._dict[DataParticleKey.VALUES]:
+            log.debug('Values do not match')
+            return False
+
+        timestamp = self.contents[DataParticleKey.INTERNAL_TIMESTAMP]
+        arg_timestamp = arg.contents[DataParticleKey.INTERNAL_TIMESTAMP]
+        if timestamp is None or arg_timestamp is None:
+            return timestamp == arg_timestamp
+        if abs(timestamp - arg_timestamp) > allowed_diff:
+            log.debug('Timestamp %s does not match %s', timestamp, arg_timestamp)
+            return False
+        return True
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """
+        Context in which every particle built gets the same driver timestamp,
+        so the clock is only read once for a batch of particles. Nested
+        batches keep the timestamp of the outermost batch.
+        """
+        if DataParticle._batch_driver_timestamp is not None:
+            yield
+            return
+
+        DataParticle._batch_driver_timestamp = ntplib.system_to_ntp_time(time.time())
+        try:
+            yield
+        finally:
+            DataParticle._batch_driver_timestamp = None
+
     @classmethod
     def type(cls):
         """
@@ -173,7 +446,9 @@ class DataParticle(object):
         @raises NotImplementedException If there is an invalid id
         """
         if DataParticleKey.has(id):
-            return self.contents[id]
+            if id in self.contents:
+                return self.contents[id]
+            return dict(self._header_template)[id]
         else:
             raise NotImplementedException("Value %s not available in particle!", id)
 
@@ -204,12 +479,16 @@ class DataParticle(object):
         #    if  not self._check_timestamp(self.contents[time]):
         #        raise SampleException("Invalid port agent timestamp in raw packet")
 
+        # the raw data has been released, the dictionary can not be built again
+        if self.raw_data is None and self._dict:
+            return self._dict
+
         # verify preferred timestamp exists in the structure...
         if not self._check_preferred_timestamps():
             raise SampleException("Preferred timestamp not in particle!")
 
         # build response structure
-        self._encoding_errors = []
+        self._encoding_errors = None
         values = self._build_parsed_values()
         result = self._build_base_structure()
         result[DataParticleKey.STREAM_NAME] = self.data_particle_type()
@@ -234,9 +513,20 @@ class DataParticle(object):
         """
         if not self._dict:
             self.generate_dict()
-        json_result = json.dumps(self._dict, sort_keys=sorted)
+        encoder = _SORTED_JSON_ENCODER if sorted else _JSON_ENCODER
+        json_result = encoder.encode(self._dict)
         return json_result
 
+    def release_raw_data(self):
+        """
+        Generate the particle dictionary if it has not been yet, then drop the
+        raw data so it does not stay in memory while the particle is buffered.
+        generate_dict() and generate() keep returning the same output.
+        """
+        if not self._dict:
+            self.generate_dict()
+        self.raw_data = None
+
     def _build_parsed_values(self):
         """
         Build values of a parsed structure. Just the values are built so
@@ -256,7 +546,8 @@ class DataParticle(object):
 
         @return A fresh copy of a core structure to be exported
         """
-        result = dict(self.contents)
+        result = dict(self._header_template)
+        result.update(self.contents)
         # clean out optional fields that were missing
         if not self.contents[DataParticleKey.PORT_TIMESTAMP]:
             del result[DataParticleKey.PORT_TIMESTAMP]
@@ -313,14 +604,36 @@ class DataParticle(object):
             encoded_val = encoding_function(value)
         except Exception as e:
             log.error("Data particle error encoding. Name:%s Value:%s", name, value)
+            if self._encoding_errors is None:
+                self._encoding_errors = []
             self._encoding_errors.append({name: value})
         return {DataParticleKey.VALUE_ID: name,
                 DataParticleKey.VALUE: encoded_val}
 
+    def _encode_values(self, value_encoder, record=None):
+        """
+        Encode a whole record with a compiled ValueEncoder, storing any errors
+        in the encoding errors
+        @param value_encoder The ValueEncoder for this particle
+        @param record The record to encode, the raw data if not given
+        @retval The values list
+        """
+        if record is None:
+            record = self.raw_data
+
+        values, errors = value_encoder.encode(record)
+        if errors:
+            if self._encoding_errors is None:
+                self._encoding_errors = []
+            self._encoding_errors.extend(errors)
+        return values
+
     def get_encoding_errors(self):
         """
         Return the encoding errors list
         """
+        if self._encoding_errors is None:
+            return []
         return self._encoding_errors
 
 class RawDataParticleKey(BaseEnum):
@@ -396,3 +709,105 @@ class RawDataParticle(DataParticle):
         ]
 
         return result
+
+
+class ParticleBatch(object):
+    """
+    Columnar batch of particles from a fixed schema stream. The values are a
+    NumPy structured array with one row per particle and one field per
+    particle value, in value order, with the timestamps of each row held in
+    arrays alongside. Rows are only expanded into particle dictionaries, the
+    same as DataParticle.generate_dict() builds, when a consumer needs them.
+    """
+
+    def __init__(self, stream_name, values, internal_timestamps,
+                 port_timestamps=None,
+                 preferred_timestamp=DataParticleKey.INTERNAL_TIMESTAMP,
+                 quality_flag=DataParticleValue.OK):
+        """
+        @param stream_name The data particle type of every particle in the batch
+        @param values A NumPy structured array of the particle values
+        @param internal_timestamps The NTP internal timestamp of each row
+        @param port_timestamps The NTP port timestamp of each row, or None
+        @param preferred_timestamp The preferred timestamp key of the particles
+        @param quality_flag The quality flag of the particles
+        @throws SampleException if the values are not a structured array or
+           the timestamps do not match the number of rows
+        """
+        if values.dtype.names is None:
+            raise SampleException("Particle batch values must be a structured array")
+        internal_timestamps = numpy.asarray(internal_timestamps, dtype=numpy.float64)
+        if len(internal_timestamps) != len(values):
+            raise SampleException("Particle batch has %d rows but %d internal timestamps" %
+                                  (len(values), len(internal_timestamps)))
+        if port_timestamps is not None:
+            port_timestamps = numpy.asarray(port_timestamps, dtype=numpy.float64)
+            if len(port_timestamps) != len(values):
+                raise SampleException("Particle batch has %d rows but %d port timestamps" %
+                                      (len(values), len(port_timestamps)))
+
+        driver_timestamp = DataParticle._batch_driver_timestamp
+        if driver_timestamp is None:
+            driver_timestamp = ntplib.system_to_ntp_time(time.time())
+
+        self.stream_name = stream_name
+        self.values = values
+        self.internal_timestamps = internal_timestamps
+        self.port_timestamps = port_timestamps
+        self.preferred_timestamp = preferred_timestamp
+        self.quality_flag = quality_flag
+        self.driver_timestamp = driver_timestamp
+
+    def __len__(self):
+        return len(self.values)
+
+    def type(self):
+        """
+        return the data particle type of the particles in the batch
+        """
+        return self.stream_name
+
+    def generate_dicts(self):
+        """
+        Expand the batch into one particle dictionary per row. The values are
+        converted to python types a column at a time.
+        @retval A list of particle dictionaries
+        """
+        header = dict(DataParticle._header_template)
+        header[DataParticleKey.DRIVER_TIMESTAMP] = self.driver_timestamp
+        header[DataParticleKey.PREFERRED_TIMESTAMP] = self.preferred_timestamp
+        header[DataParticleKey.QUALITY_FLAG] = self.quality_flag
+        header[DataParticleKey.STREAM_NAME] = self.stream_name
+
+        names = self.values.dtype.names
+        columns = [self.values[name].tolist() for name in names]
+        internal_timestamps = self.internal_timestamps.tolist()
+        if self.port_timestamps is None:
+            port_timestamps = [None] * len(self.values)
+        else:
+            port_timestamps = self.port_timestamps.tolist()
+
+        value_id = DataParticleKey.VALUE_ID
+        value_key = DataParticleKey.VALUE
+        result = []
+        for row, internal_timestamp, port_timestamp in izip(izip(*columns), internal_timestamps, port_timestamps):
+            particle_dict = dict(header)
+            # optional timestamps are left out when missing, as in DataParticle
+            if internal_timestamp:
+                particle_dict[DataParticleKey.INTERNAL_TIMESTAMP] = internal_timestamp
+            if port_timestamp:
+                particle_dict[DataParticleKey.PORT_TIMESTAMP] = port_timestamp
+            particle_dict[DataParticleKey.VALUES] = [{value_id: name, value_key: value}
+                                                     for name, value in izip(names, row)]
+            result.append(particle_dict)
+        return result
+
+    def generate_samples(self, sorted=False):
+        """
+        Expand the batch into the JSON string of each particle, as
+        DataParticle.generate() would encode it
+        @param sorted Sort the keys of the particle dictionaries
+        @retval A list of JSON strings
+        """
+        encode = (_SORTED_JSON_ENCODER if sorted else _JSON_ENCODER).encode
+        return [encode(particle_dict) for particle_dict in self.generate_dicts()]
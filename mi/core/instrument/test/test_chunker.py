@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+"""
+@package mi.core.instrument.test.test_chunker
+@file mi/core/instrument/test/test_chunker.py
+@brief Test code for the chunker buffer engines
+"""
+__license__ = 'Apache 2.0'
+
+import mmap
+import re
+import tempfile
+from functools import partial
+
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.core.instrument.chunker import Chunker, StringChunker, BufferChunker, ChunkIndex
+
+SAMPLE_REGEX = re.compile(r'AB[0-9]{3}\n')
+SAMPLE_SIEVE = partial(Chunker.regex_sieve_function, regex_list=[SAMPLE_REGEX])
+
+
+@attr('UNIT', group='mi')
+class ChunkIndexUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.index = ChunkIndex([(0, 5, 1.0), (5, 10, 2.0), (12, 20, 3.0)])
+
+    def test_list_interface(self):
+        """
+        The index behaves like the list of tuples it replaces
+        """
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index[0], (0, 5, 1.0))
+        self.assertEqual(self.index[-1], (12, 20, 3.0))
+        self.assertEqual(list(self.index), [(0, 5, 1.0), (5, 10, 2.0), (12, 20, 3.0)])
+        self.assertEqual(self.index.popleft(), (0, 5, 1.0))
+        self.assertEqual(self.index, [(5, 10, 2.0), (12, 20, 3.0)])
+        self.assertFalse(ChunkIndex())
+
+    def test_lookup(self):
+        """
+        Offsets map to the chunk holding them, or the next chunk after them
+        """
+        self.assertEqual(self.index.timestamp_at(0), 1.0)
+        self.assertEqual(self.index.timestamp_at(5), 2.0)
+        self.assertEqual(self.index.timestamp_at(10), 3.0)
+        self.assertIsNone(self.index.timestamp_at(20))
+        self.assertEqual(self.index.find_end(10), 1)
+        self.assertEqual(self.index.find(10), 2)
+
+    def test_trim(self):
+        """
+        Trimming drops consumed chunks and clips the straddling chunk
+        """
+        self.index.trim(7)
+        self.assertEqual(self.index, [(7, 10, 2.0), (12, 20, 3.0)])
+        self.index.trim(10)
+        self.assertEqual(self.index, [(12, 20, 3.0)])
+
+    def test_merge(self):
+        """
+        Chunks can be extended or removed by start offset
+        """
+        self.index.set_end(1, 15)
+        self.assertEqual(self.index, [(0, 5, 1.0), (5, 15, 2.0)])
+        self.index.remove_start(5)
+        self.assertEqual(self.index, [(0, 5, 1.0)])
+        self.index.remove_start(3)
+        self.assertEqual(self.index, [(0, 5, 1.0)])
+
+    def test_many_chunks(self):
+        """
+        Consuming a large index from the front keeps lookups correct
+        """
+        index = ChunkIndex((i * 2, i * 2 + 2, float(i)) for i in xrange(10000))
+        for i in xrange(5000):
+            index.trim(i * 2 + 2)
+            self.assertEqual(index.timestamp_at(i * 2 + 3), float(i + 1))
+        self.assertEqual(len(index), 5000)
+        self.assertEqual(index[0], (10000, 10002, 5000.0))
+
+
+@attr('UNIT', group='mi')
+class BufferChunkerUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.chunker = BufferChunker(SAMPLE_SIEVE)
+
+    def test_fragment(self):
+        """
+        A sample split across several chunks is only reported once it is complete
+        """
+        self.chunker.add_chunk('AB1', 1.0)
+        self.assertEqual(self.chunker.get_next_data(), (None, None))
+        self.chunker.add_chunk('2', 2.0)
+        self.chunker.add_chunk('3\n', 3.0)
+        self.assertEqual(self.chunker.get_next_data(), (1.0, 'AB123\n'))
+        self.assertEqual(self.chunker.get_next_data(), (None, None))
+
+    def test_data_and_non_data(self):
+        """
+        Data and non-data come back with indices relative to the unread buffer
+        """
+        self.chunker.add_chunk('xxAB123\nyyyAB456\nzz', 1.0)
+
+        self.assertEqual(self.chunker.get_next_non_data_with_index(clean=False), (1.0, 'xx', 0, 2))
+        self.assertEqual(self.chunker.get_next_data_with_index(), (1.0, 'AB123\n', 2, 8))
+        self.assertEqual(self.chunker.get_next_non_data_with_index(clean=False), (1.0, 'yyy', 0, 3))
+        self.assertEqual(self.chunker.get_next_data_with_index(), (1.0, 'AB456\n', 3, 9))
+        # trailing bytes after the last sample are held until more data arrives
+        self.assertEqual(self.chunker.get_next_non_data_with_index(), (None, None, None, None))
+        self.assertEqual(self.chunker.buffer, 'zz')
+
+    def test_compaction(self):
+        """
+        Consumed data is dropped from the buffer once enough has built up
+        """
+        self.chunker.COMPACT_THRESHOLD = 12
+        for i in xrange(10):
+            self.chunker.add_chunk('AB%03d\n' % i, float(i))
+
+        for i in xrange(10):
+            self.assertEqual(self.chunker.get_next_data(), (float(i), 'AB%03d\n' % i))
+
+        self.assertEqual(self.chunker.buffer, '')
+        self.assertEqual(len(self.chunker._data), 0)
+        self.assertEqual(self.chunker._base, 60)
+
+    def test_matches_string_chunker(self):
+        """
+        Feed the same fragmented stream through both engines and compare every
+        result along the way
+        """
+        string_chunker = StringChunker(SAMPLE_SIEVE)
+        self.chunker.COMPACT_THRESHOLD = 8
+
+        stream = 'AB123\nxxAB1' + '23\nA' + 'B999\nzzz\n' + 'AB' + '000\n' + 'q' * 30 + 'AB111\n'
+        for index in xrange(0, len(stream), 5):
+            chunk = stream[index:index + 5]
+            string_chunker.add_chunk(chunk, float(index))
+            self.chunker.add_chunk(chunk, float(index))
+
+            self.assertEqual(string_chunker.get_next_non_data_with_index(clean=False),
+                             self.chunker.get_next_non_data_with_index(clean=False))
+            self.assertEqual(string_chunker.get_next_data_with_index(),
+                             self.chunker.get_next_data_with_index())
+            self.assertEqual(string_chunker.buffer, self.chunker.buffer)
+
+        string_chunker.clean_all_chunks()
+        self.chunker.clean_all_chunks()
+        self.assertEqual(string_chunker.buffer, self.chunker.buffer)
+
+    def test_resumable_sieve(self):
+        """
+        A resumable sieve is only handed the data past its restart index
+        """
+        sieve_input = []
+
+        def line_sieve(raw_data):
+            sieve_input.append(raw_data)
+            return Chunker.line_sieve_function(raw_data, regex_list=[SAMPLE_REGEX])
+
+        chunker = BufferChunker(line_sieve)
+        chunker.add_chunk('junk line\nmore', 1.0)
+        chunker.add_chunk(' junk\nAB1', 2.0)
+        chunker.add_chunk('23\n', 3.0)
+
+        self.assertEqual(sieve_input, ['junk line\nmore', 'more junk\nAB1', 'AB123\n'])
+        self.assertEqual(chunker.get_next_non_data_with_index(clean=False),
+                         (1.0, 'junk line\nmore junk\n', 0, 20))
+        self.assertEqual(chunker.get_next_data_with_index(), (2.0, 'AB123\n', 20, 26))
+
+    def test_read_only_data(self):
+        """
+        A mapped file is held and sieved in place, and only copied if more data follows it
+        """
+        sieve_input = []
+
+        def sieve(raw_data):
+            sieve_input.append(raw_data)
+            return SAMPLE_SIEVE(raw_data)
+
+        with tempfile.TemporaryFile() as stream_handle:
+            stream_handle.write('xxAB123\nyyAB4')
+            stream_handle.flush()
+            mapped = mmap.mmap(stream_handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+            chunker = BufferChunker(sieve)
+            chunker.add_chunk(buffer(mapped, 2), 1.0)
+            self.assertIsInstance(chunker._data, buffer)
+            self.assertIsInstance(sieve_input[-1], buffer)
+            self.assertEqual(chunker.get_next_data_with_index(), (1.0, 'AB123\n', 0, 6))
+
+            chunker.add_chunk('56\n', 2.0)
+            self.assertIsInstance(chunker._data, bytearray)
+            self.assertEqual(sieve_input[-1], 'yyAB456\n')
+            self.assertEqual(chunker.get_next_non_data(), (1.0, 'yy'))
+            self.assertEqual(chunker.get_next_data(), (1.0, 'AB456\n'))
+
+            chunker.add_chunk(mapped, 3.0)
+            self.assertIsInstance(chunker._data, buffer)
+            self.assertEqual(chunker.get_next_data_with_index(), (3.0, 'AB123\n', 2, 8))
+            mapped.close()
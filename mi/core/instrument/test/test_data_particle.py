@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+
+"""
+@package mi.core.instrument.test.test_data_particle
+@file mi/core/instrument/test/test_data_particle.py
+@brief Test code for the base data particle
+"""
+__license__ = 'Apache 2.0'
+
+import json
+from StringIO import StringIO
+
+import numpy
+
+from nose.plugins.attrib import attr
+
+from mi.core.exceptions import SampleException
+from mi.core.unit_test import MiUnitTest
+from mi.core.instrument.data_particle import DataParticle, DataParticleKey, DataParticleValue, ValueEncoder, \
+    ParticleSerializer, ParticleBatch
+
+
+class SampleParticle(DataParticle):
+    """
+    Particle with a single integer value
+    """
+    __slots__ = ()
+
+    _data_particle_type = 'sample'
+
+    def _build_parsed_values(self):
+        return [self._encode_value('value', self.raw_data, int)]
+
+
+class MappedParticle(DataParticle):
+    """
+    Particle encoding a list of strings with a particle map
+    """
+    __slots__ = ()
+
+    _data_particle_type = 'mapped'
+    _value_encoder = ValueEncoder([('a', 0, int), ('b', 1, float), ('c', 2, int)])
+
+    def _build_parsed_values(self):
+        return self._encode_values(self._value_encoder)
+
+
+class ArrayParticle(DataParticle):
+    """
+    Particle with NumPy values
+    """
+    __slots__ = ()
+
+    _data_particle_type = 'array'
+
+    def _build_parsed_values(self):
+        return [{DataParticleKey.VALUE_ID: 'array', DataParticleKey.VALUE: numpy.array(self.raw_data)},
+                {DataParticleKey.VALUE_ID: 'scalar', DataParticleKey.VALUE: numpy.int16(self.raw_data[0][0])}]
+
+
+@attr('UNIT', group='mi')
+class ValueEncoderUnitTest(MiUnitTest):
+
+    def test_encode(self):
+        """
+        The encoded values match encoding each value with _encode_value
+        """
+        particle = MappedParticle(['1', '2.5', '3'])
+        expected = [particle._encode_value(name, particle.raw_data[source], function)
+                    for name, source, function in MappedParticle._value_encoder._fields]
+
+        self.assertEqual(particle._build_parsed_values(), expected)
+        self.assertEqual(particle.get_encoding_errors(), [])
+
+    def test_encoding_errors(self):
+        """
+        A value that fails to encode is None, and the rest are still encoded
+        """
+        particle = MappedParticle(['x', '2.5', 'y'])
+
+        self.assertEqual(particle._build_parsed_values(),
+                         [{DataParticleKey.VALUE_ID: 'a', DataParticleKey.VALUE: None},
+                          {DataParticleKey.VALUE_ID: 'b', DataParticleKey.VALUE: 2.5},
+                          {DataParticleKey.VALUE_ID: 'c', DataParticleKey.VALUE: None}])
+        self.assertEqual(particle.get_encoding_errors(), [{'a': 'x'}, {'c': 'y'}])
+
+    def test_missing_source(self):
+        """
+        A missing source is raised unless the encoder is optional
+        """
+        self.assertRaises(IndexError, MappedParticle(['1', '2.5'])._build_parsed_values)
+
+        encoder = ValueEncoder([('a', 'a', int), ('b', 'b', int)], optional=True)
+        self.assertEqual(encoder.encode({'a': '1'}),
+                         ([{DataParticleKey.VALUE_ID: 'a', DataParticleKey.VALUE: 1},
+                           {DataParticleKey.VALUE_ID: 'b', DataParticleKey.VALUE: None}], None))
+
+    def test_project(self):
+        """
+        A projected encoder keeps the named values in the original order, and a sparse one leaves out the
+        values which are None
+        """
+        encoder = ValueEncoder([('a', 'a', int), ('b', 'b', int), ('c', 'c', lambda value: None)], optional=True)
+
+        projected = encoder.project(['c', 'a'])
+        self.assertEqual(projected.sources, ('a', 'c'))
+        self.assertEqual(projected.encode({'a': '1'}),
+                         ([{DataParticleKey.VALUE_ID: 'a', DataParticleKey.VALUE: 1},
+                           {DataParticleKey.VALUE_ID: 'c', DataParticleKey.VALUE: None}], None))
+
+        sparse = encoder.project(sparse=True)
+        self.assertEqual(len(sparse), 3)
+        self.assertEqual(sparse.encode({'a': '1', 'c': '3'}),
+                         ([{DataParticleKey.VALUE_ID: 'a', DataParticleKey.VALUE: 1}], None))
+        self.assertEqual(sparse.encode({'a': 'x', 'b': '2'}),
+                         ([{DataParticleKey.VALUE_ID: 'b', DataParticleKey.VALUE: 2}], [{'a': 'x'}]))
+
+
+@attr('UNIT', group='mi')
+class DataParticleUnitTest(MiUnitTest):
+
+    def test_slots(self):
+        """
+        A subclass declaring empty slots has no instance dictionary
+        """
+        particle = SampleParticle('1', internal_timestamp=3600.0)
+        self.assertFalse(hasattr(particle, '__dict__'))
+
+    def test_generate_dict(self):
+        """
+        The header template is merged into the generated structure
+        """
+        particle = SampleParticle('1', internal_timestamp=3600.0,
+                                  preferred_timestamp=DataParticleKey.INTERNAL_TIMESTAMP)
+        result = particle.generate_dict()
+
+        self.assertEqual(result[DataParticleKey.PKT_FORMAT_ID], DataParticleValue.JSON_DATA)
+        self.assertEqual(result[DataParticleKey.PKT_VERSION], 1)
+        self.assertEqual(result[DataParticleKey.STREAM_NAME], 'sample')
+        self.assertEqual(result[DataParticleKey.INTERNAL_TIMESTAMP], 3600.0)
+        self.assertEqual(result[DataParticleKey.QUALITY_FLAG], DataParticleValue.OK)
+        self.assertEqual(result[DataParticleKey.VALUES],
+                         [{DataParticleKey.VALUE_ID: 'value', DataParticleKey.VALUE: 1}])
+        self.assertNotIn(DataParticleKey.PORT_TIMESTAMP, result)
+        self.assertEqual(particle.get_value(DataParticleKey.PKT_VERSION), 1)
+        self.assertEqual(json.loads(particle.generate()), result)
+        self.assertEqual(particle.get_encoding_errors(), [])
+
+    def test_encoding_errors(self):
+        particle = SampleParticle('x', internal_timestamp=3600.0)
+        particle.generate_dict()
+        self.assertEqual(particle.get_encoding_errors(), [{'value': 'x'}])
+
+    def test_batch(self):
+        """
+        Particles built in the same batch share a driver timestamp
+        """
+        with DataParticle.batch():
+            first = SampleParticle('1')
+            with DataParticle.batch():
+                second = SampleParticle('2')
+
+        self.assertEqual(first.get_value(DataParticleKey.DRIVER_TIMESTAMP),
+                         second.get_value(DataParticleKey.DRIVER_TIMESTAMP))
+        self.assertIsNone(DataParticle._batch_driver_timestamp)
+
+    def test_release_raw_data(self):
+        """
+        Releasing the raw data keeps the generated output and equality
+        """
+        particle = SampleParticle('1', internal_timestamp=3600.0)
+        expected = SampleParticle('1', internal_timestamp=3600.0)
+        result = particle.generate_dict()
+
+        particle.release_raw_data()
+
+        self.assertIsNone(particle.raw_data)
+        self.assertEqual(particle.generate_dict(), result)
+        self.assertEqual(particle, expected)
+        self.assertFalse(particle == SampleParticle('2', internal_timestamp=3600.0))
+
+
+@attr('UNIT', group='mi')
+class ParticleSerializerUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.particles = [SampleParticle(str(value), internal_timestamp=3600.0) for value in range(3)]
+
+    def test_ndjson(self):
+        """
+        Each particle is written on its own line, as generate() encodes it
+        """
+        serializer = ParticleSerializer(sort_keys=True)
+        stream = StringIO()
+
+        self.assertEqual(serializer.write_ndjson(self.particles, stream), 3)
+        self.assertEqual(stream.getvalue(), ''.join(particle.generate(sorted=True) + '\n'
+                                                    for particle in self.particles))
+        self.assertEqual(serializer.to_ndjson(self.particles), stream.getvalue())
+
+    def test_array(self):
+        serializer = ParticleSerializer()
+        stream = StringIO()
+
+        self.assertEqual(serializer.write_array(self.particles, stream), 3)
+        self.assertEqual(json.loads(stream.getvalue()), [particle.generate_dict() for particle in self.particles])
+        self.assertEqual(serializer.to_array(self.particles), stream.getvalue())
+        self.assertEqual(serializer.to_array([]), '[]')
+
+    def test_numpy(self):
+        """
+        NumPy arrays and scalars are encoded without converting them first
+        """
+        particle = ArrayParticle([[1, 2], [3, 4]], internal_timestamp=3600.0)
+        values = json.loads(ParticleSerializer().encode(particle))[DataParticleKey.VALUES]
+
+        self.assertEqual(values, [{DataParticleKey.VALUE_ID: 'array', DataParticleKey.VALUE: [[1, 2], [3, 4]]},
+                                  {DataParticleKey.VALUE_ID: 'scalar', DataParticleKey.VALUE: 1}])
+
+
+@attr('UNIT', group='mi')
+class ParticleBatchUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.values = numpy.array([(1, 2.5, (1, 2)), (2, 3.5, (3, 4))],
+                                  dtype=[('a', 'i4'), ('b', 'f8'), ('c', 'i2', (2,))])
+
+    def test_generate_dicts(self):
+        """
+        Each row expands to the dictionary a particle of the stream generates
+        """
+        with DataParticle.batch():
+            batch = ParticleBatch('mapped', self.values, [3600.0, 0.0])
+            particle = MappedParticle(['1', '2.5', '3'], internal_timestamp=3600.0,
+                                      preferred_timestamp=DataParticleKey.INTERNAL_TIMESTAMP)
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.type(), 'mapped')
+
+        result = batch.generate_dicts()
+        expected = particle.generate_dict()
+        expected[DataParticleKey.VALUES][2][DataParticleKey.VALUE] = [1, 2]
+        self.assertEqual(result[0], expected)
+        self.assertNotIn(DataParticleKey.INTERNAL_TIMESTAMP, result[1])
+        self.assertEqual(result[1][DataParticleKey.VALUES][2][DataParticleKey.VALUE], [3, 4])
+        self.assertEqual([json.loads(sample) for sample in batch.generate_samples()], result)
+
+    def test_serializer(self):
+        """
+        The serializer expands batches among particles
+        """
+        batch = ParticleBatch('mapped', self.values, [3600.0, 3600.0])
+        particle = SampleParticle('1', internal_timestamp=3600.0)
+
+        self.assertEqual(len(ParticleSerializer().to_ndjson([particle, batch]).splitlines()), 3)
+
+    def test_bad_batch(self):
+        self.assertRaises(SampleException, ParticleBatch, 'mapped', numpy.arange(2), [0.0, 0.0])
+        self.assertRaises(SampleException, ParticleBatch, 'mapped', self.values, [0.0])
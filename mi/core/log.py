@@ -23,7 +23,6 @@ to create a logger automatically scoped with the calling package and ready to us
     from ooi.logging import log    # no longer need get_logger at all
 
 """
-import inspect
 import logging
 import os
 import sys
@@ -36,6 +35,8 @@ from mi.core.common import Singleton
 from mi.logging import config, log
 
 LOGGING_CONFIG_ENVIRONMENT_VARIABLE="MI_LOGGING_CONFIG"
+METHOD_LOGGING_ENVIRONMENT_VARIABLE="MI_METHOD_LOGGING"
+METHOD_LOGGING_OFF=('off', 'false', '0')
 
 LOGGING_PRIMARY_FROM_FILE='res/config/mi-logging.yml'
 LOGGING_PRIMARY_FROM_EGG='mi-logging.yml'
@@ -78,9 +79,21 @@ class LoggerManager(Singleton):
                 print >> sys.stderr, str(os.getpid()) + ' supplemented logging from ' + LOGGING_CONTAINER_OVERRIDE
 
 
+def method_logging_enabled():
+    """
+    Method logging is switched off, for production, by setting the environment
+    variable MI_METHOD_LOGGING to "off". The logging metaclass and log_method
+    then leave methods unwrapped, so they cost nothing.
+    """
+    return os.environ.get(METHOD_LOGGING_ENVIRONMENT_VARIABLE, '').lower() not in METHOD_LOGGING_OFF
+
+
 def get_logging_metaclass(log_level='trace'):
     class LoggingMetaClass(type):
         def __new__(mcs, class_name, bases, class_dict):
+            if not method_logging_enabled():
+                return type.__new__(mcs, class_name, bases, class_dict)
+
             wrapper = log_method(class_name=class_name, log_level=log_level)
             new_class_dict = {}
             for attributeName, attribute in class_dict.items():
@@ -92,16 +105,19 @@ def get_logging_metaclass(log_level='trace'):
 
 
 def log_method(class_name=None, log_level='trace'):
+    if not method_logging_enabled():
+        return lambda func: func
+
     name = "UNKNOWN_MODULE_NAME"
-    stack = inspect.stack()
     # step through the stack until we leave mi.core.log
-    for frame in stack:
-        module = inspect.getmodule(frame[0])
-        if module:
-            name = module.__name__
-            if name != 'mi.core.log':
-                break
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_globals.get('__name__', name)
+        if name != 'mi.core.log':
+            break
+        frame = frame.f_back
     logger = logging.getLogger(name)
+    level = getattr(logging, log_level.upper())
 
     def wrapper(func):
         if class_name is not None:
@@ -111,9 +127,12 @@ def log_method(class_name=None, log_level='trace'):
 
         @wraps(func)
         def inner(*args, **kwargs):
-            getattr(logger, log_level)('entered %s | args: %r | kwargs: %r', func_name, args, kwargs)
+            # check the level once, so a disabled level costs a single check
+            if not logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+            logger.log(level, 'entered %s | args: %r | kwargs: %r', func_name, args, kwargs)
             r = func(*args, **kwargs)
-            getattr(logger, log_level)('exiting %s | returning %r', func_name, r)
+            logger.log(level, 'exiting %s | returning %r', func_name, r)
             return r
         return inner
 
@@ -121,4 +140,12 @@ def log_method(class_name=None, log_level='trace'):
 
 
 def get_logger():
-    return log
+    """
+    Called at module level this returns the scoped logger, which installs the
+    module's logger as "module.log" the first time it is used. Called inside a
+    function it returns the module's real logger, so each log call does not
+    have to find the calling module again.
+    """
+    if sys._getframe(1).f_code.co_name == '<module>':
+        return log
+    return log._caller_logger()
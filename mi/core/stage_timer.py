@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+"""
+@package mi.core.stage_timer
+@file mi/core/stage_timer.py
+@brief Opt-in timing of the stages of parsing a file
+
+The parsers, chunker and dataset driver mark the stages they run with
+StageTimer.stage(). While no StageTimer is active this returns a shared
+context manager which does nothing, so the marks can stay in place on
+production nodes. They are placed around reads, sieve calls and batches of
+particles rather than single particles to keep that cost out of the per
+particle path. While a StageTimer is active it collects the wall time, CPU
+time and number of calls of each stage. A stage's times exclude the stages
+nested inside it.
+
+Timing a driver run is switched on by setting the MI_STAGE_TIMING environment
+variable to "log", to log the summary when the run finishes, or to the path
+of a file the summary is appended to as a line of JSON. It can also be
+collected around any code with:
+
+    with StageTimer() as timer:
+        parse(...)
+    timer.summary()
+"""
+
+# mi.core.time would otherwise be imported in place of the time module
+from __future__ import absolute_import
+
+__license__ = 'Apache 2.0'
+
+import json
+import os
+import time
+
+from mi.core.common import BaseEnum
+from mi.core.log import get_logger
+log = get_logger()
+
+STAGE_TIMING_ENVIRONMENT_VARIABLE = 'MI_STAGE_TIMING'
+
+# MI_STAGE_TIMING value which logs the summary instead of writing it to a file
+LOG_DESTINATION = 'log'
+
+
+class Stage(BaseEnum):
+    """
+    The stages of parsing a file
+    """
+    # reading the file
+    READ = 'read'
+    # running the sieve function over the chunker buffer
+    SIEVE = 'sieve'
+    # the rest of the parser get_records() call, building the particles
+    BUILD = 'build'
+    # generating the JSON of the particles
+    ENCODE = 'encode'
+    # handing the generated particles to the particle data handler
+    PUBLISH = 'publish'
+
+
+class _NoTiming(object):
+    """
+    Context manager used for stages while timing is disabled
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NO_TIMING = _NoTiming()
+
+
+class _StageTiming(object):
+    """
+    Context manager timing one call of a stage
+    """
+    __slots__ = ('_timer', '_name')
+
+    def __init__(self, timer, name):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._timer._enter(self._name)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._timer._exit()
+        return False
+
+
+class StageTimer(object):
+    """
+    Collects the wall time, CPU time and call count of each stage run while
+    it is active
+    """
+    # the timer collecting stage times, None while timing is disabled
+    active = None
+
+    def __init__(self):
+        # stage name to [calls, wall seconds, cpu seconds]
+        self._totals = {}
+        # [stage name, wall start, cpu start] of the stages being timed
+        self._stack = []
+        self._previous = None
+        self._start = None
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    @classmethod
+    def stage(cls, name):
+        """
+        Mark a stage, as a context manager
+        @param name The stage, one of the Stage values
+        """
+        timer = cls.active
+        if timer is None:
+            return _NO_TIMING
+        return _StageTiming(timer, name)
+
+    @classmethod
+    def from_environment(cls):
+        """
+        @retval A tuple of a new StageTimer and the destination of its summary
+            from MI_STAGE_TIMING, or (None, None) if timing is not switched on
+        """
+        destination = os.environ.get(STAGE_TIMING_ENVIRONMENT_VARIABLE)
+        if not destination:
+            return None, None
+        return cls(), destination
+
+    def __enter__(self):
+        self._previous = StageTimer.active
+        StageTimer.active = self
+        self._start = (time.time(), time.clock())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wall += time.time() - self._start[0]
+        self._cpu += time.clock() - self._start[1]
+        StageTimer.active = self._previous
+        self._previous = None
+        return False
+
+    def _add(self, name, calls, wall, cpu):
+        totals = self._totals.get(name)
+        if totals is None:
+            totals = self._totals[name] = [0, 0.0, 0.0]
+        totals[0] += calls
+        totals[1] += wall
+        totals[2] += cpu
+
+    def _enter(self, name):
+        wall = time.time()
+        cpu = time.clock()
+        if self._stack:
+            # pause the enclosing stage
+            outer = self._stack[-1]
+            self._add(outer[0], 0, wall - outer[1], cpu - outer[2])
+        self._stack.append([name, wall, cpu])
+
+    def _exit(self):
+        wall = time.time()
+        cpu = time.clock()
+        name, wall_start, cpu_start = self._stack.pop()
+        self._add(name, 1, wall - wall_start, cpu - cpu_start)
+        if self._stack:
+            # resume the enclosing stage
+            outer = self._stack[-1]
+            outer[1] = wall
+            outer[2] = cpu
+
+    def summary(self):
+        """
+        @retval A dictionary of the calls, wall seconds and cpu seconds of each
+            stage run, and the wall and cpu seconds the timer was active
+        """
+        stages = {}
+        for name, (calls, wall, cpu) in self._totals.iteritems():
+            stages[name] = {'calls': calls, 'wall_seconds': wall, 'cpu_seconds': cpu}
+        return {'stages': stages, 'wall_seconds': self._wall, 'cpu_seconds': self._cpu}
+
+    def report(self, destination, label=None):
+        """
+        Log the summary, or append it to a file as a line of JSON
+        @param destination "log" or the path of the file
+        @param label A label to add to the summary, such as the parsed file
+        """
+        summary = self.summary()
+        summary['label'] = label
+        if destination == LOG_DESTINATION:
+            log.info("Stage timing: %s", json.dumps(summary, sort_keys=True))
+        else:
+            with open(destination, 'a') as stream_handle:
+                stream_handle.write(json.dumps(summary, sort_keys=True) + '\n')
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+
+"""
+@package mi.core.test.test_log
+@file mi/core/test/test_log.py
+@brief Test code for the method logging wrappers
+"""
+__license__ = 'Apache 2.0'
+
+import logging
+import os
+import sys
+import types
+from textwrap import dedent
+
+from mock import patch
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.core.log import get_logging_metaclass, log_method, METHOD_LOGGING_ENVIRONMENT_VARIABLE
+from mi.logging import log
+from mi.logging.logger import _ScopedLogger
+
+MODULE_NAME = 'mi.core.test.scoped_logger_module'
+
+# a module getting its logger at module level and inside a function
+MODULE_SOURCE = dedent('''
+    from mi.core.log import get_logger
+    log = get_logger()
+
+    def function_logger():
+        return get_logger()
+
+    def emit(message):
+        log.info(message)
+''')
+# line of the log call in emit()
+EMIT_LINE = 9
+
+
+class ReprCounter(object):
+    """
+    An argument which counts how many times it is formatted
+    """
+    def __init__(self):
+        self.repr_calls = 0
+
+    def __repr__(self):
+        self.repr_calls += 1
+        return 'ReprCounter()'
+
+
+class RecordHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+        self.records = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.records.append(record)
+
+
+def pair(a, b=None):
+    return a, b
+
+
+@attr('UNIT', group='mi')
+class LogMethodUnitTest(MiUnitTest):
+
+    def setUp(self):
+        environment = patch.dict(os.environ, {METHOD_LOGGING_ENVIRONMENT_VARIABLE: 'on'})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        self.logger = logging.getLogger(__name__)
+        self.handler = RecordHandler()
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.addCleanup(setattr, self.logger, 'propagate', True)
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+
+    def test_disabled_level(self):
+        """
+        The arguments of a logged method are not formatted when its level is disabled
+        """
+        self.logger.setLevel(logging.INFO)
+        logged_pair = log_method(log_level='debug')(pair)
+        counter = ReprCounter()
+
+        self.assertEqual(logged_pair(counter, b=counter), (counter, counter))
+        self.assertEqual(counter.repr_calls, 0)
+        self.assertEqual(self.handler.messages, [])
+
+    def test_enabled_level(self):
+        """
+        A logged method logs its arguments and return value in the same form as before
+        """
+        self.logger.setLevel(logging.DEBUG)
+        counter = ReprCounter()
+
+        class Logged(object):
+            __metaclass__ = get_logging_metaclass(log_level='debug')
+
+            def echo(self, value, suffix=''):
+                return [value, suffix]
+
+        logged = Logged()
+        self.assertEqual(logged.echo(counter, suffix='s'), [counter, 's'])
+        self.assertEqual(counter.repr_calls, 2)
+        self.assertEqual(self.handler.messages, [
+            "entered Logged.echo | args: (%r, ReprCounter()) | kwargs: {'suffix': 's'}" % logged,
+            "exiting Logged.echo | returning [ReprCounter(), 's']"])
+
+        self.assertEqual(log_method(log_level='debug')(pair)(1, b=2), (1, 2))
+        self.assertEqual(self.handler.messages[2:], [
+            "entered pair | args: (1,) | kwargs: {'b': 2}",
+            "exiting pair | returning (1, 2)"])
+
+    def test_logging_off(self):
+        """
+        With method logging off methods are left unwrapped
+        """
+        with patch.dict(os.environ, {METHOD_LOGGING_ENVIRONMENT_VARIABLE: 'off'}):
+            self.assertIs(log_method()(pair), pair)
+            metaclass = get_logging_metaclass()
+            logged_class = metaclass('Logged', (object,), {'pair': pair})
+        self.assertIs(logged_class.__dict__['pair'], pair)
+
+        self.assertIsNot(log_method()(pair), pair)
+        logged_class = metaclass('Logged', (object,), {'pair': pair})
+        self.assertIsNot(logged_class.__dict__['pair'], pair)
+        self.assertEqual(logged_class.__dict__['pair'].__name__, 'pair')
+
+
+@attr('UNIT', group='mi')
+class ScopedLoggerUnitTest(MiUnitTest):
+
+    def setUp(self):
+        # start from an empty logger cache and no filters
+        for name, value in (('_loggers', {}), ('_filters', [])):
+            patcher = patch.object(_ScopedLogger, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.logger = logging.getLogger(MODULE_NAME)
+        self.handler = RecordHandler()
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.addCleanup(setattr, self.logger, 'propagate', True)
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+
+    def load_module(self, source=MODULE_SOURCE):
+        """
+        @retval A new module named MODULE_NAME running source
+        """
+        module = types.ModuleType(MODULE_NAME)
+        sys.modules[MODULE_NAME] = module
+        self.addCleanup(sys.modules.pop, MODULE_NAME, None)
+        exec compile(source, MODULE_NAME.replace('.', '/') + '.py', 'exec') in module.__dict__
+        return module
+
+    def test_module_level(self):
+        """
+        At module level get_logger() returns the scoped logger, inside a function the module's real logger
+        """
+        module = self.load_module()
+        self.assertIs(module.log, log)
+
+        logger = module.function_logger()
+        self.assertIs(type(logger), logging.Logger)
+        self.assertIs(logger, self.logger)
+
+    def test_cache(self):
+        """
+        The logger of a module is only created once, with the filters added once, and installed as module.log
+        """
+        scope_filter = logging.Filter(MODULE_NAME)
+        log._add_filter(scope_filter)
+        module = self.load_module()
+
+        with patch('mi.logging.logger.logging.getLogger', wraps=logging.getLogger) as get_logger_patch, \
+                patch.object(logging.Logger, 'addFilter', autospec=True) as add_filter:
+            logger = module.function_logger()
+            self.assertIs(module.function_logger(), logger)
+            module.emit('message')
+
+        self.assertEqual(get_logger_patch.call_count, 1)
+        add_filter.assert_called_once_with(logger, scope_filter)
+        self.assertIs(_ScopedLogger._loggers[MODULE_NAME], logger)
+        self.assertIs(module.log, logger)
+
+    def test_module_log_replaced(self):
+        """
+        module.log is only replaced while it is still the scoped logger
+        """
+        module = self.load_module(MODULE_SOURCE + 'log = "not the scoped logger"\n')
+
+        self.assertIs(module.function_logger(), self.logger)
+        self.assertEqual(module.log, 'not the scoped logger')
+
+    def test_first_message_caller(self):
+        """
+        The first message, logged through the scoped logger, reports the line and function which logged it
+        """
+        module = self.load_module()
+        module.emit('first')
+        self.assertIs(module.log, self.logger)
+        module.emit('second')
+
+        self.assertEqual(self.handler.messages, ['first', 'second'])
+        self.assertEqual([(record.lineno, record.funcName) for record in self.handler.records],
+                         [(EMIT_LINE, 'emit'), (EMIT_LINE, 'emit')])
+        self.assertEqual(self.logger.findCaller, self.logger._original_find_caller)
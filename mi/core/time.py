@@ -15,6 +15,7 @@ __license__ = 'Apache 2.0'
 import calendar
 from datetime import datetime
 import ntplib
+import numpy as np
 import time
 import re
 
@@ -25,6 +26,164 @@ DATE_PATTERN = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$'
 DATE_MATCHER = re.compile(DATE_PATTERN)
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
+# seconds between the NTP epoch, 1900-01-01, and the unix epoch
+NTP_UNIX_OFFSET = float(ntplib.NTP.NTP_DELTA)
+
+# NTP time of 2000-01-01
+TIME_2000_NTP_OFFSET = calendar.timegm((2000, 1, 1, 0, 0, 0)) + NTP_UNIX_OFFSET
+
+# seconds between the mac epoch, 1904-01-01, and the unix epoch
+UNIX_MINUS_MAC_SECONDS = (datetime(1970, 1, 1) - datetime(1904, 1, 1)).total_seconds()
+
+# microseconds between the Windows FILETIME epoch, 1601-01-01, and the unix epoch
+UNIX_MINUS_FILETIME_MICROSECONDS = (datetime(1970, 1, 1) - datetime(1601, 1, 1)).days * 86400 * 1000000
+
+# ':SS' with the seconds of a minute to their value, faster than int()
+_SECONDS = dict((':%02d' % second, second) for second in xrange(60))
+
+# fixed width strptime directives FixedTimestampParser takes before the seconds
+_FIXED_WIDTH_DIRECTIVES = {
+    '%Y': r'(?P<year>\d{4})',
+    '%m': r'(?P<month>\d{2})',
+    '%d': r'(?P<day>\d{2})',
+    '%H': r'(?P<hour>\d{2})',
+    '%M': r'(?P<minute>\d{2})'
+}
+
+
+class FixedTimestampParser(object):
+    """
+    Converts timestamp strings of one format to unix time, faster than
+    datetime.strptime for strings with fixed width fields. The format must
+    have the year, month, day, hour and minute, followed by the seconds and
+    their fraction, ':%S.%f', and an optional literal suffix such as 'Z'.
+    The part of the string up to the minutes is at a fixed offset, and the
+    unix time of the start of each minute is memoized by its text, so the
+    date and time only need to be parsed once a minute. The fraction of the
+    seconds and the suffix are checked with a single precompiled match, and
+    fractions of up to three digits, the usual milliseconds, are memoized by
+    their text as well. Strings with fields which are not fixed width,
+    which strptime accepts, are converted with strptime, so the results and
+    errors are the same.
+    """
+
+    # number of minutes memoized before the memo is cleared
+    MINUTE_MEMO_SIZE = 4096
+    # number of digits of the fractions which are memoized, there are at most 1110 of them
+    MEMOIZED_FRACTION_DIGITS = 3
+
+    def __init__(self, strptime_format):
+        """
+        @param strptime_format The datetime.strptime format of the timestamps
+        @throws ValueError if the format does not have fixed width fields which
+            end with the seconds and their fraction
+        """
+        prefix_end = strptime_format.find(':%S.%f')
+        if prefix_end == -1 or '%' in strptime_format[prefix_end + 6:]:
+            raise ValueError("Format %s does not end with ':%%S.%%f'" % strptime_format)
+
+        prefix_format = strptime_format[:prefix_end]
+        pattern = ''
+        for index, part in enumerate(re.split('(%.)', prefix_format)):
+            if index % 2 == 0:
+                pattern += re.escape(part)
+            elif part in _FIXED_WIDTH_DIRECTIVES and _FIXED_WIDTH_DIRECTIVES[part] not in pattern:
+                pattern += _FIXED_WIDTH_DIRECTIVES[part]
+            else:
+                raise ValueError("Format %s has a directive %s which is not fixed width" % (strptime_format, part))
+        if len(_FIXED_WIDTH_DIRECTIVES) != len(re.findall('%.', prefix_format)):
+            raise ValueError("Format %s does not have the year, month, day, hour and minute" % strptime_format)
+
+        suffix = strptime_format[prefix_end + 6:]
+        prefix_length = len(datetime(2000, 1, 1).strftime(prefix_format))
+
+        self._strptime_format = strptime_format
+        self._prefix_matcher = re.compile(pattern + '$')
+        self._minute_memo = {}
+        self._fraction_memo = {}
+
+        # the fast path of to_unix_time, fetched with a single attribute lookup: the prefix length, the
+        # slices of ':SS', of the fraction with the suffix and of the fraction alone, the match of the
+        # fraction and the suffix, the longest timestamp with a memoized fraction, and the memos
+        fraction_start = prefix_length + 3
+        self._fixed_width = (prefix_length,
+                             slice(prefix_length, fraction_start),
+                             slice(fraction_start, None),
+                             slice(fraction_start, -len(suffix) or None),
+                             re.compile(r'\.\d{1,6}' + re.escape(suffix) + r'\Z').match,
+                             fraction_start + 1 + self.MEMOIZED_FRACTION_DIGITS + len(suffix),
+                             self._minute_memo,
+                             self._fraction_memo)
+
+    def _minute_start(self, prefix):
+        """
+        @param prefix The text of the timestamp up to its minutes
+        @retval The unix time of the start of the minute, or None if the prefix
+            is not a valid time with fixed width fields
+        """
+        match = self._prefix_matcher.match(prefix)
+        if match is None:
+            return None
+        try:
+            dt = datetime(int(match.group('year')), int(match.group('month')), int(match.group('day')),
+                          int(match.group('hour')), int(match.group('minute')))
+        except ValueError:
+            return None
+
+        start = calendar.timegm(dt.timetuple())
+        if len(self._minute_memo) >= self.MINUTE_MEMO_SIZE:
+            # cleared in place, the fast path holds the same dictionary
+            self._minute_memo.clear()
+        self._minute_memo[prefix] = start
+        return start
+
+    def to_unix_time(self, timestamp_str):
+        """
+        @param timestamp_str The timestamp string
+        @retval The unix time in seconds, with microsecond precision
+        @throws ValueError if the string does not match the format
+        """
+        prefix_length, seconds_text, rest_text, fraction_text, rest_matcher, memoized_length, \
+            minute_memo, fraction_memo = self._fixed_width
+        start = minute_memo.get(timestamp_str[:prefix_length])
+        if start is None:
+            start = self._minute_start(timestamp_str[:prefix_length])
+
+        # the rest is ':SS', then the fraction and the suffix
+        second = _SECONDS.get(timestamp_str[seconds_text])
+        fraction = fraction_memo.get(timestamp_str[rest_text])
+        if fraction is None and rest_matcher(timestamp_str, rest_text.start):
+            fraction = float(timestamp_str[fraction_text])
+            if len(timestamp_str) <= memoized_length:
+                fraction_memo[timestamp_str[rest_text]] = fraction
+
+        if start is not None and second is not None and fraction is not None:
+            return start + second + fraction
+
+        dt = datetime.strptime(timestamp_str, self._strptime_format)
+        return calendar.timegm(dt.timetuple()) + (dt.microsecond / 1000000.0)
+
+    def to_ntp_time(self, timestamp_str):
+        """
+        @param timestamp_str The timestamp string
+        @retval The NTP time in seconds, with microsecond precision
+        @throws ValueError if the string does not match the format
+        """
+        return self.to_unix_time(timestamp_str) + NTP_UNIX_OFFSET
+
+    def to_ntp_times(self, timestamp_strs):
+        """
+        @param timestamp_strs A sequence of timestamp strings, such as a column of a file
+        @retval A float64 array of the NTP times, the same as to_ntp_time() gives
+        @throws ValueError if a string does not match the format
+        """
+        to_unix_time = self.to_unix_time
+        return unix_times_to_ntp_times([to_unix_time(timestamp_str) for timestamp_str in timestamp_strs])
+
+
+# ISO8601 dates as string_to_ntp_date_time takes them, once they have been given a fraction and 'Z'
+ISO8601_TIMESTAMP_PARSER = FixedTimestampParser(DATE_FORMAT)
+
 
 def string_to_ntp_date_time(datestr):
     """
@@ -54,9 +213,7 @@ def string_to_ntp_date_time(datestr):
         if datestr[-1:] != 'Z':
             datestr += 'Z'
 
-        dt = datetime.strptime(datestr, DATE_FORMAT)
-
-        unix_timestamp = calendar.timegm(dt.timetuple()) + (dt.microsecond / 1000000.0)
+        unix_timestamp = ISO8601_TIMESTAMP_PARSER.to_unix_time(datestr)
 
         # convert to ntp (seconds since gmt jan 1 1900)
         timestamp = ntplib.system_to_ntp_time(unix_timestamp)
@@ -79,3 +236,58 @@ def time_to_ntp_date_time(unix_time=None):
 
     timestamp = ntplib.system_to_ntp_time(unix_time)
     return float(timestamp)
+
+
+# The array conversions below take any sequence of numbers and return float64
+# arrays. They do the same floating point operations in the same order as the
+# scalar conversions they are named after, so the results are bit identical.
+
+def unix_times_to_ntp_times(unix_times):
+    """
+    The array form of ntplib.system_to_ntp_time
+    @param unix_times Seconds since 1970-01-01
+    @retval A float64 array of seconds since 1900-01-01
+    """
+    return np.asarray(unix_times, dtype=np.float64) + NTP_UNIX_OFFSET
+
+
+def times_2000_to_ntp_times(times_2000):
+    """
+    The array form of mi.dataset.parser.utilities.time_2000_to_ntp_time
+    @param times_2000 Seconds since 2000-01-01
+    @retval A float64 array of seconds since 1900-01-01
+    """
+    return np.asarray(times_2000, dtype=np.float64) + TIME_2000_NTP_OFFSET
+
+
+def mac_times_to_ntp_times(mac_times):
+    """
+    The array form of ntplib.system_to_ntp_time applied to
+    mi.dataset.parser.utilities.mac_timestamp_to_utc_timestamp
+    @param mac_times Seconds since 1904-01-01
+    @retval A float64 array of seconds since 1900-01-01
+    """
+    return (np.asarray(mac_times, dtype=np.float64) - UNIX_MINUS_MAC_SECONDS) + NTP_UNIX_OFFSET
+
+
+def filetimes_to_ntp_times(filetimes):
+    """
+    The array form of converting Windows FILETIMEs, such as the EK60 ping
+    times, through datetime(1601, 1, 1) + timedelta(microseconds=filetime / 10.0),
+    calendar.timegm and ntplib.system_to_ntp_time
+    @param filetimes Integer counts of 100 nanoseconds since 1601-01-01
+    @retval A float64 array of seconds since 1900-01-01
+    """
+    # timedelta rounds the float microseconds to the nearest whole number, and halves away from zero
+    float_microseconds = np.asarray(filetimes, dtype=np.int64) / 10.0
+    whole_microseconds = np.trunc(float_microseconds)
+    microseconds = np.where(np.abs(float_microseconds - whole_microseconds) == 0.5,
+                            whole_microseconds + np.sign(float_microseconds),
+                            np.round(float_microseconds)).astype(np.int64)
+    microseconds -= UNIX_MINUS_FILETIME_MICROSECONDS
+
+    # calendar.timegm adds the seconds and their fraction to the whole minutes
+    minutes, microseconds = np.divmod(microseconds, 60000000)
+    seconds, microseconds = np.divmod(microseconds, 1000000)
+    unix_times = (minutes * 60).astype(np.float64) + (seconds + microseconds / 1e6)
+    return unix_times + NTP_UNIX_OFFSET
@@ -7,6 +7,8 @@ from mi.core.log import get_logger
 log = get_logger()
 
 from mi.core.exceptions import NotImplementedException
+from mi.core.instrument.data_particle import ParticleBatch
+from mi.core.stage_timer import Stage, StageTimer
 
 class ParticleDataHandler(object):
     """
@@ -26,6 +28,14 @@ class ParticleDataHandler(object):
         else:
             self._samples[sample_type].append(sample)
 
+    def addParticleSamples(self, sample_type, samples):
+        log.debug("Sample type: %s, %d samples", sample_type, len(samples))
+        self._samples.setdefault(sample_type, []).extend(samples)
+
+    def addParticleBatch(self, batch):
+        log.debug("Sample type: %s, batch of %d samples", batch.type(), len(batch))
+        self.addParticleSamples(batch.type(), batch.generate_samples())
+
     def setParticleDataCaptureFailure(self):
         log.debug("Particle data capture failed")
         self._failure = True
@@ -39,31 +49,111 @@ class DataSetDriver(object):
     which is called directly from uFrame
     """
 
-    def __init__(self, parser, particleDataHdlrObj):
+    # number of records requested from the parser at a time
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, parser, particleDataHdlrObj, batch_size=DEFAULT_BATCH_SIZE):
 
         self._parser = parser
         self._particleDataHdlrObj = particleDataHdlrObj
+        self._batch_size = batch_size
 
     def processFileStream(self):
         """
         Method to extract records from a parser's get_records method
-        and pass them to the Java particleDataHdlrObj passed in from uFrame
+        and pass them to the Java particleDataHdlrObj passed in from uFrame.
+        The stages are timed if MI_STAGE_TIMING is set and no timer is
+        already active.
+        """
+        timer, destination = StageTimer.from_environment()
+        if timer is None or StageTimer.active is not None:
+            self._process_records()
+            return
+
+        with timer:
+            self._process_records()
+        stream_handle = getattr(self._parser, '_stream_handle', None)
+        timer.report(destination, getattr(stream_handle, 'name', None))
+
+    def _process_records(self):
+        """
+        Pass all the records from the parser to the particleDataHdlrObj
         """
         while True:
             try:
-                records = self._parser.get_records(1)
+                # the parser builds the particles, reads and sieves are timed as their own stages
+                with StageTimer.stage(Stage.BUILD):
+                    records = self._parser.get_records(self._batch_size)
 
                 if len(records) == 0:
                     log.debug("Done retrieving records.")
                     break
 
-                for record in records:
-                    self._particleDataHdlrObj.addParticleSample(record.type(), record.generate())
+                self._publish_records(records)
             except Exception as e:
                 log.error(e)
                 self._particleDataHdlrObj.setParticleDataCaptureFailure()
                 break
 
+    def _publish_records(self, records):
+        """
+        Generate the records and hand them to the particleDataHdlrObj, grouping
+        consecutive records of the same type into one call. Particle batches are
+        handed over as they are. Records generated before a failure are still
+        handed over before the exception is raised.
+        :param records: list of particles and particle batches from the parser
+        """
+        sample_type = None
+        samples = []
+
+        # timed per call rather than per particle, handing over samples is its own stage
+        with StageTimer.stage(Stage.ENCODE):
+            try:
+                for record in records:
+                    if isinstance(record, ParticleBatch):
+                        if samples:
+                            self._add_samples(sample_type, samples)
+                            samples = []
+                        sample_type = None
+                        self._add_batch(record)
+                        continue
+
+                    record_type = record.type()
+                    if record_type != sample_type and samples:
+                        self._add_samples(sample_type, samples)
+                        samples = []
+                    sample_type = record_type
+                    samples.append(record.generate())
+            finally:
+                if samples:
+                    self._add_samples(sample_type, samples)
+
+    def _add_batch(self, batch):
+        """
+        Hand a particle batch to the particleDataHdlrObj, expanding it into
+        generated particles if it does not provide addParticleBatch
+        :param batch: a particle batch from the parser
+        """
+        if hasattr(self._particleDataHdlrObj, 'addParticleBatch'):
+            with StageTimer.stage(Stage.PUBLISH):
+                self._particleDataHdlrObj.addParticleBatch(batch)
+        else:
+            self._add_samples(batch.type(), batch.generate_samples())
+
+    def _add_samples(self, sample_type, samples):
+        """
+        Hand a list of samples of one type to the particleDataHdlrObj, in a
+        single call if it provides addParticleSamples
+        :param sample_type: the particle type of the samples
+        :param samples: list of generated particles
+        """
+        with StageTimer.stage(Stage.PUBLISH):
+            if hasattr(self._particleDataHdlrObj, 'addParticleSamples'):
+                self._particleDataHdlrObj.addParticleSamples(sample_type, samples)
+            else:
+                for sample in samples:
+                    self._particleDataHdlrObj.addParticleSample(sample_type, sample)
+
 
 class SimpleDatasetDriver(DataSetDriver):
     """
@@ -11,16 +11,21 @@ out of files and feed them into the system.
 __author__ = 'Steve Foley'
 __license__ = 'Apache 2.0'
 
+import mmap
 import time
 import ntplib
+from collections import deque
+from itertools import islice
+from types import GeneratorType
 
 from mi.core.log import get_logger
 log = get_logger()
-from mi.core.instrument.chunker import StringChunker
-from mi.core.instrument.data_particle import DataParticleKey
+from mi.core.instrument.chunker import BufferChunker
+from mi.core.instrument.data_particle import DataParticle, DataParticleKey
 from mi.core.exceptions import RecoverableSampleException, SampleEncodingException
 from mi.core.exceptions import NotImplementedException, UnexpectedDataException
 from mi.core.common import BaseEnum
+from mi.core.stage_timer import Stage, StageTimer
 
 
 class DataSetDriverConfigKeys(BaseEnum):
@@ -38,6 +43,112 @@ class DataSetDriverConfigKeys(BaseEnum):
     CLASS = "class"
     URI = "uri"
     CLASS_ARGS = "class_args"
+    RELEASE_RAW_DATA = "release_raw_data"
+    PARTICLE_PARAMETERS = "particle_parameters"
+    SPARSE_VALUES = "sparse_values"
+    PARTICLE_BATCHES = "particle_batches"
+
+
+def map_stream(stream_handle):
+    """
+    Get the rest of a stream in one read-only buffer, for parsers which need
+    the whole file at once. A stream backed by a file is memory mapped so the
+    data is not read and copied in blocks, other streams are read. Either
+    way the stream is left at its end, as it would be after read().
+    @param stream_handle The stream to read
+    @retval A string, or a read-only buffer over the mapped file, holding the
+        data from the current position to the end of the stream
+    """
+    with StageTimer.stage(Stage.READ):
+        try:
+            fileno = stream_handle.fileno()
+        except (AttributeError, IOError):
+            # not backed by a file, e.g. StringIO
+            return stream_handle.read()
+
+        position = stream_handle.tell()
+        try:
+            mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            # empty files and files which can not be mapped, e.g. pipes
+            return stream_handle.read()
+
+        stream_handle.seek(0, 2)
+        if position >= len(mapped):
+            return ''
+        return buffer(mapped, position)
+
+
+class RecordQueue(object):
+    """
+    First in, first out queue of parsed records used as a parser record
+    buffer. Records are added at the back and taken from the front in
+    constant time. The high water mark is the number of records at which
+    the queue reports itself full, so parsers can stop loading more data
+    until records have been taken out. A queue without a high water mark
+    is never full.
+    """
+    DEFAULT_HIGH_WATER_MARK = 10000
+
+    def __init__(self, high_water_mark=DEFAULT_HIGH_WATER_MARK):
+        """
+        @param high_water_mark The number of records at which the queue is full, or None
+        """
+        self._records = deque()
+        self.high_water_mark = high_water_mark
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __repr__(self):
+        return 'RecordQueue(%r)' % list(self._records)
+
+    @property
+    def full(self):
+        """
+        True if the queue holds at least high water mark records
+        """
+        return self.high_water_mark is not None and len(self._records) >= self.high_water_mark
+
+    def append(self, record):
+        self._records.append(record)
+
+    def extend(self, records):
+        self._records.extend(records)
+
+    def insert(self, index, record):
+        """
+        Insert a record before the given index, inserting at the front is constant time
+        """
+        if index == 0:
+            self._records.appendleft(record)
+        else:
+            self._records.rotate(-index)
+            self._records.appendleft(record)
+            self._records.rotate(index)
+
+    def popleft(self):
+        """
+        Remove and return the record at the front of the queue
+        @throws IndexError if the queue is empty
+        """
+        return self._records.popleft()
+
+    def take(self, count):
+        """
+        Remove records from the front of the queue
+        @param count The maximum number of records to remove
+        @retval A list of up to count records, in queue order
+        """
+        count = min(count, len(self._records))
+        popleft = self._records.popleft
+        return [popleft() for _ in xrange(count)]
+
+    def clear(self):
+        self._records.clear()
 
 
 class Parser(object):
@@ -62,7 +173,7 @@ class Parser(object):
            ultimately from the agent) where we send our error events to
            be published into ION
         """
-        self._chunker = StringChunker(sieve_fn)
+        self._chunker = BufferChunker(sieve_fn)
         self._stream_handle = stream_handle
         self._state = state
         self._state_callback = state_callback
@@ -128,6 +239,10 @@ class Parser(object):
                     log.warn("Failed to encode: %s", encoding_errors)
                     raise SampleEncodingException("Failed to encode: %s" % encoding_errors)
 
+                # the particle dictionary is generated, so the raw data is no longer needed
+                if self._config.get(DataSetDriverConfigKeys.RELEASE_RAW_DATA):
+                    particle.release_raw_data()
+
         except (RecoverableSampleException, SampleEncodingException) as e:
             log.error("Sample exception detected: %s raw data: %s", e, raw_data)
             if self._exception_callback:
@@ -165,7 +280,7 @@ class BufferLoadingParser(Parser):
            ultimately from the agent) where we send our error events to
            be published into ION
         """
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._timestamp = 0.0
         self.file_complete = False
 
@@ -185,8 +300,9 @@ class BufferLoadingParser(Parser):
         if num_records <= 0:
             return []
         try:
-            while len(self._record_buffer) < num_records:
-                self._load_particle_buffer()        
+            with DataParticle.batch():
+                while len(self._record_buffer) < num_records:
+                    self._load_particle_buffer()
         except EOFError:
             self._process_end_of_file()
         return self._yank_particles(num_records)
@@ -213,17 +329,12 @@ class BufferLoadingParser(Parser):
         cannot be collected (perhaps due to an EOF), the list will have the
         elements it was able to collect.
         """
-        if len(self._record_buffer) < num_records:
-            num_to_fetch = len(self._record_buffer)
-        else:
-            num_to_fetch = num_records
+        records_to_return = self._record_buffer.take(num_records)
         log.trace("Yanking %s records of %s requested",
-                  num_to_fetch,
+                  len(records_to_return),
                   num_records)
 
         return_list = []
-        records_to_return = self._record_buffer[:num_to_fetch]
-        self._record_buffer = self._record_buffer[num_to_fetch:]
         if len(records_to_return) > 0:
             self._state = records_to_return[-1][1]  # state side of tuple of last entry
             # strip the state info off of them now that we have what we need
@@ -243,11 +354,14 @@ class BufferLoadingParser(Parser):
     def _load_particle_buffer(self):
         """
         Load up the internal record buffer with some particles based on a
-        gather from the get_block method.
+        gather from the get_block method. At least one block is read, then
+        reading stops once the record buffer reaches its high water mark.
         """
         while self.get_block():
             result = self.parse_chunks()
             self._record_buffer.extend(result)
+            if self._record_buffer.full:
+                break
 
     def get_block(self, size=1024):
         """
@@ -257,7 +371,8 @@ class BufferLoadingParser(Parser):
         @throws EOFError when the end of the file is reached
         """
         # read in some more data
-        data = self._stream_handle.read(size)
+        with StageTimer.stage(Stage.READ):
+            data = self._stream_handle.read(size)
         if data:
             self._chunker.add_chunk(data, ntplib.system_to_ntp_time(time.time()))
             return len(data)
@@ -289,9 +404,11 @@ class SimpleParser(Parser):
         """
 
         # the record buffer which will store all parsed particles
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         # a flag indicating if the file has been parsed or not
         self._file_parsed = False
+        # the iterator get_records pulls particles from
+        self._particle_iterator = None
 
         super(SimpleParser, self).__init__(config,
                                            stream_handle,
@@ -305,9 +422,41 @@ class SimpleParser(Parser):
         """
         This method must be overridden.  This method should open and read the file and parser the data within, and at
         the end of this method self._record_buffer will be filled with all the particles in the file.
+
+        Alternatively, this method can be written as a generator which yields each particle as it is parsed.  The
+        file is then only parsed as far as needed to return the particles requested, so the whole file never needs
+        to be held in the record buffer.
         """
         raise NotImplementedException("parse_file() not overridden!")
 
+    def iter_particles(self):
+        """
+        Return an iterator over the particles in the file which have not been returned yet, in order.  If parse_file
+        is a generator the file is parsed lazily as particles are pulled, otherwise parse_file is run to completion
+        on the first pull.  The same iterator is shared with get_records.
+        """
+        if self._particle_iterator is None:
+            self._particle_iterator = self._generate_particles()
+
+        return self._particle_iterator
+
+    def _generate_particles(self):
+        """
+        Generator driving parse_file, see iter_particles
+        """
+        particles = self.parse_file()
+        self._file_parsed = True
+
+        if isinstance(particles, GeneratorType):
+            for particle in particles:
+                # parse_file may also have added particles to the record buffer, keep them in order
+                self._record_buffer.append(particle)
+                while self._record_buffer:
+                    yield self._record_buffer.popleft()
+
+        while self._record_buffer:
+            yield self._record_buffer.popleft()
+
     def get_records(self, number_requested=1):
         """
         Initiate parsing the file if it has not been done already, and pop particles off the record buffer to
@@ -315,14 +464,9 @@ class SimpleParser(Parser):
         @param number_requested the number of records requested to be returned
         @return an array of particles, with a length of the number requested or less
         """
-        particles_to_return = []
-
-        if number_requested > 0:
-            if self._file_parsed is False:
-                self.parse_file()
-                self._file_parsed = True
-
-        while len(particles_to_return) < number_requested and len(self._record_buffer) > 0:
-            particles_to_return.append(self._record_buffer.pop(0))
+        if number_requested <= 0:
+            return []
 
-        return particles_to_return
+        # particles built to fill this request share a driver timestamp
+        with DataParticle.batch():
+            return list(islice(self.iter_particles(), number_requested))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.dataset_runner
+@file mi/dataset/dataset_runner.py
+@brief Runs a driver parse() entry point over many files in parallel
+"""
+
+__license__ = 'Apache 2.0'
+
+import time
+import traceback
+from collections import deque
+from multiprocessing import Process, Pipe, cpu_count
+
+from mi.core.log import get_logger
+log = get_logger()
+
+from mi.dataset.dataset_driver import ParticleDataHandler
+from mi.dataset.parse_cache import ParseCache, cached_parse
+
+
+class FileParseResult(object):
+    """
+    The particles parsed from one file by a DriverRunner
+    """
+
+    def __init__(self, source_file, samples=None, failure=False, error=None, attempts=0):
+        """
+        @param source_file The path of the parsed file
+        @param samples A dictionary of the generated particles by particle type
+        @param failure True if particle data capture failed for this file
+        @param error A description of the error which stopped parsing, or None
+        @param attempts The number of worker processes used to parse the file
+        """
+        self.source_file = source_file
+        self.samples = samples if samples is not None else {}
+        self.failure = failure
+        self.error = error
+        self.attempts = attempts
+
+    def __repr__(self):
+        return 'FileParseResult(%r, %d particle types, failure=%r, attempts=%d)' % \
+               (self.source_file, len(self.samples), self.failure, self.attempts)
+
+
+def _parse_worker(connection, module_name, base_python_code_path, source_file, cache_directory=None):
+    """
+    Worker process target, parses one file with the driver module into a
+    ParticleDataHandler and sends back (samples, failure, error, cache bytes).
+    With a cache directory the particles are replayed from the parse cache if
+    the file was already parsed by the same driver version. The worker does
+    not evict cache entries, it reports the bytes it added to the cache so the
+    runner can.
+    """
+    handler = ParticleDataHandler()
+    error = None
+    cache = None
+    try:
+        module = __import__(module_name, fromlist=['parse'])
+        if cache_directory is None:
+            module.parse(base_python_code_path, source_file, handler)
+        else:
+            cache = ParseCache(cache_directory, auto_evict=False)
+            cached_parse(cache, module, base_python_code_path, source_file, handler)
+    except Exception:
+        error = traceback.format_exc()
+        handler.setParticleDataCaptureFailure()
+
+    cache_bytes = cache.bytes_added if cache is not None else 0
+    connection.send((handler._samples, handler._failure, error, cache_bytes))
+    connection.close()
+
+
+class DriverRunner(object):
+    """
+    Fans the parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj)
+    calls of a driver module out over a set of worker processes, one file
+    per process, each parsing into its own ParticleDataHandler as uFrame
+    would. Results are returned in the order the files were given. A file
+    whose worker dies without sending a result is retried in a new process.
+    """
+
+    # seconds to wait between checks on the running workers
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, driver_module, base_python_code_path, processes=None, max_retries=1,
+                 cache_directory=None):
+        """
+        @param driver_module The driver module, or its name, providing parse()
+        @param base_python_code_path The basePythonCodePath passed to parse()
+        @param processes The number of worker processes, the number of CPUs if None
+        @param max_retries The number of times a file is retried after its worker crashes
+        @param cache_directory The directory of a ParseCache to parse through, or None
+        """
+        if not isinstance(driver_module, basestring):
+            driver_module = driver_module.__name__
+        self._module_name = driver_module
+        self._base_path = base_python_code_path
+        self._processes = processes or cpu_count()
+        self._max_retries = max_retries
+        self._cache_directory = cache_directory
+        self._cache = ParseCache(cache_directory) if cache_directory is not None else None
+
+    def run(self, source_files):
+        """
+        Parse each of the files
+        @param source_files A list of file paths
+        @retval A list of FileParseResult, in the same order as source_files
+        """
+        results = [FileParseResult(source_file) for source_file in source_files]
+        pending = deque(range(len(source_files)))
+        running = {}
+
+        while pending or running:
+            while pending and len(running) < self._processes:
+                index = pending.popleft()
+                running[index] = self._start(results[index])
+
+            if not self._collect(running, results, pending):
+                time.sleep(self.POLL_INTERVAL)
+
+        return results
+
+    def _start(self, result):
+        """
+        Start a worker process parsing the file of a result
+        @retval A tuple of the process and the parent end of its pipe
+        """
+        parent_connection, child_connection = Pipe(duplex=False)
+        process = Process(target=_parse_worker,
+                          args=(child_connection, self._module_name, self._base_path, result.source_file,
+                                self._cache_directory))
+        process.daemon = True
+        process.start()
+        child_connection.close()
+        result.attempts += 1
+        return process, parent_connection
+
+    def _collect(self, running, results, pending):
+        """
+        Collect the results of finished workers, queueing a retry for crashed ones
+        @retval True if any worker finished
+        """
+        finished = False
+        for index, (process, connection) in running.items():
+            result = results[index]
+            ready = connection.poll()
+            if not ready:
+                if process.is_alive():
+                    continue
+                # the worker may have sent its result and exited since it was polled
+                ready = connection.poll()
+
+            if ready:
+                try:
+                    result.samples, result.failure, result.error, cache_bytes = connection.recv()
+                except EOFError:
+                    # the worker closed its pipe without sending a result
+                    self._crashed(index, result, process, pending)
+                else:
+                    process.join()
+                    if cache_bytes:
+                        self._cache.added(cache_bytes)
+                        self._cache.trim()
+            else:
+                self._crashed(index, result, process, pending)
+
+            connection.close()
+            del running[index]
+            finished = True
+
+        return finished
+
+    def _crashed(self, index, result, process, pending):
+        """
+        Handle a worker which exited without a result, retrying the file if allowed
+        """
+        process.join()
+        if result.attempts <= self._max_retries:
+            log.warn("Worker parsing %s exited with code %s, retrying", result.source_file, process.exitcode)
+            pending.append(index)
+        else:
+            log.error("Worker parsing %s exited with code %s", result.source_file, process.exitcode)
+            result.failure = True
+            result.error = "Worker exited with code %s" % process.exitcode
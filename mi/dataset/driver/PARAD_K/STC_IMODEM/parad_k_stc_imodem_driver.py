@@ -12,6 +12,9 @@ from mi.core.versioning import  version
 
 #sys.path.append(basePythonCodePath)
 
+FILE_PATTERNS = ['E*.DAT']
+
+
 @version("0.0.3")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     from mi.logging import config
@@ -15,6 +15,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.dataset_driver import DataSetDriver, ParticleDataHandler
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['E*.DAT']
+
+
 @version("0.0.3")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
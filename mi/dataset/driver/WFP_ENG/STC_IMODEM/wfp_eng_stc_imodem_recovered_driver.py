@@ -19,6 +19,9 @@ from mi.dataset.parser.wfp_eng__stc_imodem_particles import WfpEngStcImodemEngin
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['E*.DAT']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
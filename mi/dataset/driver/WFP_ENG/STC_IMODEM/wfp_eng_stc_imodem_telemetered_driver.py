@@ -20,6 +20,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['E*.DAT']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
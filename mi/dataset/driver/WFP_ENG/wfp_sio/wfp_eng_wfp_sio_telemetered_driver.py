@@ -17,6 +17,9 @@ from mi.dataset.parser.wfp_eng_wfp_sio import WfpEngWfpSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.we_wfp*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.pd0', '*.PD0']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
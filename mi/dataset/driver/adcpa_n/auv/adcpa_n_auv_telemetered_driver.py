@@ -16,6 +16,9 @@ from mi.dataset.parser.adcpa_n_auv import AdcpaNAuvParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -14,6 +14,9 @@ from mi.dataset.parser.adcp_pd0 import AdcpPd0Parser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.000']
+
+
 @version("0.1.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -17,6 +17,9 @@ from mi.dataset.parser.adcps_jln_sio import AdcpsJlnSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.adcps*.dat']
+
+
 @version("15.6.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
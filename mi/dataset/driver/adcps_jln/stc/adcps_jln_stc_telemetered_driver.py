@@ -16,6 +16,9 @@ from mi.dataset.parser.adcps_jln_stc import AdcpsJlnStcParser, \
     AdcpsJlnStcParticleClassKey
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['adcpt_*.DAT']
+
+
 @version("0.0.4")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -18,6 +18,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.adcp.log', '*.adcp_*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -19,6 +19,9 @@ from mi.dataset.parser.adcpt_m_dspec import AdcptMDspecParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['DSpec*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
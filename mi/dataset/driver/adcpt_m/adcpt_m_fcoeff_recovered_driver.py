@@ -17,6 +17,9 @@ from mi.dataset.parser.adcpt_m_fcoeff import AdcptMFCoeffParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['FCoeff*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -19,6 +19,9 @@ from mi.dataset.parser.adcpt_m_log9 import AdcptMLog9Parser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_LOG9*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.adcpt_m_wvs import AdcptMWVSParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.WVS']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
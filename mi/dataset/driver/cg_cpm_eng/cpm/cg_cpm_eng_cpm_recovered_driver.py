@@ -13,6 +13,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.driver.cg_cpm_eng.cpm.cg_cpm_eng_cpm_common_driver import CgCpmEngCpmDriver
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['cpm_status.*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
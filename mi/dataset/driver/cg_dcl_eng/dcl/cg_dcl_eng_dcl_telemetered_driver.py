@@ -27,6 +27,9 @@ from mi.dataset.parser.cg_dcl_eng_dcl import CgDclEngDclParser, CgDclEngDclParti
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.syslog*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -13,6 +13,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.driver.cg_stc_eng.stc.cg_stc_eng_stc_common_driver import CgStcEngDriver
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['stc_status*.txt']
+
+
 @version("0.0.2")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -16,6 +16,9 @@ from mi.dataset.parser.mopak_o_dcl import \
     MopakParticleClassType
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['*.mopak*.log', '*.3dmgx3*.log']
+
+
 @version("0.0.2")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -24,6 +27,8 @@ def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     parser_config = {
         DataSetDriverConfigKeys.PARTICLE_MODULE: 'mi.dataset.parser.mopak_o_dcl',
         DataSetDriverConfigKeys.PARTICLE_CLASS: None,
+        # accel and rate records have fixed layouts, so their particles are built in batches
+        DataSetDriverConfigKeys.PARTICLE_BATCHES: True,
         # particle_class configuration does nothing for multi-particle parsers
         # put the class names in specific config parameters so the parser can get them
         # use real classes as objects instead of strings to make it easier
@@ -17,6 +17,9 @@ from mi.dataset.driver.cg_stc_eng.stc.driver_common import RteODclDriver
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.rte*.log']
+
+
 @version("0.0.2")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -16,6 +16,9 @@ from mi.dataset.parser.ctdav_n_auv import CtdavNAuvParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -18,6 +18,9 @@ from mi.core.versioning import version
 MODULE_NAME = 'mi.dataset.parser.ctdbp_cdef'
 
 
+FILE_PATTERNS = ['*.hex']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
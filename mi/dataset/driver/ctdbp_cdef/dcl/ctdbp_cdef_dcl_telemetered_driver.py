@@ -17,6 +17,9 @@ from mi.core.versioning import version
 
 MODULE_NAME = 'mi.dataset.parser.ctdbp_cdef_dcl'
 
+FILE_PATTERNS = ['*.ctdbp*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -23,6 +23,9 @@ CTDBP_RECOV_CONFIG = {
     DataSetDriverConfigKeys.PARTICLE_CLASS: 'CtdbpPDclRecoveredDataParticle'
 }
 
+FILE_PATTERNS = ['ctdbp*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -20,6 +20,9 @@ from mi.dataset.parser.ctdmo_ghqr_imodem import CtdmoGhqrImodemParser, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['ctdmo*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -21,6 +21,9 @@ FILENAME_REGEX = r'SBE37-IM_(\d+)_\d{4}_\d{2}_\d{2}.hex'
 FILENAME_MATCHER = re.compile(FILENAME_REGEX)
 
 
+FILE_PATTERNS = ['SBE37-IM_*.hex']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
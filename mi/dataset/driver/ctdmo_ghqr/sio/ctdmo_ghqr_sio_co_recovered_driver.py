@@ -14,6 +14,9 @@ from mi.dataset.parser.ctdmo_ghqr_sio import CtdmoGhqrSioRecoveredCoParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['CTD*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
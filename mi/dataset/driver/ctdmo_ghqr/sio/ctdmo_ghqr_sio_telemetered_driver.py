@@ -14,6 +14,9 @@ from mi.dataset.parser.ctdmo_ghqr_sio import CtdmoGhqrSioTelemeteredParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.ctdmo*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
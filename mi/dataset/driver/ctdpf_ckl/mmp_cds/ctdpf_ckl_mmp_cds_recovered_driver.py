@@ -17,6 +17,9 @@ from mi.dataset.parser.ctdpf_ckl_mmp_cds import CtdpfCklMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['ctd_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -44,6 +44,9 @@ class CtdpfCklWfpRecoveredDriver(SimpleDatasetDriver):
 
         return parser
 
+FILE_PATTERNS = ['C*.DAT', 'C*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -45,6 +45,9 @@ class CtdpfCklWfpTelemeteredDriver(SimpleDatasetDriver):
         return parser
 
 
+FILE_PATTERNS = ['C*.DAT', 'C*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.ctdpf_ckl_wfp_sio import CtdpfCklWfpSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.wc_wfp*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -21,6 +21,9 @@ from mi.dataset.parser.cspp_base import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_CTD.txt', '*_PPD_CTD.txt']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -16,6 +16,9 @@ from mi.dataset.parser.dofst_k_wfp_particles import DofstKWfpRecoveredDataPartic
     DofstKWfpRecoveredMetadataParticle
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['C*.DAT', 'C*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.dofst_k_wfp_particles import DofstKWfpTelemeteredDataPart
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['C*.DAT', 'C*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -19,6 +19,9 @@ from mi.dataset.parser.dosta_abcdjm_cspp import DostaAbcdjmCsppParser, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_OPT.txt', '*_PPD_OPT.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
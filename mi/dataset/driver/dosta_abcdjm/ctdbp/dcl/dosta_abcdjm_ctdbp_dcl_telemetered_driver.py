@@ -18,6 +18,9 @@ from mi.core.versioning import version
 MODULE_NAME = 'mi.dataset.parser.dosta_abcdjm_ctdb_dcl'
 
 
+FILE_PATTERNS = ['*.ctdbp*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -11,6 +11,9 @@ from mi.dataset.parser.dosta_abcdjm_dcl import DostaAbcdjmDclRecoveredParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.dosta*.log']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.dosta_abcdjm_mmp_cds import DostaAbcdjmMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['optode_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
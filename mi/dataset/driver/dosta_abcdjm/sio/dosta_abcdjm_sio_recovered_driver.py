@@ -23,6 +23,9 @@ from mi.dataset.parser.dosta_abcdjm_sio import DostaAbcdjmSioParser, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['DOS*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -26,6 +26,9 @@ from mi.dataset.parser.dosta_abcdjm_sio import DostaAbcdjmSioParser, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.dosta*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -16,6 +16,9 @@ from mi.dataset.parser.dosta_ln_auv import DostaLnAuvParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
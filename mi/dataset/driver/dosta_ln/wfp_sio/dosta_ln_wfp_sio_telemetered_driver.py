@@ -17,6 +17,9 @@ from mi.dataset.parser.dosta_ln_wfp_sio import DostaLnWfpSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.we_wfp*.dat']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -14,6 +14,9 @@ import os
 
 log = get_logger()
 
+FILE_PATTERNS = ['*.mpk']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     config.add_configuration(os.path.join(basePythonCodePath, 'res', 'config', 'mi-logging.yml'))
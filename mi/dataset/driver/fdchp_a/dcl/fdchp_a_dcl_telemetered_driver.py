@@ -12,6 +12,9 @@ from mi.dataset.parser.fdchp_a_dcl import FdchpADclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.fdchp*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
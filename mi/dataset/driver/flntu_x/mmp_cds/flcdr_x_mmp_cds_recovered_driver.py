@@ -17,6 +17,9 @@ from mi.dataset.parser.flcdr_x_mmp_cds import FlcdrXMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['flcdr_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
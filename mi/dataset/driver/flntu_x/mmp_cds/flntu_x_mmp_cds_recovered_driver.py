@@ -17,6 +17,9 @@ from mi.dataset.parser.flntu_x_mmp_cds import FlntuXMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['flntu_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
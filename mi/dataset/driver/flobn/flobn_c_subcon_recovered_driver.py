@@ -17,6 +17,9 @@ from mi.dataset.parser.flobn_cm_subcon import FlobnCSubconParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['FLOBN-C_*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.flobn_cm_subcon import FlobnMSubconTemperatureParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['FLOBN-M_Temp_*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -24,6 +24,9 @@ FLORD_TELEM_CONFIG = {
 }
 
 
+FILE_PATTERNS = ['ctdbp*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.global_wfp_e_file_parser import GlobalWfpEFileParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['E*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -13,6 +13,9 @@ from mi.dataset.parser.flord_l_wfp_sio import FlordLWfpSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.we_wfp*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
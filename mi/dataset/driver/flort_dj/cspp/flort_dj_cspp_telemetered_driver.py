@@ -25,6 +25,9 @@ from mi.dataset.parser.cspp_base import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_FLR.txt', '*_PPD_FLR.txt']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -45,6 +45,9 @@ class FlortDjDclTelemeteredDriver:
         return self._particleDataHdlrObj
 
 
+FILE_PATTERNS = ['*.flort*.log']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     config.add_configuration(os.path.join(basePythonCodePath, 'res', 'config', 'mi-logging.yml'))
@@ -19,6 +19,9 @@ from mi.dataset.parser.flort_dj_sio import FlortDjSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.flort*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
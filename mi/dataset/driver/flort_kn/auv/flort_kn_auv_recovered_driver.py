@@ -16,6 +16,9 @@ from mi.dataset.parser.flort_kn_auv import FlortKnAuvParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -19,6 +19,9 @@ from mi.dataset.parser.fuelcell_eng_dcl import FuelCellEngDclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.pwrsys*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -10,6 +10,9 @@ from mi.dataset.parser.hyd_o_dcl import HydODclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.hyd*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
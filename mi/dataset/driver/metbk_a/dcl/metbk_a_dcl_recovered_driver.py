@@ -10,6 +10,9 @@ from mi.dataset.driver.metbk_a.dcl.metbk_dcl_a_driver import process, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.metbk*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     process(sourceFilePath, particleDataHdlrObj, RECOVERED_PARTICLE_CLASS)
@@ -15,6 +15,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.PD0']
+
+
 @version("0.1.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -16,6 +16,9 @@ from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['*.mrg']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
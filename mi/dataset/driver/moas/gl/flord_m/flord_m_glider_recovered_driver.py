@@ -15,6 +15,9 @@ from mi.dataset.driver.moas.gl.flord_m.flord_m_glider_driver import FlordMDriver
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.mrg']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
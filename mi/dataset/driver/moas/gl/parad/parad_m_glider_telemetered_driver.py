@@ -13,6 +13,9 @@ from mi.dataset.driver.moas.gl.parad.parad_m_glider_driver import ParadMDriver
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.mrg']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -16,6 +16,9 @@ from mi.dataset.parser.nutnr_b_dcl_conc import NutnrBDclConcTelemeteredParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.nutnr*.log']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
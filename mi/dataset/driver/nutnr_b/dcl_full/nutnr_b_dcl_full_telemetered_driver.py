@@ -15,6 +15,9 @@ from mi.dataset.dataset_driver import DataSetDriver
 from mi.dataset.parser.nutnr_b_dcl_full import NutnrBDclFullTelemeteredParser
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['*.nutnr*.log']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     
@@ -24,6 +24,9 @@ from mi.dataset.parser.nutnr_j_cspp import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_SNA_SNA.txt']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
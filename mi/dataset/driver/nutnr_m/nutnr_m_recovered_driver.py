@@ -10,6 +10,9 @@ from mi.dataset.parser.nutnr_m import NutnrMParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.bin']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
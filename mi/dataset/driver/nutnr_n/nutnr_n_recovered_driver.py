@@ -10,6 +10,9 @@ from mi.dataset.parser.nutnr_n import NutnrNParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.sun']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
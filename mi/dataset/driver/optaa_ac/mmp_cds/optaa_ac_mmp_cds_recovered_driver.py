@@ -17,6 +17,9 @@ from mi.dataset.parser.optaa_ac_mmp_cds import OptaaAcMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['acs_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -23,6 +23,9 @@ from mi.dataset.parser.optaa_dj_cspp import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_ACS_ACS.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -45,6 +45,9 @@ class OptaaDjDclRecoveredDriver:
         return self._particleDataHdlrObj
 
 
+FILE_PATTERNS = ['*.optaa*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     config.add_configuration(os.path.join(basePythonCodePath, 'res', 'config', 'mi-logging.yml'))
@@ -17,6 +17,9 @@ from mi.dataset.parser.osmoi_a_subcon import OsmoiASubconParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['osmoi_*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
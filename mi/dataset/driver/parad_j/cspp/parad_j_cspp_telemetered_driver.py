@@ -23,6 +23,9 @@ from mi.dataset.parser.parad_j_cspp import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_PARS.txt', '*_PPD_PARS.txt']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
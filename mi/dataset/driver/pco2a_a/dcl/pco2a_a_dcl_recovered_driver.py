@@ -13,6 +13,9 @@ from mi.dataset.driver.pco2a_a.dcl.pco2a_a_dcl_driver import process, \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.pco2a*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     process(sourceFilePath, particleDataHdlrObj, RECOVERED_PARTICLE_CLASSES)
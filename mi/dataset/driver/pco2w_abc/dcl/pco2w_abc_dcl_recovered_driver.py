@@ -21,6 +21,9 @@ from mi.dataset.parser.pco2w_abc_particles import Pco2wAbcDclMetadataRecoveredDa
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.pco2w*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -24,6 +24,9 @@ from mi.dataset.parser.pco2w_abc_particles import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['pco2w*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -48,6 +48,9 @@ class Pco2wAbcDriver:
         return self._particleDataHdlrObj
 
 
+FILE_PATTERNS = ['SAMI_C*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     config.add_configuration(os.path.join(basePythonCodePath, 'res', 'config', 'mi-logging.yml'))
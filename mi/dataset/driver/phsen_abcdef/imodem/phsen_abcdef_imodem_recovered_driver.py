@@ -23,6 +23,9 @@ from mi.dataset.parser.phsen_abcdef_imodem_particles import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['phsen*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -19,6 +19,9 @@ from mi.dataset.parser.phsen_abcdef import PhsenRecoveredParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['SAMI_P*.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -18,6 +18,9 @@ from mi.dataset.parser.phsen_abcdef_sio import PhsenAbcdefSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.phsen*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
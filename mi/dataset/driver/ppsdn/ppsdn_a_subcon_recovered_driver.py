@@ -17,6 +17,9 @@ from mi.dataset.parser.ppsdn_a_subcon import PpsdnASubconParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['ppsdn_*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -11,6 +11,9 @@ from mi.dataset.parser.presf_abc_dcl import PresfAbcDclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.presf*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -17,6 +17,9 @@ from mi.dataset.parser.rasfl_a_subcon import RasflASubconParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['rasfl_*.csv']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -16,6 +16,9 @@ from mi.dataset.dataset_driver import SimpleDatasetDriver
 from mi.dataset.parser.sio_eng_sio import SioEngSioParser
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['STA*.DAT']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
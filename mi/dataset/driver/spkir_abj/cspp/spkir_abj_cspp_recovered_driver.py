@@ -22,6 +22,9 @@ from mi.dataset.parser.cspp_base import \
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_OCR.txt', '*_PPD_OCR.txt']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -45,6 +45,9 @@ class SpkirAbjDclTelemeteredDriver:
         return self._particleDataHdlrObj
 
 
+FILE_PATTERNS = ['*.spkir*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     config.add_configuration(os.path.join(basePythonCodePath, 'res', 'config', 'mi-logging.yml'))
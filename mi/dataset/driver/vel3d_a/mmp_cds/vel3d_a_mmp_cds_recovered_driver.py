@@ -24,6 +24,9 @@ from mi.dataset.parser.vel3d_a_mmp_cds import Vel3dAMmpCdsParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['acm_*.mpk']
+
+
 @version("0.0.1")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
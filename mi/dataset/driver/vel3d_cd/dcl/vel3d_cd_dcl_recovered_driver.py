@@ -12,6 +12,9 @@ from mi.dataset.parser.vel3d_cd_dcl import Vel3dCdDclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.vel3d*.log']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
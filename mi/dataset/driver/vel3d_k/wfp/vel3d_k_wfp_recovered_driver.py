@@ -16,6 +16,9 @@ from mi.dataset.dataset_driver import DataSetDriver, ParticleDataHandler
 from mi.dataset.parser.vel3d_k_wfp import Vel3dKWfpParser
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['A*.DAT']
+
+
 @version("0.1.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
@@ -15,6 +15,9 @@ from mi.dataset.dataset_driver import DataSetDriver, ParticleDataHandler
 from mi.dataset.parser.vel3d_k_wfp_stc import Vel3dKWfpStcParser
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['*.DEC']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
 
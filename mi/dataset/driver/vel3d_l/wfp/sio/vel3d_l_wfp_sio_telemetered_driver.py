@@ -19,6 +19,9 @@ from mi.dataset.parser.vel3d_l_wfp import Vel3dLWfpSioParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['node*.wa_wfp*.dat']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
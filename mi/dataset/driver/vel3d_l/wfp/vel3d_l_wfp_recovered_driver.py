@@ -19,6 +19,9 @@ from mi.dataset.parser.vel3d_l_wfp import Vel3dLWfpParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['A*.DAT']
+
+
 @version("0.1.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
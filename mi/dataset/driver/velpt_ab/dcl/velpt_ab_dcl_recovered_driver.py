@@ -21,6 +21,9 @@ from mi.dataset.parser.velpt_ab_dcl_particles import VelptAbDclDiagnosticsDataPa
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.velpt*.log']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
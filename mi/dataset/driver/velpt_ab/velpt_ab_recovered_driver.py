@@ -19,6 +19,9 @@ from mi.dataset.parser.velpt_ab_particles import VelptAbInstrumentDataParticle,
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.aqd']
+
+
 @version("15.7.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -16,6 +16,9 @@ from mi.dataset.parser.cspp_base import METADATA_PARTICLE_CLASS_KEY, DATA_PARTIC
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*_PPB_ADCP.txt', '*_PPD_ADCP.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
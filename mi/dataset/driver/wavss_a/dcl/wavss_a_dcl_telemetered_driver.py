@@ -52,6 +52,9 @@ class WavssADclTelemeteredDriver:
         return self._particleDataHdlrObj
 
 
+FILE_PATTERNS = ['*.wavss*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -24,6 +24,9 @@ from mi.dataset.parser.cspp_base import \
 
 from mi.core.versioning import version
 
+FILE_PATTERNS = ['*_WC_HMR.txt']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -19,6 +19,9 @@ from mi.dataset.parser.winch_cspp import WinchCsppParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*-WINCH*.LOG']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
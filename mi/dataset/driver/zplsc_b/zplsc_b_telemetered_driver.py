@@ -17,6 +17,9 @@ from mi.dataset.parser.zplsc_b import ZplscBParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.raw']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, outputFilePath, particleDataHdlrObj):
     """
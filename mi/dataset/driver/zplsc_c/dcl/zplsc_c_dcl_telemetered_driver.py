@@ -15,6 +15,9 @@ from mi.dataset.parser.zplsc_c_dcl import ZplscCDclParser
 from mi.core.versioning import version
 
 
+FILE_PATTERNS = ['*.zplsc*.log']
+
+
 @version("15.6.0")
 def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
     """
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.driver_registry
+@file mi/dataset/driver_registry.py
+@brief Registry of the dataset drivers which imports only the driver used
+
+The driver modules under mi/dataset/driver are listed in a manifest,
+mi/dataset/driver/manifest.json, which is generated from their source
+without importing them. Each entry maps the driver name, the module name
+without its _driver suffix, to its module, the instrument package it is in,
+the version set on its parse() function with mi.core.versioning.version and
+the file patterns it declares in a module level FILE_PATTERNS list. Looking
+up a driver in the registry only imports that driver's module, so a process
+parsing one file does not pay for importing the others.
+
+The manifest is regenerated after adding or changing a driver with:
+    python -m mi.dataset.driver_registry build
+"""
+
+__license__ = 'Apache 2.0'
+
+import fnmatch
+import json
+import os
+
+
+DRIVER_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'driver')
+MANIFEST_PATH = os.path.join(DRIVER_ROOT, 'manifest.json')
+DRIVER_SUFFIX = '_driver'
+
+
+class DriverRegistryKey(object):
+    """
+    Keys of a manifest entry
+    """
+    MODULE = 'module'
+    INSTRUMENT = 'instrument'
+    VERSION = 'version'
+    FILE_PATTERNS = 'file_patterns'
+
+
+def _source_entry(path):
+    """
+    Read the manifest entry of a driver module from its source
+    @param path The path of the driver module
+    @retval The entry, or None if the module does not define parse()
+    """
+    import ast
+
+    with open(path) as stream_handle:
+        tree = ast.parse(stream_handle.read(), path)
+
+    entry = None
+    file_patterns = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == 'parse':
+            entry = {DriverRegistryKey.VERSION: None}
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call) and getattr(decorator.func, 'id', None) == 'version' \
+                        and decorator.args:
+                    entry[DriverRegistryKey.VERSION] = ast.literal_eval(decorator.args[0])
+        elif isinstance(node, ast.Assign) and \
+                any(getattr(target, 'id', None) == 'FILE_PATTERNS' for target in node.targets):
+            file_patterns = list(ast.literal_eval(node.value))
+
+    if entry is not None:
+        entry[DriverRegistryKey.FILE_PATTERNS] = file_patterns
+    return entry
+
+
+def build_manifest(driver_root=DRIVER_ROOT):
+    """
+    Build the manifest from the driver sources
+    @param driver_root The directory holding the driver packages
+    @retval A dictionary of manifest entries by driver name
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(driver_root)))
+    manifest = {}
+    for directory, directories, files in os.walk(driver_root):
+        directories.sort()
+        for name in sorted(files):
+            if not name.endswith(DRIVER_SUFFIX + '.py'):
+                continue
+            path = os.path.join(directory, name)
+            entry = _source_entry(path)
+            if entry is None:
+                continue
+
+            driver_name = name[:-len(DRIVER_SUFFIX + '.py')]
+            if driver_name in manifest:
+                raise ValueError("Driver name %s is used by %s and %s" %
+                                 (driver_name, manifest[driver_name][DriverRegistryKey.MODULE], path))
+            entry[DriverRegistryKey.MODULE] = os.path.relpath(path[:-len('.py')], package_root).replace(os.sep, '.')
+            entry[DriverRegistryKey.INSTRUMENT] = os.path.relpath(directory, driver_root).replace(os.sep, '.')
+            manifest[driver_name] = entry
+
+    return manifest
+
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    with open(path, 'w') as stream_handle:
+        stream_handle.write(json.dumps(manifest, indent=2, sort_keys=True, separators=(',', ': ')) + '\n')
+
+
+class DriverRegistry(object):
+    """
+    Looks up dataset drivers by name in the manifest, importing a driver
+    module only when its parse() function is asked for
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        """
+        @param manifest_path The manifest, built from the driver sources if it does not exist
+        """
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as stream_handle:
+                self._manifest = json.load(stream_handle)
+        else:
+            self._manifest = build_manifest()
+        self._parse_functions = {}
+
+    def __contains__(self, driver_name):
+        return driver_name in self._manifest
+
+    def __len__(self):
+        return len(self._manifest)
+
+    def names(self, instrument=None):
+        """
+        @param instrument Only the drivers in this instrument package or the
+            packages below it, e.g. 'moas.gl' or 'moas.gl.ctdgv'
+        @retval A sorted list of driver names
+        """
+        if instrument is None:
+            return sorted(self._manifest)
+        return sorted(name for name, entry in self._manifest.iteritems()
+                      if entry[DriverRegistryKey.INSTRUMENT] == instrument or
+                      entry[DriverRegistryKey.INSTRUMENT].startswith(instrument + '.'))
+
+    def entry(self, driver_name):
+        """
+        @retval The manifest entry of a driver
+        @throws KeyError if there is no such driver
+        """
+        return self._manifest[driver_name]
+
+    def version(self, driver_name):
+        """
+        @retval The version of a driver, without importing it
+        """
+        return self._manifest[driver_name][DriverRegistryKey.VERSION]
+
+    def match(self, source_file):
+        """
+        @retval A sorted list of the names of the drivers declaring a file pattern
+            which matches the name of a file
+        """
+        file_name = os.path.basename(source_file)
+        return sorted(name for name, entry in self._manifest.iteritems()
+                      if any(fnmatch.fnmatch(file_name, pattern)
+                             for pattern in entry[DriverRegistryKey.FILE_PATTERNS]))
+
+    def get_parse(self, driver_name):
+        """
+        Import a driver module, if it has not been yet
+        @retval The parse() function of the driver
+        @throws KeyError if there is no such driver
+        """
+        parse = self._parse_functions.get(driver_name)
+        if parse is None:
+            module_name = self._manifest[driver_name][DriverRegistryKey.MODULE]
+            parse = __import__(module_name, fromlist=['parse']).parse
+            self._parse_functions[driver_name] = parse
+        return parse
+
+    def parse(self, driver_name, basePythonCodePath, sourceFilePath, particleDataHdlrObj):
+        """
+        Parse a file with a driver, as uFrame calls its parse() function
+        """
+        return self.get_parse(driver_name)(basePythonCodePath, sourceFilePath, particleDataHdlrObj)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Manage the dataset driver manifest')
+    parser.add_argument('command', choices=['build', 'check'],
+                        help='build the manifest, or check it is up to date with the driver sources')
+    args = parser.parse_args(argv)
+
+    manifest = build_manifest()
+    if args.command == 'build':
+        write_manifest(manifest)
+        print 'Wrote %d drivers to %s' % (len(manifest), MANIFEST_PATH)
+    elif DriverRegistry()._manifest != manifest:
+        raise SystemExit('%s is out of date, run python -m mi.dataset.driver_registry build' % MANIFEST_PATH)
+
+
+if __name__ == '__main__':
+    main()
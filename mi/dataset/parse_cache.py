@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.parse_cache
+@file mi/dataset/parse_cache.py
+@brief On disk cache of the particles a driver parsed from a file
+
+The cache is keyed on the content hash of the file, the driver module, the
+version stamped on its parse() function with mi.core.versioning.version and
+the parser configuration, so a file is only parsed again when one of those
+changes. Entries are evicted least recently used first once the cache grows
+past its size limit. Several processes may use the same cache directory, an
+entry removed by one of them is a miss for the others.
+
+Usage:
+    python -m mi.dataset.parse_cache <cache directory> invalidate [--module <driver module>]
+    python -m mi.dataset.parse_cache <cache directory> stats
+"""
+
+__license__ = 'Apache 2.0'
+
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from mi.core.log import get_logger
+log = get_logger()
+
+# extension of the cache entry files
+ENTRY_EXTENSION = '.particles'
+
+# bytes read at a time when hashing a file
+HASH_BLOCK_SIZE = 1 << 20
+
+
+class ParseCache(object):
+    """
+    Directory of cache entries, one subdirectory per driver module. Each
+    entry holds the generated particles of one parsed file, one particle per
+    line preceded by its particle type and a tab.
+
+    The total size of the entries is estimated from the last walk of the
+    directory plus the entries added since, and the directory is only walked
+    again to evict entries once the estimate is past the size limit.
+    """
+    DEFAULT_MAX_BYTES = 1 << 30
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, auto_evict=True):
+        """
+        @param directory The cache directory, created if it does not exist
+        @param max_bytes The size the cache is trimmed to after adding an entry
+        @param auto_evict If False adding an entry does not evict any, the
+            process owning the cache calls added() and trim() instead
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.auto_evict = auto_evict
+        # bytes of the entries written through this cache object
+        self.bytes_added = 0
+        # estimated total size of the entries, None until the directory is walked
+        self._size = None
+        _make_directory(directory)
+
+    @staticmethod
+    def driver_version(driver_module):
+        """
+        @param driver_module The driver module
+        @retval The version of the driver parse() function, or None if it has none
+        """
+        return getattr(getattr(driver_module, 'parse', None), 'version', None)
+
+    @staticmethod
+    def key(source_file, driver_module, parser_config=None):
+        """
+        Build the cache key of a file parsed by a driver
+        @param source_file The path of the file
+        @param driver_module The driver module
+        @param parser_config The parser configuration, if the caller has one
+        @retval The key, or None if the driver has no version so can not be cached
+        """
+        driver_version = ParseCache.driver_version(driver_module)
+        if driver_version is None:
+            return None
+
+        file_hash = hashlib.sha1()
+        with open(source_file, 'rb') as stream_handle:
+            data = stream_handle.read(HASH_BLOCK_SIZE)
+            while data:
+                file_hash.update(data)
+                data = stream_handle.read(HASH_BLOCK_SIZE)
+
+        key_hash = hashlib.sha1(file_hash.hexdigest())
+        key_hash.update('\0' + driver_module.__name__)
+        key_hash.update('\0' + str(driver_version))
+        key_hash.update('\0' + json.dumps(parser_config, sort_keys=True, default=repr))
+        return key_hash.hexdigest()
+
+    def _path(self, driver_module_name, key):
+        return os.path.join(self.directory, driver_module_name, key + ENTRY_EXTENSION)
+
+    def get(self, driver_module_name, key):
+        """
+        Read an entry, marking it as recently used
+        @param driver_module_name The name of the driver module
+        @param key The cache key
+        @retval A list of (particle type, generated particle) tuples, or None on a miss
+        """
+        path = self._path(driver_module_name, key)
+        try:
+            with open(path, 'rb') as stream_handle:
+                data = stream_handle.read()
+        except IOError:
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError as e:
+            # evicted by another process since it was read
+            if e.errno != errno.ENOENT:
+                raise
+        return [tuple(line.split('\t', 1)) for line in data.splitlines()]
+
+    def put(self, driver_module_name, key, samples):
+        """
+        Write an entry, then evict entries if the cache is past its size limit
+        @param driver_module_name The name of the driver module
+        @param key The cache key
+        @param samples A list of (particle type, generated particle) tuples
+        @retval The size of the entry in bytes
+        """
+        path = self._path(driver_module_name, key)
+        module_directory = os.path.dirname(path)
+        _make_directory(module_directory)
+
+        # write to a temporary file and rename it so readers never see a partial entry
+        data = ''.join(['%s\t%s\n' % sample for sample in samples])
+        handle, temp_path = tempfile.mkstemp(dir=module_directory)
+        with os.fdopen(handle, 'wb') as stream_handle:
+            stream_handle.write(data)
+        os.rename(temp_path, path)
+
+        self.bytes_added += len(data)
+        if self.auto_evict:
+            self.added(len(data))
+            self.trim()
+        return len(data)
+
+    def added(self, size):
+        """
+        Count entries added to the cache in the size estimate
+        @param size The number of bytes added
+        """
+        if self._size is not None:
+            self._size += size
+
+    def trim(self):
+        """
+        Evict entries if the estimated size of the cache is past its size limit,
+        walking the directory only then or if it has not been walked yet
+        @retval The number of entries removed
+        """
+        if self._size is not None and self._size <= self.max_bytes:
+            return 0
+        return self.evict()
+
+    def entries(self):
+        """
+        @retval A list of (modified time, size, path) of each entry
+        """
+        result = []
+        for root, directories, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(ENTRY_EXTENSION):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError as e:
+                        # evicted by another process
+                        if e.errno != errno.ENOENT:
+                            raise
+                        continue
+                    result.append((stat.st_mtime, stat.st_size, path))
+        return result
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits its size limit
+        @retval The number of entries removed
+        """
+        entries = sorted(self.entries())
+        total = sum(size for mtime, size, path in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                # evicted by another process
+                if e.errno != errno.ENOENT:
+                    raise
+            total -= size
+
+        self._size = total
+        return removed
+
+    def invalidate(self, driver_module_name=None):
+        """
+        Remove the entries of one driver module, or every entry
+        @param driver_module_name The name of the driver module, or None for all
+        """
+        if driver_module_name is None:
+            for name in os.listdir(self.directory):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        else:
+            shutil.rmtree(os.path.join(self.directory, driver_module_name), ignore_errors=True)
+        self._size = None
+
+
+def _make_directory(directory):
+    """
+    Create a directory if it does not exist, another process may be creating it too
+    """
+    try:
+        os.makedirs(directory)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+
+class _RecordingHandler(object):
+    """
+    Particle data handler which forwards to another handler and records the
+    generated particles it is given, so they can be cached
+    """
+
+    def __init__(self, handler):
+        self._handler = handler
+        self.samples = []
+        self.failure = False
+
+    def addParticleSample(self, sample_type, sample):
+        self.samples.append((sample_type, sample))
+        self._handler.addParticleSample(sample_type, sample)
+
+    def addParticleSamples(self, sample_type, samples):
+        self.samples.extend([(sample_type, sample) for sample in samples])
+        _add_samples(self._handler, sample_type, samples)
+
+    def addParticleBatch(self, batch):
+        self.addParticleSamples(batch.type(), batch.generate_samples())
+
+    def setParticleDataCaptureFailure(self):
+        self.failure = True
+        self._handler.setParticleDataCaptureFailure()
+
+
+def _add_samples(handler, sample_type, samples):
+    """
+    Hand a list of samples of one type to a particle data handler
+    """
+    if hasattr(handler, 'addParticleSamples'):
+        handler.addParticleSamples(sample_type, samples)
+    else:
+        for sample in samples:
+            handler.addParticleSample(sample_type, sample)
+
+
+def cached_parse(cache, driver_module, basePythonCodePath, sourceFilePath, particleDataHdlrObj,
+                 parser_config=None):
+    """
+    Call the parse() function of a driver module, replaying the particles from
+    the cache if the file was already parsed by the same driver version
+    @param cache The ParseCache
+    @param driver_module The driver module
+    @param parser_config The parser configuration, if the caller has one
+    @retval True if the particles were replayed from the cache
+    """
+    key = ParseCache.key(sourceFilePath, driver_module, parser_config)
+    if key is None:
+        log.debug("Driver %s has no version, not caching", driver_module.__name__)
+        driver_module.parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj)
+        return False
+
+    samples = cache.get(driver_module.__name__, key)
+    if samples is not None:
+        log.debug("Replaying %d cached particles for %s", len(samples), sourceFilePath)
+        # hand over consecutive samples of the same type in one call
+        start = 0
+        for index in xrange(1, len(samples) + 1):
+            if index == len(samples) or samples[index][0] != samples[start][0]:
+                _add_samples(particleDataHdlrObj, samples[start][0],
+                             [sample for sample_type, sample in samples[start:index]])
+                start = index
+        return True
+
+    recorder = _RecordingHandler(particleDataHdlrObj)
+    driver_module.parse(basePythonCodePath, sourceFilePath, recorder)
+    # only complete parses are cached, a failure has to be seen again
+    if not recorder.failure:
+        cache.put(driver_module.__name__, key, recorder.samples)
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage a dataset driver parse cache')
+    parser.add_argument('directory', help='the cache directory')
+    subparsers = parser.add_subparsers(dest='command')
+    invalidate_parser = subparsers.add_parser('invalidate', help='remove cache entries')
+    invalidate_parser.add_argument('--module', help='only remove the entries of this driver module')
+    subparsers.add_parser('stats', help='show the number and size of the cache entries')
+    args = parser.parse_args(argv)
+
+    cache = ParseCache(args.directory)
+    if args.command == 'invalidate':
+        cache.invalidate(args.module)
+    else:
+        entries = cache.entries()
+        print '%d entries, %d bytes' % (len(entries), sum(size for mtime, size, path in entries))
+
+
+if __name__ == '__main__':
+    main()
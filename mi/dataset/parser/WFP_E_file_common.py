@@ -15,7 +15,7 @@ from mi.core.log import get_logger
 log = get_logger()
 from mi.core.exceptions import SampleException, NotImplementedException, DatasetParserException
 from mi.core.common import BaseEnum
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 
 # This regex will be used to match the flags for one of the two bit patterns:
 #  0001 0000 0000 0000 0001 0001 0000 0000  (regex: \x00\x01\x00{7}\x01\x00\x01\x00{4})
@@ -77,7 +77,7 @@ class WfpEFileParser(BufferLoadingParser):
                  *args, **kwargs):
 
         self._timestamp = 0.0
-        self._record_buffer = []  # holds tuples of (record, state)
+        self._record_buffer = RecordQueue()  # holds tuples of (record, state)
         self._read_state = {StateKey.POSITION: 0}
         super(WfpEFileParser, self).__init__(config,
                                              stream_handle,
@@ -133,7 +133,7 @@ class WfpEFileParser(BufferLoadingParser):
         if not (StateKey.POSITION in state_obj):
             raise DatasetParserException("Invalid state keys")
         self._chunker.clean_all_chunks()
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
         self._stream_handle.seek(state_obj[StateKey.POSITION])
@@ -10,15 +10,19 @@ Release notes:
 initial release
 """
 import datetime as dt
+import os
 import struct
+from collections import deque
+from multiprocessing import Pool
 
 from mi.core.common import BaseEnum
 from mi.core.exceptions import RecoverableSampleException
 from mi.core.exceptions import UnexpectedDataException
 from mi.core.instrument.data_particle import DataParticle, DataParticleKey
 from mi.core.log import get_logger
-from mi.dataset.dataset_parser import SimpleParser, DataSetDriverConfigKeys
-from mi.dataset.parser.pd0_parser import AdcpPd0Record, PD0ParsingException
+from mi.dataset.dataset_parser import SimpleParser, DataSetDriverConfigKeys, map_stream
+from mi.dataset.parser.pd0_parser import AdcpPd0Record, PD0ParsingException, beam_lists, \
+    EnsembleIndex, EnsembleStatus
 
 __author__ = 'Jeff Roy'
 __license__ = 'Apache 2.0'
@@ -226,6 +230,7 @@ class AdcpDataParticleType(BaseEnum):
 
 
 class Pd0Base(DataParticle):
+    __slots__ = ()
     ntp_epoch = dt.datetime(1900, 1, 1)
 
     def __init__(self, *args, **kwargs):
@@ -245,12 +250,15 @@ class Pd0Base(DataParticle):
 
 
 class VelocityBase(Pd0Base):
+    __slots__ = ()
     def _build_base_values(self):
         """
         Build the BASE values for all ADCP VELOCITY particles
         """
         record = self.raw_data
         ensemble_number = (record.variable_data.ensemble_roll_over << 16) + record.variable_data.ensemble_number
+        correlation_magnitudes = beam_lists(record.correlation_magnitudes)
+        echo_intensity = beam_lists(record.echo_intensity)
 
         return [
             # FIXED LEADER
@@ -268,19 +276,20 @@ class VelocityBase(Pd0Base):
             # SYSCONFIG BITMAP
             (AdcpPd0ParsedKey.SYSCONFIG_VERTICAL_ORIENTATION, record.sysconfig.beam_facing),
             # CORRELATION MAGNITUDES
-            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM1, record.correlation_magnitudes.beam1),
-            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM2, record.correlation_magnitudes.beam2),
-            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM3, record.correlation_magnitudes.beam3),
-            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM4, record.correlation_magnitudes.beam4),
+            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM1, correlation_magnitudes[0]),
+            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM2, correlation_magnitudes[1]),
+            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM3, correlation_magnitudes[2]),
+            (AdcpPd0ParsedKey.CORRELATION_MAGNITUDE_BEAM4, correlation_magnitudes[3]),
             # ECHO INTENSITIES
-            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM1, record.echo_intensity.beam1),
-            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM2, record.echo_intensity.beam2),
-            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM3, record.echo_intensity.beam3),
-            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM4, record.echo_intensity.beam4),
+            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM1, echo_intensity[0]),
+            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM2, echo_intensity[1]),
+            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM3, echo_intensity[2]),
+            (AdcpPd0ParsedKey.ECHO_INTENSITY_BEAM4, echo_intensity[3]),
         ]
 
 
 class VelocityEarth(VelocityBase):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.VELOCITY_EARTH
 
     def _build_parsed_values(self):
@@ -289,17 +298,19 @@ class VelocityEarth(VelocityBase):
         """
         record = self.raw_data
         fields = self._build_base_values()
+        velocities = beam_lists(record.velocities)
+        percent_good = beam_lists(record.percent_good)
 
         fields.extend([
             # EARTH VELOCITIES
-            (AdcpPd0ParsedKey.WATER_VELOCITY_EAST, record.velocities.beam1),
-            (AdcpPd0ParsedKey.WATER_VELOCITY_NORTH, record.velocities.beam2),
-            (AdcpPd0ParsedKey.WATER_VELOCITY_UP, record.velocities.beam3),
-            (AdcpPd0ParsedKey.ERROR_VELOCITY, record.velocities.beam4),
-            (AdcpPd0ParsedKey.PERCENT_GOOD_3BEAM, record.percent_good.beam1),
-            (AdcpPd0ParsedKey.PERCENT_TRANSFORMS_REJECT, record.percent_good.beam2),
-            (AdcpPd0ParsedKey.PERCENT_BAD_BEAMS, record.percent_good.beam3),
-            (AdcpPd0ParsedKey.PERCENT_GOOD_4BEAM, record.percent_good.beam4),
+            (AdcpPd0ParsedKey.WATER_VELOCITY_EAST, velocities[0]),
+            (AdcpPd0ParsedKey.WATER_VELOCITY_NORTH, velocities[1]),
+            (AdcpPd0ParsedKey.WATER_VELOCITY_UP, velocities[2]),
+            (AdcpPd0ParsedKey.ERROR_VELOCITY, velocities[3]),
+            (AdcpPd0ParsedKey.PERCENT_GOOD_3BEAM, percent_good[0]),
+            (AdcpPd0ParsedKey.PERCENT_TRANSFORMS_REJECT, percent_good[1]),
+            (AdcpPd0ParsedKey.PERCENT_BAD_BEAMS, percent_good[2]),
+            (AdcpPd0ParsedKey.PERCENT_GOOD_4BEAM, percent_good[3]),
             (AdcpPd0ParsedKey.PRESSURE, record.variable_data.pressure),
         ])
 
@@ -307,10 +318,12 @@ class VelocityEarth(VelocityBase):
 
 
 class VelocityGlider(VelocityEarth):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.VELOCITY_GLIDER
 
 
 class VelocityInst(VelocityBase):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.VELOCITY_INST
 
     def _build_parsed_values(self):
@@ -319,17 +332,19 @@ class VelocityInst(VelocityBase):
         """
         record = self.raw_data
         fields = self._build_base_values()
+        velocities = beam_lists(record.velocities)
+        percent_good = beam_lists(record.percent_good)
 
         fields.extend([
             # INSTRUMENT VELOCITIES
-            (AdcpPd0ParsedKey.WATER_VELOCITY_FORWARD, record.velocities.beam1),
-            (AdcpPd0ParsedKey.WATER_VELOCITY_STARBOARD, record.velocities.beam2),
-            (AdcpPd0ParsedKey.WATER_VELOCITY_VERTICAL, record.velocities.beam3),
-            (AdcpPd0ParsedKey.ERROR_VELOCITY, record.velocities.beam4),
-            (AdcpPd0ParsedKey.PERCENT_GOOD_3BEAM, record.percent_good.beam1),
-            (AdcpPd0ParsedKey.PERCENT_TRANSFORMS_REJECT, record.percent_good.beam2),
-            (AdcpPd0ParsedKey.PERCENT_BAD_BEAMS, record.percent_good.beam3),
-            (AdcpPd0ParsedKey.PERCENT_GOOD_4BEAM, record.percent_good.beam4)])
+            (AdcpPd0ParsedKey.WATER_VELOCITY_FORWARD, velocities[0]),
+            (AdcpPd0ParsedKey.WATER_VELOCITY_STARBOARD, velocities[1]),
+            (AdcpPd0ParsedKey.WATER_VELOCITY_VERTICAL, velocities[2]),
+            (AdcpPd0ParsedKey.ERROR_VELOCITY, velocities[3]),
+            (AdcpPd0ParsedKey.PERCENT_GOOD_3BEAM, percent_good[0]),
+            (AdcpPd0ParsedKey.PERCENT_TRANSFORMS_REJECT, percent_good[1]),
+            (AdcpPd0ParsedKey.PERCENT_BAD_BEAMS, percent_good[2]),
+            (AdcpPd0ParsedKey.PERCENT_GOOD_4BEAM, percent_good[3])])
 
         return [{DataParticleKey.VALUE_ID: key, DataParticleKey.VALUE: value} for key, value in fields]
 
@@ -339,6 +354,7 @@ class EngineeringBase(Pd0Base):
     ADCP PD0 data particle
     @throw SampleException if when break happens
     """
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.PD0_ENGINEERING
 
     def _build_base_fields(self):
@@ -370,6 +386,7 @@ class GliderEngineering(EngineeringBase):
     ADCP PD0 data particle
     @throw SampleException if when break happens
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -384,6 +401,7 @@ class AuvEngineering(EngineeringBase):
     ADCP PD0 data particle
     @throw SampleException if when break happens
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -405,6 +423,7 @@ class AdcpsEngineering(EngineeringBase):
     ADCP PD0 data particle
     @throw SampleException if when break happens
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -427,6 +446,7 @@ class BaseConfig(Pd0Base):
     ADCP PD0 data particle
     @throw SampleException if when break happens
     """
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.PD0_CONFIG
 
     def _build_base_fields(self):
@@ -496,6 +516,7 @@ class BaseConfig(Pd0Base):
 
 
 class GliderConfig(BaseConfig):
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -508,6 +529,7 @@ class GliderConfig(BaseConfig):
 
 
 class AdcpsConfig(BaseConfig):
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -522,6 +544,7 @@ class AdcpsConfig(BaseConfig):
 
 
 class AuvConfig(BaseConfig):
+    __slots__ = ()
     def _build_parsed_values(self):
         record = self.raw_data
         fields = self._build_base_fields()
@@ -533,6 +556,7 @@ class AuvConfig(BaseConfig):
 
 
 class BaseBottom(Pd0Base):
+    __slots__ = ()
     def _build_fields(self):
         record = self.raw_data
 
@@ -584,6 +608,7 @@ class BaseBottom(Pd0Base):
 
 
 class EarthBottom(BaseBottom):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.BOTTOM_TRACK_EARTH
 
     def _build_parsed_values(self):
@@ -605,6 +630,7 @@ class EarthBottom(BaseBottom):
 
 
 class InstBottom(BaseBottom):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.BOTTOM_TRACK_INST
 
     def _build_parsed_values(self):
@@ -626,6 +652,7 @@ class InstBottom(BaseBottom):
 
 
 class BottomConfig(Pd0Base):
+    __slots__ = ()
     _data_particle_type = AdcpDataParticleType.BOTTOM_TRACK_CONFIG
 
     def _build_parsed_values(self):
@@ -645,7 +672,65 @@ class BottomConfig(Pd0Base):
         return [{DataParticleKey.VALUE_ID: key, DataParticleKey.VALUE: value} for key, value in fields]
 
 
+class AdcpPd0ConfigKey(BaseEnum):
+    # number of worker processes decoding the ensembles, they are decoded by the parser itself if not set
+    WORKERS = 'workers'
+    # if True the ensemble index of a file is saved next to it, and loaded instead of built when it is parsed again
+    ENSEMBLE_INDEX_SIDECAR = 'ensemble_index_sidecar'
+
+
+def _decode_ensemble(ensemble, particle_classes, glider):
+    """
+    Decode an ensemble into the particles it can generate
+    @retval A list of the velocity, config and engineering particles, followed by the bottom track
+        and bottom track config particles if the ensemble has bottom track data
+    @throws PD0ParsingException if the ensemble can not be decoded
+    """
+    pd0 = AdcpPd0Record(ensemble, glider=glider, cell_arrays=True)
+
+    particles = [particle_classes['velocity'](pd0),
+                 particle_classes['config'](pd0),
+                 particle_classes['engineering'](pd0)]
+
+    if hasattr(pd0, 'bottom_track'):
+        particles.append(particle_classes['bottom_track'](pd0))
+        particles.append(particle_classes['bottom_track_config'](pd0))
+
+    return particles
+
+
+def _decode_ensembles(task):
+    """
+    Worker pool task decoding a run of ensembles. The particle dictionaries are generated in the
+    worker, and the records released so only the generated particles are sent back.
+    @param task A tuple of a list of ensembles, the particle classes dictionary and the glider flag
+    @retval A list of the particles of each ensemble, None for an ensemble which could not be decoded
+    """
+    ensembles, particle_classes, glider = task
+    results = []
+    for ensemble in ensembles:
+        try:
+            particles = _decode_ensemble(ensemble, particle_classes, glider)
+        except PD0ParsingException:
+            results.append(None)
+        else:
+            for particle in particles:
+                particle.release_raw_data()
+            results.append(particles)
+    return results
+
+
 class AdcpPd0Parser(SimpleParser):
+    """
+    Parses the ensembles of a PD0 file. The file is indexed first, see EnsembleIndex, then the
+    ensembles are decoded in order, or in a pool of worker processes if the workers config setting
+    is given. The particles are returned in file order either way.
+    """
+    # number of ensembles sent to a worker process at a time
+    ENSEMBLES_PER_TASK = 64
+    # number of tasks per worker process sent ahead of the particles being returned
+    TASKS_PER_WORKER = 2
+
     def __init__(self, *args, **kwargs):
         super(AdcpPd0Parser, self).__init__(*args, **kwargs)
         self._particle_classes = self._config[DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT]
@@ -664,61 +749,118 @@ class AdcpPd0Parser(SimpleParser):
         self._last_values[stream] = values
         return True
 
+    def _ensemble_index(self, data, start):
+        """
+        Get the ensemble index of the data, from the sidecar of the file if it is enabled and up to date
+        @param data The data from the start position to the end of the file
+        @param start The position in the file the data starts at
+        """
+        source_path = getattr(self._stream_handle, 'name', None)
+        use_sidecar = self._config.get(AdcpPd0ConfigKey.ENSEMBLE_INDEX_SIDECAR) and start == 0 and \
+            isinstance(source_path, basestring) and os.path.isfile(source_path)
+
+        index = EnsembleIndex.load(source_path) if use_sidecar else None
+        if index is None:
+            index = EnsembleIndex.build(data)
+            if use_sidecar:
+                try:
+                    index.save(source_path)
+                except EnvironmentError as e:
+                    log.warn("Unable to save the ensemble index of %s: %s", source_path, e)
+        return index
+
+    def _decoded_ensembles(self, data, index):
+        """
+        Decode the valid ensembles of the index, in the parser or in a pool of worker processes
+        @retval A generator of a tuple of each index entry and the particles of its ensemble, the
+            particles are None if the entry is not a valid ensemble or it could not be decoded
+        """
+        workers = self._config.get(AdcpPd0ConfigKey.WORKERS)
+        if not workers:
+            for entry in index:
+                particles = None
+                offset, length, status, _ = entry
+                if status == EnsembleStatus.OK:
+                    try:
+                        particles = _decode_ensemble(data[offset:offset + length], self._particle_classes, self._glider)
+                    except PD0ParsingException:
+                        pass
+                yield entry, particles
+            return
+
+        def chunk_results(chunk, result):
+            results = iter(result.get())
+            for entry in chunk:
+                yield entry, next(results) if entry[2] == EnsembleStatus.OK else None
+
+        pool = Pool(workers)
+        try:
+            # only a few tasks per worker are outstanding at a time, so the ensembles are sliced out of
+            # the file and decoded as the particles are returned, and the results are taken in order
+            outstanding = deque()
+            for i in xrange(0, len(index), self.ENSEMBLES_PER_TASK):
+                chunk = index.entries[i:i + self.ENSEMBLES_PER_TASK].tolist()
+                task = ([data[offset:offset + length] for offset, length, status, _ in chunk if status == EnsembleStatus.OK],
+                        self._particle_classes, self._glider)
+                outstanding.append((chunk, pool.apply_async(_decode_ensembles, (task,))))
+                if len(outstanding) >= workers * self.TASKS_PER_WORKER:
+                    for item in chunk_results(*outstanding.popleft()):
+                        yield item
+
+            while outstanding:
+                for item in chunk_results(*outstanding.popleft()):
+                    yield item
+        finally:
+            pool.terminate()
+
     def parse_file(self):
         """
         Entry point into parsing the file
-        Loop through the file one ensemble at a time
+        Index the ensembles of the file, then yield the particles from each ensemble in order
         """
+        # the particles from each ensemble are held back until the next ensemble has been read,
+        # so a problem with an ensemble is reported before the particles preceding it are returned
+        pending_particles = []
 
-        position = 0  # set position to beginning of file
-        header_id_bytes = self._stream_handle.read(2)  # read the first two bytes of the file
+        start = self._stream_handle.tell()
+        data = map_stream(self._stream_handle)
+        index = self._ensemble_index(data, start)
 
-        while header_id_bytes:  # will be None when EOF is found
+        for (offset, length, status, _), particles in self._decoded_ensembles(data, index):
 
-            if header_id_bytes == ADCPS_PD0_HEADER_REGEX:
+            if status == EnsembleStatus.NO_HEADER:
+                # the file was searched two bytes at a time for the next header
+                for _ in xrange((length + 1) // 2):
+                    log.warn('did not find header ID bytes')
+                    self._exception_callback(RecoverableSampleException(
+                        "Did not find Header ID bytes where expected, trying next 2 bytes"))
 
-                # get the ensemble size from the next 2 bytes (excludes checksum bytes)
-                num_bytes = struct.unpack("<H", self._stream_handle.read(2))[0]
+            elif status == EnsembleStatus.INCOMPLETE:  # reached EOF
+                log.warn("not enough bytes left for complete ensemble")
+                self._exception_callback(UnexpectedDataException("Found incomplete ensemble at end of file"))
 
-                self._stream_handle.seek(position)  # reset to beginning of ensemble
-                input_buffer = self._stream_handle.read(num_bytes + 2)  # read entire ensemble
+            elif particles is None:
+                # the checksum did not match or the ensemble could not be decoded
+                self._exception_callback(RecoverableSampleException("Exception parsing PD0"))
 
-                if len(input_buffer) == num_bytes + 2:  # make sure there are enough bytes including checksum
+            else:
+                velocity, config, engineering = particles[:3]
+                ensemble_particles = [velocity]
 
-                    try:
-                        pd0 = AdcpPd0Record(input_buffer, glider=self._glider)
-
-                        velocity = self._particle_classes['velocity'](pd0)
-                        self._record_buffer.append(velocity)
-
-                        config = self._particle_classes['config'](pd0)
-                        engineering = self._particle_classes['engineering'](pd0)
-
-                        for particle in [config, engineering]:
-                            if self._changed(particle):
-                                self._record_buffer.append(particle)
+                for particle in [config, engineering]:
+                    if self._changed(particle):
+                        ensemble_particles.append(particle)
 
-                        if hasattr(pd0, 'bottom_track'):
-                            bt = self._particle_classes['bottom_track'](pd0)
-                            bt_config = self._particle_classes['bottom_track_config'](pd0)
-                            self._record_buffer.append(bt)
-
-                            if self._changed(bt_config):
-                                self._record_buffer.append(bt_config)
-
-                    except PD0ParsingException:
-                        # seek to just past this header match
-                        # self._stream_handle.seek(position + 2)
-                        self._exception_callback(RecoverableSampleException("Exception parsing PD0"))
+                if len(particles) > 3:
+                    bt, bt_config = particles[3:]
+                    ensemble_particles.append(bt)
 
-                else:  # reached EOF
-                    log.warn("not enough bytes left for complete ensemble")
-                    self._exception_callback(UnexpectedDataException("Found incomplete ensemble at end of file"))
+                    if self._changed(bt_config):
+                        ensemble_particles.append(bt_config)
 
-            else:  # did not get header ID bytes
-                log.warn('did not find header ID bytes')
-                self._exception_callback(RecoverableSampleException(
-                    "Did not find Header ID bytes where expected, trying next 2 bytes"))
+                for particle in pending_particles:
+                    yield particle
+                pending_particles = ensemble_particles
 
-            position = self._stream_handle.tell()  # set the new file position
-            header_id_bytes = self._stream_handle.read(2)  # read the next two bytes of the file
+        for particle in pending_particles:
+            yield particle
@@ -56,6 +56,7 @@ ADCPA_N_AUV_PARAM_MAP = [
 
 class AdcpaNAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "adcpa_n_auv_instrument"
 
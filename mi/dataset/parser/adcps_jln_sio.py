@@ -112,6 +112,7 @@ class AdcpsJlnSioDataParticle(DataParticle):
     """
     Class for parsing data from the ADCPS instrument on a MSFM platform node
     """
+    __slots__ = ('_data_match',)
 
     _data_particle_type = DataParticleType.SAMPLE
 
@@ -31,7 +31,7 @@ from mi.core.exceptions import SampleException, \
     UnexpectedDataException, \
     ConfigurationException
 
-from mi.dataset.dataset_parser import BufferLoadingParser, DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import BufferLoadingParser, DataSetDriverConfigKeys, RecordQueue
 from mi.dataset.parser import utilities
 
 # *** Defining regexes for this parser ***
@@ -110,6 +110,7 @@ class AdcpsJlnStcInstrumentDataParticle(DataParticle):
     """
     Base class for parsing data from the adcps_jln_stc instrument data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -198,6 +199,7 @@ class AdcpsJlnStcInstrumentTelemeteredDataParticle(
     """
     Class for parsing data from the adcps_jln_stc instrument telemetered data set
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPS_JLN_INS_TELEMETERED
 
 
@@ -206,6 +208,7 @@ class AdcpsJlnStcInstrumentRecoveredDataParticle(
     """
     Class for parsing data from the adcps_jln_stc instrument recovered data set
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPS_JLN_INS_RECOVERED
 
 
@@ -223,6 +226,7 @@ class AdcpsJlnStcMetadataDataParticleKey(BaseEnum):
 
 class AdcpsJlnStcMetadataDataParticle(DataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -248,11 +252,13 @@ class AdcpsJlnStcMetadataDataParticle(DataParticle):
 
 class AdcpsJlnStcMetadataTelemeteredDataParticle(AdcpsJlnStcMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPS_JLN_META_TELEMETERED
 
 
 class AdcpsJlnStcMetadataRecoveredDataParticle(AdcpsJlnStcMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPS_JLN_META_RECOVERED
 
 
@@ -308,7 +314,7 @@ class AdcpsJlnStcParser(BufferLoadingParser):
         if not (StateKey.POSITION in state_obj):
             raise DatasetParserException("Invalid state keys")
         self._chunker.clean_all_chunks()
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._saved_header = None
         self._state = state_obj
         self._read_state = state_obj
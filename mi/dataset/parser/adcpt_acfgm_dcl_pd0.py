@@ -18,7 +18,7 @@ from mi.core.common import BaseEnum
 from mi.core.exceptions import RecoverableSampleException
 from mi.core.instrument.data_particle import DataParticleKey
 from mi.core.log import get_logger
-from mi.dataset.dataset_parser import Parser
+from mi.dataset.dataset_parser import Parser, RecordQueue
 from mi.dataset.parser import utilities
 from mi.dataset.parser.pd0_parser import AdcpPd0Record, PD0ParsingException, InsufficientDataException
 
@@ -54,7 +54,7 @@ class AdcptAcfgmDclPd0Parser(Parser):
                  publish_callback=None):  # No longer used
 
         self._file_parsed = False
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._last_values = {}
 
         super(AdcptAcfgmDclPd0Parser, self).__init__(config,
@@ -97,7 +97,7 @@ class AdcptAcfgmDclPd0Parser(Parser):
                 # then reset our state.
                 if pd0_buffer.startswith(PD0_START_STRING):
                     try:
-                        pd0 = AdcpPd0Record(pd0_buffer)
+                        pd0 = AdcpPd0Record(pd0_buffer, cell_arrays=True)
                         count += 1
                         self._create_particles(pd0, ts)
                         ts = None
@@ -145,6 +145,6 @@ class AdcptAcfgmDclPd0Parser(Parser):
             # Iterate through the particles returned, and pop them off from the beginning of the record
             # buffer to the end
             while len(particles_to_return) < num_records_requested and len(self._record_buffer) > 0:
-                particles_to_return.append(self._record_buffer.pop(0))
+                particles_to_return.append(self._record_buffer.popleft())
 
         return particles_to_return
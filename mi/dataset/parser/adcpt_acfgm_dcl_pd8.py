@@ -193,6 +193,7 @@ class AdcptAcfgmPd8InstrumentDataParticle(DclInstrumentDataParticle):
     """
     Class for generating the adcpt_acfgm_dcl_pd8 instrument particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data, *args, **kwargs):
         super(AdcptAcfgmPd8InstrumentDataParticle, self).__init__(
@@ -203,6 +204,7 @@ class AdcptAcfgmPd8DclInstrumentParticle(AdcptAcfgmPd8InstrumentDataParticle):
     """
     Class for generating Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPT_ACFGM_PD8_DCL_INSTRUMENT
 
 
@@ -210,6 +212,7 @@ class AdcptAcfgmPd8DclInstrumentRecoveredParticle(AdcptAcfgmPd8InstrumentDataPar
     """
     Class for generating Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.ADCPT_ACFGM_PD8_DCL_INSTRUMENT_RECOVERED
 
 
@@ -157,6 +157,7 @@ class AdcptMDspecInstrumentDataParticle(DataParticle):
     """
     Class for generating the adcpt_m_instrument_dspec_recovered data particle.
     """
+    __slots__ = ('instrument_particle_map',)
 
     _data_particle_type = DataParticleType.SAMPLE
 
@@ -178,6 +178,7 @@ class AdcptMFCoeffInstrumentDataParticle(DataParticle):
     """
     Class for generating the adcpt_m_instrument_fcoeff_recovered data particle.
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
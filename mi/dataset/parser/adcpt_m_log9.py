@@ -105,6 +105,7 @@ class AdcptMLog9InstrumentDataParticle(DataParticle):
     """
     Class for generating the adcpt_m_instrument_log9_recovered data particle.
     """
+    __slots__ = ('instrument_particle_map',)
 
     BURST_YEAR_IDX = 0
     BURST_MONTH_IDX = 1
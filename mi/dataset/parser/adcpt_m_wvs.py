@@ -421,6 +421,7 @@ class AdcptMWVSInstrumentDataParticle(DataParticle):
     """
     Class for generating the adcpt_m_instrument_wvs_recovered data particle.
     """
+    __slots__ = ('_file_time', '_sequence_number', 'encoding_func_dict', 'final_result')
 
     _data_particle_type = DataParticleType.SAMPLE
 
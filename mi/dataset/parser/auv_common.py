@@ -56,6 +56,7 @@ class AuvCommonParticle(DataParticle):
     Each tuple shall contain 3 values
     (parameter_name, index into raw_data, encoding function)
     """
+    __slots__ = ()
 
     _auv_param_map = None  # must be set in derived class constructor
 
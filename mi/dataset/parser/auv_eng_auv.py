@@ -55,18 +55,21 @@ AUV_ENG_AUV_IMAGENEX_852_COUNT = 22  # number of expected fields
 
 class AuvEngAuvImagenex852Particle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_IMAGENEX_852_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvImagenex852TelemParticle(AuvEngAuvImagenex852Particle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_imagenex_852"
 
 
 class AuvEngAuvImagenex852RecovParticle(AuvEngAuvImagenex852Particle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_imagenex_852_recovered"
 
@@ -103,18 +106,21 @@ AUV_ENG_AUV_DIGITAL_USBL_COUNT = 23  # number of expected fields
 
 class AuvEngAuvDigitalUsblParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_DIGITAL_USBL_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvDigitalUsblTelemParticle(AuvEngAuvDigitalUsblParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_digital_usbl"
 
 
 class AuvEngAuvDigitalUsblRecovParticle(AuvEngAuvDigitalUsblParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_digital_usbl_recovered"
 
@@ -153,18 +159,21 @@ AUV_ENG_AUV_TRI_FIN_MOTOR_COUNT = 25  # number of expected fields
 
 class AuvEngAuvTriFinMotorParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_TRI_FIN_MOTOR_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvTriFinMotorTelemParticle(AuvEngAuvTriFinMotorParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_tri_fin_motor"
 
 
 class AuvEngAuvTriFinMotorRecovParticle(AuvEngAuvTriFinMotorParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_tri_fin_motor_recovered"
 
@@ -188,18 +197,21 @@ AUV_ENG_AUV_EMERGENCY_BOARD_COUNT = 11  # number of expected fields
 
 class AuvEngAuvEmergencyBoardParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_EMERGENCY_BOARD_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvEmergencyBoardTelemParticle(AuvEngAuvEmergencyBoardParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_emergency_board"
 
 
 class AuvEngAuvEmergencyBoardRecovParticle(AuvEngAuvEmergencyBoardParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_emergency_board_recovered"
 
@@ -221,18 +233,21 @@ AUV_ENG_AUV_OIL_COMPENSATOR_COUNT = 9  # number of expected fields
 
 class AuvEngAuvOilCompensatorParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_OIL_COMPENSATOR_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvOilCompensatorTelemParticle(AuvEngAuvOilCompensatorParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_oil_compensator"
 
 
 class AuvEngAuvOilCompensatorRecovParticle(AuvEngAuvOilCompensatorParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_oil_compensator_recovered"
 
@@ -277,18 +292,21 @@ AUV_ENG_AUV_SMART_BATTERY_COUNT = 32  # number of expected fields
 
 class AuvEngAuvSmartBatteryParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_SMART_BATTERY_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvSmartBatteryTelemParticle(AuvEngAuvSmartBatteryParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_smart_battery"
 
 
 class AuvEngAuvSmartBatteryRecovParticle(AuvEngAuvSmartBatteryParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_smart_battery_recovered"
 
@@ -324,18 +342,21 @@ AUV_ENG_AUV_DIGITAL_TX_BOARD_COUNT = 23  # number of expected fields
 
 class AuvEngAuvDigitalTxBoardParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_DIGITAL_TX_BOARD_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvDigitalTxBoardTelemParticle(AuvEngAuvDigitalTxBoardParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_digital_tx_board"
 
 
 class AuvEngAuvDigitalTxBoardRecovParticle(AuvEngAuvDigitalTxBoardParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_digital_tx_board_recovered"
 
@@ -353,18 +374,21 @@ AUV_ENG_AUV_FAULT_MESSAGE_COUNT = 5  # number of expected fields
 
 class AuvEngAuvFaultMessageParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_FAULT_MESSAGE_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvFaultMessageTelemParticle(AuvEngAuvFaultMessageParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_fault_message"
 
 
 class AuvEngAuvFaultMessageRecovParticle(AuvEngAuvFaultMessageParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_fault_message_recovered"
 
@@ -423,18 +447,21 @@ AUV_ENG_AUV_STATE_COUNT = 46  # number of expected fields
 
 class AuvEngAuvStateParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = AUV_ENG_AUV_STATE_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class AuvEngAuvStateTelemParticle(AuvEngAuvStateParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_state"
 
 
 class AuvEngAuvStateRecovParticle(AuvEngAuvStateParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "auv_eng_auv_state_recovered"
 
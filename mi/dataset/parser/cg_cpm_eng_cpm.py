@@ -1438,6 +1438,7 @@ class CgCpmEngCpmDataParticle(DataParticle):
     """
     Abstract Class for the cg_cpm_eng_cmp data set
     """
+    __slots__ = ('_data_dict',)
     _data_particle_type = None
 
     def __init__(self,
@@ -1564,6 +1565,7 @@ class CgCpmEngCpmRecoveredDataParticle(CgCpmEngCpmDataParticle):
     """
     Class for the recovered cg_stc_eng_stc data set
     """
+    __slots__ = ()
     _data_particle_type = CgCpmEngCpmDataParticleType.CG_CPM_ENG_CPM_RECOVERED
 
 
@@ -1571,6 +1573,7 @@ class CgCpmEngCpmTelemeteredDataParticle(CgCpmEngCpmDataParticle):
     """
     Class for the telemetered cg_stc_eng_stc data set
     """
+    __slots__ = ()
     _data_particle_type = CgCpmEngCpmDataParticleType.CG_CPM_ENG_CPM_TELEMETERED
 
 
@@ -730,6 +730,7 @@ class CgDclEngDclDataParticle(DataParticle):
     """
     Base data particle for cg_dcl_eng_dcl.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -752,41 +753,49 @@ class CgDclEngDclDataParticle(DataParticle):
 
 class CgDclEngDclMsgCountsRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_MSG_COUNTS_RECOVERED
 
 
 class CgDclEngDclMsgCountsTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_MSG_COUNTS_TELEMETERED
 
 
 class CgDclEngDclCpuUptimeRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_CPU_UPTIME_RECOVERED
 
 
 class CgDclEngDclCpuUptimeTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_CPU_UPTIME_TELEMETERED
 
 
 class CgDclEngDclErrorRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_ERROR_RECOVERED
 
 
 class CgDclEngDclErrorTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_ERROR_TELEMETERED
 
 
 class CgDclEngDclGpsRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_GPS_RECOVERED
 
 
 class CgDclEngDclGpsTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_GPS_TELEMETERED
 
 
@@ -794,6 +803,7 @@ class CgDclEngDclPpsDataParticle(CgDclEngDclDataParticle):
     """
     Class for building a CgDclEngDclPpsDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -827,11 +837,13 @@ class CgDclEngDclPpsDataParticle(CgDclEngDclDataParticle):
 
 class CgDclEngDclPpsRecoveredDataParticle(CgDclEngDclPpsDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_PPS_RECOVERED
 
 
 class CgDclEngDclPpsTelemeteredDataParticle(CgDclEngDclPpsDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_PPS_TELEMETERED
 
 
@@ -839,6 +851,7 @@ class CgDclEngDclSupervDataParticle(CgDclEngDclDataParticle):
     """
     Class for building a CgDclEngDclSupervDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -900,21 +913,25 @@ class CgDclEngDclSupervDataParticle(CgDclEngDclDataParticle):
 
 class CgDclEngDclSupervRecoveredDataParticle(CgDclEngDclSupervDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_SUPERV_RECOVERED
 
 
 class CgDclEngDclSupervTelemeteredDataParticle(CgDclEngDclSupervDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_SUPERV_TELEMETERED
 
 
 class CgDclEngDclDlogMgrRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_MGR_RECOVERED
 
 
 class CgDclEngDclDlogMgrTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_MGR_TELEMETERED
 
 
@@ -922,6 +939,7 @@ class CgDclEngDclDlogStatusDataParticle(CgDclEngDclDataParticle):
     """
     Class for building a CgDclEngDclDlogStatusDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -956,11 +974,13 @@ class CgDclEngDclDlogStatusDataParticle(CgDclEngDclDataParticle):
 
 class CgDclEngDclDlogStatusRecoveredDataParticle(CgDclEngDclDlogStatusDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_STATUS_RECOVERED
 
 
 class CgDclEngDclDlogStatusTelemeteredDataParticle(CgDclEngDclDlogStatusDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_STATUS_TELEMETERED
 
 
@@ -968,6 +988,7 @@ class CgDclEngDclStatusDataParticle(CgDclEngDclDataParticle):
     """
     Class for building a CgDclEngDclStatusDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -1003,21 +1024,25 @@ class CgDclEngDclStatusDataParticle(CgDclEngDclDataParticle):
 
 class CgDclEngDclStatusRecoveredDataParticle(CgDclEngDclStatusDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_STATUS_RECOVERED
 
 
 class CgDclEngDclStatusTelemeteredDataParticle(CgDclEngDclStatusDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_STATUS_TELEMETERED
 
 
 class CgDclEngDclDlogAarmRecoveredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_AARM_RECOVERED
 
 
 class CgDclEngDclDlogAarmTelemeteredDataParticle(CgDclEngDclDataParticle):
 
+    __slots__ = ()
     _data_particle_type = CgDclEngDclDataParticleType.CG_DCL_ENG_DCL_DLOG_AARM_TELEMETERED
 
 
@@ -343,6 +343,7 @@ class CgStcEngStcParserDataAbstractParticle(DataParticle):
     """
     Abstract Class for parsing data from the cg_stc_eng_stc data set
     """
+    __slots__ = ()
     _data_particle_type = None
 
     def _build_parsed_values(self):
@@ -1241,10 +1242,12 @@ class CgStcEngStcParserDataParticle(CgStcEngStcParserDataAbstractParticle):
     """
     Class for parsing data from the cg_stc_eng_stc data set
     """
+    __slots__ = ()
     _data_particle_type = CgDataParticleType.TELEMETERED
 
 
 class CgStcEngStcParserRecoveredDataParticle(CgStcEngStcParserDataAbstractParticle):
+    __slots__ = ()
     _data_particle_type = CgDataParticleType.RECOVERED
 
 
@@ -26,7 +26,7 @@ from mi.core.exceptions import DatasetParserException, \
     ConfigurationException
 from mi.core.instrument.chunker import StringChunker
 from mi.core.instrument.data_particle import DataParticle
-from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys, RecordQueue
 from mi.dataset.dataset_parser import BufferLoadingParser
 from mi.dataset.parser.common_regexes import END_OF_LINE_REGEX, \
     FLOAT_REGEX, ASCII_HEX_CHAR_REGEX
@@ -141,6 +141,7 @@ class CsppMetadataDataParticle(DataParticle):
     """
     Class for parsing cspp metadata particle values
     """
+    __slots__ = ()
 
     def _build_metadata_parsed_values(self):
         """
@@ -256,7 +257,7 @@ class CsppParser(BufferLoadingParser):
             raise ConfigurationException('Configuration missing particle classes dict')
 
         # Initialize the record buffer to an empty list
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
 
         # Initialize the metadata flag
         self._metadata_extracted = False
@@ -265,7 +266,7 @@ class CsppParser(BufferLoadingParser):
         super(CsppParser, self).__init__(config,
                                          stream_handle,
                                          None,
-                                         partial(StringChunker.regex_sieve_function,
+                                         partial(StringChunker.line_sieve_function,
                                                  regex_list=[SIEVE_MATCHER]),
                                          lambda state, ingested: None,
                                          lambda data: None,
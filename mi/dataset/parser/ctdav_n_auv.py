@@ -41,18 +41,21 @@ CTDAV_N_AUV_PARAM_MAP = [
 
 class CtdavNAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = CTDAV_N_AUV_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class CtdavNAuvTelemeteredParticle(CtdavNAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "ctdav_n_auv_instrument"
 
 
 class CtdavNAuvRecoveredParticle(CtdavNAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "ctdav_n_auv_instrument_recovered"
 
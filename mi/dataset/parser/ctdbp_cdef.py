@@ -121,6 +121,7 @@ class CtdbpCdefInstrumentDataParticle(DataParticle):
     """
     Class for generating the ctdbp_cdef_instrument_recovered data particle.
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
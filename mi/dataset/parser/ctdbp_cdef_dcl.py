@@ -148,6 +148,7 @@ class CtdbpCdefDclDataParticle(DataParticle):
     """
     Class for parsing data from the data set
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -182,6 +183,7 @@ class CtdbpCdefDclRecoveredDataParticle(CtdbpCdefDclDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
 
@@ -189,6 +191,7 @@ class CtdbpCdefDclTelemeteredDataParticle(CtdbpCdefDclDataParticle):
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
 
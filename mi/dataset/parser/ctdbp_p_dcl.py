@@ -130,6 +130,7 @@ class CtdbpPDclCommonDataParticle(DataParticle):
     """
     Class for parsing data from the CTDBP P data set
     """
+    __slots__ = ()
     _data_particle_map = None
 
     def __init__(self, raw_data,
@@ -168,6 +169,7 @@ class CtdbpPDclRecoveredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating CTDBP Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.CTDBP_RECOVERED
     _data_particle_map = CTDBP_DATA_PARTICLE_MAP
 
@@ -176,6 +178,7 @@ class CtdbpPDclTelemeteredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating CTDBP Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.CTDBP_TELEMETERED
     _data_particle_map = CTDBP_DATA_PARTICLE_MAP
 
@@ -184,6 +187,7 @@ class DostaAbcdjmCtdbpPDclRecoveredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating DOSTA Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.DOSTA_RECOVERED
     _data_particle_map = DOSTA_DATA_PARTICLE_MAP
 
@@ -192,6 +196,7 @@ class DostaAbcdjmCtdbpPDclTelemeteredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating DOSTA Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.DOSTA_TELEMETERED
     _data_particle_map = DOSTA_DATA_PARTICLE_MAP
 
@@ -200,6 +205,7 @@ class FlordGCtdbpPDclRecoveredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating DOSTA Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORD_RECOVERED
     _data_particle_map = FLORD_DATA_PARTICLE_MAP
 
@@ -208,6 +214,7 @@ class FlordGCtdbpPDclTelemeteredDataParticle(CtdbpPDclCommonDataParticle):
     """
     Class for generating DOSTA Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORD_TELEMETERED
     _data_particle_map = FLORD_DATA_PARTICLE_MAP
 
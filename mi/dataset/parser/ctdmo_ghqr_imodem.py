@@ -160,6 +160,7 @@ class CtdmoGhqrImodemInstrumentDataParticle(DataParticle):
     """
     Class for generating the CTDMO instrument particle.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -208,12 +209,14 @@ class CtdmoGhqrImodemInstrumentDataParticle(DataParticle):
 
 class CtdmoGhqrImodemInstrumentTelemeteredDataParticle(
     CtdmoGhqrImodemInstrumentDataParticle):
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.CTDMO_GHQR_IMODEM_INSTRUMENT
 
 
 class CtdmoGhqrImodemInstrumentRecoveredDataParticle(
     CtdmoGhqrImodemInstrumentDataParticle):
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.CTDMO_GHQR_IMODEM_INSTRUMENT_RECOVERED
 
@@ -222,6 +225,7 @@ class CtdmoGhqrImodemMetadataDataParticle(DataParticle):
     """
     Class for generating the Metadata particle.
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Generate a particle by calling encode_value for each entry
@@ -239,6 +243,7 @@ class CtdmoGhqrImodemMetadataDataParticle(DataParticle):
 class CtdmoGhqrImodemMetadataTelemeteredDataParticle(
     CtdmoGhqrImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.CTDMO_GHQR_IMODEM_METADATA
 
@@ -246,6 +251,7 @@ class CtdmoGhqrImodemMetadataTelemeteredDataParticle(
 class CtdmoGhqrImodemMetadataRecoveredDataParticle(
     CtdmoGhqrImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.CTDMO_GHQR_IMODEM_METADATA_RECOVERED
 
@@ -191,6 +191,7 @@ class CtdmoGhqrRecoveredInstrumentDataParticle(DataParticle):
     """
     Class for generating Instrument Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_CT_PARTICLE
 
     def _build_parsed_values(self):
@@ -248,6 +249,7 @@ class CtdmoGhqrSioTelemeteredInstrumentDataParticle(DataParticle):
     """
     Class for generating Instrument Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_CT_PARTICLE
 
     def _build_parsed_values(self):
@@ -319,6 +321,7 @@ class CtdmoGhqrSioOffsetDataParticle(DataParticle):
     Class for generating the Offset Data Particle from the CTDMO instrument
     on a MSFM platform node
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -354,6 +357,7 @@ class CtdmoGhqrSioRecoveredOffsetDataParticle(CtdmoGhqrSioOffsetDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_CO_PARTICLE
 
 
@@ -361,6 +365,7 @@ class CtdmoGhqrSioTelemeteredOffsetDataParticle(CtdmoGhqrSioOffsetDataParticle):
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_CO_PARTICLE
 
 
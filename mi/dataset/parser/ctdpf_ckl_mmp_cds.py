@@ -35,6 +35,7 @@ class CtdpfCklMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the CtdpfCklMmpCds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
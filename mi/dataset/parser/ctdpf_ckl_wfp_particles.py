@@ -39,6 +39,7 @@ class CtdpfCklWfpDataParticle(DataParticle):
     """
     Class for creating the instrument particle for ctdpf_ckl_wfp
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -64,18 +65,21 @@ class CtdpfCklWfpRecoveredDataParticle(CtdpfCklWfpDataParticle):
     """
     Class for the recovered ctdpf_ckl_wfp instrument particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED_DATA
 
 class CtdpfCklWfpTelemeteredDataParticle(CtdpfCklWfpDataParticle):
     """
     Class for the telemetered ctdpf_ckl_wfp instrument particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED_DATA
 
 class CtdpfCklWfpMetadataParticle(DataParticle):
     """
     Class for creating the metadata particle for ctdpf_ckl
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -102,10 +106,12 @@ class CtdpfCklWfpRecoveredMetadataParticle(CtdpfCklWfpMetadataParticle):
     """
     Class for the recovered ctdpf_ckl_wfp metadata particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED_METADATA
 
 class CtdpfCklWfpTelemeteredMetadataParticle(CtdpfCklWfpMetadataParticle):
     """
     Class for the telemetered ctdpf_ckl_wfp metadata particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED_METADATA
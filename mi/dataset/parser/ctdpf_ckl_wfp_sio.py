@@ -71,6 +71,7 @@ class CtdpfCklWfpSioDataParticle(DataParticle):
     """
     Class for creating the data particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.DATA
 
     def _build_parsed_values(self):
@@ -90,6 +91,7 @@ class CtdpfCklWfpSioMetadataParticle(DataParticle):
     """
     Class for creating the metadata particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.METADATA
 
     def _build_parsed_values(self):
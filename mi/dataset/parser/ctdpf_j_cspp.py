@@ -78,6 +78,7 @@ class CtdpfJCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Base Class for building a ctdpf_j_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -114,6 +115,7 @@ class CtdpfJCsppMetadataRecoveredDataParticle(CtdpfJCsppMetadataDataParticle):
     """
     Class for building a ctdpf_j_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -122,6 +124,7 @@ class CtdpfJCsppMetadataTelemeteredDataParticle(CtdpfJCsppMetadataDataParticle):
     """
     Class for building a ctdpf_j_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -130,6 +133,7 @@ class CtdpfJCsppInstrumentDataParticle(DataParticle):
     """
     Base Class for building a ctdpf_j_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -183,6 +187,7 @@ class CtdpfJCsppInstrumentRecoveredDataParticle(CtdpfJCsppInstrumentDataParticle
     """
     Class for building a ctdpf_j_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -191,6 +196,7 @@ class CtdpfJCsppInstrumentTelemeteredDataParticle(CtdpfJCsppInstrumentDataPartic
     """
     Class for building a ctdpf_j_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
@@ -30,7 +30,7 @@ from mi.core.exceptions import \
     ConfigurationException
 
 
-from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys, RecordQueue
 from mi.dataset.dataset_parser import BufferLoadingParser
 from mi.core.instrument.chunker import StringChunker
 
@@ -139,6 +139,7 @@ class DbgPdbgMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a dbg pdbg metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -174,6 +175,7 @@ class DbgPdbgMetadataRecoveredDataParticle(DbgPdbgMetadataDataParticle):
     """
     Class for building a dbg pdbg recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.METADATA_RECOVERED
 
@@ -182,6 +184,7 @@ class DbgPdbgMetadataTelemeteredDataParticle(DbgPdbgMetadataDataParticle):
     """
     Class for building a dbg pdbg telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.METADATA_TELEMETERED
 
@@ -190,6 +193,7 @@ class DbgPdbgBatteryParticle(DataParticle):
     """
     Class for parsing data from the dbg pdbg engineering data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -233,6 +237,7 @@ class DbgPdbgRecoveredBatteryParticle(DbgPdbgBatteryParticle):
     """
     Class for building a dbg pdbg recovered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.BATTERY_RECOVERED
 
@@ -241,6 +246,7 @@ class DbgPdbgTelemeteredBatteryParticle(DbgPdbgBatteryParticle):
     """
     Class for building a dbg pdbg telemetered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.BATTERY_TELEMETERED
 
@@ -249,6 +255,7 @@ class DbgPdbgGpsParticle(DataParticle):
     """
     Class for parsing data from the dbg pdbg engineering data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -288,6 +295,7 @@ class DbgPdbgRecoveredGpsParticle(DbgPdbgGpsParticle):
     """
     Class for building a dbg pdbg recovered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.GPS_RECOVERED
 
@@ -296,6 +304,7 @@ class DbgPdbgTelemeteredGpsParticle(DbgPdbgGpsParticle):
     """
     Class for building a dbg pdbg telemetered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DbgPdbgDataParticleType.GPS_TELEMETERED
 
@@ -351,7 +360,7 @@ class DbgPdbgCsppParser(BufferLoadingParser):
             raise ConfigurationException('Configuration missing particle classes dict')
 
         # Initialize the record buffer to an empty list
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
 
         # Call the superclass constructor
         super(DbgPdbgCsppParser, self).__init__(config,
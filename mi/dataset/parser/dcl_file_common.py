@@ -62,6 +62,7 @@ class DclInstrumentDataParticle(DataParticle):
     """
     Class for generating the dcl instrument particle.
     """
+    __slots__ = ('instrument_particle_map',)
 
     def __init__(self, raw_data, instrument_particle_map, *args, **kwargs):
 
@@ -136,7 +137,7 @@ class DclFileCommonParser(BufferLoadingParser):
             config,
             stream_handle,
             None,
-            partial(StringChunker.regex_sieve_function,
+            partial(StringChunker.line_sieve_function,
                     regex_list=[record_matcher]),
             *args, **kwargs)
 
@@ -40,6 +40,7 @@ class DofstKWfpDataParticle(DataParticle):
     """
     Class for creating the instrument particle for dofst_k
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -59,6 +60,7 @@ class DofstKWfpRecoveredDataParticle(DofstKWfpDataParticle):
     """
     Class for the recovered dofst_k_wfp instrument particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED_DATA
 
 
@@ -66,6 +68,7 @@ class DofstKWfpTelemeteredDataParticle(DofstKWfpDataParticle):
     """
     Class for the telemetered dofst_k_wfp instrument particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED_DATA
 
 
@@ -73,6 +76,7 @@ class DofstKWfpMetadataParticle(DataParticle):
     """
     Class for creating the metadata particle for dofst_k
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -99,6 +103,7 @@ class DofstKWfpRecoveredMetadataParticle(DofstKWfpMetadataParticle):
     """
     Class for the recovered dofst_k_wfp metadata particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED_METADATA
 
 
@@ -106,4 +111,5 @@ class DofstKWfpTelemeteredMetadataParticle(DofstKWfpMetadataParticle):
     """
     Class for the telemetered dofst_k_wfp metadata particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED_METADATA
@@ -121,6 +121,7 @@ class DostaAbcdjmCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a dosta_abcdjm_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -150,6 +151,7 @@ class DostaAbcdjmCsppMetadataRecoveredDataParticle(DostaAbcdjmCsppMetadataDataPa
     """
     Class for building a dosta_abcdjm_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -158,6 +160,7 @@ class DostaAbcdjmCsppMetadataTelemeteredDataParticle(DostaAbcdjmCsppMetadataData
     """
     Class for building a dosta_abcdjm_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -166,6 +169,7 @@ class DostaAbcdjmCsppInstrumentDataParticle(DataParticle):
     """
     Class for building a dosta_abcdjm_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -192,6 +196,7 @@ class DostaAbcdjmCsppInstrumentRecoveredDataParticle(DostaAbcdjmCsppInstrumentDa
     """
     Class for building a dosta_abcdjm_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -200,6 +205,7 @@ class DostaAbcdjmCsppInstrumentTelemeteredDataParticle(DostaAbcdjmCsppInstrument
     """
     Class for building a dosta_abcdjm_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
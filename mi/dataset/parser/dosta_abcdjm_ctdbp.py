@@ -99,6 +99,7 @@ class DostaAbcdjmCtdbpInstrumentDataParticle(DataParticle):
     """
     Class for generating the dosta_abcdjm_ctdbp_instrument_recovered data particle.
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
@@ -150,6 +150,7 @@ class DostaAbcdjmCtdbpDclDataParticle(DataParticle):
     """
     Class for parsing data from the data set
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -184,6 +185,7 @@ class DostaAbcdjmCtdbpDclRecoveredDataParticle(DostaAbcdjmCtdbpDclDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
 
@@ -191,6 +193,7 @@ class DostaAbcdjmCtdbpDclTelemeteredDataParticle(DostaAbcdjmCtdbpDclDataParticle
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
 
@@ -152,6 +152,7 @@ class DostaAbcdjmDclInstrumentDataParticle(DataParticle):
     """
     Class for generating the Dosta instrument particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -192,6 +193,7 @@ class DostaAbcdjmDclRecoveredInstrumentDataParticle(DostaAbcdjmDclInstrumentData
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_INSTRUMENT_PARTICLE
 
 
@@ -199,6 +201,7 @@ class DostaAbcdjmDclTelemeteredInstrumentDataParticle(DostaAbcdjmDclInstrumentDa
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_INSTRUMENT_PARTICLE
 
 
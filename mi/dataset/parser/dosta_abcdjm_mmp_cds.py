@@ -33,6 +33,7 @@ class DostaAbcdjmMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the DostaAbcdjmMmpCds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
     
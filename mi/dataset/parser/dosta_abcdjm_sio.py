@@ -82,6 +82,7 @@ class DostaAbcdjmSioDataParticle(DataParticle):
     """
     Class for parsing data from the DOSTA series a,b,c,d,j,m instrument
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -139,6 +140,7 @@ class DostaAbcdjmSioMetadataDataParticle(DataParticle):
     """
     Class for parsing data from the DOSTA series a,b,c,d,j,m instrument
     """
+    __slots__ = ()
     
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -173,6 +175,7 @@ class DostaAbcdjmSioRecoveredDataParticle(DostaAbcdjmSioDataParticle):
     """
     Class for building a DostadParser recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE_RECOVERED
 
@@ -181,6 +184,7 @@ class DostaAbcdjmSioTelemeteredDataParticle(DostaAbcdjmSioDataParticle):
     """
     Class for building a DostadParser telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE_TELEMETERED
 
@@ -189,6 +193,7 @@ class DostaAbcdjmSioRecoveredMetadataDataParticle(DostaAbcdjmSioMetadataDataPart
     """
     Class for building a DostadParser recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -197,6 +202,7 @@ class DostaAbcdjmSioTelemeteredMetadataDataParticle(DostaAbcdjmSioMetadataDataPa
     """
     Class for building a DostadParser telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -51,18 +51,21 @@ DOSTA_LN_AUV_PARAM_MAP = [
 
 class DostaLnAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = DOSTA_LN_AUV_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class DostaLnAuvTelemeteredParticle(DostaLnAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "dosta_ln_auv_instrument"
 
 
 class DostaLnAuvRecoveredParticle(DostaLnAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "dosta_ln_auv_instrument_recovered"
 
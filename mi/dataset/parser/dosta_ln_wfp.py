@@ -42,6 +42,7 @@ class DostaLnWfpInstrumentParserDataParticle(DataParticle):
     """
     Class to build parsed values for the dosta_ln_wfp_instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
     
@@ -47,6 +47,7 @@ class DostaLnWfpSioDataParticle(DataParticle):
     """
     Class for parsing data from the dosta_ln_wfp_sio data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
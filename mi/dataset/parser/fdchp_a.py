@@ -24,6 +24,7 @@ RECORD_SIZE = 55
 
 
 class FdchpADataParticle(DataParticle):
+    __slots__ = ()
     _data_particle_type = 'fdchp_a_instrument_recovered'
 
     YEAR_IDX = 0
@@ -50,6 +50,7 @@ class DataParticleType(BaseEnum):
 
 class FdchpADclCommonParticle(DataParticle):
 
+    __slots__ = ()
     # dictionary for unpacking float fields which map directly to a parameters (string -> float)
     UNPACK_DICT = {
         # start at index 2 since stored and dcl timestamp are first
@@ -148,10 +149,12 @@ class FdchpADclCommonParticle(DataParticle):
 
 
 class FdchpADclTelemeteredParticle(FdchpADclCommonParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED
 
 
 class FdchpADclRecoveredParticle(FdchpADclCommonParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED
 
 
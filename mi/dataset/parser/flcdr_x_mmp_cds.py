@@ -36,6 +36,7 @@ class FlcdrXMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the FlcdrXMmpCds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
@@ -36,6 +36,7 @@ class FlntuXMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the FlntuXMmpCds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
@@ -67,6 +67,7 @@ FLOBN_M_TEMP_DATA_MAP = [
 
 
 class FlobnCMDataParticle(DataParticle):
+    __slots__ = ()
     instrument_particle_map = []
     time_struct = "%Y/%m/%d %H"
     start_time_index = 1
@@ -106,87 +107,102 @@ class FlobnCMDataParticle(DataParticle):
 
 
 class FlobnCUpperCoilDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_c_upper_coil_recovered'
     instrument_particle_map = FLOBN_C_COIL_DATA_MAP
 
 
 class FlobnCLowerCoilDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_c_lower_coil_recovered'
     instrument_particle_map = FLOBN_C_COIL_DATA_MAP
 
 
 class FlobnMPositionX1DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_x1_recovered'
     instrument_particle_map = FLOBN_M_POSITION_XY_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionX2DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_x2_recovered'
     instrument_particle_map = FLOBN_M_POSITION_XY_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionY1DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_y1_recovered'
     instrument_particle_map = FLOBN_M_POSITION_XY_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionY2DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_y2_recovered'
     instrument_particle_map = FLOBN_M_POSITION_XY_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionZ1DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_z1_recovered'
     instrument_particle_map = FLOBN_M_POSITION_Z_DATA_MAP
     start_time_index = 0
 
 class FlobnMPositionZ2DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_z2_recovered'
     instrument_particle_map = FLOBN_M_POSITION_Z_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionZ3DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_z3_recovered'
     instrument_particle_map = FLOBN_M_POSITION_Z_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionZ4DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_z4_recovered'
     instrument_particle_map = FLOBN_M_POSITION_Z_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMPositionZ5DataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_position_z5_recovered'
     instrument_particle_map = FLOBN_M_POSITION_Z_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMDirectionXFlowRateDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_direction_x_flow_rate_recovered'
     instrument_particle_map = FLOBN_M_FLOW_RATE_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMDirectionYFlowRateDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_direction_y_flow_rate_recovered'
     instrument_particle_map = FLOBN_M_FLOW_RATE_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMDirectionZFlowRateDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_direction_z_flow_rate_recovered'
     instrument_particle_map = FLOBN_M_FLOW_RATE_DATA_MAP
     start_time_index = 0
 
 
 class FlobnMAmbientTemperatureDataParticle(FlobnCMDataParticle):
+    __slots__ = ()
     _data_particle_type = 'flobn_m_ambient_temperature_recovered'
     instrument_particle_map = FLOBN_M_TEMP_DATA_MAP
     time_struct = "%Y/%m/%d %H:%M"
@@ -51,6 +51,7 @@ class FlordLWfpInstrumentParserDataParticle(DataParticle):
     """
     Class for parsing data from the flord_l_wfp data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
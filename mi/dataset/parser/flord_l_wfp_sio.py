@@ -44,6 +44,7 @@ class FlordLWfpSioDataParticleKey(BaseEnum):
 
 class FlordLWfpSioDataParticle(DataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.SAMPLE
 
     def _build_parsed_values(self):
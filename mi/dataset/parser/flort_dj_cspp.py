@@ -126,6 +126,7 @@ class FlortDjCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a flort_dj_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -153,6 +154,7 @@ class FlortDjCsppMetadataRecoveredDataParticle(FlortDjCsppMetadataDataParticle):
     """
     Class for building a flort_dj_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -161,6 +163,7 @@ class FlortDjCsppMetadataTelemeteredDataParticle(FlortDjCsppMetadataDataParticle
     """
     Class for building a flort_dj_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -169,6 +172,7 @@ class FlortDjCsppInstrumentDataParticle(DataParticle):
     """
     Class for building a flort_dj_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -197,6 +201,7 @@ class FlortDjCsppInstrumentRecoveredDataParticle(FlortDjCsppInstrumentDataPartic
     """
     Class for building a flort_dj_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -205,6 +210,7 @@ class FlortDjCsppInstrumentTelemeteredDataParticle(FlortDjCsppInstrumentDataPart
     """
     Class for building a flort_dj_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
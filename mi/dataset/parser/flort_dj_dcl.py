@@ -47,7 +47,7 @@ from mi.core.instrument.data_particle import \
     DataParticleKey, \
     DataParticleValue
 
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 
 from mi.dataset.parser.common_regexes import \
     DATE_YYYY_MM_DD_REGEX
@@ -157,6 +157,7 @@ class FlortDjDclInstrumentDataParticle(DataParticle):
     """
     Class for generating the Flort_dj instrument particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -197,6 +198,7 @@ class FlortDjDclRecoveredInstrumentDataParticle(FlortDjDclInstrumentDataParticle
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_INSTRUMENT_PARTICLE
 
 
@@ -204,6 +206,7 @@ class FlortDjDclTelemeteredInstrumentDataParticle(FlortDjDclInstrumentDataPartic
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_INSTRUMENT_PARTICLE
 
 
@@ -326,7 +329,7 @@ class FlortDjDclParser(BufferLoadingParser):
             raise DatasetParserException('%s missing in state keys' %
                                          FlortStateKey.POSITION)
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
 
@@ -52,6 +52,7 @@ class FlortdCommonParserDataParticle(DataParticle):
     """
     Class for parsing data from the FLORT-D instrument
     """
+    __slots__ = ('_data_match',)
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -131,6 +132,7 @@ class FlortdParserDataParticle(FlortdCommonParserDataParticle):
     """
     Class for parsing telemetered FLORT-D data
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.SAMPLE
 
 
@@ -138,6 +140,7 @@ class FlortdRecoveredParserDataParticle(FlortdCommonParserDataParticle):
     """
     Class for parsing recovered FLORT-D data
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.SAMPLE_RECOVERED
 
 
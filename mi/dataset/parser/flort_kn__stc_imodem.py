@@ -42,6 +42,7 @@ class Flort_kn_stc_imodemParserDataParticleAbstract(DataParticle):
     Parent class for the recovered and instrument particles (Flort_kn__stc_imodemParserDataParticleRecovered and
     Flort_kn__stc_imodemParserDataParticle respectively)
     """
+    __slots__ = ()
 
     _data_particle_type = None
     
@@ -67,6 +68,7 @@ class Flort_kn_stc_imodemParserDataParticleRecovered(Flort_kn_stc_imodemParserDa
     """
      The FLORT_KN__STC_IMODEM data set recovered particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.FLORT_KN_INSTRUMENT_RECOVERED
 
@@ -74,6 +76,7 @@ class Flort_kn_stc_imodemParserDataParticleTelemetered(Flort_kn_stc_imodemParser
     """
      The FLORT_KN__STC_IMODEM data set telemetered particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORT_KN_INSTRUMENT_TELEMETERED
 
 class Flort_kn_stc_imodemParser(WfpEFileParser):
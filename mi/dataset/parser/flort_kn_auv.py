@@ -61,18 +61,21 @@ def compute_metadata_timestamp(parts):
 
 class FlortKnAuvMetadataParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = FLORT_KN_AUV_METADATA_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class FlortKnAuvMetadataTelemParticle(FlortKnAuvMetadataParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "flort_kn_auv_metadata"
 
 
 class FlortKnMetadataRecovParticle(FlortKnAuvMetadataParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "flort_kn_auv_metadata_recovered"
 
@@ -109,18 +112,21 @@ FLORT_KN_AUV_INSTRUMENT_PARAM_MAP = [
 
 class FlortKnAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = FLORT_KN_AUV_INSTRUMENT_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class FlortKnAuvInstrumentTelemParticle(FlortKnAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "flort_kn_auv_instrument"
 
 
 class FlortKnAuvInstrumentRecovParticle(FlortKnAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "flort_kn_auv_instrument_recovered"
 
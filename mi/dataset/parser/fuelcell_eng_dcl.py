@@ -95,6 +95,7 @@ class FuelCellEngDclDataCommonParticle(DataParticle):
 
     # dictionary for unpacking integer fields which map directly to a parameter
     
+    __slots__ = ()
     UNPACK_DICT = {
         # Start at index 1, DCL timestamp is at 0
         'datalog_manager_version': 1,
@@ -139,10 +140,12 @@ class FuelCellEngDclDataCommonParticle(DataParticle):
 
 
 class FuelCellEngDclDataParticleRecovered(FuelCellEngDclDataCommonParticle):
+    __slots__ = ()
     _data_particle_type = FuelCellEngDataParticleType.FUELCELL_ENG_DCL_RECOVERED
     
 
 class FuelCellEngDclDataParticleTelemetered(FuelCellEngDclDataCommonParticle):
+    __slots__ = ()
     _data_particle_type = FuelCellEngDataParticleType.FUELCELL_ENG_DCL_TELEMETERED
 
 
@@ -10,13 +10,19 @@ __license__ = 'Apache 2.0'
 
 import re
 import ntplib
+from functools import partial
+from itertools import izip
 from math import copysign, isnan
+
+import numpy as np
+
 from mi.core.log import get_logger
 from mi.core.common import BaseEnum
 from mi.core.exceptions import SampleException, UnexpectedDataException, RecoverableSampleException, \
     ConfigurationException, SampleEncodingException, DatasetParserException
-from mi.core.instrument.data_particle import DataParticle, DataParticleKey
-from mi.dataset.dataset_parser import SimpleParser, DataSetDriverConfigKeys
+from mi.core.instrument.data_particle import DataParticle, DataParticleKey, ValueEncoder
+from mi.core.time import unix_times_to_ntp_times
+from mi.dataset.dataset_parser import SimpleParser, DataSetDriverConfigKeys, RecordQueue
 
 # start the logger
 log = get_logger()
@@ -76,33 +82,97 @@ class GliderParticle(DataParticle):
     This class should be a parent class to all the data particle classes
     associated with the glider.
     """
+    __slots__ = ('_projection',)
 
     # It is possible that record could be parsed, but they don't
     # contain actual science data for this instrument. This flag
     # will be set to true if we have found data when parsed.
     common_parameters = GliderParticleKey.list()
 
-    def _parsed_values(self, key_list):
+    # (particle class, projection) to the value encoder built by projected_encoder()
+    _projected_encoders = {}
+    # the cache is cleared when it reaches this size, parsers only use a few projections
+    _MAX_PROJECTED_ENCODERS = 100
 
-        value_list = [self.raw_data.get(key, None) for key in key_list]
+    def __init__(self, raw_data, projection=None, **kwargs):
+        """
+        @param raw_data The glider data dictionary
+        @param projection The projection of the particle values, from projection()
+        """
+        super(GliderParticle, self).__init__(raw_data, **kwargs)
+        self._projection = projection
 
-        result = []
-        for key, value in zip(key_list, value_list):
-            # encode strings into float or int
-            if value is None:
-                # this key was not present in this file, there is no value
-                result.append({DataParticleKey.VALUE_ID: key, DataParticleKey.VALUE: None})
-            elif ('_lat' in key or '_lon' in key) and value != 'NaN':
-                # special encoding for latitude and longitude
-                result.append(self._encode_value(key, value, GliderParticle._string_to_ddegrees))
-            elif value == 'NaN' or '.' in value or 'e' in value:
-                # this is a float
-                result.append(self._encode_value(key, value, GliderParticle._encode_float_or_nan))
+    @staticmethod
+    def projection(parameters=None, sparse=False):
+        """
+        Get the projection which limits the values a particle encodes, for
+        files where most of the hundreds of engineering parameters are not
+        wanted. The common parameters giving the time of the row are always
+        encoded. Which rows generate a particle does not change, that still
+        depends on all the science parameters. The projection is a plain
+        tuple, so projected particles pickle the same as any other.
+        @param parameters The names of the parameters to encode, or None for all of them
+        @param sparse If True the parameters which have no value, because they
+           are NaN or not in the file, are left out of the particle values
+        @retval The projection, or None if it encodes all the parameters and is not sparse
+        """
+        if parameters is None and not sparse:
+            return None
+
+        if parameters is not None:
+            parameters = frozenset(parameters).union(GliderParticle.common_parameters)
+        return parameters, sparse
+
+    @classmethod
+    def projected_encoder(cls, projection=None):
+        """
+        @param projection A projection from projection(), or None
+        @retval The value encoder of this particle class limited by a projection
+        """
+        if projection is None:
+            return cls._value_encoder
+
+        key = (cls, projection)
+        encoder = GliderParticle._projected_encoders.get(key)
+        if encoder is None:
+            if len(GliderParticle._projected_encoders) >= GliderParticle._MAX_PROJECTED_ENCODERS:
+                GliderParticle._projected_encoders.clear()
+            encoder = cls._value_encoder.project(*projection)
+            GliderParticle._projected_encoders[key] = encoder
+        return encoder
+
+    @staticmethod
+    def _compile_encoder(key_list):
+        """
+        Compile the value encoder for a list of glider keys. Keys that are
+        not present in a file have no value, latitudes and longitudes get
+        their special encoding and any other value is a float or an int.
+        @param key_list The keys of the particle values, in order
+        @retval A ValueEncoder for the glider data dictionary
+        """
+        fields = []
+        for key in key_list:
+            if '_lat' in key or '_lon' in key:
+                fields.append((key, key, GliderParticle._encode_lat_lon))
             else:
-                # if it is not a float it is an int
-                result.append(self._encode_value(key, value, int))
+                fields.append((key, key, GliderParticle._encode_number))
+        return ValueEncoder(fields, optional=True)
 
-        return result
+    @staticmethod
+    def _encode_number(value):
+        # encode strings into float or int
+        if value == 'NaN' or '.' in value or 'e' in value:
+            # this is a float
+            return GliderParticle._encode_float_or_nan(value)
+        # if it is not a float it is an int
+        return int(value)
+
+    @staticmethod
+    def _encode_lat_lon(value):
+        # special encoding for latitude and longitude
+        if value == 'NaN':
+            return None
+        return GliderParticle._string_to_ddegrees(value)
 
     @staticmethod
     def _encode_float_or_nan(value):
@@ -160,9 +230,12 @@ class CtdgvParticleKey(GliderParticleKey):
 
 
 class CtdgvTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.CTDGV_M_GLIDER_INSTRUMENT
     science_parameters = CtdgvParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(CtdgvParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Extracts CTDGV data from the glider data dictionary initialized with
@@ -171,13 +244,16 @@ class CtdgvTelemeteredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(CtdgvParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class CtdgvRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.CTDGV_M_GLIDER_INSTRUMENT_RECOVERED
     science_parameters = CtdgvParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(CtdgvParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Extracts CTDGV data from the glider data dictionary initialized with
@@ -186,7 +262,7 @@ class CtdgvRecoveredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(CtdgvParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class DostaTelemeteredParticleKey(GliderParticleKey):
@@ -214,9 +290,12 @@ class DostaRecoveredParticleKey(GliderParticleKey):
 
 
 class DostaTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.DOSTA_ABCDJM_GLIDER_INSTRUMENT
     science_parameters = DostaTelemeteredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(DostaTelemeteredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts DOSTA data from the
@@ -225,13 +304,16 @@ class DostaTelemeteredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(DostaTelemeteredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class DostaRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.DOSTA_ABCDJM_GLIDER_RECOVERED
     science_parameters = DostaRecoveredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(DostaRecoveredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts DOSTA data from the
@@ -240,7 +322,7 @@ class DostaRecoveredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(DostaRecoveredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class FlordParticleKey(GliderParticleKey):
@@ -256,9 +338,12 @@ class FlordParticleKey(GliderParticleKey):
 
 
 class FlordTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORD_M_GLIDER_INSTRUMENT
     science_parameters = FlordParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(FlordParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts FLORD data from the
@@ -267,13 +352,16 @@ class FlordTelemeteredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(FlordParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class FlordRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORD_M_GLIDER_INSTRUMENT_RECOVERED
     science_parameters = FlordParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(FlordParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts FLORD data from the
@@ -282,7 +370,7 @@ class FlordRecoveredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(FlordParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class FlortTelemeteredParticleKey(GliderParticleKey):
@@ -308,9 +396,12 @@ class FlortRecoveredParticleKey(GliderParticleKey):
 
 
 class FlortTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORT_M_GLIDER_INSTRUMENT
     science_parameters = FlortTelemeteredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(FlortTelemeteredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts FLORT data from the
@@ -319,13 +410,16 @@ class FlortTelemeteredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(FlortTelemeteredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class FlortRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.FLORT_M_GLIDER_RECOVERED
     science_parameters = FlortRecoveredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(FlortRecoveredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts FLORT data from the
@@ -334,7 +428,7 @@ class FlortRecoveredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(FlortRecoveredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class ParadTelemeteredParticleKey(GliderParticleKey):
@@ -351,9 +445,12 @@ class ParadRecoveredParticleKey(GliderParticleKey):
 
 
 class ParadTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.PARAD_M_GLIDER_INSTRUMENT
     science_parameters = ParadTelemeteredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(ParadTelemeteredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts PARAD data from the
@@ -362,13 +459,16 @@ class ParadTelemeteredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(ParadTelemeteredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class ParadRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.PARAD_M_GLIDER_RECOVERED
     science_parameters = ParadRecoveredParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(ParadRecoveredParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts PARAD data from the
@@ -377,7 +477,7 @@ class ParadRecoveredDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(ParadRecoveredParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class EngineeringRecoveredParticleKey(GliderParticleKey):
@@ -712,6 +812,7 @@ class EngineeringScienceTelemeteredParticleKey(GliderParticleKey):
 
 
 class EngineeringTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_TELEMETERED
     science_parameters = EngineeringTelemeteredParticleKey.science_parameter_list()
     
@@ -719,6 +820,8 @@ class EngineeringTelemeteredDataParticle(GliderParticle):
     keys_exclude_sci_times.remove(GliderParticleKey.SCI_M_PRESENT_TIME)
     keys_exclude_sci_times.remove(GliderParticleKey.SCI_M_PRESENT_SECS_INTO_MISSION)
 
+    _value_encoder = GliderParticle._compile_encoder(keys_exclude_sci_times)
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts engineering data from the
@@ -728,10 +831,11 @@ class EngineeringTelemeteredDataParticle(GliderParticle):
         @throws SampleException if the data is not a glider data dictionary
         """
         # need to exclude sci times
-        return self._parsed_values(EngineeringTelemeteredDataParticle.keys_exclude_sci_times)
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class EngineeringMetadataCommonDataParticle(DataParticle):
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -748,14 +852,17 @@ class EngineeringMetadataCommonDataParticle(DataParticle):
 
 
 class EngineeringMetadataDataParticle(EngineeringMetadataCommonDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_METADATA
 
 
 class EngineeringMetadataRecoveredDataParticle(EngineeringMetadataCommonDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_METADATA_RECOVERED
 
 
 class EngineeringScienceTelemeteredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_SCI_TELEMETERED
     science_parameters = EngineeringScienceTelemeteredParticleKey.science_parameter_list()
     
@@ -763,6 +870,8 @@ class EngineeringScienceTelemeteredDataParticle(GliderParticle):
     keys_exclude_times.remove(GliderParticleKey.M_PRESENT_TIME)
     keys_exclude_times.remove(GliderParticleKey.M_PRESENT_SECS_INTO_MISSION)
 
+    _value_encoder = GliderParticle._compile_encoder(keys_exclude_times)
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts engineering data from the
@@ -772,10 +881,11 @@ class EngineeringScienceTelemeteredDataParticle(GliderParticle):
         @throws SampleException if the data is not a glider data dictionary
         """
         # need to exclude m times
-        return self._parsed_values(EngineeringScienceTelemeteredDataParticle.keys_exclude_times)
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class EngineeringRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_RECOVERED
     science_parameters = EngineeringRecoveredParticleKey.science_parameter_list()
     
@@ -783,6 +893,8 @@ class EngineeringRecoveredDataParticle(GliderParticle):
     keys_exclude_sci_times.remove(GliderParticleKey.SCI_M_PRESENT_TIME)
     keys_exclude_sci_times.remove(GliderParticleKey.SCI_M_PRESENT_SECS_INTO_MISSION)
 
+    _value_encoder = GliderParticle._compile_encoder(keys_exclude_sci_times)
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts engineering data from the
@@ -792,10 +904,11 @@ class EngineeringRecoveredDataParticle(GliderParticle):
         @throws SampleException if the data is not a glider data dictionary
         """
         # need to exclude sci times
-        return self._parsed_values(EngineeringRecoveredDataParticle.keys_exclude_sci_times)
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class EngineeringScienceRecoveredDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.GLIDER_ENG_SCI_RECOVERED
     science_parameters = EngineeringScienceRecoveredParticleKey.science_parameter_list()
     
@@ -803,6 +916,8 @@ class EngineeringScienceRecoveredDataParticle(GliderParticle):
     keys_exclude_times.remove(GliderParticleKey.M_PRESENT_TIME)
     keys_exclude_times.remove(GliderParticleKey.M_PRESENT_SECS_INTO_MISSION)
 
+    _value_encoder = GliderParticle._compile_encoder(keys_exclude_times)
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts engineering data from the
@@ -812,7 +927,7 @@ class EngineeringScienceRecoveredDataParticle(GliderParticle):
         @throws SampleException if the data is not a glider data dictionary
         """
         # need to exclude m times
-        return self._parsed_values(EngineeringScienceRecoveredDataParticle.keys_exclude_times)
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class NutnrMParticleKey(GliderParticleKey):
@@ -823,9 +938,12 @@ class NutnrMParticleKey(GliderParticleKey):
 
 
 class NutnrMDataParticle(GliderParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_M_GLIDER_INSTRUMENT
     science_parameters = NutnrMParticleKey.science_parameter_list()
 
+    _value_encoder = GliderParticle._compile_encoder(NutnrMParticleKey.list())
+
     def _build_parsed_values(self):
         """
         Takes a GliderParser object and extracts FLORT data from the
@@ -834,7 +952,7 @@ class NutnrMDataParticle(GliderParticle):
         @returns result a list of dictionaries of particle data
         @throws SampleException if the data is not a glider data dictionary
         """
-        return self._parsed_values(NutnrMParticleKey.list())
+        return self._encode_values(self.projected_encoder(self._projection))
 
 
 class GliderParser(SimpleParser):
@@ -842,20 +960,37 @@ class GliderParser(SimpleParser):
     GliderParser parses a Slocum Electric Glider data file that has been
     converted to ASCII from binary and merged with it's corresponding flight or
     science data file, and holds the self describing header data in a header
-    dictionary and the data in a data dictionary using the column labels as the
-    dictionary keys. These dictionaries are used to build the particles.
+    dictionary. The data rows are read in blocks into arrays of columns, the
+    rows with science data for a particle class are found for a whole block at
+    once, and each particle is built from a dictionary of only the columns it
+    encodes, using the column labels as the dictionary keys.
+
+    The particle_parameters config setting, a list of parameter names, limits
+    the values of the data particles to those parameters, and the
+    sparse_values setting leaves the parameters without a value out of them.
+    See GliderParticle.projection.
     """
+    # number of data rows read into columns at a time, which bounds the memory used for wide files
+    ROWS_PER_BLOCK = 500
+
     def __init__(self,
                  config,
                  stream_handle,
                  exception_callback):
 
-        self._record_buffer = []  # holds tuples of (record, state)
+        self._record_buffer = RecordQueue()  # holds tuples of (record, state)
         self._header_dict = {}
         # only initialize particle class to None if it does not already exist
         if not hasattr(self, '_particle_class'):
             self._particle_class = None
         self.num_columns = None
+        # column label to the index of its column
+        self._column_index = {}
+        # particle class to the columns it uses, see _particle_columns
+        self._class_columns = {}
+        # the projection of the particle values, limiting their parameters or leaving out missing values
+        self._projection = GliderParticle.projection(config.get(DataSetDriverConfigKeys.PARTICLE_PARAMETERS),
+                                                     bool(config.get(DataSetDriverConfigKeys.SPARSE_VALUES)))
 
         super(GliderParser, self).__init__(config,
                                            stream_handle,
@@ -946,6 +1081,7 @@ class GliderParser(SimpleParser):
         label_list = self._stream_handle.readline().strip().split()
         self.num_columns = len(label_list)
         self._header_dict['labels'] = label_list
+        self._column_index = dict((label, index) for index, label in enumerate(label_list))
 
         # the m_present_time label is required to generate particles, raise an exception if it is not found
         if not GliderParticleKey.M_PRESENT_TIME in label_list:
@@ -975,55 +1111,129 @@ class GliderParser(SimpleParser):
 
         log.debug("Label count: %d", self.num_columns)
 
-    def _read_data(self, data_record):
+    def _read_blocks(self):
         """
-        Read in the column labels, data type, number of bytes of each
-        data type, and the data from an ASCII glider data file.
+        Read the data rows into blocks of columns
+        @retval A generator of 2-D object arrays of the value strings, indexed by row and column
+        @throws DatasetParserException, after the block of the rows before it, if a row does not
+            have a value for each column
         """
-        data_dict = {}
-        data_labels = self._header_dict['labels']
-        data = data_record.strip().split()
-
-        if self.num_columns != len(data):
-            err_msg = "GliderParser._read_data(): Num Of Columns NOT EQUAL to Num of Data items: " + \
-                      "Expected Columns= %s vs Actual Data= %s" % (self.num_columns, len(data))
-            log.error(err_msg)
-            raise DatasetParserException(err_msg)
+        rows = []
+        for line in self._stream_handle:
+            values = line.split()
+            if len(values) != self.num_columns:
+                if rows:
+                    yield np.array(rows, dtype=object)
+                err_msg = "GliderParser._read_blocks(): Num Of Columns NOT EQUAL to Num of Data items: " + \
+                          "Expected Columns= %s vs Actual Data= %s" % (self.num_columns, len(values))
+                log.error(err_msg)
+                raise DatasetParserException(err_msg)
+
+            rows.append(values)
+            if len(rows) == self.ROWS_PER_BLOCK:
+                yield np.array(rows, dtype=object)
+                rows = []
+
+        if rows:
+            yield np.array(rows, dtype=object)
+
+    def _particle_columns(self, particle_class):
+        """
+        Find the columns a particle class uses, the first time it is asked for
+        @retval A tuple of the indices of the science parameter columns, the labels of the
+            columns the particle encodes and the indices of those columns
+        """
+        columns = self._class_columns.get(particle_class)
+        if columns is None:
+            science_columns = [self._column_index[key] for key in particle_class.science_parameters
+                               if key in self._column_index]
+            value_keys = [key for key in particle_class.projected_encoder(self._projection).sources
+                          if key in self._column_index]
+            value_columns = [self._column_index[key] for key in value_keys]
+            columns = self._class_columns[particle_class] = (science_columns, value_keys, value_columns)
+        return columns
 
-        # extract record to dictionary
-        for ii, value in enumerate(data):
-            label = data_labels[ii]
-            data_dict[label] = value
+    @staticmethod
+    def _science_mask(block, science_columns):
+        """
+        @retval A boolean array of the rows of a block which have a value other than NaN in
+            any of the science parameter columns
+        """
+        if not science_columns:
+            return np.zeros(len(block), dtype=bool)
+        return (block[:, science_columns] != 'NaN').any(axis=1)
 
-        return data_dict
+    @staticmethod
+    def _timestamps(time_values):
+        """
+        @param time_values An array of m_present_time strings
+        @retval An iterable of their NTP timestamps
+        """
+        try:
+            return unix_times_to_ntp_times(time_values.astype(np.float64)).tolist()
+        except ValueError:
+            # convert them one at a time, so the error is raised at the row it is in
+            return (ntplib.system_to_ntp_time(float(value)) for value in time_values)
 
     def parse_file(self):
         """
-        Create particles from the data in the file
+        Generate particles from the data in the file
         """
         # the header was already read in the init, start at the first sample line
+        return self._parse_rows([self._particle_class])
 
-        for line in self._stream_handle:
-
-            # create the dictionary of key/value pairs composed of the labels and the values from the
-            # record being parsed
-            # ex: data_dict = {'sci_bsipar_temp':10.67, n1, n2, nn}
-            data_dict = self._read_data(line)
-
-            if GliderParser._has_science_data(data_dict, self._particle_class):
-                # create the timestamp
-                timestamp = ntplib.system_to_ntp_time(float(data_dict[GliderParticleKey.M_PRESENT_TIME]))
-                # create the particle
-                self._record_buffer.append(self._extract_sample(self._particle_class, None, data_dict, timestamp))
-
-    @staticmethod
-    def _has_science_data(data_dict, particle_class):
+    def _parse_rows(self, particle_classes, metadata_class=None):
         """
-        Examine the data_dict to see if it contains particle parameters
+        Generate the particles of several particle classes in one pass over the data rows. Each row
+        with science data for a particle class generates a particle of that class, the particles of
+        a row are generated in the order of the classes.
+        @param particle_classes A list of GliderParticle classes
+        @param metadata_class The class of the engineering metadata particle generated before the
+            particles of the first row, or None
         """
-        for key, value in data_dict.iteritems():
-            if value != 'NaN' and key in particle_class.science_parameters:
-                return True
+        class_columns = [self._particle_columns(particle_class) for particle_class in particle_classes]
+        if self._projection is not None:
+            particle_classes = [partial(particle_class, projection=self._projection)
+                                for particle_class in particle_classes]
+        time_column = self._column_index[GliderParticleKey.M_PRESENT_TIME]
+
+        for block in self._read_blocks():
+            # find the rows with science data for each particle class
+            masks = [GliderParser._science_mask(block, science_columns) for science_columns, _, _ in class_columns]
+            row_mask = np.logical_or.reduce(masks)
+            if metadata_class is not None and not self._metadata_sent:
+                row_mask[0] = True
+            row_indices = np.flatnonzero(row_mask)
+
+            # the values each particle class uses from each of its rows
+            class_rows = [iter(block[mask][:, value_columns].tolist())
+                          for mask, (_, _, value_columns) in izip(masks, class_columns)]
+
+            for row_index, timestamp in izip(row_indices,
+                                             GliderParser._timestamps(block[row_indices, time_column])):
+                # handle this particle if it is an engineering metadata particle
+                if metadata_class is not None and not self._metadata_sent:
+                    yield self._metadata_particle(metadata_class, timestamp)
+
+                # create the dictionary of key/value pairs composed of the labels and the values the
+                # particle uses from the row, ex: data_dict = {'sci_bsipar_temp':10.67, n1, n2, nn}
+                for particle_class, mask, (_, value_keys, _), rows in izip(particle_classes, masks,
+                                                                         class_columns, class_rows):
+                    if mask[row_index]:
+                        yield self._extract_sample(particle_class, None, dict(izip(value_keys, next(rows))),
+                                                   timestamp)
+
+    def _metadata_particle(self, metadata_class, timestamp):
+        """
+        Build the engineering metadata particle from the header, which is only produced once
+        """
+        # change the names in the dictionary from the name in the data file to the parameter name
+        header_data_dict = {'glider_eng_filename': self._header_dict.get('filename_label'),
+                            'glider_mission_name': self._header_dict.get('mission_name'),
+                            'glider_eng_fileopen_time': self._header_dict.get('fileopen_time')}
+
+        self._metadata_sent = True
+        return self._extract_sample(metadata_class, None, header_data_dict, timestamp)
 
 
 class EngineeringClassKey(BaseEnum):
@@ -1064,38 +1274,90 @@ class GliderEngineeringParser(GliderParser):
 
     def parse_file(self):
         """
-        Create particles out of the data in the file
+        Generate particles out of the data in the file
         """
         # the header was already read in the init, start at the samples
+        return self._parse_rows([self._particle_class, self._science_class], self._metadata_class)
 
-        for data_record in self._stream_handle:
+    def handle_metadata_particle(self, timestamp):
+        """
+        Check if this particle is an engineering metadata particle that hasn't already been produced, ensure the
+        metadata particle is produced only once
+        """
+        return self._metadata_particle(self._metadata_class, timestamp)
+
+
+# the particle classes of the instruments on a glider, by instrument, to parse a file
+# for all of them at once with GliderMultiplexParser
+TELEMETERED_PARTICLE_CLASSES_DICT = {
+    'ctdgv': 'CtdgvTelemeteredDataParticle',
+    'dosta': 'DostaTelemeteredDataParticle',
+    'flord': 'FlordTelemeteredDataParticle',
+    'flort': 'FlortTelemeteredDataParticle',
+    'nutnr_m': 'NutnrMDataParticle',
+    'parad': 'ParadTelemeteredDataParticle',
+    EngineeringClassKey.METADATA: 'EngineeringMetadataDataParticle',
+    EngineeringClassKey.DATA: 'EngineeringTelemeteredDataParticle',
+    EngineeringClassKey.SCIENCE: 'EngineeringScienceTelemeteredDataParticle'
+}
+
+RECOVERED_PARTICLE_CLASSES_DICT = {
+    'ctdgv': 'CtdgvRecoveredDataParticle',
+    'dosta': 'DostaRecoveredDataParticle',
+    'flord': 'FlordRecoveredDataParticle',
+    'flort': 'FlortRecoveredDataParticle',
+    'parad': 'ParadRecoveredDataParticle',
+    EngineeringClassKey.METADATA: 'EngineeringMetadataRecoveredDataParticle',
+    EngineeringClassKey.DATA: 'EngineeringRecoveredDataParticle',
+    EngineeringClassKey.SCIENCE: 'EngineeringScienceRecoveredDataParticle'
+}
+
+
+class GliderMultiplexParser(GliderParser):
+    """
+    Parses a glider file once for the particle classes of several instruments, instead of once
+    for each of them. The particle classes dictionary maps a name for each instrument to the name
+    of its particle class, as in TELEMETERED_PARTICLE_CLASSES_DICT. Each row is handed to every
+    particle class with science data in it, the particles of a row are generated in the order of
+    the names. An engineering_metadata entry adds the engineering metadata particle, generated
+    before the particles of the first row as GliderEngineeringParser does.
+    """
+    def __init__(self,
+                 config,
+                 stream_handle,
+                 exception_callback):
 
-            # create the dictionary of key/value pairs composed of the labels and the values from the
-            # record being parsed
-            data_dict = self._read_data(data_record)
-            timestamp = ntplib.system_to_ntp_time(float(data_dict[GliderParticleKey.M_PRESENT_TIME]))
+        # set the class types from the config
+        particle_class_dict = config.get(DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT)
+        if not particle_class_dict:
+            raise ConfigurationException('Missing particle_classes_dict in config')
 
-            # handle this particle if it is an engineering metadata particle
-            if not self._metadata_sent:
-                self._record_buffer.append(self.handle_metadata_particle(timestamp))
+        # get the particle module
+        module = __import__('mi.dataset.parser.glider', fromlist=particle_class_dict.values())
+        self._metadata_class = None
+        self._particle_classes = []
+        for name in sorted(particle_class_dict):
+            # get the class from the string name of the class
+            particle_class = getattr(module, particle_class_dict[name], None)
+            if particle_class is None:
+                raise ConfigurationException('Config provided a class which does not exist %s' % config)
+            if name == EngineeringClassKey.METADATA:
+                self._metadata_class = particle_class
+            else:
+                self._particle_classes.append(particle_class)
 
-            # check for the presence of particle data in the raw data row before continuing
-            if GliderParser._has_science_data(data_dict, self._particle_class):
-                self._record_buffer.append(self._extract_sample(self._particle_class, None, data_dict, timestamp))
+        if not self._particle_classes:
+            raise ConfigurationException('Config provided no particle classes other than metadata %s' % config)
+        self._particle_class = self._particle_classes[0]
+        self._metadata_sent = False
 
-            # check for the presence of science particle data in the raw data row before continuing
-            if GliderParser._has_science_data(data_dict, self._science_class):
-                self._record_buffer.append(self._extract_sample(self._science_class, None, data_dict, timestamp))
+        super(GliderMultiplexParser, self).__init__(config,
+                                                    stream_handle,
+                                                    exception_callback)
 
-    def handle_metadata_particle(self, timestamp):
+    def parse_file(self):
         """
-        Check if this particle is an engineering metadata particle that hasn't already been produced, ensure the
-        metadata particle is produced only once
+        Generate the particles of all the particle classes from the data in the file
         """
-        # change the names in the dictionary from the name in the data file to the parameter name
-        header_data_dict = {'glider_eng_filename': self._header_dict.get('filename_label'),
-                            'glider_mission_name': self._header_dict.get('mission_name'),
-                            'glider_eng_fileopen_time': self._header_dict.get('fileopen_time')}
-
-        self._metadata_sent = True
-        return self._extract_sample(self._metadata_class, None, header_data_dict, timestamp)
+        # the header was already read in the init, start at the samples
+        return self._parse_rows(self._particle_classes, self._metadata_class)
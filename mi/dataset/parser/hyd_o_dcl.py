@@ -38,6 +38,7 @@ PARTICLE_MAP = [
 
 
 class HydODclCommonDataParticle(DataParticle):
+    __slots__ = ()
     def _build_parsed_values(self):
         # the timestamp comes from the DCL logger timestamp, parse the string into a datetime
         utc_time = dcl_controller_timestamp_to_utc_time(self.raw_data.group(DCL_TIMESTAMP_GROUP))
@@ -48,10 +49,12 @@ class HydODclCommonDataParticle(DataParticle):
 
 
 class HydODclTelemeteredDataParticle(HydODclCommonDataParticle):
+    __slots__ = ()
     _data_particle_type = 'hyd_o_dcl_instrument'
 
 
 class HydODclRecoveredDataParticle(HydODclCommonDataParticle):
+    __slots__ = ()
     _data_particle_type = 'hyd_o_dcl_instrument_recovered'
 
 
@@ -119,6 +119,7 @@ class MetbkADclInstrumentDataParticle(DclInstrumentDataParticle):
     """
     Class for generating the Metbk_a instrument particle.
     """
+    __slots__ = ()
     def __init__(self, raw_data, *args, **kwargs):
 
         super(MetbkADclInstrumentDataParticle, self).__init__(
@@ -131,6 +132,7 @@ class MetbkADclRecoveredInstrumentDataParticle(MetbkADclInstrumentDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_INSTRUMENT_PARTICLE
 
 
@@ -138,6 +140,7 @@ class MetbkADclTelemeteredInstrumentDataParticle(MetbkADclInstrumentDataParticle
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_INSTRUMENT_PARTICLE
 
 
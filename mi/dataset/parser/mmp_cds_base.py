@@ -23,7 +23,7 @@ log = get_logger()
 from mi.core.common import BaseEnum
 from mi.core.instrument.data_particle import DataParticle
 from mi.core.exceptions import DatasetParserException, SampleException, NotImplementedException
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue, map_stream
 
 # The number of items in a list associated unpacked data within a McLane Moored Profiler cabled docking station
 # data chunk
@@ -56,6 +56,7 @@ class MmpCdsParserDataParticle(DataParticle):
     Class for building a data particle given parsed data as received from a McLane Moored Profiler connected to
     a cabled docking station.
     """
+    __slots__ = ()
 
     def _get_mmp_cds_subclass_particle_params(self, subclass_specific_msgpack_unpacked_data):
         """
@@ -128,8 +129,10 @@ class MmpCdsParser(BufferLoadingParser):
         @param publish_callback The function to call to provide particles
         """
 
-        # Initialize the record buffer to an empty list
-        self._record_buffer = []
+        # Initialize the record buffer, without a high water mark since the whole file is
+        # parsed at once, and the number of records already taken out of it
+        self._record_buffer = RecordQueue(high_water_mark=None)
+        self._records_taken = 0
 
         if state is None:
             state = {StateKey.PARTICLES_RETURNED: 0}
@@ -165,7 +168,8 @@ class MmpCdsParser(BufferLoadingParser):
         # Clear out any pre-existing chunks
         self._chunker.clean_all_chunks()
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue(high_water_mark=None)
+        self._records_taken = 0
 
         # Set the state and read state to the provide state
         self._state = state_obj
@@ -188,7 +192,12 @@ class MmpCdsParser(BufferLoadingParser):
                 self._state[StateKey.PARTICLES_RETURNED] > 0:
             particles_returned = self._state[StateKey.PARTICLES_RETURNED]
 
-        total_num_records = len(self._record_buffer)
+        # the whole file is parsed again after the state is set, drop the records
+        # which were returned before
+        if particles_returned > self._records_taken:
+            self._records_taken += len(self._record_buffer.take(particles_returned - self._records_taken))
+
+        total_num_records = self._records_taken + len(self._record_buffer)
 
         num_records_remaining = total_num_records - particles_returned
 
@@ -203,9 +212,8 @@ class MmpCdsParser(BufferLoadingParser):
 
         return_list = []
 
-        end_range = particles_returned + num_to_fetch
-
-        records_to_return = self._record_buffer[particles_returned:end_range]
+        records_to_return = self._record_buffer.take(num_to_fetch)
+        self._records_taken += len(records_to_return)
         if len(records_to_return) > 0:
 
             # Update the number of particles returned
@@ -233,17 +241,9 @@ class MmpCdsParser(BufferLoadingParser):
         @return The length of data retrieved.
         @throws EOFError when the end of the file is reached.
         """
-        # Read in data in blocks so as to not tie up the CPU.
-        eof = False
-        data = ''
-        while not eof:
-            next_block = self._stream_handle.read(size)
-            if next_block:
-                data = data + next_block
-            else:
-                eof = True
-
-        if data != '':
+        data = map_stream(self._stream_handle)
+
+        if len(data):
             self._timestamp = float(ntplib.system_to_ntp_time(time.time()))
             log.debug("Calculated current time timestamp %.10f", self._timestamp)
             self._chunker.add_chunk(data, self._timestamp)
@@ -15,23 +15,26 @@ __license__ = 'Apache 2.0'
 
 import copy
 import ntplib
+import numpy
 import struct
 import binascii
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 import time
 
 from mi.core.log import get_logger
 log = get_logger()
 
 from mi.core.common import BaseEnum
-from mi.core.instrument.data_particle import DataParticle
+from mi.core.instrument.data_particle import DataParticle, ParticleBatch
 from mi.core.exceptions import \
     SampleException, \
     DatasetParserException, \
     UnexpectedDataException, \
     ConfigurationException
 
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.parser import utilities
 
@@ -76,12 +79,28 @@ class MopakODclAccelParserDataParticleKey(BaseEnum):
     MOPAK_TIMER = 'mopak_timer'
 
 
+# layout of the values in an accel record, following its ID byte
+ACCEL_DTYPE = numpy.dtype([(MopakODclAccelParserDataParticleKey.MOPAK_ACCELX, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_ACCELY, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_ACCELZ, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_ANG_RATEX, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_ANG_RATEY, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_ANG_RATEZ, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_MAGX, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_MAGY, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_MAGZ, '>f4'),
+                           (MopakODclAccelParserDataParticleKey.MOPAK_TIMER, '>u4')])
+
+
 class MopakODclAccelAbstractDataParticle(DataParticle):
     """
     Abstract Class for parsing data from the Mopak_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = None
+    # layout of the record values when particles are built in batches
+    _batch_dtype = ACCEL_DTYPE
 
     def _build_parsed_values(self):
         """
@@ -114,6 +133,7 @@ class MopakODclAccelParserDataParticle(MopakODclAccelAbstractDataParticle):
     """
     Class for parsing data from the Mopak_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = MopakDataParticleType.ACCEL_TELEM
 
@@ -122,6 +142,7 @@ class MopakODclAccelParserRecoveredDataParticle(MopakODclAccelAbstractDataPartic
     """
     Class for parsing data from the Mopak_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = MopakDataParticleType.ACCEL_RECOV
 
@@ -136,12 +157,25 @@ class MopakODclRateParserDataParticleKey(BaseEnum):
     MOPAK_TIMER = 'mopak_timer'
 
 
+# layout of the values in a rate record, following its ID byte
+RATE_DTYPE = numpy.dtype([(MopakODclRateParserDataParticleKey.MOPAK_ROLL, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_PITCH, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_YAW, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_ANG_RATEX, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_ANG_RATEY, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_ANG_RATEZ, '>f4'),
+                          (MopakODclRateParserDataParticleKey.MOPAK_TIMER, '>u4')])
+
+
 class MopakODclRateParserDataAbstractParticle(DataParticle):
     """
     Abstract Class for parsing data from the mopak_o_dcl data set
     """
+    __slots__ = ()
 
     _data_particle_type = None
+    # layout of the record values when particles are built in batches
+    _batch_dtype = RATE_DTYPE
     
     def _build_parsed_values(self):
         """
@@ -171,6 +205,7 @@ class MopakODclRateParserDataParticle(MopakODclRateParserDataAbstractParticle):
     """
     Class for parsing data from the mopak_o_dcl data set
     """
+    __slots__ = ()
 
     _data_particle_type = MopakDataParticleType.RATE_TELEM
 
@@ -179,6 +214,7 @@ class MopakODclRateParserRecoveredDataParticle(MopakODclRateParserDataAbstractPa
     """
     Class for parsing data from the mopak_o_dcl data set
     """
+    __slots__ = ()
 
     _data_particle_type = MopakDataParticleType.RATE_RECOV
 
@@ -213,6 +249,9 @@ class MopakODclParser(BufferLoadingParser):
             log.error('Parser configuration missing or incorrect')
             raise ConfigurationException
 
+        # build a ParticleBatch from each run of records of the same type instead of a particle per record
+        self._particle_batches = config.get(DataSetDriverConfigKeys.PARTICLE_BATCHES, False)
+
         super(MopakODclParser, self).__init__(config,
                                               stream_handle,
                                               state,
@@ -322,7 +361,7 @@ class MopakODclParser(BufferLoadingParser):
            not (StateKey.TIMER_ROLLOVER in state_obj) or \
            not (StateKey.TIMER_START in state_obj):
             raise DatasetParserException("Invalid state keys: %s" % state_obj)
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._chunker.clean_all_chunks()
         self._state = state_obj
         self._read_state = state_obj
@@ -343,8 +382,12 @@ class MopakODclParser(BufferLoadingParser):
         exception if the timer is reset in the middle.
         @retval a list of tuples with sample particles encountered in this
             parsing, plus the state. An empty list of nothing was parsed.
+            With particle batches configured each consecutive run of records
+            of the same type is one ParticleBatch.
         """
         result_particles = []
+        # (particle class, record values, timestamp, state) of each record, with particle batches
+        batch_rows = []
         (nd_timestamp, non_data, non_start, non_end) = self._chunker.get_next_non_data_with_index(clean=False)
         (timestamp, chunk, start, end) = self._chunker.get_next_data_with_index(clean=True)
         self.handle_non_data(non_data, non_end, start)
@@ -395,25 +438,49 @@ class MopakODclParser(BufferLoadingParser):
                 last_timer = timer
 
                 if chunk[0] == ACCEL_ID:
+                    particle_class = self._accel_particle_class
+                    record_bytes = ACCEL_BYTES
+                else:
+                    particle_class = self._rate_particle_class
+                    record_bytes = RATE_BYTES
 
-                    sample = self._extract_sample(self._accel_particle_class, None, chunk, timestamp)
+                if self._particle_batches:
                     # increment state
-                    self._increment_state(ACCEL_BYTES)
-
-                elif chunk[0] == RATE_ID:
-                    sample = self._extract_sample(self._rate_particle_class, None, chunk, timestamp)
+                    self._increment_state(record_bytes)
+                    batch_rows.append((particle_class, chunk[1:record_bytes - 2], timestamp,
+                                       copy.copy(self._read_state)))
+                else:
+                    sample = self._extract_sample(particle_class, None, chunk, timestamp)
                     # increment state
-                    self._increment_state(RATE_BYTES)
+                    self._increment_state(record_bytes)
 
-                if sample:
-                    result_particles.append((sample, copy.copy(self._read_state)))
+                    if sample:
+                        result_particles.append((sample, copy.copy(self._read_state)))
 
             (nd_timestamp, non_data, non_start, non_end) = self._chunker.get_next_non_data_with_index(clean=False)
             (timestamp, chunk, start, end) = self._chunker.get_next_data_with_index(clean=True)
             self.handle_non_data(non_data, non_end, start)
 
+        if batch_rows:
+            result_particles.extend(self._build_batches(batch_rows))
+
         return result_particles
 
+    @staticmethod
+    def _build_batches(batch_rows):
+        """
+        Build a particle batch from each run of consecutive records of the same particle class
+        @param batch_rows A list of (particle class, record values, timestamp, state) tuples
+        @retval A list of tuples of each batch and the state after its last record
+        """
+        result = []
+        for particle_class, run in groupby(batch_rows, itemgetter(0)):
+            run = list(run)
+            values = numpy.frombuffer(''.join([row[1] for row in run]), particle_class._batch_dtype)
+            batch = ParticleBatch(particle_class._data_particle_type, values, [row[2] for row in run])
+            result.append((batch, run[-1][3]))
+        return result
+
     def handle_non_data(self, non_data, non_end, start):
         """
         handle data in the non_data chunker queue
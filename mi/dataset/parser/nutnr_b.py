@@ -27,7 +27,7 @@ from mi.dataset.parser.nutnr_b_particles import \
     NutnrBInstrumentRecoveredDataParticle, \
     NutnrBDarkInstrumentRecoveredDataParticle, \
     NutnrBDataParticleKey
-from mi.dataset.dataset_parser import Parser
+from mi.dataset.dataset_parser import Parser, RecordQueue
 from mi.dataset.parser.common_regexes import THREE_CHAR_DAY_OF_WEEK_REGEX, \
     THREE_CHAR_MONTH_REGEX, TIME_HR_MIN_SEC_REGEX, END_OF_LINE_REGEX, \
     DATE_DAY_REGEX, DATE_YEAR_REGEX, FLOAT_REGEX, INT_REGEX
@@ -165,7 +165,7 @@ class NutnrBParser(Parser):
                                            exception_callback)
 
         self._file_parsed = False
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._metadata_state = 0
         self._metadata = {NutnrBDataParticleKey.STARTUP_TIME_STRING: None,
                           NutnrBDataParticleKey.FIRMWARE_VERSION: None,
@@ -443,6 +443,6 @@ class NutnrBParser(Parser):
             # Iterate through the particles returned, and pop them off from the beginning of the record
             # buffer to the end
             while len(particles_to_return) < num_records_requested and len(self._record_buffer) > 0:
-                particles_to_return.append(self._record_buffer.pop(0))
+                particles_to_return.append(self._record_buffer.popleft())
 
         return particles_to_return
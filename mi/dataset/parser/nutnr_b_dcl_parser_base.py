@@ -23,7 +23,7 @@ log = get_logger()
 from mi.core.exceptions import RecoverableSampleException, NotImplementedException, \
     UnexpectedDataException
 
-from mi.dataset.dataset_parser import Parser
+from mi.dataset.dataset_parser import Parser, RecordQueue
 
 from mi.dataset.parser.nutnr_b_particles import NutnrBDataParticleKey
 from mi.dataset.parser.utilities import dcl_controller_timestamp_to_utc_time, \
@@ -321,7 +321,7 @@ class NutnrBDclParser(Parser):
 
         # Initialize the
         self._file_parsed = False
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._metadata_state = 0
         self._metadata_timestamp = 0.0
         self._metadata_particle_generated_for_block = False
@@ -515,6 +515,6 @@ class NutnrBDclParser(Parser):
             # Iterate through the particles returned, and pop them off from the beginning of the record
             # buffer to the end
             while len(particles_to_return) < num_records_requested and len(self._record_buffer) > 0:
-                particles_to_return.append(self._record_buffer.pop(0))
+                particles_to_return.append(self._record_buffer.popleft())
 
         return particles_to_return
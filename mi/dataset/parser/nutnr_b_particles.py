@@ -79,6 +79,7 @@ class NutnrBMetadataRecoveredDataParticle(DataParticle):
     """
     Class for generating the nutnr b metadata recovered particle.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_METADATA_RECOVERED
 
     def _build_parsed_values(self):
@@ -106,6 +107,7 @@ class NutnrBInstrumentRecoveredDataParticle(DataParticle):
     """
     Class for generating the nutnr b instrument recovered particle.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_INSTRUMENT_RECOVERED
 
     def _build_parsed_values(self):
@@ -126,6 +128,7 @@ class NutnrBDarkInstrumentRecoveredDataParticle(DataParticle):
     """
     Class for generating the nutnr b instrument recovered particle.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DARK_INSTRUMENT_RECOVERED
 
     def _build_parsed_values(self):
@@ -146,6 +149,7 @@ class NutnrBDclInstrumentDataParticle(DataParticle):
     """
     Class for generating the nutnr b dcl instrument particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -179,6 +183,7 @@ class NutnrBDclMetadataDataParticle(DataParticle):
     """
     Class for generating the nutnr_b_dcl Metadata particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -212,6 +217,7 @@ class NutnrBDclConcRecoveredInstrumentDataParticle(NutnrBDclInstrumentDataPartic
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_CONC_INSTRUMENT_RECOVERED
 
 
@@ -219,6 +225,7 @@ class NutnrBDclDarkConcRecoveredInstrumentDataParticle(NutnrBDclInstrumentDataPa
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_DARK_CONC_INSTRUMENT_RECOVERED
 
 
@@ -226,6 +233,7 @@ class NutnrBDclConcTelemeteredInstrumentDataParticle(NutnrBDclInstrumentDataPart
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_CONC_INSTRUMENT
 
 
@@ -233,6 +241,7 @@ class NutnrBDclDarkConcTelemeteredInstrumentDataParticle(NutnrBDclInstrumentData
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_DARK_CONC_INSTRUMENT
 
 
@@ -240,6 +249,7 @@ class NutnrBDclConcRecoveredMetadataDataParticle(NutnrBDclMetadataDataParticle):
     """
     Class for generating Metadata Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_CONC_METADATA_RECOVERED
 
 
@@ -247,6 +257,7 @@ class NutnrBDclConcTelemeteredMetadataDataParticle(NutnrBDclMetadataDataParticle
     """
     Class for generating Metadata Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_CONC_METADATA
 
 
@@ -254,6 +265,7 @@ class NutnrBDclFullRecoveredInstrumentDataParticle(NutnrBDclInstrumentDataPartic
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_FULL_INSTRUMENT_RECOVERED
 
 
@@ -261,6 +273,7 @@ class NutnrBDclDarkFullRecoveredInstrumentDataParticle(NutnrBDclInstrumentDataPa
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_DARK_FULL_INSTRUMENT_RECOVERED
 
 
@@ -268,6 +281,7 @@ class NutnrBDclFullTelemeteredInstrumentDataParticle(NutnrBDclInstrumentDataPart
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_FULL_INSTRUMENT
 
 
@@ -275,6 +289,7 @@ class NutnrBDclDarkFullTelemeteredInstrumentDataParticle(NutnrBDclInstrumentData
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_DARK_FULL_INSTRUMENT
 
 
@@ -282,6 +297,7 @@ class NutnrBDclFullRecoveredMetadataDataParticle(NutnrBDclMetadataDataParticle):
     """
     Class for generating Metadata Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_FULL_METADATA_RECOVERED
 
 
@@ -289,4 +305,5 @@ class NutnrBDclFullTelemeteredMetadataDataParticle(NutnrBDclMetadataDataParticle
     """
     Class for generating Metadata Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.NUTNR_B_DCL_FULL_METADATA
\ No newline at end of file
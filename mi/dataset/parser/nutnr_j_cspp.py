@@ -139,6 +139,7 @@ class NutnrJCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for parsing metadata from the nutnr_j_cspp data set
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -163,11 +164,13 @@ class NutnrJCsppMetadataDataParticle(CsppMetadataDataParticle):
 
 class NutnrJCsppMetadataTelemeteredDataParticle(NutnrJCsppMetadataDataParticle):
     """ Class for building a telemetered data sample parser """
+    __slots__ = ()
     _data_particle_type = DataParticleType.METADATA
 
 
 class NutnrJCsppMetadataRecoveredDataParticle(NutnrJCsppMetadataDataParticle):
     """ Class for building a recovered data sample parser """
+    __slots__ = ()
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
 
@@ -175,6 +178,7 @@ class NutnrJCsppDataParticle(DataParticle):
     """
     Class for parsing data from the nutnr_j_cspp data set
     """
+    __slots__ = ()
     _parameter_map = None
     _spectral_channels = None
 
@@ -213,6 +217,7 @@ class NutnrJCsppDataParticle(DataParticle):
 
 class NutnrJCsppTelemeteredDataParticle(NutnrJCsppDataParticle):
     """ Class for building a telemetered data sample parser """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.LIGHT_INSTRUMENT
     _spectral_channels = LIGHT_SPECTRAL_CHANNELS
@@ -221,6 +226,7 @@ class NutnrJCsppTelemeteredDataParticle(NutnrJCsppDataParticle):
 
 class NutnrJCsppRecoveredDataParticle(NutnrJCsppDataParticle):
     """ Class for building a recovered data sample parser """
+    __slots__ = ()
     _data_particle_type = DataParticleType.LIGHT_INSTRUMENT_RECOVERED
     _spectral_channels = LIGHT_SPECTRAL_CHANNELS
     _parameter_map = LIGHT_PARAMETER_MAP
@@ -228,6 +234,7 @@ class NutnrJCsppRecoveredDataParticle(NutnrJCsppDataParticle):
 
 class NutnrJCsppDarkTelemeteredDataParticle(NutnrJCsppDataParticle):
     """ Class for building a telemetered data sample parser """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.DARK_INSTRUMENT
     _spectral_channels = DARK_SPECTRAL_CHANNELS
@@ -236,6 +243,7 @@ class NutnrJCsppDarkTelemeteredDataParticle(NutnrJCsppDataParticle):
 
 class NutnrJCsppDarkRecoveredDataParticle(NutnrJCsppDataParticle):
     """ Class for building a recovered data sample parser """
+    __slots__ = ()
     _data_particle_type = DataParticleType.DARK_INSTRUMENT_RECOVERED
     _spectral_channels = DARK_SPECTRAL_CHANNELS
     _parameter_map = DARK_PARAMETER_MAP
@@ -38,12 +38,14 @@ DARK_PARAMETER_MAP = PARAMETER_MAP_START + DARK_SPECTRAL_MAP + PARAMETER_MAP_END
 
 class NutnrMDataParticle(SunaDataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'nutnr_m_instrument_recovered'
     _param_map = LIGHT_PARAMETER_MAP
 
 
 class NutnrMDarkDataParticle(SunaDataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'nutnr_m_dark_instrument_recovered'
     _param_map = DARK_PARAMETER_MAP
 
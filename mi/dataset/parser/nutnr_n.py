@@ -48,12 +48,14 @@ DARK_PARAMETER_MAP = PARAMETER_MAP_START + DARK_SPECTRAL_MAP + PARAMETER_MAP_END
 
 class NutnrNDataParticle(SunaDataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'nutnr_n_instrument_recovered'
     _param_map = LIGHT_PARAMETER_MAP
 
 
 class NutnrNDarkDataParticle(SunaDataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'nutnr_n_dark_instrument_recovered'
     _param_map = DARK_PARAMETER_MAP
 
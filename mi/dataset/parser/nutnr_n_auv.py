@@ -61,6 +61,7 @@ NUTNR_N_AUV_PARAM_MAP = [
 
 class NutnrNAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = NUTNR_N_AUV_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
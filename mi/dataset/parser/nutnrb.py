@@ -23,7 +23,7 @@ from mi.core.common import BaseEnum
 from mi.core.instrument.chunker import StringChunker
 from mi.core.instrument.data_particle import DataParticle, DataParticleKey
 from mi.core.exceptions import SampleException, DatasetParserException
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 
 DATA_REGEX = '(\d{4}/\d*/\d*\s*\d*:\d*:\d*\.\d*) (SAT)(N[LD]C)(\d+),(\d{7}),([\-\d\.]*),([\-\d\.]*),([\-\d\.]*),([\-\d\.]*),([\-\d\.]*),([\-\d\.]*)[\r\n]*'  # ^M
 DATA_MATCHER = re.compile(DATA_REGEX)
@@ -54,6 +54,7 @@ class NutnrbDataParticle(DataParticle):
     """
     Class for parsing data from the CE_ISSM_RI_NUTNR_B instrument
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
@@ -138,7 +139,7 @@ class NutnrbParser(BufferLoadingParser):
                                           **kwargs)
 
         self._timestamp = 0.0
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._read_state = {StateKey.POSITION:0}
 
         if state:
@@ -154,7 +155,7 @@ class NutnrbParser(BufferLoadingParser):
             raise DatasetParserException("Invalid state structure")
         if not (StateKey.POSITION in state_obj):
             raise DatasetParserException("Invalid state keys")
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
 
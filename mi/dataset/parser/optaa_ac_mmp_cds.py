@@ -93,6 +93,7 @@ class OptaaAcMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the optaa_ac_mmp_cds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
     
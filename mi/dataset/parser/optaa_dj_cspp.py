@@ -137,6 +137,7 @@ class OptaaDjCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Base Class for building a metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -172,6 +173,7 @@ class OptaaDjCsppMetadataRecoveredDataParticle(OptaaDjCsppMetadataDataParticle):
     """
     Class for building a recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -180,6 +182,7 @@ class OptaaDjCsppMetadataTelemeteredDataParticle(OptaaDjCsppMetadataDataParticle
     """
     Class for building a telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -188,6 +191,7 @@ class OptaaDjCsppInstrumentDataParticle(DataParticle):
     """
     Base Class for building a instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -277,6 +281,7 @@ class OptaaDjCsppInstrumentRecoveredDataParticle(OptaaDjCsppInstrumentDataPartic
     """
     Class for building a recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -285,6 +290,7 @@ class OptaaDjCsppInstrumentTelemeteredDataParticle(OptaaDjCsppInstrumentDataPart
     """
     Class for building a telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
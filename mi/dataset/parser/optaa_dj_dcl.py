@@ -40,7 +40,7 @@ from mi.core.exceptions import \
     UnexpectedDataException
 
 from mi.core.instrument.data_particle import DataParticle
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 
 SIZE_CHECKSUM = 2                    # number of bytes for checksum in the input
 SIZE_PAD = 1                         # number of bytes for trailing pad in the input
@@ -203,6 +203,7 @@ class OptaaDjDclInstrumentDataParticle(DataParticle):
     """
     Class for generating the Optaa_dj instrument particle.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -222,6 +223,7 @@ class OptaaDjDclRecoveredInstrumentDataParticle(OptaaDjDclInstrumentDataParticle
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_INSTRUMENT_PARTICLE
 
 
@@ -229,6 +231,7 @@ class OptaaDjDclTelemeteredInstrumentDataParticle(OptaaDjDclInstrumentDataPartic
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_INSTRUMENT_PARTICLE
 
 
@@ -236,6 +239,7 @@ class OptaaDjDclMetadataDataParticle(DataParticle):
     """
     Class for generating the Optaa_dj Metadata particle.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -255,6 +259,7 @@ class OptaaDjDclRecoveredMetadataDataParticle(OptaaDjDclMetadataDataParticle):
     """
     Class for generating Metadata Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.REC_METADATA_PARTICLE
 
 
@@ -262,6 +267,7 @@ class OptaaDjDclTelemeteredMetadataDataParticle(OptaaDjDclMetadataDataParticle):
     """
     Class for generating Metadata Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TEL_METADATA_PARTICLE
 
 
@@ -558,7 +564,7 @@ class OptaaDjDclParser(BufferLoadingParser):
                 log.warn(error_message)
                 raise DatasetParserException(error_message)
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
 
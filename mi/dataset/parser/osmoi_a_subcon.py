@@ -76,6 +76,7 @@ START_TIME_IDX = 2
 
 class OsmoiASubconInstrumentDataParticle(DataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'osmoi_a_subcon_instrument_recovered'
     instrument_particle_map = OSMOI_DATA_MAP
 
@@ -98,6 +98,7 @@ class ParadJCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Base Class for building a parad_j_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -134,6 +135,7 @@ class ParadJCsppMetadataRecoveredDataParticle(ParadJCsppMetadataDataParticle):
     """
     Class for building a parad_j_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -142,6 +144,7 @@ class ParadJCsppMetadataTelemeteredDataParticle(ParadJCsppMetadataDataParticle):
     """
     Class for building a parad_j_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -150,6 +153,7 @@ class ParadJCsppInstrumentDataParticle(DataParticle):
     """
     Base Class for building a parad_j_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -203,6 +207,7 @@ class ParadJCsppInstrumentRecoveredDataParticle(ParadJCsppInstrumentDataParticle
     """
     Class for building a parad_j_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -211,6 +216,7 @@ class ParadJCsppInstrumentTelemeteredDataParticle(ParadJCsppInstrumentDataPartic
     """
     Class for building a parad_j_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
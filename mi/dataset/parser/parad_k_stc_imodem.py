@@ -43,6 +43,7 @@ class Parad_k_stc_DataParticle(DataParticle):
     Generic class to generate Parad_k_stc data particles for both recovered
     and telemetered data.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -77,6 +78,7 @@ class Parad_k_stc_imodemDataParticle(Parad_k_stc_DataParticle):
     """
     Class for parsing telemetered data from the PARAD_K_STC_IMODEM data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.PARAD_K_INS
 
@@ -85,6 +87,7 @@ class Parad_k_stc_imodemRecoveredDataParticle(Parad_k_stc_DataParticle):
     """
     Class for parsing recovered data from the PARAD_K_STC_IMODEM data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.PARAD_K_INS_RECOVERED
 
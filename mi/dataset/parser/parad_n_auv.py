@@ -38,18 +38,21 @@ PARAD_N_AUV_PARAM_MAP = [
 
 class ParadNAuvInstrumentParticle(AuvCommonParticle):
 
+    __slots__ = ()
     _auv_param_map = PARAD_N_AUV_PARAM_MAP
     # must provide a parameter map for _build_parsed_values
 
 
 class ParadNAuvTelemeteredParticle(ParadNAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "parad_n_auv_instrument"
 
 
 class ParadNAuvRecoveredParticle(ParadNAuvInstrumentParticle):
 
+    __slots__ = ()
     # set the data_particle_type for the DataParticle class
     _data_particle_type = "parad_n_auv_instrument_recovered"
 
@@ -167,6 +167,7 @@ class Pco2aADclInstrumentDataParticleAir(DclInstrumentDataParticle):
     """
     Class for generating the Pco2a_a_dcl instrument particles.
     """
+    __slots__ = ()
     data_matcher = SENSOR_DATA_MATCHER_AIR
 
     def __init__(self, raw_data, *args, **kwargs):
@@ -179,6 +180,7 @@ class Pco2aADclInstrumentDataParticleWater(DclInstrumentDataParticle):
     """
     Class for generating the Pco2a_a_dcl instrument particles.
     """
+    __slots__ = ()
     data_matcher = SENSOR_DATA_MATCHER_WATER
 
     def __init__(self, raw_data, *args, **kwargs):
@@ -191,6 +193,7 @@ class Pco2aADclTelemeteredInstrumentDataParticleAir(Pco2aADclInstrumentDataParti
     """
     Class for generating Offset Data Particles from Telemetered air data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2A_INSTRUMENT_AIR_PARTICLE
 
 
@@ -198,6 +201,7 @@ class Pco2aADclTelemeteredInstrumentDataParticleWater(Pco2aADclInstrumentDataPar
     """
     Class for generating Offset Data Particles from Telemetered water data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2A_INSTRUMENT_WATER_PARTICLE
 
 
@@ -205,6 +209,7 @@ class Pco2aADclRecoveredInstrumentDataParticleAir(Pco2aADclInstrumentDataParticl
     """
     Class for generating Offset Data Particles from Recovered air data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2A_INSTRUMENT_AIR_RECOVERED_PARTICLE
 
 
@@ -212,6 +217,7 @@ class Pco2aADclRecoveredInstrumentDataParticleWater(Pco2aADclInstrumentDataParti
     """
     Class for generating Offset Data Particles from Recovered water data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2A_INSTRUMENT_WATER_RECOVERED_PARTICLE
 
 
@@ -5,7 +5,7 @@ import re
 
 from mi.core.exceptions import RecoverableSampleException
 from mi.core.log import get_logger
-from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys, RecordQueue
 
 log = get_logger()
 from mi.dataset.dataset_parser import Parser
@@ -165,7 +165,7 @@ class Pco2wAbcParser(Parser):
                  publish_callback=None):  # No longer used
 
         self._file_parsed = False
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._metadata_class = config[
             DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT][
                 Pco2wAbcParticleClassKey.METADATA_PARTICLE_CLASS]
@@ -484,6 +484,6 @@ class Pco2wAbcParser(Parser):
             # Iterate through the particles returned, and pop them off from the beginning of the record
             # buffer to the end
             while len(particles_to_return) < num_records_requested and len(self._record_buffer) > 0:
-                particles_to_return.append(self._record_buffer.pop(0))
+                particles_to_return.append(self._record_buffer.popleft())
 
         return particles_to_return
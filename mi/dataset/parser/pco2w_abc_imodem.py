@@ -5,7 +5,7 @@ import re
 
 from mi.core.exceptions import RecoverableSampleException
 from mi.core.log import get_logger
-from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys, RecordQueue
 
 log = get_logger()
 from mi.dataset.dataset_parser import SimpleParser
@@ -84,7 +84,7 @@ class Pco2wAbcImodemParser(SimpleParser):
                                                    stream_handle,
                                                    exception_callback)
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._metadata_class = config[
             DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT][
                 Pco2wAbcParticleClassKey.METADATA_PARTICLE_CLASS]
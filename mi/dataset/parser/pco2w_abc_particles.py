@@ -84,6 +84,7 @@ class Pco2wAbcDataParticleKey(BaseEnum):
 
 class Pco2wAbcBaseDataParticle(DataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -106,6 +107,7 @@ class Pco2wAbcBaseDataParticle(DataParticle):
 
 class Pco2wAbcDclBaseDataParticle(Pco2wAbcBaseDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into
@@ -132,6 +134,7 @@ class Pco2wAbcDclBaseDataParticle(Pco2wAbcBaseDataParticle):
 
 class Pco2wAbcInstrumentBaseDataParticle(Pco2wAbcBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = None
 
     def _build_parsed_values(self):
@@ -156,6 +159,7 @@ class Pco2wAbcInstrumentBaseDataParticle(Pco2wAbcBaseDataParticle):
 
 class Pco2wAbcInstrumentDataParticle(Pco2wAbcInstrumentBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_INSTRUMENT
 
     def _build_parsed_values(self):
@@ -176,6 +180,7 @@ class Pco2wAbcInstrumentDataParticle(Pco2wAbcInstrumentBaseDataParticle):
 
 class Pco2wAbcInstrumentBlankDataParticle(Pco2wAbcInstrumentBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_INSTRUMENT_BLANK
 
     def _build_parsed_values(self):
@@ -196,6 +201,7 @@ class Pco2wAbcInstrumentBlankDataParticle(Pco2wAbcInstrumentBaseDataParticle):
 
 class Pco2wAbcMetadataDataParticle(Pco2wAbcBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_METADATA
 
     def _build_parsed_values(self):
@@ -298,6 +304,7 @@ class Pco2wAbcMetadataDataParticle(Pco2wAbcBaseDataParticle):
 
 class Pco2wAbcPowerDataParticle(Pco2wAbcBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_POWER
 
     def _build_parsed_values(self):
@@ -311,6 +318,7 @@ class Pco2wAbcPowerDataParticle(Pco2wAbcBaseDataParticle):
 
 class Pco2wAbcDclInstrumentDataParticle(Pco2wAbcInstrumentDataParticle, Pco2wAbcDclBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = None
 
     def _build_parsed_values(self):
@@ -324,16 +332,19 @@ class Pco2wAbcDclInstrumentDataParticle(Pco2wAbcInstrumentDataParticle, Pco2wAbc
 
 class Pco2wAbcDclInstrumentTelemeteredDataParticle(Pco2wAbcDclInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_INSTRUMENT
 
 
 class Pco2wAbcDclInstrumentRecoveredDataParticle(Pco2wAbcDclInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_INSTRUMENT_RECOVERED
 
 
 class Pco2wAbcDclInstrumentBlankDataParticle(Pco2wAbcInstrumentBlankDataParticle, Pco2wAbcDclBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_INSTRUMENT_BLANK
 
     def _build_parsed_values(self):
@@ -347,16 +358,19 @@ class Pco2wAbcDclInstrumentBlankDataParticle(Pco2wAbcInstrumentBlankDataParticle
 
 class Pco2wAbcDclInstrumentBlankTelemeteredDataParticle(Pco2wAbcDclInstrumentBlankDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_INSTRUMENT_BLANK
 
 
 class Pco2wAbcDclInstrumentBlankRecoveredDataParticle(Pco2wAbcDclInstrumentBlankDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_INSTRUMENT_BLANK_RECOVERED
 
 
 class Pco2wAbcDclMetadataDataParticle(Pco2wAbcMetadataDataParticle, Pco2wAbcDclBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = None
 
     def _build_parsed_values(self):
@@ -370,16 +384,19 @@ class Pco2wAbcDclMetadataDataParticle(Pco2wAbcMetadataDataParticle, Pco2wAbcDclB
 
 class Pco2wAbcDclMetadataTelemeteredDataParticle(Pco2wAbcDclMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_METADATA
 
 
 class Pco2wAbcDclMetadataRecoveredDataParticle(Pco2wAbcDclMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_METADATA_RECOVERED
 
 
 class Pco2wAbcDclPowerDataParticle(Pco2wAbcPowerDataParticle, Pco2wAbcDclBaseDataParticle):
 
+    __slots__ = ()
     _data_particle_type = None
 
     def _build_parsed_values(self):
@@ -393,16 +410,19 @@ class Pco2wAbcDclPowerDataParticle(Pco2wAbcPowerDataParticle, Pco2wAbcDclBaseDat
 
 class Pco2wAbcDclPowerTelemeteredDataParticle(Pco2wAbcDclPowerDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_POWER
 
 
 class Pco2wAbcDclPowerRecoveredDataParticle(Pco2wAbcDclPowerDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_DCL_POWER_RECOVERED
 
 
 class Pco2wAbcImodemDataParticle(DataParticle):
 
+    __slots__ = ()
     _encoding_rules = None
 
     def _build_parsed_values(self):
@@ -434,6 +454,7 @@ class Pco2wAbcImodemDataParticle(DataParticle):
 
 class Pco2wAbcImodemInstrumentDataParticle(Pco2wAbcImodemDataParticle):
 
+    __slots__ = ()
     _encoding_rules = {
         Pco2wAbcDataParticleKey.UNIQUE_ID: int,
         Pco2wAbcDataParticleKey.RECORD_TYPE: int,
@@ -447,16 +468,19 @@ class Pco2wAbcImodemInstrumentDataParticle(Pco2wAbcImodemDataParticle):
 
 class Pco2wAbcImodemInstrumentTelemeteredDataParticle(Pco2wAbcImodemInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_INSTRUMENT
 
 
 class Pco2wAbcImodemInstrumentRecoveredDataParticle(Pco2wAbcImodemInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_INSTRUMENT_RECOVERED
 
 
 class Pco2wAbcImodemInstrumentBlankDataParticle(Pco2wAbcImodemDataParticle):
 
+    __slots__ = ()
     _encoding_rules = {
         Pco2wAbcDataParticleKey.UNIQUE_ID: int,
         Pco2wAbcDataParticleKey.RECORD_TYPE: int,
@@ -471,6 +495,7 @@ class Pco2wAbcImodemInstrumentBlankDataParticle(Pco2wAbcImodemDataParticle):
 class Pco2wAbcImodemInstrumentBlankTelemeteredDataParticle(
         Pco2wAbcImodemInstrumentBlankDataParticle):
 
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.PCO2W_ABC_IMODEM_INSTRUMENT_BLANK
 
@@ -478,12 +503,14 @@ class Pco2wAbcImodemInstrumentBlankTelemeteredDataParticle(
 class Pco2wAbcImodemInstrumentBlankRecoveredDataParticle(
         Pco2wAbcImodemInstrumentBlankDataParticle):
 
+    __slots__ = ()
     _data_particle_type = \
         DataParticleType.PCO2W_ABC_IMODEM_INSTRUMENT_BLANK_RECOVERED
 
 
 class Pco2wAbcImodemControlDataParticle(Pco2wAbcImodemDataParticle):
 
+    __slots__ = ()
     _encoding_rules = {
         Pco2wAbcDataParticleKey.UNIQUE_ID: int,
         Pco2wAbcDataParticleKey.RECORD_TYPE: int,
@@ -514,16 +541,19 @@ class Pco2wAbcImodemControlDataParticle(Pco2wAbcImodemDataParticle):
 
 class Pco2wAbcImodemControlTelemeteredDataParticle(Pco2wAbcImodemControlDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_CONTROL
 
 
 class Pco2wAbcImodemControlRecoveredDataParticle(Pco2wAbcImodemControlDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_CONTROL_RECOVERED
 
 
 class Pco2wAbcImodemPowerDataParticle(Pco2wAbcImodemDataParticle):
 
+    __slots__ = ()
     _encoding_rules = {
         Pco2wAbcDataParticleKey.UNIQUE_ID: int,
         Pco2wAbcDataParticleKey.RECORD_TYPE: int,
@@ -534,16 +564,19 @@ class Pco2wAbcImodemPowerDataParticle(Pco2wAbcImodemDataParticle):
 
 class Pco2wAbcImodemPowerTelemeteredDataParticle(Pco2wAbcImodemPowerDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_POWER
 
 
 class Pco2wAbcImodemPowerRecoveredDataParticle(Pco2wAbcImodemPowerDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_POWER_RECOVERED
 
 
 class Pco2wAbcImodemMetadataDataParticle(Pco2wAbcImodemDataParticle):
 
+    __slots__ = ()
     _encoding_rules = {
         Pco2wAbcDataParticleKey.FILE_TIME: str,
         Pco2wAbcDataParticleKey.INSTRUMENT_ID: str,
@@ -558,9 +591,11 @@ class Pco2wAbcImodemMetadataDataParticle(Pco2wAbcImodemDataParticle):
 
 class Pco2wAbcImodemMetadataTelemeteredDataParticle(Pco2wAbcImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_METADATA
 
 
 class Pco2wAbcImodemMetadataRecoveredDataParticle(Pco2wAbcImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PCO2W_ABC_IMODEM_METADATA_RECOVERED
\ No newline at end of file
@@ -7,14 +7,32 @@
 Release notes:
 """
 from collections import namedtuple
+from datetime import datetime
+import os
 import pprint
+import re
 import struct
+import tempfile
 
 import sys
 
+import numpy as np
+
 namedtuple_store = {}
 bitmapped_namedtuple_store = {}
 
+# array types of the values in the cell data blocks, by struct format
+CELL_DTYPES = {
+    'h': np.dtype('<i2'),
+    'B': np.dtype('u1'),
+}
+
+
+# the header ID bytes every ensemble starts with
+PD0_HEADER_ID = b'\x7f\x7f'
+
+NTP_EPOCH = datetime(1900, 1, 1)
+
 
 class PD0ParsingException(Exception):
     pass
@@ -58,9 +76,66 @@ def count_zero_bits(bitmask):
     return zero_digits
 
 
+class CellData(object):
+    """
+    A velocity, correlation, echo intensity or percent good block of an
+    ensemble. The values are a (cells x beams) array viewing the ensemble
+    data rather than a copy of it, beam1 to beam4 are views of its columns.
+    """
+    __slots__ = ('id', 'cells')
+
+    def __init__(self, block_id, cells):
+        self.id = block_id
+        self.cells = cells
+
+    def __repr__(self):
+        return 'CellData(id=%r, cells=%r)' % (self.id, self.cells)
+
+    @property
+    def beam1(self):
+        return self.cells[:, 0]
+
+    @property
+    def beam2(self):
+        return self.cells[:, 1]
+
+    @property
+    def beam3(self):
+        return self.cells[:, 2]
+
+    @property
+    def beam4(self):
+        return self.cells[:, 3]
+
+    def beams(self):
+        """
+        @retval The values of each beam as a list, for all four beams
+        """
+        return self.cells.T.tolist()
+
+
+def beam_lists(cell_data):
+    """
+    Get the values of each beam of a cell data block as a list
+    @param cell_data A CellData, or the namedtuple of lists a record decodes
+        when it does not decode cell arrays
+    @retval A list of the values of the four beams
+    """
+    if isinstance(cell_data, CellData):
+        return cell_data.beams()
+    return [cell_data.beam1, cell_data.beam2, cell_data.beam3, cell_data.beam4]
+
+
 class AdcpPd0Record(object):
-    def __init__(self, data, glider=False):
+    def __init__(self, data, glider=False, cell_arrays=False):
+        """
+        @param data The ensemble data
+        @param glider If True the sensor source and available bits are decoded for a glider ADCP
+        @param cell_arrays If True the cell data blocks are decoded as CellData arrays
+            instead of lists of the values of each beam
+        """
         self.data = data
+        self.cell_arrays = cell_arrays
         self.header = None
         self.offsets = None
         self.fixed_data = None
@@ -93,7 +168,15 @@ class AdcpPd0Record(object):
         return _class(*data)
 
     def _unpack_cell_data(self, name, format_string, offset):
-        _class = namedtuple(name, ('id', 'beam1', 'beam2', 'beam3', 'beam4'))
+        if self.cell_arrays:
+            number_of_cells = self.fixed_data.number_of_cells
+            block_id = struct.unpack_from('<H', self.data, offset)[0]
+            cells = np.frombuffer(self.data, CELL_DTYPES[format_string], number_of_cells * 4, offset + 2)
+            return CellData(block_id, cells.reshape(number_of_cells, 4))
+
+        if name not in namedtuple_store:
+            namedtuple_store[name] = namedtuple(name, ('id', 'beam1', 'beam2', 'beam3', 'beam4'))
+        _class = namedtuple_store[name]
         data = struct.unpack_from('<H%d%s' % (self.fixed_data.number_of_cells * 4, format_string), self.data, offset)
         _object = _class(data[0], [], [], [], [])
         _object.beam1[:] = data[1::4]
@@ -589,3 +672,175 @@ class AdcpPd0Record(object):
         )
 
         self.error_word = self._unpack_bitmapped('error_word', error_word_format, self.variable_data.error_status_word)
+
+
+class EnsembleStatus(object):
+    """
+    What an ensemble index entry covers
+    """
+    # a complete ensemble with a valid checksum
+    OK = 0
+    # a complete ensemble whose checksum does not match its data
+    BAD_CHECKSUM = 1
+    # the start of an ensemble cut off by the end of the file
+    INCOMPLETE = 2
+    # bytes skipped two at a time looking for the next ensemble header
+    NO_HEADER = 3
+
+
+class EnsembleIndex(object):
+    """
+    Index of the ensembles in PD0 data, built by a pre-pass which only reads
+    the ensemble headers, checksums and variable leader times. Each entry has
+    the offset and length of an ensemble, or of a span of bytes without one,
+    its EnsembleStatus and the NTP time of its real time clock, NaN if it has
+    none. The entries cover the data from start to end in order, so a parser
+    can read the ensembles from the index rather than by walking the file,
+    and skip straight to the ensembles of a time range.
+
+    The index can be saved next to the file it indexes as a sidecar, which is
+    only loaded again while the file has the same size and modification time.
+    """
+    DTYPE = np.dtype([('offset', '<i8'), ('length', '<i8'), ('status', 'u1'), ('time', '<f8')])
+    SIDECAR_SUFFIX = '.ensembles.npz'
+    # version of the sidecar format, a sidecar of another version is rebuilt
+    VERSION = 1
+
+    _header_id_regex = re.compile(re.escape(PD0_HEADER_ID))
+
+    def __init__(self, entries):
+        """
+        @param entries An array of DTYPE entries
+        """
+        self.entries = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries.tolist())
+
+    @classmethod
+    def build(cls, data):
+        """
+        Index PD0 data the same way it is walked two bytes at a time looking for
+        ensemble headers
+        @param data A string or buffer holding the PD0 data
+        @retval The EnsembleIndex
+        """
+        size = len(data)
+        byte_values = np.frombuffer(data, np.uint8)
+        entries = []
+        position = 0
+
+        while position < size:
+            if data[position:position + 2] != PD0_HEADER_ID:
+                # skip to the next header found two bytes at a time from here
+                start = position
+                while True:
+                    match = cls._header_id_regex.search(data, position)
+                    if match is None:
+                        position = size
+                        break
+                    position = match.start()
+                    if (position - start) % 2 == 0:
+                        break
+                    position += 1
+                entries.append((start, position - start, EnsembleStatus.NO_HEADER, np.nan))
+                continue
+
+            # the ensemble size from the next 2 bytes excludes the checksum bytes
+            if position + 4 > size:
+                entries.append((position, size - position, EnsembleStatus.INCOMPLETE, np.nan))
+                break
+            num_bytes = struct.unpack_from('<H', data, position + 2)[0]
+            length = num_bytes + 2
+            if position + length > size:
+                entries.append((position, size - position, EnsembleStatus.INCOMPLETE, np.nan))
+                break
+
+            stored_checksum = struct.unpack_from('<H', data, position + num_bytes)[0]
+            calculated_checksum = int(byte_values[position:position + num_bytes].sum()) & 65535
+            if calculated_checksum == stored_checksum:
+                entries.append((position, length, EnsembleStatus.OK, cls._ensemble_time(data, position)))
+            else:
+                entries.append((position, length, EnsembleStatus.BAD_CHECKSUM, np.nan))
+            position += length
+
+        return cls(np.array(entries, dtype=cls.DTYPE))
+
+    @staticmethod
+    def _ensemble_time(data, position):
+        """
+        @retval The NTP time of the real time clock in the variable leader of the ensemble
+            starting at a position, or NaN if it has no valid one
+        """
+        try:
+            num_data_types = struct.unpack_from('<B', data, position + 5)[0]
+            for offset in struct.unpack_from('<%dH' % num_data_types, data, position + 6):
+                if struct.unpack_from('<H', data, position + offset)[0] == BlockId.VARIABLE_DATA:
+                    year, month, day, hour, minute, second, hundredths = \
+                        struct.unpack_from('<7B', data, position + offset + 4)
+                    rtc_time = datetime(2000 + year, month, day, hour, minute, second)
+                    return (rtc_time - NTP_EPOCH).total_seconds() + hundredths / 100.0
+        except (struct.error, ValueError):
+            pass
+        return np.nan
+
+    def select(self, start_time=None, end_time=None):
+        """
+        Get the entries of the valid ensembles in a time range
+        @param start_time The NTP time of the first ensemble, or None for no limit
+        @param end_time The NTP time the ensembles are before, or None for no limit
+        @retval An array of DTYPE entries
+        """
+        entries = self.entries
+        mask = entries['status'] == EnsembleStatus.OK
+        if start_time is not None:
+            mask &= entries['time'] >= start_time
+        if end_time is not None:
+            mask &= entries['time'] < end_time
+        return entries[mask]
+
+    @classmethod
+    def sidecar_path(cls, source_path):
+        return source_path + cls.SIDECAR_SUFFIX
+
+    @staticmethod
+    def _source_stamp(source_path):
+        """
+        @retval The size and modification time a sidecar is only valid for
+        """
+        stat = os.stat(source_path)
+        return np.array([stat.st_size, stat.st_mtime], dtype=np.float64)
+
+    def save(self, source_path):
+        """
+        Save the index as the sidecar of the file it indexes
+        @param source_path The path of the indexed file
+        """
+        path = self.sidecar_path(source_path)
+        # write to a temporary file and rename it so readers never see a partial index
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        with os.fdopen(handle, 'wb') as stream_handle:
+            np.savez(stream_handle, entries=self.entries, source=self._source_stamp(source_path),
+                     version=np.array([self.VERSION]))
+        os.rename(temp_path, path)
+
+    @classmethod
+    def load(cls, source_path):
+        """
+        Load the sidecar index of a file
+        @param source_path The path of the indexed file
+        @retval The EnsembleIndex, or None if there is no sidecar or it is out of date
+        """
+        path = cls.sidecar_path(source_path)
+        try:
+            with open(path, 'rb') as stream_handle:
+                sidecar = np.load(stream_handle)
+                if sidecar['version'].tolist() != [cls.VERSION] or \
+                        sidecar['source'].tolist() != cls._source_stamp(source_path).tolist():
+                    return None
+                return cls(sidecar['entries'])
+        except (IOError, OSError, KeyError, ValueError):
+            return None
@@ -121,6 +121,7 @@ class PhsenRecoveredInstrumentDataParticle(DataParticle):
     """
     Class for parsing data from the phsen_abcdef ph data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
@@ -222,6 +223,7 @@ class PhsenRecoveredMetadataDataParticle(DataParticle):
     """
     Class for parsing data from the phsen_abcdef control data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA
 
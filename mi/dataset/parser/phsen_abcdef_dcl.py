@@ -22,7 +22,7 @@ from mi.core.log import get_logger
 from mi.core.common import BaseEnum
 from mi.core.instrument.data_particle import DataParticle, DataParticleKey
 from mi.core.exceptions import DatasetParserException, UnexpectedDataException, RecoverableSampleException
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue, map_stream
 from mi.core.instrument.chunker import StringChunker
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.parser.common_regexes import END_OF_LINE_REGEX, ONE_OR_MORE_WHITESPACE_REGEX
@@ -80,6 +80,7 @@ class StateKey(BaseEnum):
 
 class PhsenAbcdefDclMetadataDataParticle(DataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Extracts PHSEN ABCDEF DCL Metadata data from raw_data.
@@ -317,6 +318,7 @@ class PhsenAbcdefDclMetadataDataParticleKey(BaseEnum):
 
 
 class PhsenAbcdefDclInstrumentDataParticle(DataParticle):
+    __slots__ = ()
     measurement_num_of_chars = 4
 
     def _create_light_measurements_array(self, working_record):
@@ -497,21 +499,25 @@ class PhsenAbcdefDclInstrumentDataParticleKey(BaseEnum):
 
 class PhsenAbcdefDclMetadataRecoveredDataParticle(PhsenAbcdefDclMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
 
 class PhsenAbcdefDclMetadataTelemeteredDataParticle(PhsenAbcdefDclMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
 
 class PhsenAbcdefDclInstrumentRecoveredDataParticle(PhsenAbcdefDclInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
 
 class PhsenAbcdefDclInstrumentTelemeteredDataParticle(PhsenAbcdefDclInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
 
@@ -578,18 +584,9 @@ class PhsenAbcdefDclParser(BufferLoadingParser):
         The length of data retrieved.
         An EOFError is raised when the end of the file is reached.
         """
-        # Read in data in blocks so as to not tie up the CPU.
-        BLOCK_SIZE = 1024
-        eof = False
-        data = ''
-        while not eof:
-            next_block = self._stream_handle.read(BLOCK_SIZE)
-            if next_block:
-                data = data + next_block
-            else:
-                eof = True
+        data = map_stream(self._stream_handle)
 
-        if data != '':
+        if len(data):
             self._chunker.add_chunk(data, self._timestamp)
             self.file_complete = True
             return len(data)
@@ -610,7 +607,7 @@ class PhsenAbcdefDclParser(BufferLoadingParser):
         if not (StateKey.START_OF_DATA in state_obj):
             raise DatasetParserException("Missing state key %s" % StateKey.START_OF_DATA)
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
         self._chunker.clean_all_chunks()
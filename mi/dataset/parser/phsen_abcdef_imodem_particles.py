@@ -129,6 +129,7 @@ class PhsenAbcdefImodemScienceBaseDataParticle(DataParticle):
     """
     BaseDataParticle class for Science records, which are pH records or control records.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -149,6 +150,7 @@ class PhsenAbcdefImodemInstrumentDataParticle(PhsenAbcdefImodemScienceBaseDataPa
     """
     Class for the instrument particle.
     """
+    __slots__ = ()
 
     _data_particle_type = None
 
@@ -171,6 +173,7 @@ class PhsenAbcdefImodemControlDataParticle(PhsenAbcdefImodemScienceBaseDataParti
     """
     Class for the control particle.
     """
+    __slots__ = ()
 
     _data_particle_type = None
 
@@ -203,6 +206,7 @@ class PhsenAbcdefImodemMetadataDataParticle(DataParticle):
     """
     Class for the metadata particle.
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -231,29 +235,35 @@ class PhsenAbcdefImodemMetadataDataParticle(DataParticle):
 
 class PhsenAbcdefImodemInstrumentTelemeteredDataParticle(PhsenAbcdefImodemInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_INSTRUMENT
 
 
 class PhsenAbcdefImodemInstrumentRecoveredDataParticle(PhsenAbcdefImodemInstrumentDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_INSTRUMENT_RECOVERED
 
 
 class PhsenAbcdefImodemControlTelemeteredDataParticle(PhsenAbcdefImodemControlDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_CONTROL
 
 
 class PhsenAbcdefImodemControlRecoveredDataParticle(PhsenAbcdefImodemControlDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_CONTROL_RECOVERED
 
 
 class PhsenAbcdefImodemMetadataTelemeteredDataParticle(PhsenAbcdefImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_METADATA
 
 
 class PhsenAbcdefImodemMetadataRecoveredDataParticle(PhsenAbcdefImodemMetadataDataParticle):
 
+    __slots__ = ()
     _data_particle_type = DataParticleType.PHSEN_ABCDEF_IMODEM_METADATA_RECOVERED
@@ -106,6 +106,7 @@ class PhsenAbcdefSioDataParticle(DataParticle):
     """
     Class for parsing data from the mflm_phsen instrument
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.SAMPLE
 
@@ -211,6 +212,7 @@ class PhsenAbcdefSioControlDataParticle(DataParticle):
     """
     Class for parsing data from the mflm_phsen instrument
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.CONTROL
 
@@ -42,6 +42,7 @@ START_TIME_IDX = 2
 
 class PpsdnASubconInstrumentDataParticle(DataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'ppsdn_a_subcon_instrument_recovered'
     instrument_particle_map = PPSDN_DATA_MAP
 
@@ -196,6 +196,7 @@ class PresfAbcDclParserTideDataParticle(DataParticle):
     """
     Class for parsing data from the presf_abc_dcl tide data set
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -232,6 +233,7 @@ class PresfAbcDclParserWaveDataParticle(DataParticle):
     """
     Class for parsing data from the presf_abc_dcl wave data set
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -288,6 +290,7 @@ class PresfAbcDclRecoveredTideDataParticle(PresfAbcDclParserTideDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TIDE_RECOVERED
 
 
@@ -295,6 +298,7 @@ class PresfAbcDclTelemeteredTideDataParticle(PresfAbcDclParserTideDataParticle):
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TIDE_TELEMETERED
 
 
@@ -302,6 +306,7 @@ class PresfAbcDclRecoveredWaveDataParticle(PresfAbcDclParserWaveDataParticle):
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVE_RECOVERED
 
 
@@ -309,6 +314,7 @@ class PresfAbcDclTelemeteredWaveDataParticle(PresfAbcDclParserWaveDataParticle):
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVE_TELEMETERED
 
 
@@ -75,6 +75,7 @@ START_TIME_IDX = 2
 
 class RasflASubconInstrumentDataParticle(DataParticle):
 
+    __slots__ = ()
     _data_particle_type = 'rasfl_a_subcon_instrument_recovered'
     instrument_particle_map = RASFL_DATA_MAP
 
@@ -24,7 +24,7 @@ from mi.core.log import get_logger ; log = get_logger()
 from mi.core.common import BaseEnum
 from mi.core.instrument.data_particle import DataParticle
 from mi.core.exceptions import SampleException, DatasetParserException, UnexpectedDataException
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 from mi.core.instrument.chunker import StringChunker
 
 # This is an example of the input string
@@ -63,6 +63,7 @@ class RteODclParserDataAbstractParticle(DataParticle):
     """
     Abstract Class for parsing data from the rte_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = RteDataParticleType.INSTRUMENT
     
@@ -94,6 +95,7 @@ class RteODclParserDataParticle(RteODclParserDataAbstractParticle):
     """
     Class for parsing data from the rte_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = RteDataParticleType.INSTRUMENT
 
@@ -101,6 +103,7 @@ class RteODclParserRecoveredDataParticle(RteODclParserDataAbstractParticle):
     """
     Class for parsing data from the rte_o_stc data set
     """
+    __slots__ = ()
 
     _data_particle_type = RteDataParticleType.RECOVERED
 
@@ -140,7 +143,7 @@ class RteODclParser(BufferLoadingParser):
         if not ((StateKey.POSITION in state_obj)):
             raise DatasetParserException("Invalid state keys")
         
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
         self._chunker.clean_all_chunks()
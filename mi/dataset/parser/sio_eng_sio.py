@@ -58,6 +58,7 @@ class SioEngSioDataParticle(DataParticle):
     """
     Abstract Class for particles from the sio_eng_sio_mule data set
     """
+    __slots__ = ()
 
     @staticmethod
     def encode_int_16(hex_str):
@@ -89,6 +90,7 @@ class SioEngSioTelemeteredDataParticle(SioEngSioDataParticle):
     """
     Concrete Class for particles from the sio_eng_sio_mule data set
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.TELEMETERED
 
 
@@ -96,6 +98,7 @@ class SioEngSioRecoveredDataParticle(SioEngSioDataParticle):
     """
     Concrete Class for particles from the sio_eng_sio recovered data set
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.RECOVERED
 
 
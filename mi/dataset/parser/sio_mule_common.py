@@ -18,7 +18,7 @@ import ntplib
 
 from mi.core.log import get_logger
 log = get_logger()
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue, map_stream
 
 # SIO Main controller header (ascii) and data (binary):
 #   Start of header
@@ -90,7 +90,7 @@ class SioParser(BufferLoadingParser):
 
         self.all_data = None
         self.input_file = stream_handle
-        self._record_buffer = []  # holds list of records
+        self._record_buffer = RecordQueue()  # holds list of records
 
     @staticmethod
     def calc_checksum(data):
@@ -169,19 +169,9 @@ class SioParser(BufferLoadingParser):
     def read_file(self):
         """
         This function reads the entire input file.
-        @returns: A string containing the contents of the entire file.
+        @returns: A string or read-only buffer containing the contents of the entire file.
         """
-        input_buffer = ''
-
-        while True:
-            # read data in small blocks in order to not block processing
-            next_data = self._stream_handle.read(1024)
-            if next_data != '':
-                input_buffer = input_buffer + next_data
-            else:
-                break
-
-        return input_buffer
+        return map_stream(self._stream_handle)
 
     def sieve_function(self, raw_data):
         """
@@ -253,14 +243,4 @@ class SioParser(BufferLoadingParser):
         cannot be collected (perhaps due to an EOF), the list will have the
         elements it was able to collect.
         """
-        return_list = []
-        if len(self._record_buffer) < num_to_fetch:
-            num_to_fetch = len(self._record_buffer)
-
-        records_to_return = self._record_buffer[:num_to_fetch]
-        self._record_buffer = self._record_buffer[num_to_fetch:]
-        if len(records_to_return) > 0:
-            for item in records_to_return:
-                return_list.append(item)
-
-        return return_list
+        return self._record_buffer.take(num_to_fetch)
@@ -162,6 +162,7 @@ class SpkirAbjCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Base Class for building a spkir_abj_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -198,6 +199,7 @@ class SpkirAbjCsppMetadataRecoveredDataParticle(SpkirAbjCsppMetadataDataParticle
     """
     Class for building a spkir_abj_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -206,6 +208,7 @@ class SpkirAbjCsppMetadataTelemeteredDataParticle(SpkirAbjCsppMetadataDataPartic
     """
     Class for building a spkir_abj_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -214,6 +217,7 @@ class SpkirAbjCsppInstrumentDataParticle(DataParticle):
     """
     Base Class for building a spkir_abj_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -284,6 +288,7 @@ class SpkirAbjCsppInstrumentRecoveredDataParticle(SpkirAbjCsppInstrumentDataPart
     """
     Class for building a spkir_abj_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -292,6 +297,7 @@ class SpkirAbjCsppInstrumentTelemeteredDataParticle(SpkirAbjCsppInstrumentDataPa
     """
     Class for building a spkir_abj_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
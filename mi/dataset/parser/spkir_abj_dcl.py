@@ -42,7 +42,8 @@ from mi.core.instrument.chunker import \
 from mi.core.log import get_logger; log = get_logger()
 
 from mi.dataset.dataset_parser import \
-    BufferLoadingParser
+    BufferLoadingParser, \
+    RecordQueue
 
 from mi.dataset.parser.common_regexes import \
     DATE_YYYY_MM_DD_REGEX, \
@@ -186,6 +187,7 @@ class SpkirAbjDclInstrumentDataParticle(DataParticle):
     """
     Class for generating the Spkir instrument particle.
     """
+    __slots__ = ()
 
     def __init__(self, raw_data,
                  port_timestamp=None,
@@ -225,6 +227,7 @@ class SpkirAbjDclRecoveredInstrumentDataParticle(SpkirAbjDclInstrumentDataPartic
     """
     Class for generating Offset Data Particles from Recovered data.
     """
+    __slots__ = ()
     _data_particle_type = SpkirDataParticleType.REC_INSTRUMENT_PARTICLE
 
 
@@ -232,6 +235,7 @@ class SpkirAbjDclTelemeteredInstrumentDataParticle(SpkirAbjDclInstrumentDataPart
     """
     Class for generating Offset Data Particles from Telemetered data.
     """
+    __slots__ = ()
     _data_particle_type = SpkirDataParticleType.TEL_INSTRUMENT_PARTICLE
 
 
@@ -393,7 +397,7 @@ class SpkirAbjDclParser(BufferLoadingParser):
             raise DatasetParserException('%s missing in state keys' %
                                          SpkirStateKey.POSITION)
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._state = state_obj
         self._read_state = state_obj
 
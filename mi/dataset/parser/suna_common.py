@@ -18,7 +18,7 @@ from mi.core.log import get_logger
 log = get_logger()
 from mi.core.instrument.data_particle import DataParticle, DataParticleKey, DataParticleValue
 from mi.core.exceptions import SampleException, NotImplementedException, RecoverableSampleException
-from mi.dataset.dataset_parser import SimpleParser
+from mi.dataset.dataset_parser import SimpleParser, map_stream
 
 # frame header is always 10 characters
 FRAME_HEADER_SIZE = 10
@@ -60,6 +60,7 @@ def get_year_and_day_of_year(year_and_day_of_year):
 
 class SunaDataParticle(DataParticle):
 
+    __slots__ = ()
     _param_map = None  # must be set in derived class constructor
 
     def __init__(self, raw_data,
@@ -130,8 +131,8 @@ class SunaParser(SimpleParser):
         format is found.
         """
 
-        # read the whole file so start and end of frames can be found
-        data = self._stream_handle.read()
+        # map the whole file so start and end of frames can be found
+        data = map_stream(self._stream_handle)
         end_idx = 0
 
         # loop over all found frame headers
@@ -8,16 +8,20 @@
 """
 
 import os
+import pickle
+from itertools import combinations, islice
 from StringIO import StringIO
 from nose.plugins.attrib import attr
 
-from mi.core.exceptions import ConfigurationException
+from mi.core.exceptions import ConfigurationException, DatasetParserException
+from mi.core.instrument.data_particle import DataParticleKey
 from mi.core.log import get_logger
 log = get_logger()
 
 from mi.dataset.test.test_parser import ParserUnitTestCase, BASE_RESOURCE_PATH
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
-from mi.dataset.parser.glider import GliderParser, GliderEngineeringParser
+from mi.dataset.parser.glider import GliderParser, GliderEngineeringParser, GliderMultiplexParser, GliderParticle
+from mi.dataset.parser.glider import RECOVERED_PARTICLE_CLASSES_DICT
 from mi.dataset.parser.glider import CtdgvRecoveredDataParticle, CtdgvTelemeteredDataParticle, CtdgvParticleKey
 from mi.dataset.parser.glider import DostaTelemeteredDataParticle, DostaTelemeteredParticleKey
 from mi.dataset.parser.glider import DostaRecoveredDataParticle, DostaRecoveredParticleKey
@@ -294,6 +298,35 @@ class CtdgvTelemeteredGliderTest(GliderParserUnitTestCase):
             self.assert_particles(record, 'multiple_ctdgv_record.mrg.result.yml', self.resource_path)
             self.assertEquals(self.exception_callback_value, [])
 
+    def test_short_row(self):
+        """
+        Verify the particles before a row with missing values are returned before the error
+        """
+        short_row = CTDGV_RECORD.strip().splitlines()[-1].rsplit(' ', 1)[0]
+        self.set_data(HEADER, CTDGV_RECORD, '\n', short_row)
+        self.parser = GliderParser(self.config, self.test_data, self.exception_callback)
+
+        self.assertEqual(len(self.parser.get_records(2)), 2)
+        with self.assertRaises(DatasetParserException):
+            self.parser.get_records(1)
+
+    def test_blocks(self):
+        """
+        Verify the particles do not depend on how the rows are split into blocks
+        """
+        def parse(rows_per_block):
+            with open(os.path.join(self.resource_path, 'unit_363_2013_245_6_6.mrg'), 'rU') as file_handle:
+                parser = GliderParser(self.config, file_handle, self.exception_callback)
+                parser.ROWS_PER_BLOCK = rows_per_block
+                return [(particle.get_value(DataParticleKey.INTERNAL_TIMESTAMP),
+                         particle.generate_dict()[DataParticleKey.VALUES])
+                        for particle in parser.get_records(2000)]
+
+        particles = parse(GliderParser.ROWS_PER_BLOCK)
+        self.assertGreater(len(particles), 100)
+        self.assertEqual(parse(7), particles)
+        self.assertEqual(parse(1), particles)
+
     def test_real(self):
         """
         Test with several real files and confirm no exceptions occur
@@ -760,6 +793,60 @@ class ENGGliderTest(GliderParserUnitTestCase):
         with self.assertRaises(ConfigurationException):
             self.parser = GliderEngineeringParser(bad_config, self.test_data, self.exception_callback)
 
+    def test_particle_parameters(self):
+        """
+        Verify the particles only have the configured parameters, and the time of the row
+        """
+        config = dict(self.config)
+        config[DataSetDriverConfigKeys.PARTICLE_PARAMETERS] = [EngineeringTelemeteredParticleKey.M_BATTPOS,
+                                                               EngineeringScienceTelemeteredParticleKey.SCI_M_DISK_FREE]
+        self.set_data(HEADER4, ENGSCI_RECORD)
+        self.parser = GliderEngineeringParser(config, self.test_data, self.exception_callback)
+
+        records = self.parser.get_records(5)
+        self.assert_type(records[:1], EngineeringMetadataDataParticle)
+        self.assert_type(records[1::2], EngineeringTelemeteredDataParticle)
+        self.assert_type(records[2::2], EngineeringScienceTelemeteredDataParticle)
+        self.assertIsInstance(records[1], EngineeringTelemeteredDataParticle)
+
+        values = records[1].generate_dict()[DataParticleKey.VALUES]
+        self.assertEqual([value[DataParticleKey.VALUE_ID] for value in values],
+                         [EngineeringTelemeteredParticleKey.M_BATTPOS,
+                          EngineeringTelemeteredParticleKey.M_PRESENT_SECS_INTO_MISSION,
+                          EngineeringTelemeteredParticleKey.M_PRESENT_TIME])
+        self.assert_particle_values(records[1], {EngineeringTelemeteredParticleKey.M_BATTPOS: 0.703717})
+        self.assert_particle_values(records[2], {EngineeringScienceTelemeteredParticleKey.SCI_M_DISK_FREE: 1000.1})
+        self.assert_no_more_data()
+
+    def test_pickle_projected(self):
+        """
+        Verify particles with projected values pickle as their own particle class
+        """
+        config = dict(self.config)
+        config[DataSetDriverConfigKeys.PARTICLE_PARAMETERS] = [EngineeringTelemeteredParticleKey.M_BATTPOS]
+        config[DataSetDriverConfigKeys.SPARSE_VALUES] = True
+        self.set_data(HEADER4, ENGSCI_RECORD)
+        self.parser = GliderEngineeringParser(config, self.test_data, self.exception_callback)
+
+        for record in self.parser.get_records(3):
+            copy = pickle.loads(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+            self.assertIs(type(copy), type(record))
+            self.assertEqual(copy.generate_dict(), record.generate_dict())
+
+    def test_projected_encoder_cache(self):
+        """
+        Verify the cache of projected value encoders stays bounded
+        """
+        sources = EngineeringTelemeteredDataParticle._value_encoder.sources
+        for names in islice(combinations(sources, 2), GliderParticle._MAX_PROJECTED_ENCODERS * 2):
+            projection = GliderParticle.projection(names)
+            encoder = EngineeringTelemeteredDataParticle.projected_encoder(projection)
+            self.assertTrue(set(names).issubset(encoder.sources))
+            self.assertIs(EngineeringTelemeteredDataParticle.projected_encoder(projection), encoder)
+            self.assertLessEqual(len(GliderParticle._projected_encoders), GliderParticle._MAX_PROJECTED_ENCODERS)
+
+        self.assertIs(EngineeringTelemeteredDataParticle.projected_encoder(GliderParticle.projection()),
+                      EngineeringTelemeteredDataParticle._value_encoder)
 
 
 @attr('UNIT', group='mi')
@@ -828,4 +915,111 @@ class ENGRecoveredGliderTest(GliderParserUnitTestCase):
             parser = GliderEngineeringParser(self.config, file_handle, self.exception_callback)
             records = parser.get_records(240)
             self.assert_(len(records) > 3)
-            self.assertEquals(self.exception_callback_value, [])
\ No newline at end of file
+            self.assertEquals(self.exception_callback_value, [])
+
+    def test_sparse_values(self):
+        """
+        Verify the parameters without a value are left out of the particles, and the rest are unchanged
+        """
+        def parse(config):
+            with open(os.path.join(self.resource_path, 'unit_363_2013_245_6_6.mrg'), 'rU') as file_handle:
+                parser = GliderEngineeringParser(config, file_handle, self.exception_callback)
+                return [record.generate_dict()[DataParticleKey.VALUES] for record in parser.get_records(240)]
+
+        config = dict(self.config)
+        config[DataSetDriverConfigKeys.SPARSE_VALUES] = True
+        dense = parse(self.config)
+        sparse = parse(config)
+
+        self.assertEqual(len(sparse), len(dense))
+        for dense_values, sparse_values in zip(dense, sparse):
+            self.assertEqual([value for value in dense_values if value[DataParticleKey.VALUE] is not None],
+                             sparse_values)
+        self.assertLess(sum(map(len, sparse)), sum(map(len, dense)) / 2)
+
+@attr('UNIT', group='mi')
+class GliderMultiplexTest(GliderParserUnitTestCase):
+    """
+    Test cases for parsing glider data for all instruments at once
+    """
+    config = {
+        DataSetDriverConfigKeys.PARTICLE_MODULE: 'mi.dataset.parser.glider',
+        DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: RECOVERED_PARTICLE_CLASSES_DICT
+    }
+
+    resource_path = os.path.join(BASE_RESOURCE_PATH, 'moas', 'gl', 'flort_m', 'resource')
+
+    def parse(self, parser_class, config):
+        with open(os.path.join(self.resource_path, 'unit_247_2012_051_0_0-sciDataOnly.mrg'), 'rU') as file_handle:
+            parser = parser_class(config, file_handle, self.exception_callback)
+            return [(particle.type(), particle.get_value(DataParticleKey.INTERNAL_TIMESTAMP),
+                     particle.generate_dict()[DataParticleKey.VALUES])
+                    for particle in parser.get_records(5000)]
+
+    def test_per_instrument(self):
+        """
+        Verify the particles of each instrument are the ones its own parser generates
+        """
+        particles = self.parse(GliderMultiplexParser, self.config)
+        self.assertEquals(self.exception_callback_value, [])
+
+        eng_config = {DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: dict(
+            (key, RECOVERED_PARTICLE_CLASSES_DICT[key]) for key in EngineeringClassKey.list())}
+        eng_particles = self.parse(GliderEngineeringParser, eng_config)
+        eng_types = set(particle[0] for particle in eng_particles)
+        self.assertEqual([particle for particle in particles if particle[0] in eng_types], eng_particles)
+
+        instrument_count = 0
+        for name, class_name in RECOVERED_PARTICLE_CLASSES_DICT.iteritems():
+            if name in EngineeringClassKey.list():
+                continue
+            instrument_particles = self.parse(GliderParser, {
+                DataSetDriverConfigKeys.PARTICLE_MODULE: 'mi.dataset.parser.glider',
+                DataSetDriverConfigKeys.PARTICLE_CLASS: class_name})
+            particle_type = globals()[class_name]._data_particle_type
+            self.assertEqual([particle for particle in particles if particle[0] == particle_type],
+                             instrument_particles)
+            instrument_count += len(instrument_particles)
+
+        self.assertGreater(instrument_count, 0)
+        self.assertEqual(len(particles), len(eng_particles) + instrument_count)
+        # the particles of each row follow the order of the instrument names
+        self.assertEqual(particles[0][0], EngineeringMetadataRecoveredDataParticle._data_particle_type)
+        self.assertEqual([particle[1] for particle in particles], sorted(particle[1] for particle in particles))
+
+    def test_blocks(self):
+        """
+        Verify the particles do not depend on how the rows are split into blocks
+        """
+        particles = self.parse(GliderMultiplexParser, self.config)
+        GliderMultiplexParser.ROWS_PER_BLOCK = 3
+        try:
+            self.assertEqual(self.parse(GliderMultiplexParser, self.config), particles)
+        finally:
+            del GliderMultiplexParser.ROWS_PER_BLOCK
+
+    def test_without_metadata(self):
+        """
+        Verify instruments can be parsed together without the engineering metadata
+        """
+        config = {DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: {
+            'ctdgv': 'CtdgvTelemeteredDataParticle',
+            'dosta': 'DostaTelemeteredDataParticle'}}
+        self.set_data(HEADER, CTDGV_RECORD)
+        self.parser = GliderMultiplexParser(config, self.test_data, self.exception_callback)
+        records = self.parser.get_records(10)
+        self.assert_type(records[:1], CtdgvTelemeteredDataParticle)
+        self.assertNotIn(EngineeringMetadataDataParticle._data_particle_type,
+                         [record.type() for record in records])
+
+    def test_bad_config(self):
+        """
+        Test that a bad config causes as exception
+        """
+        self.set_data(HEADER4, ENGSCI_RECORD)
+        for bad_config in [{},
+                           {DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: {'ctdgv': 'CtdgvDataParticle'}},
+                           {DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: {
+                               EngineeringClassKey.METADATA: 'EngineeringMetadataDataParticle'}}]:
+            with self.assertRaises(ConfigurationException):
+                GliderMultiplexParser(bad_config, self.test_data, self.exception_callback)
@@ -17,6 +17,7 @@ from nose.plugins.attrib import attr
 from mi.core.log import get_logger ; log = get_logger()
 
 from mi.core.exceptions import SampleException, ConfigurationException
+from mi.core.instrument.data_particle import DataParticleKey, ParticleBatch
 from mi.dataset.test.test_parser import ParserUnitTestCase
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.dataset.parser.mopak_o_dcl import MopakODclParser, StateKey
@@ -353,6 +354,42 @@ class MopakODclParserUnitTestCase(ParserUnitTestCase):
         self.assertEqual(self.publish_callback_value[-1], self.particle_last_rate)
         self.assertEqual(self.exception_callback_value, None)
 
+    def parse_all(self, file_name, config):
+        """
+        Parse a whole file, returning the records and the final parser state
+        """
+        with open(os.path.join(RESOURCE_PATH, file_name), 'rb') as stream_handle:
+            parser = MopakODclParser(config, dict(self.start_state), stream_handle, file_name,
+                                     self.state_callback, self.pub_callback, self.except_callback)
+            records = []
+            result = parser.get_records(100)
+            while result:
+                records.extend(result)
+                result = parser.get_records(100)
+        return records, parser._state
+
+    def test_particle_batches(self):
+        """
+        Particle batches expand to the same particles and leave the same state as building each particle
+        """
+        batch_config = dict(self.config)
+        batch_config[DataSetDriverConfigKeys.PARTICLE_BATCHES] = True
+
+        for file_name in ['20140120_140004_extradata.mopak.log', '20140313_191853.3dmgx3.log']:
+            particles, state = self.parse_all(file_name, self.config)
+            batches, batch_state = self.parse_all(file_name, batch_config)
+
+            self.assertTrue(all(isinstance(batch, ParticleBatch) for batch in batches))
+            self.assertLess(len(batches), len(particles))
+            self.assertEqual(batch_state, state)
+
+            batch_dicts = [particle_dict for batch in batches for particle_dict in batch.generate_dicts()]
+            self.assertEqual(len(batch_dicts), len(particles))
+            for particle, batch_dict in zip(particles, batch_dicts):
+                particle_dict = particle.generate_dict()
+                batch_dict[DataParticleKey.DRIVER_TIMESTAMP] = particle_dict[DataParticleKey.DRIVER_TIMESTAMP]
+                self.assertEqual(batch_dict, particle_dict)
+
     def test_mid_state_start(self):
         """
         Test starting the parser in a state in the middle of processing
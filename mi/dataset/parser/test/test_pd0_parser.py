@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.parser.test
+@file mi/dataset/parser/test/test_pd0_parser.py
+@brief Test code for the PD0 ensemble record decoder
+"""
+import os
+import shutil
+import struct
+import tempfile
+from multiprocessing.pool import Pool
+from StringIO import StringIO
+
+import numpy as np
+from mock import patch
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.parser.adcp_pd0 import AdcpPd0Parser, AdcpPd0ConfigKey
+from mi.dataset.parser.pd0_parser import AdcpPd0Record, CellData, beam_lists, EnsembleIndex, EnsembleStatus
+from mi.dataset.test.test_parser import BASE_RESOURCE_PATH
+
+RESOURCE_PATH = os.path.join(BASE_RESOURCE_PATH, 'adcps_jln', 'stc', 'resource')
+
+CELL_BLOCKS = ['velocities', 'correlation_magnitudes', 'echo_intensity', 'percent_good']
+
+PARTICLE_CLASSES = {
+    'velocity': 'VelocityEarth',
+    'engineering': 'AdcpsEngineering',
+    'config': 'AdcpsConfig',
+    'bottom_track': 'EarthBottom',
+    'bottom_track_config': 'BottomConfig',
+}
+
+
+@attr('UNIT', group='mi')
+class AdcpPd0RecordUnitTest(MiUnitTest):
+
+    def setUp(self):
+        with open(os.path.join(RESOURCE_PATH, 'ADCP_CCE1T_20.PD0'), 'rb') as stream_handle:
+            data = stream_handle.read()
+        num_bytes = struct.unpack_from('<H', data, 2)[0]
+        self.ensemble = data[:num_bytes + 2]
+
+    def test_cell_arrays(self):
+        """
+        The cell arrays hold the same values as the beam lists
+        """
+        record = AdcpPd0Record(self.ensemble)
+        array_record = AdcpPd0Record(self.ensemble, cell_arrays=True)
+        number_of_cells = record.fixed_data.number_of_cells
+
+        for name in CELL_BLOCKS:
+            cell_data = getattr(record, name)
+            cell_array = getattr(array_record, name)
+            self.assertIsInstance(cell_array, CellData)
+            self.assertEqual(cell_array.id, cell_data.id)
+            self.assertEqual(cell_array.cells.shape, (number_of_cells, 4))
+            self.assertEqual(cell_array.beam2.tolist(), cell_data.beam2)
+            self.assertEqual(beam_lists(cell_array), beam_lists(cell_data))
+            self.assertEqual(len(beam_lists(cell_data)[3]), number_of_cells)
+
+        self.assertEqual(array_record.velocities.cells.dtype, np.dtype('<i2'))
+        self.assertEqual(array_record.percent_good.cells.dtype, np.dtype('u1'))
+
+    def test_views(self):
+        """
+        The cell arrays view the ensemble data rather than copying it
+        """
+        record = AdcpPd0Record(self.ensemble, cell_arrays=True)
+        self.assertFalse(record.velocities.cells.flags.owndata)
+        self.assertTrue(np.may_share_memory(record.velocities.cells, np.frombuffer(record.data, np.uint8)))
+
+
+@attr('UNIT', group='mi')
+class EnsembleIndexUnitTest(MiUnitTest):
+
+    def setUp(self):
+        with open(os.path.join(RESOURCE_PATH, 'ADCP_CCE1T_20.PD0'), 'rb') as stream_handle:
+            self.data = stream_handle.read()
+        num_bytes = struct.unpack_from('<H', self.data, 2)[0]
+        self.ensemble = self.data[:num_bytes + 2]
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_build(self):
+        """
+        The index finds the ensembles, the bytes between them and their checksum status
+        """
+        bad_checksum = self.ensemble[:-1] + chr((ord(self.ensemble[-1]) + 1) % 256)
+        data = self.ensemble + 'junk' + bad_checksum + self.ensemble + self.ensemble[:20]
+        length = len(self.ensemble)
+
+        index = EnsembleIndex.build(data)
+        entries = [entry[:3] for entry in index]
+        self.assertEqual(entries, [(0, length, EnsembleStatus.OK),
+                                   (length, 4, EnsembleStatus.NO_HEADER),
+                                   (length + 4, length, EnsembleStatus.BAD_CHECKSUM),
+                                   (2 * length + 4, length, EnsembleStatus.OK),
+                                   (3 * length + 4, 20, EnsembleStatus.INCOMPLETE)])
+        self.assertGreater(index.entries['time'][0], 3e9)
+        self.assertEqual(len(EnsembleIndex.build('')), 0)
+
+    def test_select(self):
+        """
+        Only the valid ensembles in the time range are selected
+        """
+        index = EnsembleIndex.build(self.data)
+        times = index.entries['time']
+        self.assertEqual(len(index.select()), len(index))
+        self.assertEqual(index.select(times[1], times[3])['offset'].tolist(), index.entries['offset'][1:3].tolist())
+        self.assertEqual(len(index.select(start_time=times[-1] + 1)), 0)
+
+    def test_sidecar(self):
+        """
+        The index is saved next to the file and is only loaded while the file is unchanged
+        """
+        source_path = os.path.join(self.temp_dir, 'ADCP_CCE1T_20.PD0')
+        with open(source_path, 'wb') as stream_handle:
+            stream_handle.write(self.data)
+
+        self.assertIsNone(EnsembleIndex.load(source_path))
+        index = EnsembleIndex.build(self.data)
+        index.save(source_path)
+        self.assertTrue(os.path.exists(EnsembleIndex.sidecar_path(source_path)))
+        self.assertEqual(EnsembleIndex.load(source_path).entries.tolist(), index.entries.tolist())
+
+        with open(source_path, 'ab') as stream_handle:
+            stream_handle.write(self.ensemble)
+        self.assertIsNone(EnsembleIndex.load(source_path))
+
+    def parse(self, stream_handle, **config):
+        config[DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT] = PARTICLE_CLASSES
+        exceptions = []
+        parser = AdcpPd0Parser(config, stream_handle, exceptions.append)
+        particles = parser.get_records(1000)
+        return [particle.generate_dict() for particle in particles], [str(e) for e in exceptions]
+
+    def assert_particles_equal(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for expected_dict, actual_dict in zip(expected, actual):
+            self.assertEqual(dict(expected_dict, driver_timestamp=None), dict(actual_dict, driver_timestamp=None))
+
+    def test_parse_workers(self):
+        """
+        Decoding in worker processes returns the same particles and exceptions in the same order
+        """
+        data = self.data + 'junk' + self.data[:20]
+        particles, exceptions = self.parse(StringIO(data))
+        self.assertEqual(len(exceptions), 3)
+
+        worker_particles, worker_exceptions = self.parse(StringIO(data), **{AdcpPd0ConfigKey.WORKERS: 2})
+        self.assert_particles_equal(particles, worker_particles)
+        self.assertEqual(worker_exceptions, exceptions)
+
+    @patch.object(AdcpPd0Parser, 'ENSEMBLES_PER_TASK', 2)
+    def test_parse_workers_window(self):
+        """
+        Only a few tasks per worker are sent ahead of the particles being returned
+        """
+        with open(os.path.join(RESOURCE_PATH, 'ADCP_CCE1T_20.PD0'), 'rb') as stream_handle:
+            particles, _ = self.parse(stream_handle)
+        config = {AdcpPd0ConfigKey.WORKERS: 2, DataSetDriverConfigKeys.PARTICLE_CLASSES_DICT: PARTICLE_CLASSES}
+        with open(os.path.join(RESOURCE_PATH, 'ADCP_CCE1T_20.PD0'), 'rb') as stream_handle:
+            worker_particles, _ = self.parse(stream_handle, **config)
+        self.assert_particles_equal(particles, worker_particles)
+
+        with patch.object(Pool, 'apply_async', autospec=True, side_effect=Pool.apply_async) as apply_async:
+            parser = AdcpPd0Parser(config, StringIO(self.data), None)
+            ensembles = parser._decoded_ensembles(self.data, EnsembleIndex.build(self.data))
+            next(ensembles)
+            self.assertEqual(apply_async.call_count, 2 * AdcpPd0Parser.TASKS_PER_WORKER)
+            ensembles.close()
+
+    def test_parse_sidecar(self):
+        """
+        Parsing with the sidecar saves the index, and parses the same from it
+        """
+        source_path = os.path.join(self.temp_dir, 'ADCP_CCE1T_20.PD0')
+        shutil.copy(os.path.join(RESOURCE_PATH, 'ADCP_CCE1T_20.PD0'), source_path)
+
+        with open(source_path, 'rb') as stream_handle:
+            particles, _ = self.parse(stream_handle)
+        for _ in xrange(2):
+            with open(source_path, 'rb') as stream_handle:
+                sidecar_particles, _ = self.parse(stream_handle, **{AdcpPd0ConfigKey.ENSEMBLE_INDEX_SIDECAR: True})
+            self.assertTrue(os.path.exists(EnsembleIndex.sidecar_path(source_path)))
+            self.assert_particles_equal(particles, sidecar_particles)
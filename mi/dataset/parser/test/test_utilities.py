@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.parser.test
+@file mi/dataset/parser/test/test_utilities.py
+@brief Test code for the parser timestamp utilities
+"""
+
+import calendar
+import random
+from datetime import datetime, timedelta
+
+import ntplib
+import numpy as np
+from nose.plugins.attrib import attr
+
+from mi.core.time import FixedTimestampParser, string_to_ntp_date_time, unix_times_to_ntp_times, \
+    times_2000_to_ntp_times, mac_times_to_ntp_times, filetimes_to_ntp_times
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.parser import utilities
+from mi.dataset.parser.utilities import \
+    DCL_CONTROLLER_TIMESTAMP_FORMAT, \
+    ZULU_TIMESTAMP_FORMAT, \
+    formatted_timestamp_utc_time, \
+    zulu_timestamp_to_utc_time, \
+    zulu_timestamp_to_ntp_time, \
+    dcl_controller_timestamp_to_utc_time, \
+    dcl_controller_timestamp_to_ntp_time, \
+    DCL_CONTROLLER_TIMESTAMP_PARSER, \
+    time_2000_to_ntp_time, \
+    mac_timestamp_to_utc_timestamp
+
+
+def strptime_utc_time(timestamp_str, format_str):
+    """
+    The conversion the timestamp parsers replace
+    """
+    dt = datetime.strptime(timestamp_str, format_str)
+    return calendar.timegm(dt.timetuple()) + (dt.microsecond / 1000000.0)
+
+
+@attr('UNIT', group='mi')
+class TimestampUtilitiesUnitTest(MiUnitTest):
+
+    ZULU_TIMESTAMPS = ['2014-08-17T00:57:10.648Z',
+                       '2000-01-01T00:00:00.00Z',
+                       '2016-02-29T23:59:59.999999Z',
+                       '1969-12-31T23:59:59.5Z',
+                       '1899-12-31T23:59:59.5Z']
+
+    DCL_TIMESTAMPS = ['2014/08/17 00:57:10.648',
+                      '2014/12/31 23:59:59.001',
+                      '2012/02/29 12:00:00.0']
+
+    def test_zulu(self):
+        """
+        Zulu timestamps convert to the same times as with strptime
+        """
+        for timestamp in self.ZULU_TIMESTAMPS:
+            expected = strptime_utc_time(timestamp, ZULU_TIMESTAMP_FORMAT)
+            self.assertEqual(zulu_timestamp_to_utc_time(timestamp), expected)
+            self.assertEqual(formatted_timestamp_utc_time(timestamp, ZULU_TIMESTAMP_FORMAT), expected)
+            self.assertEqual(zulu_timestamp_to_ntp_time(timestamp), float(ntplib.system_to_ntp_time(expected)))
+
+    def test_dcl_controller(self):
+        """
+        DCL controller timestamps convert to the same times as with strptime
+        """
+        for timestamp in self.DCL_TIMESTAMPS:
+            expected = strptime_utc_time(timestamp, DCL_CONTROLLER_TIMESTAMP_FORMAT)
+            self.assertEqual(dcl_controller_timestamp_to_utc_time(timestamp), expected)
+            self.assertEqual(dcl_controller_timestamp_to_ntp_time(timestamp),
+                             float(ntplib.system_to_ntp_time(expected)))
+
+    def test_fallback(self):
+        """
+        Timestamps without fixed width fields and other formats still convert with strptime
+        """
+        for timestamp in ['2014/8/17 0:57:10.648', '2014/08/17 00:57:1.6']:
+            self.assertEqual(dcl_controller_timestamp_to_utc_time(timestamp),
+                             strptime_utc_time(timestamp, DCL_CONTROLLER_TIMESTAMP_FORMAT))
+
+        self.assertEqual(formatted_timestamp_utc_time('17.08.2014 00:57', '%d.%m.%Y %H:%M'),
+                         strptime_utc_time('17.08.2014 00:57', '%d.%m.%Y %H:%M'))
+
+    def test_invalid(self):
+        """
+        Invalid timestamps raise the same errors as strptime
+        """
+        for timestamp in ['2014/02/30 00:00:00.0', '2014/08/17 24:00:00.0', '2014/08/17 00:60:00.0',
+                          '2014/08/17 00:00:60.0',
+                          '2014/08/17 00:00:00', '2014/08/17 00:00:00.', '2014/08/17 00:00:00.1234567',
+                          '2014/08/17 00:00:00.1e3', '2014/08/17 00:00:00.1\n', '2014-08-17T00:00:00.0Z',
+                          '2014/08/17 00:', 'garbage']:
+            with self.assertRaises(ValueError) as strptime_error:
+                strptime_utc_time(timestamp, DCL_CONTROLLER_TIMESTAMP_FORMAT)
+            with self.assertRaises(ValueError) as error:
+                dcl_controller_timestamp_to_utc_time(timestamp)
+            self.assertEqual(str(error.exception), str(strptime_error.exception))
+
+    def test_minute_memo(self):
+        """
+        The memo of minute start times is bounded
+        """
+        parser = FixedTimestampParser(ZULU_TIMESTAMP_FORMAT)
+        for minute in xrange(parser.MINUTE_MEMO_SIZE + 10):
+            timestamp = datetime.utcfromtimestamp(minute * 60 + 1).strftime(ZULU_TIMESTAMP_FORMAT)
+            self.assertEqual(parser.to_unix_time(timestamp), minute * 60 + 1.0)
+        self.assertLessEqual(len(parser._minute_memo), parser.MINUTE_MEMO_SIZE)
+
+    def test_fraction_memo(self):
+        """
+        Only valid fractions of up to three digits are memoized
+        """
+        parser = FixedTimestampParser(ZULU_TIMESTAMP_FORMAT)
+        for timestamp in ['2014-08-17T00:00:00.6Z', '2014-08-17T00:00:00.648Z', '2014-08-17T00:00:00.648123Z']:
+            self.assertEqual(parser.to_unix_time(timestamp), strptime_utc_time(timestamp, ZULU_TIMESTAMP_FORMAT))
+        self.assertEqual(sorted(parser._fraction_memo), ['.648Z', '.6Z'])
+
+        self.assertRaises(ValueError, parser.to_unix_time, '2014-08-17T00:00:00.1')
+        self.assertEqual(len(parser._fraction_memo), 2)
+
+    def test_format(self):
+        """
+        Formats must end with the seconds and their fraction
+        """
+        self.assertRaises(ValueError, FixedTimestampParser, '%Y-%m-%d %H:%M:%S')
+        self.assertRaises(ValueError, FixedTimestampParser, '%H:%M:%S.%f %Y-%m-%d')
+        self.assertRaises(ValueError, FixedTimestampParser, '%Y-%j %H:%M:%S.%f')
+        self.assertRaises(ValueError, FixedTimestampParser, '%m-%d %H:%M:%S.%f')
+        self.assertRaises(ValueError, FixedTimestampParser, '%Y-%m-%d %H:%M %M:%S.%f')
+
+    def test_constants(self):
+        """
+        The precomputed epoch offsets match the conversions they replace
+        """
+        self.assertEqual(time_2000_to_ntp_time(0), float(ntplib.system_to_ntp_time(
+            calendar.timegm(datetime(2000, 1, 1).timetuple()))))
+        self.assertEqual(mac_timestamp_to_utc_timestamp(utilities.UNIX_MINUS_MAC_SECONDS), 0.0)
+        self.assertEqual(utilities.UNIX_MINUS_MAC_SECONDS, 2082844800.0)
+
+    def test_string_to_ntp_date_time(self):
+        """
+        ISO8601 strings convert to the same NTP times as with strptime
+        """
+        for timestamp, normalized in [('2014-08-17T00:57:10.648Z', '2014-08-17T00:57:10.648Z'),
+                                      ('2014-08-17T00:57:10Z', '2014-08-17T00:57:10.0Z'),
+                                      ('2014-08-17T00:57:10', '2014-08-17T00:57:10.0Z')]:
+            self.assertEqual(string_to_ntp_date_time(timestamp), ntplib.system_to_ntp_time(
+                strptime_utc_time(normalized, ZULU_TIMESTAMP_FORMAT)))
+
+
+def filetime_to_ntp_time(filetime):
+    """
+    The Windows FILETIME conversion of the zplsc_b parser
+    """
+    dt = datetime(1601, 1, 1) + timedelta(microseconds=filetime / 10.0)
+    year, month, day, hour, minute, second = dt.utctimetuple()[:6]
+    unix_time = calendar.timegm((year, month, day, hour, minute, second + (dt.microsecond / 1e6)))
+    return ntplib.system_to_ntp_time(unix_time)
+
+
+@attr('UNIT', group='mi')
+class TimeArrayUnitTest(MiUnitTest):
+    """
+    The array time conversions give bit identical results to the scalar ones
+    """
+
+    def setUp(self):
+        self.random = random.Random(2016)
+
+    def assert_identical(self, scalar_times, array_times):
+        self.assertIsInstance(array_times, np.ndarray)
+        self.assertEqual(array_times.dtype, np.float64)
+        self.assertEqual(array_times.tolist(), [float(time) for time in scalar_times])
+
+    def test_unix(self):
+        unix_times = [self.random.uniform(-2e9, 4e9) for _ in xrange(1000)] + [0, 1408237030]
+        self.assert_identical([ntplib.system_to_ntp_time(time) for time in unix_times],
+                              unix_times_to_ntp_times(unix_times))
+
+    def test_time_2000(self):
+        times_2000 = [self.random.uniform(0, 1e9) for _ in xrange(1000)] + [0, 461543430]
+        self.assert_identical([time_2000_to_ntp_time(time) for time in times_2000],
+                              times_2000_to_ntp_times(times_2000))
+
+    def test_mac(self):
+        mac_times = [self.random.uniform(0, 4e9) for _ in xrange(1000)] + [0, 3491081830]
+        self.assert_identical([ntplib.system_to_ntp_time(mac_timestamp_to_utc_timestamp(time))
+                               for time in mac_times],
+                              mac_times_to_ntp_times(mac_times))
+
+    def test_filetime(self):
+        # ping times, times with half microseconds which round away from zero, and times before 1900
+        filetimes = [self.random.randint(130000000000000000, 140000000000000000) for _ in xrange(1000)] + \
+                    [self.random.randint(0, 10 ** 16) * 10 + 5 for _ in xrange(1000)] + \
+                    [self.random.randint(0, 2 ** 58) for _ in xrange(1000)] + \
+                    [0, 5, 15, 116444736000000000, 116444736000000005, 116444735999999995]
+        self.assert_identical([filetime_to_ntp_time(filetime) for filetime in filetimes],
+                              filetimes_to_ntp_times(np.array(filetimes, dtype=np.uint64)))
+
+    def test_timestamp_strings(self):
+        timestamps = ['2014/08/17 00:57:10.648', '2014/08/17 00:57:11.649', '2014/8/17 0:57:12.65']
+        self.assert_identical([dcl_controller_timestamp_to_ntp_time(timestamp) for timestamp in timestamps],
+                              DCL_CONTROLLER_TIMESTAMP_PARSER.to_ntp_times(timestamps))
+        self.assertRaises(ValueError, DCL_CONTROLLER_TIMESTAMP_PARSER.to_ntp_times, ['2014/08/17'])
+        self.assertEqual(DCL_CONTROLLER_TIMESTAMP_PARSER.to_ntp_times([]).shape, (0,))
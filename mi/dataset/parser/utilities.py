@@ -12,11 +12,11 @@ __author__ = 'Joe Padula'
 __license__ = 'Apache 2.0'
 
 from datetime import datetime
-import ntplib
 import calendar
 
 from mi.core.log import get_logger
 log = get_logger()
+from mi.core.time import FixedTimestampParser, TIME_2000_NTP_OFFSET, UNIX_MINUS_MAC_SECONDS
 
 # Format of DCL Controller Timestamp in records
 # Example: 2014/08/17 00:57:10.648
@@ -26,8 +26,23 @@ ZULU_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 # Example: 2014/08/17 00:57:10.648
 DCL_CONTROLLER_TIMESTAMP_FORMAT = "%Y/%m/%d %H:%M:%S.%f"
 
+ZULU_TIMESTAMP_PARSER = FixedTimestampParser(ZULU_TIMESTAMP_FORMAT)
+
+DCL_CONTROLLER_TIMESTAMP_PARSER = FixedTimestampParser(DCL_CONTROLLER_TIMESTAMP_FORMAT)
+
+# formats converted without strptime when their fields are fixed width
+_TIMESTAMP_PARSERS = {
+    ZULU_TIMESTAMP_FORMAT: ZULU_TIMESTAMP_PARSER,
+    DCL_CONTROLLER_TIMESTAMP_FORMAT: DCL_CONTROLLER_TIMESTAMP_PARSER
+}
+
+
 def formatted_timestamp_utc_time(timestamp_str, format_str):
 
+    parser = _TIMESTAMP_PARSERS.get(format_str)
+    if parser is not None:
+        return parser.to_unix_time(timestamp_str)
+
     dt = datetime.strptime(timestamp_str, format_str)
 
     return calendar.timegm(dt.timetuple()) + (dt.microsecond / 1000000.0)
@@ -39,8 +54,7 @@ def zulu_timestamp_to_utc_time(zulu_timestamp_str):
     :return: UTC time in seconds and microseconds precision
     """
 
-    return formatted_timestamp_utc_time(zulu_timestamp_str,
-                                        ZULU_TIMESTAMP_FORMAT)
+    return ZULU_TIMESTAMP_PARSER.to_unix_time(zulu_timestamp_str)
 
 
 def zulu_timestamp_to_ntp_time(zulu_timestamp_str):
@@ -50,9 +64,7 @@ def zulu_timestamp_to_ntp_time(zulu_timestamp_str):
     :return: NTP time in seconds and microseconds precision
     """
 
-    utc_time = zulu_timestamp_to_utc_time(zulu_timestamp_str)
-
-    return float(ntplib.system_to_ntp_time(utc_time))
+    return ZULU_TIMESTAMP_PARSER.to_ntp_time(zulu_timestamp_str)
 
 
 def time_2000_to_ntp_time(time_2000):
@@ -64,7 +76,7 @@ def time_2000_to_ntp_time(time_2000):
     Returns:
       timestamp in number of seconds since Jan 1, 1900
     """
-    return time_2000 + zulu_timestamp_to_ntp_time("2000-01-01T00:00:00.00Z")
+    return time_2000 + TIME_2000_NTP_OFFSET
 
 
 def dcl_controller_timestamp_to_utc_time(dcl_controller_timestamp_str):
@@ -75,8 +87,7 @@ def dcl_controller_timestamp_to_utc_time(dcl_controller_timestamp_str):
     """
 
 
-    return formatted_timestamp_utc_time(dcl_controller_timestamp_str,
-                                        DCL_CONTROLLER_TIMESTAMP_FORMAT)
+    return DCL_CONTROLLER_TIMESTAMP_PARSER.to_unix_time(dcl_controller_timestamp_str)
 
 
 def dcl_controller_timestamp_to_ntp_time(dcl_controller_timestamp_str):
@@ -86,9 +97,7 @@ def dcl_controller_timestamp_to_ntp_time(dcl_controller_timestamp_str):
     :return: NTP time (float64) in seconds and microseconds precision
     """
 
-    utc_time = dcl_controller_timestamp_to_utc_time(dcl_controller_timestamp_str)
-
-    return float(ntplib.system_to_ntp_time(utc_time))
+    return DCL_CONTROLLER_TIMESTAMP_PARSER.to_ntp_time(dcl_controller_timestamp_str)
 
 
 def mac_timestamp_to_utc_timestamp(mac_timestamp):
@@ -97,9 +106,7 @@ def mac_timestamp_to_utc_timestamp(mac_timestamp):
     :return: The mac timestamp converted to unix time
     """
 
-    unix_minus_mac_secs = (datetime(1970, 1, 1) - datetime(1904, 1, 1)).total_seconds()
-
-    secs_since_1970 = mac_timestamp - unix_minus_mac_secs
+    secs_since_1970 = mac_timestamp - UNIX_MINUS_MAC_SECONDS
 
     return secs_since_1970
 
@@ -44,6 +44,7 @@ class Vel3dAMmpCdsParserDataParticle(MmpCdsParserDataParticle):
     """
     Class for parsing data from the Vel3dAMmpCds data set
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT
 
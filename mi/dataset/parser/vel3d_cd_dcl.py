@@ -68,6 +68,7 @@ class Vel3dCdDclDataParticleType(BaseEnum):
 
 class Vel3dCdDclUserConfigCommonParticle(DataParticle):
 
+    __slots__ = ()
     # dictionary for unpacking ints that directly map to a parameter
     UNPACK_DICT = {
         'transmit_pulse_length': 0,
@@ -160,15 +161,18 @@ class Vel3dCdDclUserConfigCommonParticle(DataParticle):
 
 
 class Vel3dCdDclUserConfigTelemeteredParticle(Vel3dCdDclUserConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.USER_CONFIG
 
 
 class Vel3dCdDclUserConfigRecoveredParticle(Vel3dCdDclUserConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.USER_CONFIG_RECOV
 
 
 class Vel3dCdDclHardwareConfigCommonParticle(DataParticle):
 
+    __slots__ = ()
     # map for unpacking ints and strings that directly map to a parameter
     UNPACK_MAP = [
         ('board_frequency', 2, int),
@@ -209,15 +213,18 @@ class Vel3dCdDclHardwareConfigCommonParticle(DataParticle):
 
 
 class Vel3dCdDclHardwareConfigTelemeteredParticle(Vel3dCdDclHardwareConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.HARDWARE_CONFIG
 
 
 class Vel3dCdDclHardwareConfigRecoveredParticle(Vel3dCdDclHardwareConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.HARDWARE_CONFIG_RECOV
 
 
 class Vel3dCdDclHeadConfigCommonParticle(DataParticle):
 
+    __slots__ = ()
     # dictionary for unpacking ints that directly map to a parameter
     UNPACK_DICT = {
         'head_frequency': 1,
@@ -261,15 +268,18 @@ class Vel3dCdDclHeadConfigCommonParticle(DataParticle):
 
 
 class Vel3dCdDclHeadConfigTelemeteredParticle(Vel3dCdDclHeadConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.HEAD_CONFIG
 
 
 class Vel3dCdDclHeadConfigRecoveredParticle(Vel3dCdDclHeadConfigCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.HEAD_CONFIG_RECOV
 
 
 class Vel3dCdDclDataHeaderCommonParticle(DataParticle):
 
+    __slots__ = ()
     # store index into unpacked raw data by parameter name, starting from byte 9, all are ints
     UNPACK_DICT = {
         'number_velocity_records': 0,
@@ -301,15 +311,18 @@ class Vel3dCdDclDataHeaderCommonParticle(DataParticle):
 
 
 class Vel3dCdDclDataHeaderTelemeteredParticle(Vel3dCdDclDataHeaderCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.DATA_HEADER
 
 
 class Vel3dCdDclDataHeaderRecoveredParticle(Vel3dCdDclDataHeaderCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.DATA_HEADER_RECOV
 
 
 class Vel3dCdDclVelocityCommonParticle(DataParticle):
 
+    __slots__ = ()
     # store index into unpacked raw data by parameter name, all are ints
     UNPACK_DICT = {
         'ensemble_counter': 3,
@@ -356,15 +369,18 @@ class Vel3dCdDclVelocityCommonParticle(DataParticle):
 
 
 class Vel3dCdDclVelocityTelemeteredParticle(Vel3dCdDclVelocityCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.VELOCITY
 
 
 class Vel3dCdDclVelocityRecoveredParticle(Vel3dCdDclVelocityCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.VELOCITY_RECOV
 
 
 class Vel3dCdDclSystemCommonParticle(DataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Return an array of dictionaries containing parameters for the system particle
@@ -390,10 +406,12 @@ class Vel3dCdDclSystemCommonParticle(DataParticle):
 
 
 class Vel3dCdDclSystemTelemeteredParticle(Vel3dCdDclSystemCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.SYSTEM
 
 
 class Vel3dCdDclSystemRecoveredParticle(Vel3dCdDclSystemCommonParticle):
+    __slots__ = ()
     _data_particle_type = Vel3dCdDclDataParticleType.SYSTEM_RECOV
 
 
@@ -156,6 +156,7 @@ class Vel3dKWfpInstrumentParticle(DataParticle):
     """
     Class for generating vel3d_k_wfp instrument particles.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dKWfpDataParticleType.INSTRUMENT_PARTICLE
 
@@ -212,6 +213,7 @@ class Vel3dKWfpMetadataParticle(DataParticle):
     """
     Class for generating vel3d_k_wfp metadata particles.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dKWfpDataParticleType.METADATA_PARTICLE
 
@@ -240,6 +242,7 @@ class Vel3dKWfpStringParticle(DataParticle):
     """
     Class for generating vel3d_k_wfp string particles.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dKWfpDataParticleType.STRING_PARTICLE
 
@@ -151,6 +151,7 @@ class Vel3dKWfpStcMetadataParticle(DataParticle):
     """
     Class for parsing TIME data from the VEL3D_K__stc_imodem data set
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dKWfpStcDataParticleType.METADATA_PARTICLE
 
@@ -190,6 +191,7 @@ class Vel3dKWfpStcInstrumentParticle(DataParticle):
     """
     Class for parsing VELOCITY data from the VEL3D_K__stc_imodem data set
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dKWfpStcDataParticleType.INSTRUMENT_PARTICLE
 
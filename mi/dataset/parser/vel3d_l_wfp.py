@@ -158,6 +158,7 @@ class Vel3dLWfpInstrumentDataParticle(DataParticle):
     The output particle streams for vel3d_l instrument data have different
     names, but the contents of the 2 streams are identical.
     """
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Take something in the data format and turn it into an array of
@@ -228,6 +229,7 @@ class Vel3dLWfpInstrumentParticle(Vel3dLWfpInstrumentDataParticle):
     All processing is handled by the parent class as long as the
     data particle type is set correctly.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dLWfpDataParticleType.SIO_INSTRUMENT_PARTICLE
 
@@ -238,6 +240,7 @@ class Vel3dLWfpInstrumentRecoveredParticle(Vel3dLWfpInstrumentDataParticle):
     All processing is handled by the parent class as long as the
     data particle type is set correctly.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dLWfpDataParticleType.WFP_INSTRUMENT_PARTICLE
 
@@ -247,6 +250,7 @@ class Vel3dLMetadataParticle(DataParticle):
     Generic class for generating vel3d_l metadata particles,
     both recovered and telemetered.
     """
+    __slots__ = ()
 
     def generate_metadata_particle(self, particle_key_table):
         """
@@ -303,6 +307,7 @@ class Vel3dLWfpMetadataRecoveredParticle(Vel3dLMetadataParticle):
     """
     Class for generating vel3d_l_wfp metadata recovered particles.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dLWfpDataParticleType.WFP_METADATA_PARTICLE
 
@@ -318,6 +323,7 @@ class Vel3dLWfpSioMuleMetadataParticle(Vel3dLMetadataParticle):
     """
     Class for generating vel3d_l_wfp_sio_mule metadata particles.
     """
+    __slots__ = ()
 
     _data_particle_type = Vel3dLWfpDataParticleType.SIO_METADATA_PARTICLE
 
@@ -18,7 +18,7 @@ from mi.core.exceptions import RecoverableSampleException
 from mi.core.log import get_logger
 log = get_logger()
 from mi.dataset.parser.velpt_ab_particles import VelptAbDataParticle
-from mi.dataset.dataset_parser import SimpleParser
+from mi.dataset.dataset_parser import SimpleParser, RecordQueue
 from mi.dataset.dataset_parser import DataSetDriverConfigKeys
 from mi.core.common import BaseEnum
 from mi.core.exceptions import ConfigurationException
@@ -161,7 +161,7 @@ class VelptAbParser(SimpleParser):
                  file_handle,
                  exception_callback):
 
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._calculated_checksum = 0
         self._current_record = ''
         self._velocity_data = False
@@ -68,6 +68,7 @@ class VelptAbDclDataParticle(DataParticle):
     """
     Class for creating the metadata & data particles for velpt_ab_dcl
     """
+    __slots__ = ()
     # Offsets for date-time group in velocity and diagnostics data records
     minute_offset = 4
     second_offset = 5
@@ -280,6 +281,7 @@ class VelptAbDclInstrumentDataParticle(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_INSTRUMENT
 
     def _build_parsed_values(self):
@@ -329,6 +331,7 @@ class VelptAbDclDiagnosticsHeaderParticle(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_DIAGNOSTICS_METADATA
 
     def _build_parsed_values(self):
@@ -386,6 +389,7 @@ class VelptAbDclDiagnosticsDataParticle(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_DIAGNOSTICS
 
     def _build_parsed_values(self):
@@ -435,6 +439,7 @@ class VelptAbDclInstrumentDataParticleRecovered(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_INSTRUMENT_RECOVERED
 
     def _build_parsed_values(self):
@@ -484,6 +489,7 @@ class VelptAbDclDiagnosticsHeaderParticleRecovered(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_DIAGNOSTICS_METADATA_RECOVERED
 
     def _build_parsed_values(self):
@@ -541,6 +547,7 @@ class VelptAbDclDiagnosticsDataParticleRecovered(VelptAbDclDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDclDataParticleType.VELPT_AB_DCL_DIAGNOSTICS_RECOVERED
 
     def _build_parsed_values(self):
@@ -122,6 +122,7 @@ class VelptAbDataParticle(DataParticle):
     the bits within a word are numbered right to left.
     (See the System Integrator Manual, page 11.)
     """
+    __slots__ = ()
     # Offsets for date-time group in velocity and diagnostics data records
     minute_offset = 4
     second_offset = 5
@@ -614,6 +615,7 @@ class VelptAbDiagnosticsHeaderParticle(VelptAbDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDataParticleType.VELPT_AB_DIAGNOSTICS_METADATA_RECOVERED
 
     def _build_parsed_values(self):
@@ -663,6 +665,7 @@ class VelptAbDiagnosticsDataParticle(VelptAbDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDataParticleType.VELPT_AB_DIAGNOSTICS_RECOVERED
 
     def _build_parsed_values(self):
@@ -712,6 +715,7 @@ class VelptAbInstrumentMetadataParticle(VelptAbDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDataParticleType.VELPT_AB_INSTRUMENT_METADATA_RECOVERED
 
     def _build_parsed_values(self):
@@ -856,6 +860,7 @@ class VelptAbInstrumentDataParticle(VelptAbDataParticle):
     """
     See the IDD
     """
+    __slots__ = ()
     _data_particle_type = VelptAbDataParticleType.VELPT_AB_INSTRUMENT_RECOVERED
 
     def _build_parsed_values(self):
@@ -119,6 +119,7 @@ class VelptJCsppMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a velpt_j_cspp metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -146,6 +147,7 @@ class VelptJCsppMetadataRecoveredDataParticle(VelptJCsppMetadataDataParticle):
     """
     Class for building a velpt_j_cspp recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_RECOVERED
 
@@ -154,6 +156,7 @@ class VelptJCsppMetadataTelemeteredDataParticle(VelptJCsppMetadataDataParticle):
     """
     Class for building a velpt_j_cspp telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.METADATA_TELEMETERED
 
@@ -162,6 +165,7 @@ class VelptJCsppInstrumentDataParticle(DataParticle):
     """
     Class for building a velpt_j_cspp instrument data particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -189,6 +193,7 @@ class VelptJCsppInstrumentRecoveredDataParticle(VelptJCsppInstrumentDataParticle
     """
     Class for building a velpt_j_cspp recovered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_RECOVERED
 
@@ -197,6 +202,7 @@ class VelptJCsppInstrumentTelemeteredDataParticle(VelptJCsppInstrumentDataPartic
     """
     Class for building a velpt_j_cspp telemetered instrument data particle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.INSTRUMENT_TELEMETERED
 
@@ -168,6 +168,7 @@ class ArrayParticleKeys(BaseEnum):
 
 class WavssADclCommonDataParticle(DataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Set the timestamp and encode the common particles from the raw data using COMMON_PARTICLE_MAP
@@ -212,6 +213,7 @@ STATISTICS_PARTICLE_MAP = [
 
 class WavssADclStatisticsDataParticle(WavssADclCommonDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Encode the common parameters and the statistics parameters from the raw data using the particle maps
@@ -226,10 +228,12 @@ class WavssADclStatisticsDataParticle(WavssADclCommonDataParticle):
 
 
 class WavssADclStatisticsTelemeteredDataParticle(WavssADclStatisticsDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_STATISTICS
 
 
 class WavssADclStatisticsRecoveredDataParticle(WavssADclStatisticsDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_STATISTICS_RECOVERED
 
 
@@ -239,6 +243,7 @@ END_NON_DIR_ARRAY_GROUP = 9
 
 class WavssADclNonDirectionalDataParticle(WavssADclCommonDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Encode the common and bands parameters from the raw data using the particle maps, and extract the non
@@ -262,10 +267,12 @@ class WavssADclNonDirectionalDataParticle(WavssADclCommonDataParticle):
 
 
 class WavssADclNonDirectionalTelemeteredDataParticle(WavssADclNonDirectionalDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_NON_DIRECTIONAL
 
 
 class WavssADclNonDirectionalRecoveredDataParticle(WavssADclNonDirectionalDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_NON_DIRECTIONAL_RECOVERED
 
 
@@ -284,6 +291,7 @@ MEAN_DIRECTION_PARTICLE_MAP = [
 
 class WavssADclMeanDirectionalDataParticle(WavssADclCommonDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Encode the common and bands parameters from the raw data using the particle maps, and extract the 3 mean
@@ -329,10 +337,12 @@ class WavssADclMeanDirectionalDataParticle(WavssADclCommonDataParticle):
 
 
 class WavssADclMeanDirectionalTelemeteredDataParticle(WavssADclMeanDirectionalDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_MEAN_DIRECTIONAL
 
 
 class WavssADclMeanDirectionalRecoveredDataParticle(WavssADclMeanDirectionalDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_MEAN_DIRECTIONAL_RECOVERED
 
 
@@ -350,6 +360,7 @@ MOTION_PARTICLE_MAP = [
 
 class WavssADclMotionDataParticle(WavssADclCommonDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Encode the common and motion parameters from the raw data using the particle maps, and extract the 3 motion
@@ -382,10 +393,12 @@ class WavssADclMotionDataParticle(WavssADclCommonDataParticle):
 
 
 class WavssADclMotionTelemeteredDataParticle(WavssADclMotionDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_MOTION
 
 
 class WavssADclMotionRecoveredDataParticle(WavssADclMotionDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_MOTION_RECOVERED
 
 
@@ -402,6 +415,7 @@ FOURIER_PARTICLE_MAP = [
 
 class WavssADclFourierDataParticle(WavssADclCommonDataParticle):
 
+    __slots__ = ()
     def _build_parsed_values(self):
         """
         Encode the common, bands, and fourier parameters from the raw data using the particle maps, then extract and
@@ -439,10 +453,12 @@ class WavssADclFourierDataParticle(WavssADclCommonDataParticle):
 
 
 class WavssADclFourierTelemeteredDataParticle(WavssADclFourierDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_FOURIER
 
 
 class WavssADclFourierRecoveredDataParticle(WavssADclFourierDataParticle):
+    __slots__ = ()
     _data_particle_type = DataParticleType.WAVSS_A_DCL_FOURIER_RECOVERED
 
 
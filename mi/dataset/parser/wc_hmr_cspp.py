@@ -102,6 +102,7 @@ class WcHmrMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a wc hmr metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -137,6 +138,7 @@ class WcHmrMetadataRecoveredDataParticle(WcHmrMetadataDataParticle):
     """
     Class for building a wc hmr recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcHmrDataParticleType.METADATA_RECOVERED
 
@@ -145,6 +147,7 @@ class WcHmrMetadataTelemeteredDataParticle(WcHmrMetadataDataParticle):
     """
     Class for building a wc hmr telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcHmrDataParticleType.METADATA_TELEMETERED
 
@@ -153,6 +156,7 @@ class WcHmrEngDataParticle(DataParticle):
     """
     Class for parsing data from the wc hmr engineering data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -188,6 +192,7 @@ class WcHmrEngRecoveredDataParticle(WcHmrEngDataParticle):
     """
     Class for building a wc hmr recovered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcHmrDataParticleType.ENGINEERING_RECOVERED
 
@@ -196,6 +201,7 @@ class WcHmrEngTelemeteredDataParticle(WcHmrEngDataParticle):
     """
     Class for building a wc hmr telemetered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcHmrDataParticleType.ENGINEERING_TELEMETERED
 
@@ -93,6 +93,7 @@ class WcSbeMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a wc sbe metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -128,6 +129,7 @@ class WcSbeMetadataRecoveredDataParticle(WcSbeMetadataDataParticle):
     """
     Class for building a wc sbe recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcSbeDataParticleType.METADATA_RECOVERED
 
@@ -136,6 +138,7 @@ class WcSbeMetadataTelemeteredDataParticle(WcSbeMetadataDataParticle):
     """
     Class for building a wc sbe telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcSbeDataParticleType.METADATA_TELEMETERED
 
@@ -144,6 +147,7 @@ class WcSbeEngDataParticle(DataParticle):
     """
     Class for parsing data from the wc sbe engineering data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -179,6 +183,7 @@ class WcSbeEngRecoveredDataParticle(WcSbeEngDataParticle):
     """
     Class for building a wc sbe recovered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcSbeDataParticleType.ENGINEERING_RECOVERED
 
@@ -187,6 +192,7 @@ class WcSbeEngTelemeteredDataParticle(WcSbeEngDataParticle):
     """
     Class for building a wc sbe telemetered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcSbeDataParticleType.ENGINEERING_TELEMETERED
 
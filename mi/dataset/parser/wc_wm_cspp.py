@@ -129,6 +129,7 @@ class WcWmMetadataDataParticle(CsppMetadataDataParticle):
     """
     Class for building a wc wm metadata particle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -164,6 +165,7 @@ class WcWmMetadataRecoveredDataParticle(WcWmMetadataDataParticle):
     """
     Class for building a wc wm recovered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcWmDataParticleType.METADATA_RECOVERED
 
@@ -172,6 +174,7 @@ class WcWmMetadataTelemeteredDataParticle(WcWmMetadataDataParticle):
     """
     Class for building a wc wm telemetered metadata particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcWmDataParticleType.METADATA_TELEMETERED
 
@@ -180,6 +183,7 @@ class WcWmEngDataParticle(DataParticle):
     """
     Class for parsing data from the wc wm engineering data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -215,6 +219,7 @@ class WcWmEngRecoveredDataParticle(WcWmEngDataParticle):
     """
     Class for building a wc wm recovered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcWmDataParticleType.ENGINEERING_RECOVERED
 
@@ -223,6 +228,7 @@ class WcWmEngTelemeteredDataParticle(WcWmEngDataParticle):
     """
     Class for building a wc wm telemetered engineering data particle
     """
+    __slots__ = ()
 
     _data_particle_type = WcWmDataParticleType.ENGINEERING_TELEMETERED
 
@@ -24,7 +24,7 @@ from mi.core.common import BaseEnum
 from mi.core.instrument.data_particle import DataParticle, DataParticleKey
 from mi.core.exceptions import SampleException, DatasetParserException
 
-from mi.dataset.dataset_parser import BufferLoadingParser
+from mi.dataset.dataset_parser import BufferLoadingParser, RecordQueue
 
 EOP_ONLY_MATCHER = re.compile(r'\xFF{11}')
 EOP_REGEX = r'.*(\xFF{11})(.{8})'
@@ -178,7 +178,7 @@ class WfpCFileCommonParser(BufferLoadingParser):
         (StateKey.METADATA_SENT in state_obj):
             raise DatasetParserException("Invalid state keys")
         self._chunker.clean_all_chunks()
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._saved_header = None
         self._state = state_obj
         self._read_state = state_obj
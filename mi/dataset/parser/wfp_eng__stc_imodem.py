@@ -22,7 +22,7 @@ log = get_logger()
 from mi.core.exceptions import SampleException, DatasetParserException, UnexpectedDataException
 from mi.dataset.parser.WFP_E_file_common import WfpEFileParser, StateKey, \
     HEADER_BYTES, SAMPLE_BYTES, STATUS_BYTES, PROFILE_MATCHER, HEADER_MATCHER
-from mi.dataset.dataset_parser import DataSetDriverConfigKeys
+from mi.dataset.dataset_parser import DataSetDriverConfigKeys, RecordQueue
 
 
 class WfpEngStcImodemParser(WfpEFileParser):
@@ -57,7 +57,7 @@ class WfpEngStcImodemParser(WfpEFileParser):
         if not (StateKey.POSITION in state_obj):
             raise DatasetParserException("Invalid state keys")
         self._chunker.clean_all_chunks()
-        self._record_buffer = []
+        self._record_buffer = RecordQueue()
         self._saved_header = None
         self._state = state_obj
         self._read_state = state_obj
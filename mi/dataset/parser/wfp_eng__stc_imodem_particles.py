@@ -44,6 +44,7 @@ class WfpEngStcImodemStatusDataParticle(DataParticle):
     """
     Class for building a WfpEngStcImodemStatusDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -82,6 +83,7 @@ class WfpEngStcImodemStatusRecoveredDataParticle(WfpEngStcImodemStatusDataPartic
     """
     Class for building a WfpEngStcImodemStatusRecoveredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.STATUS_RECOVERED
 
@@ -90,6 +92,7 @@ class WfpEngStcImodemStatusTelemeteredDataParticle(WfpEngStcImodemStatusDataPart
     """
     Class for building a WfpEngStcImodemStatusTelemeteredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.STATUS_TELEMETERED
 
@@ -103,6 +106,7 @@ class WfpEngStcImodemStartDataParticle(DataParticle):
     """
     Class for building a WfpEngStcImodemStartDataParticle
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -136,6 +140,7 @@ class WfpEngStcImodemStartRecoveredDataParticle(WfpEngStcImodemStartDataParticle
     """
     Class for building a WfpEngStcImodemStartRecoveredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.START_TIME_RECOVERED
 
@@ -144,6 +149,7 @@ class WfpEngStcImodemStartTelemeteredDataParticle(WfpEngStcImodemStartDataPartic
     """
     Class for building a WfpEngStcImodemStartTelemeteredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.START_TIME_TELEMETERED
 
@@ -159,6 +165,7 @@ class WfpEngStcImodemEngineeringDataParticle(DataParticle):
     """
     Class for parsing data from the WFP_ENG__STC_IMODEM data set
     """
+    __slots__ = ()
 
     def _build_parsed_values(self):
         """
@@ -197,6 +204,7 @@ class WfpEngStcImodemEngineeringRecoveredDataParticle(WfpEngStcImodemEngineering
     """
     Class for building a WfpEngStcImodemEngineeringRecoveredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.ENGINEERING_RECOVERED
 
@@ -205,6 +213,7 @@ class WfpEngStcImodemEngineeringTelemeteredDataParticle(WfpEngStcImodemEngineeri
     """
     Class for building a WfpEngStcImodemEngineeringTelemeteredDataParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.ENGINEERING_TELEMETERED
 
@@ -68,6 +68,7 @@ class WfpEngWfpSioDataParticle(DataParticle):
     """
     A base class for wfp_eng_wfp_sio data particles.
     """
+    __slots__ = ()
 
     def _build_result(self, encoding_rules):
         """
@@ -86,6 +87,7 @@ class WfpEngWfpSioParserDataStartTimeParticle(WfpEngWfpSioDataParticle):
     """
     Class for building the WfpEngWfpSioParserDataStartTimeParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.START_TIME
 
@@ -117,6 +119,7 @@ class WfpEngWfpSioParserDataStatusParticle(WfpEngWfpSioDataParticle):
     """
     Class for building the WfpEngWfpSioParserDataStatusParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.STATUS
 
@@ -172,6 +175,7 @@ class WfpEngWfpSioParserDataEngineeringParticle(WfpEngWfpSioDataParticle):
     """
     Class for building the WfpEngWfpSioParserDataEngineeringParticle
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.ENGINEERING
 
@@ -114,6 +114,7 @@ class WinchCsppDataParticle(DataParticle):
     """
     Class for generating a Winch CSPP data particle
     """
+    __slots__ = ()
     _data_particle_type = DataParticleType.WINCH_CSPP_ENG
 
     def _build_parsed_values(self):
@@ -210,6 +210,7 @@ class ZplscCInstrumentDataParticle(DataParticle):
     """
     Class for generating the zplsc_c instrument particle.
     """
+    __slots__ = ()
 
     _data_particle_type = DataParticleType.ZPLSC_C_DCL_SAMPLE
     __metaclass__ = get_logging_metaclass(log_level='trace')
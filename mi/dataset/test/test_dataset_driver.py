@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.test.test_dataset_driver
+@file mi/dataset/test/test_dataset_driver.py
+@brief Test code for the dataset driver base classes
+"""
+
+import json
+import os
+import tempfile
+
+import numpy
+from nose.plugins.attrib import attr
+
+from mi.core.exceptions import SampleException
+from mi.core.instrument.data_particle import DataParticle, DataParticleKey, ParticleBatch
+from mi.core.stage_timer import Stage, StageTimer, STAGE_TIMING_ENVIRONMENT_VARIABLE
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.dataset_driver import DataSetDriver, ParticleDataHandler
+
+
+class CountParticleA(DataParticle):
+    _data_particle_type = 'count_a'
+
+    def _build_parsed_values(self):
+        if self.raw_data < 0:
+            raise SampleException("negative count")
+        return [self._encode_value('count', self.raw_data, int)]
+
+
+class CountParticleB(CountParticleA):
+    _data_particle_type = 'count_b'
+
+
+class ListParser(object):
+    """
+    Hands out a fixed list of particles, recording each request size
+    """
+    def __init__(self, particles):
+        self._particles = particles
+        self.requests = []
+
+    def get_records(self, num_records):
+        self.requests.append(num_records)
+        records = self._particles[:num_records]
+        self._particles = self._particles[num_records:]
+        return records
+
+
+class SingleSampleHandler(object):
+    """
+    A particle data handler without the bulk addParticleSamples method
+    """
+    def __init__(self):
+        self.samples = []
+        self.failure = False
+
+    def addParticleSample(self, sample_type, sample):
+        self.samples.append(sample_type)
+
+    def setParticleDataCaptureFailure(self):
+        self.failure = True
+
+
+def build_particles(counts):
+    particles = []
+    for count in counts:
+        particle_class = CountParticleA if count % 3 else CountParticleB
+        particles.append(particle_class(count, port_timestamp=3600000000.0,
+                                        preferred_timestamp=DataParticleKey.PORT_TIMESTAMP))
+    return particles
+
+
+def build_batch(counts):
+    values = numpy.array([(count,) for count in counts], dtype=[('count', 'i4')])
+    return ParticleBatch('count_a', values, [3600000000.0] * len(counts))
+
+
+@attr('UNIT', group='mi')
+class DataSetDriverUnitTest(MiUnitTest):
+
+    def test_batches(self):
+        """
+        Records are pulled from the parser in batches and handed over in order
+        """
+        parser = ListParser(build_particles(range(10)))
+        handler = ParticleDataHandler()
+        DataSetDriver(parser, handler, batch_size=4).processFileStream()
+
+        self.assertEqual(parser.requests, [4, 4, 4, 4])
+        self.assertFalse(handler._failure)
+        self.assertEqual(len(handler._samples['count_a']), 6)
+        self.assertEqual(len(handler._samples['count_b']), 4)
+
+    def test_single_sample_handler(self):
+        """
+        Handlers without addParticleSamples get one call per sample
+        """
+        parser = ListParser(build_particles(range(7)))
+        handler = SingleSampleHandler()
+        DataSetDriver(parser, handler).processFileStream()
+
+        self.assertFalse(handler.failure)
+        self.assertEqual(handler.samples, ['count_b', 'count_a', 'count_a',
+                                           'count_b', 'count_a', 'count_a', 'count_b'])
+
+    def test_failure(self):
+        """
+        Records generated before a failure in the batch are still handed over
+        """
+        parser = ListParser(build_particles([1, 2, 3, -1, 4]))
+        handler = SingleSampleHandler()
+        DataSetDriver(parser, handler).processFileStream()
+
+        self.assertTrue(handler.failure)
+        self.assertEqual(handler.samples, ['count_a', 'count_a', 'count_b'])
+
+    def test_particle_batch(self):
+        """
+        Particle batches are handed over between the particles around them
+        """
+        parser = ListParser(build_particles([1, 2]) + [build_batch([4, 5, 7])] + build_particles([8]))
+        handler = ParticleDataHandler()
+        DataSetDriver(parser, handler).processFileStream()
+
+        self.assertFalse(handler._failure)
+        self.assertEqual([json.loads(sample)[DataParticleKey.VALUES][0][DataParticleKey.VALUE]
+                          for sample in handler._samples['count_a']], [1, 2, 4, 5, 7, 8])
+
+    def test_particle_batch_single_sample_handler(self):
+        """
+        Handlers without addParticleBatch get the batch expanded into samples
+        """
+        parser = ListParser([build_batch([1, 2])] + build_particles([3]))
+        handler = SingleSampleHandler()
+        DataSetDriver(parser, handler).processFileStream()
+
+        self.assertFalse(handler.failure)
+        self.assertEqual(handler.samples, ['count_a', 'count_a', 'count_b'])
+
+
+@attr('UNIT', group='mi')
+class StageTimerUnitTest(MiUnitTest):
+
+    def test_disabled(self):
+        """
+        Without an active timer the stage marks share one context manager
+        """
+        self.assertIsNone(StageTimer.active)
+        self.assertIs(StageTimer.stage(Stage.READ), StageTimer.stage(Stage.BUILD))
+        self.assertEqual(StageTimer.from_environment(), (None, None))
+
+    def test_nested_stages(self):
+        """
+        A stage's time excludes the stages nested inside it
+        """
+        with StageTimer() as timer:
+            with StageTimer.stage(Stage.PUBLISH):
+                for _ in range(3):
+                    with StageTimer.stage(Stage.ENCODE):
+                        sum(range(100000))
+
+        self.assertIsNone(StageTimer.active)
+        summary = timer.summary()
+        stages = summary['stages']
+        self.assertEqual(sorted(stages), [Stage.ENCODE, Stage.PUBLISH])
+        self.assertEqual(stages[Stage.ENCODE]['calls'], 3)
+        self.assertEqual(stages[Stage.PUBLISH]['calls'], 1)
+        self.assertLess(stages[Stage.PUBLISH]['wall_seconds'], stages[Stage.ENCODE]['wall_seconds'])
+        self.assertLessEqual(stages[Stage.PUBLISH]['wall_seconds'] + stages[Stage.ENCODE]['wall_seconds'],
+                             summary['wall_seconds'])
+
+    def test_driver_report(self):
+        """
+        With MI_STAGE_TIMING set to a file the driver appends its summary to it
+        """
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        os.environ[STAGE_TIMING_ENVIRONMENT_VARIABLE] = path
+        try:
+            DataSetDriver(ListParser(build_particles(range(5))), ParticleDataHandler()).processFileStream()
+            DataSetDriver(ListParser([build_batch([1, 2])]), SingleSampleHandler()).processFileStream()
+            with open(path) as stream_handle:
+                first, second = [json.loads(line) for line in stream_handle]
+        finally:
+            del os.environ[STAGE_TIMING_ENVIRONMENT_VARIABLE]
+            os.remove(path)
+
+        # one get_records call returning the particles and one returning none
+        self.assertEqual(first['stages'][Stage.BUILD]['calls'], 2)
+        self.assertEqual(first['stages'][Stage.ENCODE]['calls'], 1)
+        # one call per run of particles of the same type
+        self.assertEqual(first['stages'][Stage.PUBLISH]['calls'], 4)
+        self.assertEqual(sorted(second['stages']), [Stage.BUILD, Stage.ENCODE, Stage.PUBLISH])
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.test.test_dataset_parser
+@file mi/dataset/test/test_dataset_parser.py
+@brief Test code for the dataset parser base classes
+"""
+
+import os
+import re
+import tempfile
+from functools import partial
+from StringIO import StringIO
+
+from nose.plugins.attrib import attr
+
+from mi.core.instrument.chunker import StringChunker
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.dataset_parser import SimpleParser, BufferLoadingParser, RecordQueue, map_stream
+
+
+class BufferedLineParser(SimpleParser):
+    """
+    Fills the record buffer with every line in the file
+    """
+    def parse_file(self):
+        for line in self._stream_handle:
+            self._record_buffer.append(line.strip())
+
+
+class StreamingLineParser(SimpleParser):
+    """
+    Yields each line in the file as it is read
+    """
+    def parse_file(self):
+        for line in self._stream_handle:
+            self.lines_read += 1
+            yield line.strip()
+
+    lines_read = 0
+
+
+class LineBufferLoadingParser(BufferLoadingParser):
+    """
+    Makes a (line, blocks read) record from each line, reading one byte per block
+    """
+    def __init__(self, stream_handle):
+        super(LineBufferLoadingParser, self).__init__({}, stream_handle, None,
+                                                      partial(StringChunker.regex_sieve_function,
+                                                              regex_list=[re.compile(r'[^\n]*\n')]),
+                                                      lambda state, ingested: None,
+                                                      lambda particles: None)
+        self.blocks_read = 0
+
+    def get_block(self, size=1024):
+        self.blocks_read += 1
+        return super(LineBufferLoadingParser, self).get_block(1)
+
+    def parse_chunks(self):
+        result = []
+        (timestamp, chunk) = self._chunker.get_next_data()
+        while chunk is not None:
+            result.append((chunk.strip(), self.blocks_read))
+            (timestamp, chunk) = self._chunker.get_next_data()
+        return result
+
+
+@attr('UNIT', group='mi')
+class RecordQueueUnitTest(MiUnitTest):
+
+    def test_queue(self):
+        """
+        Records come out of the queue in the order they went in
+        """
+        queue = RecordQueue(high_water_mark=3)
+        queue.extend([1, 2])
+        queue.append(3)
+        queue.insert(0, 0)
+
+        self.assertEqual(len(queue), 4)
+        self.assertTrue(queue.full)
+        self.assertEqual(queue.popleft(), 0)
+        self.assertEqual(queue.take(2), [1, 2])
+        self.assertFalse(queue.full)
+        self.assertEqual(queue.take(5), [3])
+        self.assertEqual(queue.take(5), [])
+        self.assertRaises(IndexError, queue.popleft)
+
+    def test_unbounded(self):
+        """
+        A queue without a high water mark is never full
+        """
+        queue = RecordQueue(high_water_mark=None)
+        queue.extend(range(RecordQueue.DEFAULT_HIGH_WATER_MARK + 1))
+        self.assertFalse(queue.full)
+        self.assertEqual(queue.take(3), [0, 1, 2])
+
+
+@attr('UNIT', group='mi')
+class SimpleParserUnitTest(MiUnitTest):
+
+    def test_buffered(self):
+        """
+        parse_file filling the record buffer still works
+        """
+        parser = BufferedLineParser({}, StringIO('a\nb\nc\n'), None)
+
+        self.assertEqual(parser.get_records(2), ['a', 'b'])
+        self.assertEqual(parser.get_records(2), ['c'])
+        self.assertEqual(parser.get_records(2), [])
+
+    def test_streaming(self):
+        """
+        A generator parse_file is only run as far as the particles requested
+        """
+        parser = StreamingLineParser({}, StringIO('a\nb\nc\nd\n'), None)
+
+        self.assertEqual(parser.get_records(0), [])
+        self.assertEqual(parser.lines_read, 0)
+        self.assertEqual(parser.get_records(1), ['a'])
+        self.assertEqual(parser.lines_read, 1)
+        self.assertEqual(parser.get_records(2), ['b', 'c'])
+        self.assertEqual(parser.lines_read, 3)
+        self.assertEqual(parser.get_records(5), ['d'])
+        self.assertEqual(parser.get_records(5), [])
+        self.assertEqual(list(parser.iter_particles()), [])
+
+    def test_iter_particles(self):
+        """
+        iter_particles continues from where get_records left off
+        """
+        parser = StreamingLineParser({}, StringIO('a\nb\nc\n'), None)
+
+        self.assertEqual(parser.get_records(1), ['a'])
+        self.assertEqual(list(parser.iter_particles()), ['b', 'c'])
+        self.assertEqual(parser.get_records(1), [])
+
+
+@attr('UNIT', group='mi')
+class BufferLoadingParserUnitTest(MiUnitTest):
+
+    def test_high_water_mark(self):
+        """
+        Blocks stop being loaded once the record buffer is full
+        """
+        parser = LineBufferLoadingParser(StringIO('a\nb\nc\nd\n'))
+        parser._record_buffer.high_water_mark = 2
+
+        self.assertEqual(parser.get_records(1), ['a'])
+        self.assertEqual(parser.blocks_read, 4)
+        self.assertEqual(len(parser._record_buffer), 1)
+        self.assertEqual(parser.get_records(5), ['b', 'c', 'd'])
+        self.assertTrue(parser.file_complete)
+
+
+@attr('UNIT', group='mi')
+class MapStreamUnitTest(MiUnitTest):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, data):
+        with open(self.path, 'wb') as stream_handle:
+            stream_handle.write(data)
+
+    def test_file(self):
+        """
+        A file is mapped from its current position and left at its end
+        """
+        self.write('header\nSAMPLE 1\nSAMPLE 2\n')
+        with open(self.path, 'rb') as stream_handle:
+            stream_handle.seek(7)
+            data = map_stream(stream_handle)
+
+            self.assertIsInstance(data, buffer)
+            self.assertEqual(str(data), 'SAMPLE 1\nSAMPLE 2\n')
+            self.assertEqual(data[:8], 'SAMPLE 1')
+            self.assertEqual([match.start() for match in re.finditer('SAMPLE', data)], [0, 9])
+            self.assertEqual(stream_handle.read(), '')
+
+    def test_fallback(self):
+        """
+        Empty files and streams without a file are read
+        """
+        self.write('')
+        with open(self.path, 'rb') as stream_handle:
+            self.assertEqual(map_stream(stream_handle), '')
+
+        stream_handle = StringIO('abc')
+        stream_handle.read(1)
+        self.assertEqual(map_stream(stream_handle), 'bc')
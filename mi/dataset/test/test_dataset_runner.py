@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.test.test_dataset_runner
+@file mi/dataset/test/test_dataset_runner.py
+@brief Test code for the multi-file driver runner
+"""
+
+import os
+import shutil
+import tempfile
+from collections import deque
+
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.dataset_runner import DriverRunner, FileParseResult
+
+
+def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
+    """
+    Driver parse() entry point used by the runner tests. The file holds one
+    sample per line, 'crash' makes the worker exit, 'crash once' only the
+    first time and 'fail' raises.
+    """
+    with open(sourceFilePath) as stream_handle:
+        lines = stream_handle.read().splitlines()
+
+    for line in lines:
+        if line == 'crash':
+            os._exit(3)
+        elif line == 'crash once':
+            marker = sourceFilePath + '.crashed'
+            if not os.path.exists(marker):
+                open(marker, 'w').close()
+                os._exit(3)
+        elif line == 'fail':
+            raise ValueError('bad line')
+        else:
+            particleDataHdlrObj.addParticleSample('line', line)
+
+    return particleDataHdlrObj
+
+
+class LatePollConnection(object):
+    """
+    Wraps the parent end of a worker pipe so the first poll misses the result,
+    as if the worker sent it and exited just after being polled
+    """
+    def __init__(self, connection):
+        self._connection = connection
+        self._polls = 0
+
+    def poll(self):
+        self._polls += 1
+        return self._polls > 1 and self._connection.poll()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+@attr('UNIT', group='mi')
+class DriverRunnerUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, name, lines):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as stream_handle:
+            stream_handle.write('\n'.join(lines))
+        return path
+
+    def test_order(self):
+        """
+        Results are returned in the order the files were given
+        """
+        files = [self.write_file('file%d' % index, ['a%d' % index, 'b%d' % index]) for index in range(6)]
+        results = DriverRunner(__name__, self.directory, processes=3).run(files)
+
+        self.assertEqual([result.source_file for result in results], files)
+        self.assertEqual([result.samples for result in results],
+                         [{'line': ['a%d' % index, 'b%d' % index]} for index in range(6)])
+        self.assertFalse(any(result.failure for result in results))
+
+    def test_failures(self):
+        """
+        Crashed workers are retried, parse errors and repeated crashes are failures
+        """
+        files = [self.write_file('once', ['a', 'crash once', 'b']),
+                 self.write_file('crash', ['a', 'crash']),
+                 self.write_file('fail', ['a', 'fail']),
+                 self.write_file('good', ['a'])]
+        once, crash, fail, good = DriverRunner(__name__, self.directory, processes=2, max_retries=1).run(files)
+
+        self.assertEqual(once.samples, {'line': ['a', 'b']})
+        self.assertEqual(once.attempts, 2)
+        self.assertFalse(once.failure)
+
+        self.assertTrue(crash.failure)
+        self.assertEqual(crash.attempts, 2)
+        self.assertIn('code 3', crash.error)
+
+        self.assertTrue(fail.failure)
+        self.assertEqual(fail.attempts, 1)
+        self.assertEqual(fail.samples, {'line': ['a']})
+        self.assertIn('ValueError', fail.error)
+
+        self.assertEqual(good.samples, {'line': ['a']})
+
+    def test_cache(self):
+        """
+        With a cache directory the results are the same as without
+        """
+        files = [self.write_file('file%d' % index, ['a%d' % index]) for index in range(2)]
+        runner = DriverRunner(__name__, self.directory, processes=2,
+                              cache_directory=os.path.join(self.directory, 'cache'))
+
+        self.assertEqual([result.samples for result in runner.run(files)],
+                         [{'line': ['a%d' % index]} for index in range(2)])
+
+    def test_exit_after_send(self):
+        """
+        A worker which sends its result and exits between the poll and the liveness check is not a crash
+        """
+        runner = DriverRunner(__name__, self.directory, processes=1)
+        result = FileParseResult(self.write_file('late', ['a']))
+        process, connection = runner._start(result)
+        process.join()
+
+        pending = deque()
+        running = {0: (process, LatePollConnection(connection))}
+        self.assertTrue(runner._collect(running, [result], pending))
+
+        self.assertEqual(running, {})
+        self.assertEqual(pending, deque())
+        self.assertEqual(result.samples, {'line': ['a']})
+        self.assertFalse(result.failure)
+        self.assertEqual(result.attempts, 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.test.test_driver_registry
+@file mi/dataset/test/test_driver_registry.py
+@brief Test code for the dataset driver registry
+"""
+
+import os
+import shutil
+import tempfile
+
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.dataset.driver_registry import DriverRegistry, DriverRegistryKey, build_manifest, write_manifest
+
+DRIVER_SOURCE = '''
+from mi.core.versioning import version
+
+FILE_PATTERNS = ['*.dat', 'unit_*.log']
+
+@version("1.2.3")
+def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
+    return particleDataHdlrObj
+'''
+
+COMMON_SOURCE = '''
+def process():
+    pass
+'''
+
+
+@attr('UNIT', group='mi')
+class DriverRegistryUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.driver_root = os.path.join(self.directory, 'mi', 'dataset', 'driver')
+        package = os.path.join(self.driver_root, 'unit', 'dcl')
+        os.makedirs(package)
+        for name, source in (('unit_dcl_recovered_driver.py', DRIVER_SOURCE),
+                             ('unit_dcl_common_driver.py', COMMON_SOURCE)):
+            with open(os.path.join(package, name), 'w') as stream_handle:
+                stream_handle.write(source)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build_manifest(self):
+        """
+        Drivers are listed from their source, modules without parse() are left out
+        """
+        self.assertEqual(build_manifest(self.driver_root), {
+            'unit_dcl_recovered': {
+                DriverRegistryKey.MODULE: 'mi.dataset.driver.unit.dcl.unit_dcl_recovered_driver',
+                DriverRegistryKey.INSTRUMENT: 'unit.dcl',
+                DriverRegistryKey.VERSION: '1.2.3',
+                DriverRegistryKey.FILE_PATTERNS: ['*.dat', 'unit_*.log']}})
+
+    def test_lookup(self):
+        manifest_path = os.path.join(self.directory, 'manifest.json')
+        write_manifest(build_manifest(self.driver_root), manifest_path)
+        registry = DriverRegistry(manifest_path)
+
+        self.assertIn('unit_dcl_recovered', registry)
+        self.assertEqual(registry.names('unit'), ['unit_dcl_recovered'])
+        self.assertEqual(registry.names('uni'), [])
+        self.assertEqual(registry.version('unit_dcl_recovered'), '1.2.3')
+        self.assertEqual(registry.match('/data/unit_20150101.log'), ['unit_dcl_recovered'])
+        self.assertEqual(registry.match('unit.txt'), [])
+        self.assertRaises(KeyError, registry.get_parse, 'missing')
+
+    def test_manifest_up_to_date(self):
+        """
+        The committed manifest matches the driver sources
+        """
+        registry = DriverRegistry()
+        self.assertEqual(registry._manifest, build_manifest())
+
+        parse = registry.get_parse('ctdgv_m_glider_recovered')
+        self.assertEqual(parse.version, registry.version('ctdgv_m_glider_recovered'))
+        self.assertIs(registry.get_parse('ctdgv_m_glider_recovered'), parse)
+
+    def test_match_drivers(self):
+        """
+        Every driver declares its file patterns, and instrument files match their drivers
+        """
+        registry = DriverRegistry()
+        self.assertEqual([name for name in registry.names()
+                          if not registry.entry(name)[DriverRegistryKey.FILE_PATTERNS]], [])
+
+        self.assertEqual(registry.match('/omc_data/20140424.adcpt.log'),
+                         ['adcpt_acfgm_dcl_pd0_recovered', 'adcpt_acfgm_dcl_pd0_telemetered'])
+        self.assertEqual(registry.match('11079364_PPB_CTD.txt'),
+                         ['ctdpf_j_cspp_recovered', 'ctdpf_j_cspp_telemetered'])
+        self.assertEqual(registry.match('node59p1_0.flort.dat'), ['flort_dj_sio_telemetered'])
+        self.assertIn('ctdgv_m_glider_recovered', registry.match('unit_363_2013_245_6_6.mrg'))
+        self.assertEqual(registry.match('unit.txt'), [])
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+"""
+@package mi.dataset.test.test_parse_cache
+@file mi/dataset/test/test_parse_cache.py
+@brief Test code for the driver parse cache
+"""
+
+import errno
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from mock import patch
+from nose.plugins.attrib import attr
+
+from mi.core.unit_test import MiUnitTest
+from mi.core.versioning import version
+from mi.dataset.dataset_driver import ParticleDataHandler
+from mi.dataset.parse_cache import ParseCache, cached_parse, main
+
+# number of times parse() below was called
+parse_calls = []
+
+
+@version("1.0.0")
+def parse(basePythonCodePath, sourceFilePath, particleDataHdlrObj):
+    """
+    Driver parse() entry point used by the cache tests, one sample per line
+    with its particle type before a colon, 'fail' sets a capture failure
+    """
+    parse_calls.append(sourceFilePath)
+    with open(sourceFilePath) as stream_handle:
+        for line in stream_handle.read().splitlines():
+            if line == 'fail':
+                particleDataHdlrObj.setParticleDataCaptureFailure()
+            else:
+                sample_type, sample = line.split(':', 1)
+                particleDataHdlrObj.addParticleSample(sample_type, sample)
+
+    return particleDataHdlrObj
+
+
+@attr('UNIT', group='mi')
+class ParseCacheUnitTest(MiUnitTest):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ParseCache(os.path.join(self.directory, 'cache'))
+        self.module = sys.modules[__name__]
+        del parse_calls[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, name, lines):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as stream_handle:
+            stream_handle.write('\n'.join(lines))
+        return path
+
+    def parse(self, path, parser_config=None):
+        handler = ParticleDataHandler()
+        hit = cached_parse(self.cache, self.module, self.directory, path, handler, parser_config)
+        return hit, handler
+
+    def test_replay(self):
+        """
+        A file parsed again is replayed from the cache with the same particles
+        """
+        path = self.write_file('file', ['a:{"x": 1}', 'a:{"x": 2}', 'b:{"y": "\\t"}', 'a:{"x": 3}'])
+
+        hit, first = self.parse(path)
+        self.assertFalse(hit)
+        hit, second = self.parse(path)
+        self.assertTrue(hit)
+
+        self.assertEqual(len(parse_calls), 1)
+        self.assertEqual(second._samples, first._samples)
+        self.assertEqual(second._samples, {'a': ['{"x": 1}', '{"x": 2}', '{"x": 3}'], 'b': ['{"y": "\\t"}']})
+
+    def test_key(self):
+        """
+        The key changes with the file content, driver version and parser config
+        """
+        path = self.write_file('file', ['a:1'])
+        key = ParseCache.key(path, self.module)
+
+        self.assertEqual(ParseCache.key(path, self.module), key)
+        self.assertNotEqual(ParseCache.key(path, self.module, {'a': 1}), key)
+
+        original = parse.version
+        parse.version = '1.0.1'
+        try:
+            self.assertNotEqual(ParseCache.key(path, self.module), key)
+        finally:
+            parse.version = original
+
+        self.write_file('file', ['a:2'])
+        self.assertNotEqual(ParseCache.key(path, self.module), key)
+
+    def test_failure_not_cached(self):
+        path = self.write_file('file', ['a:1', 'fail'])
+
+        self.assertFalse(self.parse(path)[0])
+        hit, handler = self.parse(path)
+        self.assertFalse(hit)
+        self.assertTrue(handler._failure)
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_evict(self):
+        """
+        The least recently used entries are evicted past the size limit
+        """
+        self.cache.max_bytes = 20
+        self.cache.put('module', 'old', [('a', '1234567')])
+        self.cache.put('module', 'used', [('a', '1234567')])
+        past = time.time() - 100
+        for name in ('old', 'used'):
+            os.utime(self.cache._path('module', name), (past, past))
+        self.assertIsNotNone(self.cache.get('module', 'used'))
+
+        self.cache.put('module', 'new', [('a', '1234567')])
+
+        self.assertIsNone(self.cache.get('module', 'old'))
+        self.assertEqual(self.cache.get('module', 'used'), [('a', '1234567')])
+        self.assertEqual(self.cache.get('module', 'new'), [('a', '1234567')])
+
+    def test_walk_past_limit(self):
+        """
+        The directory is walked on the first put, then only once the cache is past its size limit
+        """
+        self.cache.max_bytes = 35
+        with patch('os.walk', wraps=os.walk) as walk:
+            # os.walk also calls itself for the subdirectories
+            cache_walks = lambda: [args[0] for args, kwargs in walk.call_args_list].count(self.cache.directory)
+            for name in ('a', 'b', 'c'):
+                self.cache.put('module', name, [('a', '1234567')])
+            self.assertEqual(cache_walks(), 1)
+
+            self.cache.put('module', 'd', [('a', '1234567')])
+            self.assertEqual(cache_walks(), 2)
+        self.assertEqual(len(self.cache.entries()), 3)
+
+    def test_manual_evict(self):
+        """
+        Without auto evict entries are only evicted when the owner trims the cache
+        """
+        self.cache.max_bytes = 15
+        writer = ParseCache(self.cache.directory, auto_evict=False)
+        self.assertEqual(writer.put('module', 'a', [('a', '1234567')]), 10)
+        writer.put('module', 'b', [('a', '1234567')])
+        self.assertEqual(writer.bytes_added, 20)
+        self.assertEqual(len(self.cache.entries()), 2)
+
+        self.assertEqual(self.cache.trim(), 1)
+        self.cache.added(5)
+        self.assertEqual(self.cache.trim(), 0)
+
+    def test_removed_by_other_process(self):
+        """
+        Entries removed by another process while in use are skipped
+        """
+        self.cache.put('module', 'key', [('a', '1')])
+        path = self.cache._path('module', 'key')
+
+        with patch('os.utime', side_effect=OSError(errno.ENOENT, 'No such file or directory')):
+            self.assertEqual(self.cache.get('module', 'key'), [('a', '1')])
+
+        module_directory = os.path.dirname(path)
+        with patch('os.walk', return_value=[(module_directory, [], ['gone' + '.particles', 'key.particles'])]):
+            self.assertEqual([entry[2] for entry in self.cache.entries()], [path])
+
+        self.cache.max_bytes = 0
+        gone = os.path.join(module_directory, 'gone.particles')
+        with patch.object(self.cache, 'entries', return_value=[(0, 10, gone), (1, 4, path)]):
+            self.assertEqual(self.cache.evict(), 1)
+        self.assertFalse(os.path.exists(path))
+
+    def test_invalidate(self):
+        self.cache.put('first', 'key', [('a', '1')])
+        self.cache.put('second', 'key', [('a', '1')])
+
+        main([self.cache.directory, 'invalidate', '--module', 'first'])
+        self.assertIsNone(self.cache.get('first', 'key'))
+        self.assertIsNotNone(self.cache.get('second', 'key'))
+
+        main([self.cache.directory, 'invalidate'])
+        self.assertEqual(self.cache.entries(), [])
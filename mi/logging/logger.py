@@ -57,7 +57,7 @@ EVOLUTION / CREATION:
 
 
 import logging
-import inspect
+import sys
 import threading
 
 # invent a new log level called "trace".  hope that people will use it.
@@ -102,6 +102,8 @@ logging.Logger.trace = trace
 class _ScopedLogger(object):
 
     _filters = []
+    # module name to its installed logger
+    _loggers = {}
 
     def _add_filter(self, filter):
         """ set this filter on each new logger created (does not affect loggers already created)
@@ -111,36 +113,49 @@ class _ScopedLogger(object):
         self._filters.append(filter)
 
     def _install_logger(self):
-        name = "UNKNOWN_MODULE_NAME"
-        module = None
-
-        stack = inspect.stack()
-        # stack[0]: call to inspect.stack() on the line above
-        # stack[1]: call to _install_logger() by one of the delegate methods below
-        frame=stack[2] # call to the delegate method from some outside calling module
-        if frame and frame[0]:
-            module = inspect.getmodule(frame[0])
-            if module:
-                name = module.__name__
-            elif frame[1]:
-                name = frame[1]
-            true_caller_tuple = (name, frame[2], frame[3])
-        logger = logging.getLogger(name)
+        # frame 0: _install_logger(), frame 1: one of the delegate methods below
+        # frame 2: call to the delegate method from some outside calling module
+        frame = sys._getframe(2)
+        logger = self._loggers.get(frame.f_globals.get('__name__'))
+        if logger is not None:
+            return logger
+
+        logger = self._logger_for(frame)
 
         # fix bug -- first message logged was reporting line number from this file
+        true_caller_tuple = (logger.name, frame.f_lineno, frame.f_code.co_name)
         def first_time_find_caller():
             logger.findCaller = logger._original_find_caller
             return true_caller_tuple
         logger._original_find_caller = logger.findCaller
         logger.findCaller = first_time_find_caller
+        return logger
+
+    def _logger_for(self, frame):
+        """ get the logger of the module a frame is running in, creating and installing it as "module.log" the
+            first time.  loggers are cached by module name, so the scope is only resolved once per module.
+        """
+        name = frame.f_globals.get('__name__') or "UNKNOWN_MODULE_NAME"
+        logger = self._loggers.get(name)
+        if logger is not None:
+            return logger
 
+        logger = logging.getLogger(name)
         for filter in self._filters:
             logger.addFilter(filter)
+        self._loggers[name] = logger
 
-        if module:
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, 'log', self) is self:
             module.log = logger
         return logger
 
+    def _caller_logger(self, depth=1):
+        """ get the real logger of the module calling the function that calls this.
+            not intended to be called directly by client code, use mi.core.log.get_logger()
+        """
+        return self._logger_for(sys._getframe(depth + 1))
+
     # all Logger methods quietly install the true logger object and then delegate
     def setLevel(self,*a,**b):          return self._install_logger().setLevel(*a,**b)
     def isEnabledFor(self,*a,**b):      return self._install_logger().isEnabledFor(*a,**b)
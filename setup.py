@@ -7,6 +7,7 @@ setup(
     url="http://github.com/oceanobservatories/mi-dataset",
     license="BSD",
     packages=find_packages(),
+    package_data={'mi.dataset.driver': ['manifest.json']},
     install_requires=[
         "pyyaml",
         "numpy",
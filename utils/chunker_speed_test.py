@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Microbenchmark for the chunker engines.
+
+Feeds a stream of fixed size records through StringChunker and BufferChunker
+as many small fragments and reports the cost per fragment as the number of
+fragments in a file grows. With the offset based BufferChunker the cost per
+fragment should stay flat, while the StringChunker cost grows with the number
+of fragments held in the buffer.
+
+usage: python utils/chunker_speed_test.py [fragment counts...]
+"""
+
+__license__ = 'Apache 2.0'
+
+import re
+import sys
+import time
+from functools import partial
+
+from mi.core.instrument.chunker import Chunker, StringChunker, BufferChunker
+
+RECORD = 'AB%06d,12.345,67.890,1013.25\n'
+RECORD_MATCHER = re.compile(r'AB\d{6},.*\n')
+SIEVE = partial(Chunker.regex_sieve_function, regex_list=[RECORD_MATCHER])
+
+FRAGMENT_SIZE = 7
+DEFAULT_FRAGMENT_COUNTS = [1000, 5000, 10000, 20000, 50000]
+
+
+def build_fragments(fragment_count):
+    """
+    Build a stream of records and split it into fragments
+    @param fragment_count The number of fragments to build
+    @retval A list of string fragments
+    """
+    record_count = fragment_count * FRAGMENT_SIZE / len(RECORD % 0) + 1
+    stream = ''.join(RECORD % i for i in xrange(record_count))
+    return [stream[i:i + FRAGMENT_SIZE] for i in xrange(0, fragment_count * FRAGMENT_SIZE, FRAGMENT_SIZE)]
+
+
+def run_streaming(chunker_class, fragments):
+    """
+    Add each fragment and pull out any complete records right away, the way a
+    BufferLoadingParser does
+    """
+    chunker = chunker_class(SIEVE)
+    for index, fragment in enumerate(fragments):
+        chunker.add_chunk(fragment, float(index))
+        (timestamp, chunk) = chunker.get_next_data()
+        while chunk is not None:
+            (timestamp, chunk) = chunker.get_next_data()
+
+
+def run_bulk(chunker_class, fragments):
+    """
+    Add every fragment before pulling out any records, so the chunk lists
+    hold the whole file
+    """
+    chunker = chunker_class(SIEVE)
+    for index, fragment in enumerate(fragments):
+        chunker.add_chunk(fragment, float(index))
+    (timestamp, chunk) = chunker.get_next_data()
+    while chunk is not None:
+        (timestamp, chunk) = chunker.get_next_data()
+
+
+def timeit(run, chunker_class, fragments):
+    start = time.time()
+    run(chunker_class, fragments)
+    return time.time() - start
+
+
+def main(fragment_counts):
+    print '%-10s %-10s %16s %16s' % ('mode', 'fragments', 'String us/frag', 'Buffer us/frag')
+    for mode, run in [('streaming', run_streaming), ('bulk', run_bulk)]:
+        for fragment_count in fragment_counts:
+            fragments = build_fragments(fragment_count)
+            results = [timeit(run, chunker_class, fragments) * 1e6 / fragment_count
+                       for chunker_class in (StringChunker, BufferChunker)]
+            print '%-10s %-10d %16.2f %16.2f' % (mode, fragment_count, results[0], results[1])
+
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_FRAGMENT_COUNTS
+    main(counts)
@@ -32,18 +32,16 @@ mock = Mock()
 cwd = os.getcwd()
 
 def profile(f, parse):
-    import hotshot, hotshot.stats
+    import cProfile, pstats
     print f
-    prof = hotshot.Profile("glider.prof")
+    prof = cProfile.Profile()
     try:
         func = functools.partial(parse, cwd, f, mock)
         prof.runcall(func)
     except:
         print 'exception'
-    finally:
-        prof.close()
 
-    stats = hotshot.stats.load('glider.prof')
+    stats = pstats.Stats(prof)
     stats.strip_dirs()
     stats.sort_stats('time', 'calls')
     stats.print_stats(10)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark for the dataset drivers.
+
+Discovers every driver module under mi/dataset/driver with a parse()
+function and runs it over the files in its nearest resource directory,
+the same way uFrame calls it. Each driver runs in a fresh worker process so
+its peak RSS is its own. Files a driver rejects (resource directories are
+shared between the recovered and telemetered drivers of an instrument) are
+counted as failed, with the exceptions raised listed by file, and files it
+parses without producing a particle are counted as empty. Both are left out
+of the throughput figures.
+
+The results are written as JSON so they can be compared between releases:
+
+    {"python": ..., "started": ..., "drivers": {<module>: {
+        "files": ..., "failed_files": ..., "empty_files": ..., "errors": ...,
+        "bytes": ..., "particles": ..., "seconds": ..., "particles_per_second": ...,
+        "mb_per_second": ..., "peak_rss_kb": ..., "retained_objects_per_particle": ...,
+        "garbage_per_particle": ...}}}
+
+Allocation counts are not available on Python 2, there is no allocation
+counter, and nothing here is an allocation figure. With --count-objects
+parsing runs with the garbage collector disabled and two other figures are
+reported per particle. The retained objects are the net change of the gc
+generation 0 count over a file: it goes up for each container object
+allocated and down for each one freed, never below zero, so it only counts
+the containers the parse left allocated, kept by the driver or left in
+reference cycles, and is close to zero for drivers which stream their
+particles. The garbage is the number of objects a collection then frees,
+the reference cycles left behind. Both are null without --count-objects,
+which also adds an "allocation_counts" entry to the report saying that
+they are not available. The throughput figures of a run counting objects
+are not comparable with one that does not.
+
+usage: python utils/parser_benchmark.py [--match TEXT] [--output FILE]
+                                        [--timeout SECONDS] [--count-objects]
+"""
+
+__license__ = 'Apache 2.0'
+
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+from multiprocessing import Pool, TimeoutError
+
+import mi
+
+DRIVER_ROOT = os.path.join(os.path.dirname(os.path.abspath(mi.__file__)), 'dataset', 'driver')
+DRIVER_SUFFIX = '_driver.py'
+RESOURCE_DIRECTORY = 'resource'
+
+# seconds a driver may take over all of its files
+DEFAULT_TIMEOUT = 600
+
+
+class CountingHandler(object):
+    """
+    Particle data handler which only counts the particles it is given,
+    so the benchmark measures the driver rather than the handler
+    """
+
+    def __init__(self):
+        self.particles = 0
+        self.failure = False
+
+    def addParticleSample(self, sample_type, sample):
+        self.particles += 1
+
+    def addParticleSamples(self, sample_type, samples):
+        self.particles += len(samples)
+
+    def setParticleDataCaptureFailure(self):
+        self.failure = True
+
+
+def discover_drivers(driver_root=DRIVER_ROOT):
+    """
+    Find the driver modules and the resource directory each one is tested with
+    @param driver_root The directory holding the driver packages
+    @retval A sorted list of (module name, resource directory) tuples, the
+        resource directory is None if no enclosing package has one
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(driver_root)))
+    drivers = []
+    for directory, directories, files in os.walk(driver_root):
+        directories[:] = [name for name in directories if name != RESOURCE_DIRECTORY]
+        for name in files:
+            if not name.endswith(DRIVER_SUFFIX):
+                continue
+            path = os.path.join(directory, name)
+            with open(path) as stream_handle:
+                if 'def parse(' not in stream_handle.read():
+                    continue
+            module_name = os.path.relpath(path[:-len('.py')], package_root).replace(os.sep, '.')
+            drivers.append((module_name, find_resource_directory(directory, driver_root)))
+
+    return sorted(drivers)
+
+
+def find_resource_directory(directory, driver_root=DRIVER_ROOT):
+    """
+    @retval The resource directory in the directory or its nearest enclosing
+        package below the driver root, or None
+    """
+    while directory.startswith(driver_root):
+        candidate = os.path.join(directory, RESOURCE_DIRECTORY)
+        if os.path.isdir(candidate):
+            return candidate
+        if directory == driver_root:
+            break
+        directory = os.path.dirname(directory)
+    return None
+
+
+def resource_files(resource_directory):
+    """
+    @retval A sorted list of the paths of the files in a resource directory
+    """
+    if resource_directory is None:
+        return []
+    paths = []
+    for directory, directories, files in os.walk(resource_directory):
+        paths.extend(os.path.join(directory, name) for name in files)
+    return sorted(paths)
+
+
+def benchmark_driver(module_name, source_files, count_objects=False):
+    """
+    Run a driver parse() over each file. Runs in a worker process.
+    @param module_name The driver module name
+    @param source_files The paths of the files to parse
+    @param count_objects Count the objects retained by parsing and the reference cycle garbage
+    @retval A dictionary of the driver results
+    """
+    # imported here so the logging set up by the driver runs in the worker
+    module = __import__(module_name, fromlist=['parse'])
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(mi.__file__)))
+
+    result = {'files': 0, 'failed_files': 0, 'empty_files': 0, 'errors': {}, 'bytes': 0,
+              'particles': 0, 'seconds': 0.0, 'retained_objects': 0 if count_objects else None,
+              'garbage': 0 if count_objects else None}
+    for source_file in source_files:
+        handler = CountingHandler()
+        if count_objects:
+            gc.collect()
+            gc.disable()
+            start_count = gc.get_count()[0]
+        start = time.time()
+        try:
+            module.parse(base_path, source_file, handler)
+        except Exception as e:
+            handler.failure = True
+            result['errors'][os.path.basename(source_file)] = '%s: %s' % (type(e).__name__, e)
+        elapsed = time.time() - start
+        if count_objects:
+            retained_objects = gc.get_count()[0] - start_count
+            garbage = gc.collect()
+            gc.enable()
+
+        result['files'] += 1
+        if handler.failure:
+            result['failed_files'] += 1
+            continue
+        if not handler.particles:
+            result['empty_files'] += 1
+            continue
+
+        result['bytes'] += os.path.getsize(source_file)
+        result['particles'] += handler.particles
+        result['seconds'] += elapsed
+        if count_objects:
+            result['retained_objects'] += retained_objects
+            result['garbage'] += garbage
+
+    # kilobytes on Linux
+    result['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def summarize(result):
+    """
+    Add the throughput figures to a driver result
+    """
+    seconds = result['seconds']
+    particles = result['particles']
+    result['particles_per_second'] = particles / seconds if seconds else None
+    result['mb_per_second'] = result['bytes'] / 1048576.0 / seconds if seconds else None
+    for name in ('retained_objects', 'garbage'):
+        count = result.pop(name, None)
+        result[name + '_per_particle'] = float(count) / particles if count is not None and particles else None
+    return result
+
+
+def run(drivers, timeout=DEFAULT_TIMEOUT, count_objects=False):
+    """
+    Benchmark each driver in its own worker process
+    @param drivers A list of (module name, resource directory) tuples
+    @retval A dictionary of results by driver module name
+    """
+    results = {}
+    for module_name, resource_directory in drivers:
+        source_files = resource_files(resource_directory)
+        if not source_files:
+            results[module_name] = {'error': 'no resource files'}
+            continue
+
+        sys.stderr.write('%s (%d files)\n' % (module_name, len(source_files)))
+        pool = Pool(processes=1)
+        try:
+            result = pool.apply_async(benchmark_driver, (module_name, source_files, count_objects))
+            results[module_name] = summarize(result.get(timeout))
+        except TimeoutError:
+            results[module_name] = {'error': 'timed out after %s seconds' % timeout}
+        except Exception as e:
+            results[module_name] = {'error': '%s: %s' % (type(e).__name__, e)}
+        finally:
+            pool.terminate()
+            pool.join()
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the dataset drivers over their resource files')
+    parser.add_argument('--match', help='only benchmark driver modules whose name contains this text')
+    parser.add_argument('--output', help='the file to write the JSON results to, stdout by default')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='seconds a driver may take over all of its files')
+    parser.add_argument('--count-objects', action='store_true',
+                        help='report the objects retained and the reference cycle garbage per particle, '
+                             'with the collector disabled, allocation counts are not available on Python 2')
+    args = parser.parse_args(argv)
+
+    drivers = discover_drivers()
+    if args.match:
+        drivers = [driver for driver in drivers if args.match in driver[0]]
+
+    started = time.time()
+    report = {'python': sys.version.split()[0],
+              'started': started,
+              'drivers': run(drivers, args.timeout, args.count_objects),
+              'seconds': time.time() - started}
+    if args.count_objects:
+        report['allocation_counts'] = 'not available on Python 2, retained_objects_per_particle is the net ' \
+                                      'change of the gc generation 0 count and only counts retained containers'
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as stream_handle:
+            stream_handle.write(output + '\n')
+    else:
+        print output
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Microbenchmark for the fixed format timestamp parsers.
+
+Converts a run of DCL controller, zulu and ISO8601 timestamps, one per
+second over a few days as they appear in a file, with datetime.strptime and
+with the FixedTimestampParser used by mi.dataset.parser.utilities and
+mi.core.time, and reports the cost per timestamp and the speedup. Each
+conversion is timed over several runs and the fastest run is reported, so
+the figures are less sensitive to other load on the machine.
+
+usage: python utils/timestamp_speed_test.py [timestamp count]
+"""
+
+__license__ = 'Apache 2.0'
+
+import calendar
+import sys
+import time
+from datetime import datetime
+
+from mi.core.time import ISO8601_TIMESTAMP_PARSER, DATE_FORMAT
+from mi.dataset.parser.utilities import \
+    DCL_CONTROLLER_TIMESTAMP_PARSER, DCL_CONTROLLER_TIMESTAMP_FORMAT, \
+    ZULU_TIMESTAMP_PARSER, ZULU_TIMESTAMP_FORMAT
+
+DEFAULT_TIMESTAMP_COUNT = 200000
+
+# number of runs of each conversion, the fastest is reported
+RUN_COUNT = 5
+
+# first timestamp, 2014-08-17T00:57:10
+START_TIME = 1408237030
+
+
+def build_timestamps(format_str, timestamp_count):
+    """
+    @retval A list of timestamp strings 1.001 seconds apart, with millisecond fractions
+    """
+    millisecond_format = format_str.replace('%f', '%%03d')
+    timestamps = []
+    for i in xrange(timestamp_count):
+        dt = datetime.utcfromtimestamp(START_TIME + i * 1.001)
+        timestamps.append(dt.strftime(millisecond_format) % (dt.microsecond // 1000))
+    return timestamps
+
+
+def run_strptime(timestamps, format_str):
+    for timestamp in timestamps:
+        dt = datetime.strptime(timestamp, format_str)
+        calendar.timegm(dt.timetuple()) + (dt.microsecond / 1000000.0)
+
+
+def run_parser(timestamps, parser):
+    to_unix_time = parser.to_unix_time
+    for timestamp in timestamps:
+        to_unix_time(timestamp)
+
+
+def time_run(run, *args):
+    """
+    @retval The seconds taken by the fastest of RUN_COUNT runs
+    """
+    seconds = []
+    for _ in xrange(RUN_COUNT):
+        start = time.time()
+        run(*args)
+        seconds.append(time.time() - start)
+    return min(seconds)
+
+
+def main():
+    timestamp_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TIMESTAMP_COUNT
+
+    print '%-8s %14s %14s %8s' % ('format', 'strptime us', 'parser us', 'speedup')
+    for name, format_str, parser in [('dcl', DCL_CONTROLLER_TIMESTAMP_FORMAT, DCL_CONTROLLER_TIMESTAMP_PARSER),
+                                     ('zulu', ZULU_TIMESTAMP_FORMAT, ZULU_TIMESTAMP_PARSER),
+                                     ('iso8601', DATE_FORMAT, ISO8601_TIMESTAMP_PARSER)]:
+        timestamps = build_timestamps(format_str, timestamp_count)
+        strptime_seconds = time_run(run_strptime, timestamps, format_str)
+        parser_seconds = time_run(run_parser, timestamps, parser)
+        print '%-8s %14.3f %14.3f %7.1fx' % (name,
+                                              strptime_seconds / timestamp_count * 1e6,
+                                              parser_seconds / timestamp_count * 1e6,
+                                              strptime_seconds / parser_seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Microbenchmark for the compiled glider particle value encoders.
+
+Builds the values list of glider particles from their data dictionaries,
+once with the per field _encode_value path the glider particles used
+before, which rebuilt the key list for every record, and once with the
+ValueEncoder each particle class compiles, and reports the time taken
+per particle.
+
+Only time is reported. Python 2 has no allocation counter, so the number
+of temporary objects each path allocates cannot be measured here, and the
+objects a particle keeps, the values list and one dictionary per field,
+are the same for both paths.
+
+usage: python utils/value_encoder_speed_test.py [particle count]
+"""
+
+__license__ = 'Apache 2.0'
+
+import sys
+import time
+
+from mi.core.instrument.data_particle import DataParticleKey
+from mi.dataset.parser.glider import GliderParticle, CtdgvParticleKey, CtdgvRecoveredDataParticle, \
+    EngineeringRecoveredDataParticle
+
+DEFAULT_PARTICLE_COUNT = 5000
+
+
+def encode_value_path(particle, key_list):
+    """
+    Build the values list the way the glider particles did before the
+    compiled encoders, with an _encode_value call per value
+    """
+    value_list = [particle.raw_data.get(key, None) for key in key_list]
+
+    result = []
+    for key, value in zip(key_list, value_list):
+        if value is None:
+            result.append({DataParticleKey.VALUE_ID: key, DataParticleKey.VALUE: None})
+        elif ('_lat' in key or '_lon' in key) and value != 'NaN':
+            result.append(particle._encode_value(key, value, GliderParticle._string_to_ddegrees))
+        elif value == 'NaN' or '.' in value or 'e' in value:
+            result.append(particle._encode_value(key, value, GliderParticle._encode_float_or_nan))
+        else:
+            result.append(particle._encode_value(key, value, int))
+    return result
+
+
+# particle classes and the key lists their old _build_parsed_values passed
+PARTICLES = [
+    ('ctdgv, 8 fields', CtdgvRecoveredDataParticle, CtdgvParticleKey.list),
+    ('eng, 255 fields', EngineeringRecoveredDataParticle,
+     lambda: EngineeringRecoveredDataParticle.keys_exclude_sci_times),
+]
+
+
+def build_particles(particle_class, particle_count, nan_fraction):
+    """
+    @retval A list of particles with a value for every key, nan_fraction of them NaN
+    """
+    keys = particle_class._value_encoder.sources
+    nan_count = int(len(keys) * nan_fraction)
+    raw_data = {}
+    for i, key in enumerate(keys):
+        if i < nan_count:
+            raw_data[key] = 'NaN'
+        elif '_lat' in key or '_lon' in key:
+            raw_data[key] = '4030.5'
+        else:
+            raw_data[key] = '%d.5' % i if i % 2 else str(i)
+    return [particle_class(dict(raw_data), internal_timestamp=3600000000.0 + i)
+            for i in xrange(particle_count)]
+
+
+def run(function, particles):
+    """
+    @retval The seconds taken to call function on every particle
+    """
+    start = time.time()
+    for particle in particles:
+        function(particle)
+    return time.time() - start
+
+
+def main():
+    particle_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PARTICLE_COUNT
+
+    print '%-24s %12s %12s %8s' % ('particle', 'encode us', 'compiled us', 'speedup')
+    for nan_fraction in (0.0, 0.5):
+        for name, particle_class, key_list in PARTICLES:
+            particles = build_particles(particle_class, particle_count, nan_fraction)
+            encode_seconds = run(lambda particle: encode_value_path(particle, key_list()), particles)
+            compiled_seconds = run(particle_class._build_parsed_values, particles)
+            print '%-24s %12.3f %12.3f %7.1fx' % (
+                '%s, %d%% NaN' % (name, nan_fraction * 100),
+                encode_seconds / particle_count * 1e6,
+                compiled_seconds / particle_count * 1e6,
+                encode_seconds / compiled_seconds)
+
+
+if __name__ == '__main__':
+    main()